@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Benchmark the Myers differ implementations and check their parity.
+
+This diffs each pair of files in the diff viewer's test data (files named
+:file:`<name>-old.<ext>` and :file:`<name>-new.<ext>`), along with any
+additional pairs passed on the command line and a generated large file,
+using both :py:class:`~reviewboard.diffviewer.myersdiff.MyersDiffer` and
+:py:class:`~reviewboard.diffviewer.numpy_myersdiff.NumPyMyersDiffer`.
+
+The opcodes from each differ must be identical. If any differ, this will
+exit with a non-zero status.
+
+Usage::
+
+    ./contrib/internal/benchmark-differ.py [--runs N] [OLD NEW ...]
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+TOP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+TESTDATA_DIR = os.path.join(TOP_DIR, 'reviewboard', 'diffviewer', 'testdata')
+
+sys.path.insert(0, TOP_DIR)
+
+from reviewboard.diffviewer.myersdiff import MyersDiffer  # noqa: E402
+from reviewboard.diffviewer.numpy_myersdiff import (  # noqa: E402
+    NumPyMyersDiffer,
+    has_numpy,
+)
+
+
+def iter_testdata_pairs() -> Iterator[tuple[str, str]]:
+    """Yield the pairs of files in the diff viewer test data.
+
+    Yields:
+        tuple:
+        A 2-tuple of the paths to the old and new files.
+    """
+    for dirpath, dirnames, filenames in sorted(os.walk(TESTDATA_DIR)):
+        for filename in sorted(filenames):
+            if '-old.' in filename:
+                new_filename = filename.replace('-old.', '-new.', 1)
+
+                if new_filename in filenames:
+                    yield (os.path.join(dirpath, filename),
+                           os.path.join(dirpath, new_filename))
+
+
+def read_lines(
+    path: str,
+) -> list[str]:
+    """Return the lines in a file.
+
+    Args:
+        path (str):
+            The path to the file.
+
+    Returns:
+        list of str:
+        The lines in the file.
+    """
+    with open(path, encoding='utf-8', errors='replace') as fp:
+        return fp.read().splitlines(True)
+
+
+def generate_lines(
+    num_lines: int,
+    num_changes: int,
+) -> tuple[list[str], list[str]]:
+    """Generate a large SQL dump-like file and a modified version of it.
+
+    Args:
+        num_lines (int):
+            The number of lines to generate.
+
+        num_changes (int):
+            The number of edits to make to the modified version.
+
+    Returns:
+        tuple:
+        A 2-tuple of the lines in the original and modified files.
+    """
+    rand = random.Random(num_lines)
+    old_lines: list[str] = []
+
+    for i in range(num_lines):
+        value = rand.random()
+
+        if value < 0.05:
+            old_lines.append('\n')
+        elif value < 0.1:
+            old_lines.append('-- Table data\n')
+        else:
+            old_lines.append(
+                "INSERT INTO items VALUES (%d, '%s');\n"
+                % (rand.randint(0, num_lines // 2),
+                   rand.choice('abcdefgh') * rand.randint(1, 5)))
+
+    new_lines = list(old_lines)
+
+    for i in range(num_changes):
+        pos = rand.randrange(len(new_lines))
+        value = rand.random()
+
+        if value < 0.33:
+            del new_lines[pos:pos + rand.randint(1, 20)]
+        elif value < 0.66:
+            new_lines[pos:pos] = [
+                "INSERT INTO items VALUES (%d, 'new');\n"
+                % rand.randint(0, 1000)
+                for j in range(rand.randint(1, 20))
+            ]
+        else:
+            new_lines[pos] = 'UPDATE items SET value=%d;\n' % i
+
+    return old_lines, new_lines
+
+
+def time_differ(
+    differ_cls: type[MyersDiffer],
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    runs: int,
+) -> tuple[float, list]:
+    """Time the generation of opcodes for a diff.
+
+    Args:
+        differ_cls (type):
+            The differ class to use.
+
+        old_lines (list of str):
+            The lines in the original file.
+
+        new_lines (list of str):
+            The lines in the modified file.
+
+        runs (int):
+            The number of times to run the diff.
+
+    Returns:
+        tuple:
+        A 2-tuple of the best time in seconds and the opcodes.
+    """
+    best = None
+    opcodes: list = []
+
+    for i in range(runs):
+        start = time.perf_counter()
+        opcodes = list(differ_cls(old_lines, new_lines).get_opcodes())
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    assert best is not None
+
+    return best, opcodes
+
+
+def main() -> int:
+    """Run the benchmark.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the Myers differs and check opcode parity.')
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=3,
+        help='The number of times to diff each pair of files.')
+    parser.add_argument(
+        '--generated-lines',
+        type=int,
+        default=50000,
+        help='The number of lines in the generated file, or 0 to skip it.')
+    parser.add_argument(
+        'files',
+        nargs='*',
+        metavar='OLD NEW',
+        help='Additional pairs of files to diff.')
+    options = parser.parse_args()
+
+    if not has_numpy:
+        sys.stderr.write('NumPy must be installed to run this benchmark.\n')
+        return 1
+
+    if len(options.files) % 2 != 0:
+        parser.error('Files must be provided in pairs.')
+
+    cases: list[tuple[str, list[str], list[str]]] = [
+        (os.path.relpath(old_path, TESTDATA_DIR),
+         read_lines(old_path),
+         read_lines(new_path))
+        for old_path, new_path in iter_testdata_pairs()
+    ]
+
+    for i in range(0, len(options.files), 2):
+        cases.append((options.files[i],
+                      read_lines(options.files[i]),
+                      read_lines(options.files[i + 1])))
+
+    if options.generated_lines > 0:
+        num_lines = options.generated_lines
+
+        for num_changes in (num_lines // 1000, num_lines // 10):
+            old_lines, new_lines = generate_lines(num_lines, num_changes)
+            cases.append(('<generated: %d lines, %d changes>'
+                          % (num_lines, num_changes),
+                          old_lines, new_lines))
+
+    failed = False
+
+    for name, old_lines, new_lines in cases:
+        python_time, python_opcodes = time_differ(
+            MyersDiffer, old_lines, new_lines, options.runs)
+        numpy_time, numpy_opcodes = time_differ(
+            NumPyMyersDiffer, old_lines, new_lines, options.runs)
+
+        if python_opcodes == numpy_opcodes:
+            result = 'OK'
+        else:
+            result = 'MISMATCH'
+            failed = True
+
+        print('%s: %s (%d opcodes, python %.3fs, numpy %.3fs, %.2fx)'
+              % (name, result, len(python_opcodes), python_time, numpy_time,
+                 python_time / max(numpy_time, 1e-9)))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
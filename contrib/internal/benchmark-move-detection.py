@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Benchmark move detection in the diff opcode generator.
+
+This generates large diffs where blocks of code have been moved around
+(such as functions reordered during a refactor), along with any pairs of
+files passed on the command line, and times opcode generation with and
+without move detection.
+
+Generated code is made up largely of short, common lines (braces, blank
+lines, ``return None``), which match many removed lines and are the worst
+case for move detection.
+
+Usage::
+
+    ./contrib/internal/benchmark-move-detection.py [--runs N] [OLD NEW ...]
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+
+TOP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+sys.path.insert(0, TOP_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'reviewboard.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from reviewboard.diffviewer.myersdiff import MyersDiffer  # noqa: E402
+from reviewboard.diffviewer.opcode_generator import (  # noqa: E402
+    DiffOpcodeGenerator,
+)
+from reviewboard.diffviewer.settings import DiffSettings  # noqa: E402
+
+
+COMMON_LINES = [
+    '}\n',
+    '\n',
+    '    return None;\n',
+    '    break;\n',
+    '{\n',
+]
+
+
+class NoMovesDiffOpcodeGenerator(DiffOpcodeGenerator):
+    """An opcode generator with move detection disabled.
+
+    This is used as a baseline for timing.
+    """
+
+    MOVE_DETECTION_MAX_WORK = 0
+
+
+def read_lines(
+    path: str,
+) -> list[str]:
+    """Return the lines in a file.
+
+    Args:
+        path (str):
+            The path to the file.
+
+    Returns:
+        list of str:
+        The lines in the file.
+    """
+    with open(path, encoding='utf-8', errors='replace') as fp:
+        return fp.read().splitlines(True)
+
+
+def generate_function(
+    rand: random.Random,
+    index: int,
+) -> list[str]:
+    """Generate the lines for a function.
+
+    Args:
+        rand (random.Random):
+            The random number generator.
+
+        index (int):
+            The index of the function, used to give it a unique name.
+
+    Returns:
+        list of str:
+        The lines in the function.
+    """
+    lines = [
+        'int\n',
+        'function_%d(int value)\n' % index,
+        '{\n',
+    ]
+
+    for i in range(rand.randint(10, 60)):
+        if rand.random() < 0.6:
+            lines.append(rand.choice(COMMON_LINES))
+        else:
+            lines.append('    value = compute_%d(value, %d);\n'
+                         % (index, rand.randint(0, 20)))
+
+    lines.append('}\n')
+    lines.append('\n')
+
+    return lines
+
+
+def generate_moved_functions(
+    num_functions: int,
+    num_moves: int,
+) -> tuple[list[str], list[str]]:
+    """Generate a file and a version with functions moved around.
+
+    Args:
+        num_functions (int):
+            The number of functions to generate.
+
+        num_moves (int):
+            The number of functions to move.
+
+    Returns:
+        tuple:
+        A 2-tuple of the lines in the original and modified files.
+    """
+    rand = random.Random(num_functions * 1000 + num_moves)
+    functions = [
+        generate_function(rand, i)
+        for i in range(num_functions)
+    ]
+    new_functions = list(functions)
+
+    for i in range(num_moves):
+        function = new_functions.pop(rand.randrange(len(new_functions)))
+        new_functions.insert(rand.randrange(len(new_functions) + 1),
+                             function)
+
+    return (
+        [line for function in functions for line in function],
+        [line for function in new_functions for line in function],
+    )
+
+
+def generate_moved_block(
+    num_functions: int,
+) -> tuple[list[str], list[str]]:
+    """Generate a file and a version with a large block moved.
+
+    The first half of the file is moved to the end, and a few lines are
+    changed in the moved block.
+
+    Args:
+        num_functions (int):
+            The number of functions to generate.
+
+    Returns:
+        tuple:
+        A 2-tuple of the lines in the original and modified files.
+    """
+    rand = random.Random(num_functions)
+    old_lines = [
+        line
+        for i in range(num_functions)
+        for line in generate_function(rand, i)
+    ]
+    half = len(old_lines) // 2
+    moved = old_lines[:half]
+
+    for i in range(0, len(moved), 50):
+        moved[i] = '    /* Changed */\n'
+
+    return old_lines, old_lines[half:] + moved
+
+
+def time_opcodes(
+    generator_cls: type[DiffOpcodeGenerator],
+    old_lines: list[str],
+    new_lines: list[str],
+    runs: int,
+) -> tuple[float, int]:
+    """Time the generation of opcodes for a diff.
+
+    Args:
+        generator_cls (type):
+            The opcode generator class to use.
+
+        old_lines (list of str):
+            The lines in the original file.
+
+        new_lines (list of str):
+            The lines in the modified file.
+
+        runs (int):
+            The number of times to generate opcodes.
+
+    Returns:
+        tuple:
+        A 2-tuple of the best time in seconds and the number of moved lines
+        found.
+    """
+    diff_settings = DiffSettings(
+        code_safety_configs={},
+        context_num_lines=5,
+        custom_pygments_lexers={},
+        include_space_patterns=[],
+        interdiff_filtering=False,
+        paginate_by=20,
+        paginate_orphans=10,
+        syntax_highlighting=False,
+        syntax_highlighting_threshold=0,
+        syntax_highlighting_viewport_threshold=0,
+        tab_size=DiffSettings.DEFAULT_TAB_SIZE)
+    best = None
+    num_moved = 0
+
+    for i in range(runs):
+        differ = MyersDiffer(old_lines, new_lines)
+        generator = generator_cls(differ, diff_settings=diff_settings)
+
+        start = time.perf_counter()
+        opcodes = list(generator)
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+        num_moved = sum(
+            len(meta.get('moved-from', {}))
+            for tag, i1, i2, j1, j2, meta in opcodes
+            if meta
+        )
+
+    assert best is not None
+
+    return best, num_moved
+
+
+def main() -> int:
+    """Run the benchmark.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark move detection in the diff opcode generator.')
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=3,
+        help='The number of times to diff each pair of files.')
+    parser.add_argument(
+        '--functions',
+        type=int,
+        default=2000,
+        help='The number of functions in generated files, or 0 to skip '
+             'them.')
+    parser.add_argument(
+        'files',
+        nargs='*',
+        metavar='OLD NEW',
+        help='Additional pairs of files to diff.')
+    options = parser.parse_args()
+
+    if len(options.files) % 2 != 0:
+        parser.error('Files must be provided in pairs.')
+
+    cases: list[tuple[str, list[str], list[str]]] = []
+    num_functions = options.functions
+
+    if num_functions > 0:
+        for num_moves in (num_functions // 100, num_functions // 10):
+            old_lines, new_lines = generate_moved_functions(num_functions,
+                                                            num_moves)
+            cases.append(('<generated: %d functions, %d moved>'
+                          % (num_functions, num_moves),
+                          old_lines, new_lines))
+
+        old_lines, new_lines = generate_moved_block(num_functions)
+        cases.append(('<generated: %d functions, half moved>'
+                      % num_functions,
+                      old_lines, new_lines))
+
+    for i in range(0, len(options.files), 2):
+        cases.append((options.files[i],
+                      read_lines(options.files[i]),
+                      read_lines(options.files[i + 1])))
+
+    for name, old_lines, new_lines in cases:
+        baseline_time, unused = time_opcodes(
+            NoMovesDiffOpcodeGenerator, old_lines, new_lines, options.runs)
+        moves_time, num_moved = time_opcodes(
+            DiffOpcodeGenerator, old_lines, new_lines, options.runs)
+
+        print('%s: %d lines, %d moved lines found (without moves %.3fs, '
+              'with moves %.3fs, move detection %.3fs)'
+              % (name, len(new_lines), num_moved, baseline_time, moves_time,
+                 max(moves_time - baseline_time, 0)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,14 +6,22 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import MultipleObjectsReturned
-from django.db.models import Manager
+from django.db import transaction
+from django.db.models import Count, F, Manager, Q
 
 from reviewboard.accounts.trophies import trophies_registry
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
     from django.contrib.auth.models import User
 
-    from reviewboard.accounts.models import LocalSiteProfile, Profile
+    from reviewboard.accounts.models import (LocalSiteProfile,
+                                             Profile,
+                                             ReviewRequestUserSummary,
+                                             ReviewRequestVisit)
+    from reviewboard.reviews.models import Review
     from reviewboard.site.models import LocalSite
 
 
@@ -206,6 +214,418 @@ class ReviewRequestVisitManager(Manager['ReviewRequestVisit']):
             })[0]
 
 
+class ReviewRequestUserSummaryManager(Manager['ReviewRequestUserSummary']):
+    """Manager for per-user review request summaries.
+
+    This keeps the summaries up-to-date as users visit review requests and
+    create, publish, or delete reviews.
+
+    Version Added:
+        9.0
+    """
+
+    #: The fields on a review that affect a user's summary.
+    REVIEW_FIELDS = frozenset({
+        'public',
+        'review_request',
+        'review_request_id',
+        'ship_it',
+        'user',
+        'user_id',
+    })
+
+    def update_for_visit(
+        self,
+        visit: ReviewRequestVisit,
+    ) -> None:
+        """Update a user's summary after visiting a review request.
+
+        This records the visit time and resets the number of new reviews.
+        Reviews are only counted if any may have been published after the
+        visit time, which is normally not the case, since visits are
+        recorded as the page is viewed.
+
+        Args:
+            visit (reviewboard.accounts.models.ReviewRequestVisit):
+                The visit that was recorded.
+        """
+        last_review_timestamp = \
+            visit.review_request.last_review_activity_timestamp
+
+        if (last_review_timestamp is None or
+            last_review_timestamp <= visit.timestamp):
+            new_review_count = 0
+        else:
+            new_review_count = self._count_new_reviews(
+                user_id=visit.user_id,
+                review_request_id=visit.review_request_id,
+                last_visited=visit.timestamp)
+
+        updated = (
+            self
+            .filter(user=visit.user_id,
+                    review_request=visit.review_request_id)
+            .update(last_visited=visit.timestamp,
+                    new_review_count=new_review_count)
+        )
+
+        if not updated:
+            self._create_summary(user_id=visit.user_id,
+                                 review_request_id=visit.review_request_id)
+
+    def update_for_review_saved(
+        self,
+        review: Review,
+    ) -> None:
+        """Update the state of a user's own reviews after saving a review.
+
+        The summary's flags are updated from the review's state where
+        possible. The user's reviews are only counted when a flag may need
+        to be cleared, such as when publishing a draft or revoking a Ship
+        It!, and the summary is only written if something changed.
+
+        Args:
+            review (reviewboard.reviews.models.Review):
+                The review or reply that was saved.
+        """
+        user_id = review.user_id
+        review_request_id = review.review_request_id
+        summary = (
+            self
+            .filter(user=user_id,
+                    review_request=review_request_id)
+            .only('has_draft_reviews', 'has_published_reviews',
+                  'has_ship_it_reviews')
+            .first()
+        )
+
+        if summary is None:
+            self._create_summary(user_id=user_id,
+                                 review_request_id=review_request_id)
+            return
+
+        if review.public and (summary.has_draft_reviews or
+                              (summary.has_ship_it_reviews and
+                               not review.ship_it)):
+            # This may have been the user's last draft or Ship It!.
+            flags = self._get_review_flags(
+                user_id=user_id,
+                review_request_id=review_request_id)
+        else:
+            flags = {
+                'has_draft_reviews': (summary.has_draft_reviews or
+                                      not review.public),
+                'has_published_reviews': (summary.has_published_reviews or
+                                          review.public),
+                'has_ship_it_reviews': (summary.has_ship_it_reviews or
+                                        review.ship_it),
+            }
+
+        changed_flags = {
+            field: value
+            for field, value in flags.items()
+            if getattr(summary, field) != value
+        }
+
+        if changed_flags:
+            self.filter(pk=summary.pk).update(**changed_flags)
+
+    def add_published_review(
+        self,
+        review: Review,
+    ) -> None:
+        """Count a newly-published review as new for other users.
+
+        Args:
+            review (reviewboard.reviews.models.Review):
+                The review or reply that was published.
+        """
+        (
+            self
+            .filter(review_request=review.review_request_id,
+                    last_visited__lt=review.timestamp)
+            .exclude(user=review.user_id)
+            .update(new_review_count=F('new_review_count') + 1)
+        )
+
+    def remove_review(
+        self,
+        review: Review,
+    ) -> None:
+        """Update summaries after a review has been deleted.
+
+        This only updates existing summaries. It won't create new ones,
+        since the review may be deleted along with its review request.
+
+        Args:
+            review (reviewboard.reviews.models.Review):
+                The review or reply that was deleted.
+        """
+        review_request_id = review.review_request_id
+
+        if review.user_id is not None:
+            (
+                self
+                .filter(user=review.user_id,
+                        review_request=review_request_id)
+                .update(**self._get_review_flags(
+                    user_id=review.user_id,
+                    review_request_id=review_request_id))
+            )
+
+        if review.public:
+            (
+                self
+                .filter(review_request=review_request_id,
+                        last_visited__lt=review.timestamp,
+                        new_review_count__gt=0)
+                .exclude(user=review.user_id)
+                .update(new_review_count=F('new_review_count') - 1)
+            )
+
+    def rebuild(
+        self,
+        review_request_ids: (Iterable[int] | None) = None,
+        *,
+        batch_size: int = 100,
+    ) -> int:
+        """Rebuild summaries from existing visits and reviews.
+
+        This is used to populate summaries for existing data, or to repair
+        them if they've fallen out of sync. Review requests are processed
+        in batches, using a fixed number of queries per batch.
+
+        Args:
+            review_request_ids (list of int, optional):
+                The IDs of the review requests to rebuild summaries for.
+                If not provided, all summaries will be rebuilt.
+
+            batch_size (int, optional):
+                The number of review requests to rebuild at a time.
+
+        Returns:
+            int:
+            The number of summaries rebuilt.
+        """
+        from reviewboard.reviews.models import ReviewRequest
+
+        if review_request_ids is None:
+            review_request_ids = (
+                ReviewRequest.objects
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            )
+
+        review_request_ids = list(review_request_ids)
+        num_summaries = 0
+
+        for i in range(0, len(review_request_ids), batch_size):
+            num_summaries += self._rebuild_batch(
+                review_request_ids[i:i + batch_size])
+
+        return num_summaries
+
+    def _rebuild_batch(
+        self,
+        review_request_ids: list[int],
+    ) -> int:
+        """Rebuild summaries for a batch of review requests.
+
+        Args:
+            review_request_ids (list of int):
+                The IDs of the review requests to rebuild summaries for.
+
+        Returns:
+            int:
+            The number of summaries rebuilt.
+        """
+        from reviewboard.accounts.models import ReviewRequestVisit
+        from reviewboard.reviews.models import Review
+
+        summaries: dict[tuple[int, int], ReviewRequestUserSummary] = {}
+
+        def _get_summary(
+            user_id: int,
+            review_request_id: int,
+        ) -> ReviewRequestUserSummary:
+            key = (user_id, review_request_id)
+
+            try:
+                return summaries[key]
+            except KeyError:
+                summary = self.model(user_id=user_id,
+                                     review_request_id=review_request_id)
+                summaries[key] = summary
+
+                return summary
+
+        for row in (
+            Review.objects
+            .filter(review_request__in=review_request_ids,
+                    user__isnull=False)
+            .order_by()
+            .values('user', 'review_request')
+            .annotate(**self._get_review_flag_aggregates())
+        ):
+            summary = _get_summary(row['user'], row['review_request'])
+            summary.has_draft_reviews = row['draft_count'] > 0
+            summary.has_published_reviews = row['published_count'] > 0
+            summary.has_ship_it_reviews = row['ship_it_count'] > 0
+
+        new_reviews_q = (
+            Q(review_request__reviews__public=True) &
+            Q(review_request__reviews__timestamp__gt=F('timestamp')) &
+            ~Q(review_request__reviews__user=F('user'))
+        )
+
+        for row in (
+            ReviewRequestVisit.objects
+            .filter(review_request__in=review_request_ids)
+            .order_by()
+            .values('user', 'review_request', 'timestamp')
+            .annotate(new_review_count=Count('review_request__reviews',
+                                             filter=new_reviews_q))
+        ):
+            summary = _get_summary(row['user'], row['review_request'])
+            summary.last_visited = row['timestamp']
+            summary.new_review_count = row['new_review_count']
+
+        with transaction.atomic():
+            self.filter(review_request__in=review_request_ids).delete()
+            self.bulk_create(summaries.values(), batch_size=500)
+
+        return len(summaries)
+
+    def _create_summary(
+        self,
+        *,
+        user_id: int,
+        review_request_id: int,
+    ) -> None:
+        """Create a user's summary for a review request.
+
+        This is used the first time a summary is needed, and populates it
+        from the user's visit and reviews.
+
+        Args:
+            user_id (int):
+                The ID of the user.
+
+            review_request_id (int):
+                The ID of the review request.
+        """
+        from reviewboard.accounts.models import ReviewRequestVisit
+
+        last_visited = (
+            ReviewRequestVisit.objects
+            .filter(user=user_id,
+                    review_request=review_request_id)
+            .values_list('timestamp', flat=True)
+            .first()
+        )
+
+        self.get_or_create(
+            user_id=user_id,
+            review_request_id=review_request_id,
+            defaults={
+                'last_visited': last_visited,
+                'new_review_count': self._count_new_reviews(
+                    user_id=user_id,
+                    review_request_id=review_request_id,
+                    last_visited=last_visited),
+                **self._get_review_flags(
+                    user_id=user_id,
+                    review_request_id=review_request_id),
+            })
+
+    def _count_new_reviews(
+        self,
+        *,
+        user_id: int,
+        review_request_id: int,
+        last_visited: (datetime | None),
+    ) -> int:
+        """Return the number of reviews published since a user's last visit.
+
+        Args:
+            user_id (int):
+                The ID of the user.
+
+            review_request_id (int):
+                The ID of the review request.
+
+            last_visited (datetime.datetime):
+                The time of the user's last visit, if any.
+
+        Returns:
+            int:
+            The number of reviews and replies published by other users since
+            the last visit. This is 0 if the user has not visited.
+        """
+        from reviewboard.reviews.models import Review
+
+        if last_visited is None:
+            return 0
+
+        return (
+            Review.objects
+            .filter(review_request=review_request_id,
+                    public=True,
+                    timestamp__gt=last_visited)
+            .exclude(user=user_id)
+            .count()
+        )
+
+    def _get_review_flags(
+        self,
+        *,
+        user_id: int,
+        review_request_id: int,
+    ) -> dict[str, bool]:
+        """Return the state of a user's own reviews on a review request.
+
+        Args:
+            user_id (int):
+                The ID of the user.
+
+            review_request_id (int):
+                The ID of the review request.
+
+        Returns:
+            dict:
+            The values for the ``has_draft_reviews``,
+            ``has_published_reviews``, and ``has_ship_it_reviews`` fields.
+        """
+        from reviewboard.reviews.models import Review
+
+        counts = (
+            Review.objects
+            .filter(review_request=review_request_id,
+                    user=user_id)
+            .aggregate(**self._get_review_flag_aggregates())
+        )
+
+        return {
+            'has_draft_reviews': counts['draft_count'] > 0,
+            'has_published_reviews': counts['published_count'] > 0,
+            'has_ship_it_reviews': counts['ship_it_count'] > 0,
+        }
+
+    def _get_review_flag_aggregates(self) -> dict[str, Count]:
+        """Return aggregates for counting the state of a user's reviews.
+
+        Returns:
+            dict:
+            The ``draft_count``, ``published_count``, and ``ship_it_count``
+            aggregates.
+        """
+        return {
+            'draft_count': Count('pk', filter=Q(public=False)),
+            'published_count': Count('pk', filter=Q(public=True)),
+            'ship_it_count': Count('pk', filter=Q(ship_it=True)),
+        }
+
+
 class TrophyManager(Manager):
     """Manager for trophies.
 
@@ -10,7 +10,7 @@ from django.contrib.auth.models import AnonymousUser, User as DjangoUser
 from django.core.cache import cache
 from django.db import models
 from django.db.models import Q
-from django.db.models.signals import m2m_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -26,12 +26,13 @@ from typing_extensions import TypedDict
 
 from reviewboard.accounts.managers import (LocalSiteProfileManager,
                                            ProfileManager,
+                                           ReviewRequestUserSummaryManager,
                                            ReviewRequestVisitManager,
                                            TrophyManager)
 from reviewboard.accounts.trophies import trophies_registry
 from reviewboard.admin.read_only import is_site_read_only_for
 from reviewboard.avatars import avatar_services
-from reviewboard.reviews.models import Group, ReviewRequest
+from reviewboard.reviews.models import Group, Review, ReviewRequest
 from reviewboard.reviews.signals import (reply_published,
                                          review_published,
                                          review_request_published)
@@ -132,6 +133,61 @@ class ReviewRequestVisit(models.Model):
         verbose_name_plural = _('Review Request Visits')
 
 
+class ReviewRequestUserSummary(models.Model):
+    """A summary of a user's activity on a review request.
+
+    This stores information shown on the dashboard for each review request,
+    such as the number of reviews published since the user's last visit and
+    the state of the user's own reviews. It's kept up-to-date as the user
+    visits the review request and as reviews are created, published, or
+    deleted, so the dashboard doesn't need to count reviews for every row.
+
+    Summaries are built for existing data when upgrading, and can be rebuilt
+    using the ``rebuild-review-request-summaries`` management command.
+
+    Version Added:
+        9.0
+    """
+
+    user = models.ForeignKey['User', 'User'](
+        DjangoUser,
+        on_delete=models.CASCADE,
+        related_name='review_request_summaries')
+    review_request = models.ForeignKey(ReviewRequest,
+                                       on_delete=models.CASCADE,
+                                       related_name='user_summaries')
+
+    #: The time of the user's last visit to the review request, if any.
+    last_visited = models.DateTimeField(null=True, blank=True)
+
+    #: The number of reviews published by others since the last visit.
+    new_review_count = models.PositiveIntegerField(default=0)
+
+    #: Whether the user has any draft reviews or replies.
+    has_draft_reviews = models.BooleanField(default=False)
+
+    #: Whether the user has any published reviews or replies.
+    has_published_reviews = models.BooleanField(default=False)
+
+    #: Whether the user has any reviews marked Ship It!.
+    has_ship_it_reviews = models.BooleanField(default=False)
+
+    objects: ClassVar[ReviewRequestUserSummaryManager] = \
+        ReviewRequestUserSummaryManager()
+
+    def __str__(self) -> str:
+        """Return a string used for the admin site listing."""
+        return 'Review request user summary'
+
+    class Meta:
+        """Metadata for the model."""
+
+        db_table = 'accounts_reviewrequestusersummary'
+        unique_together = ('user', 'review_request')
+        verbose_name = _('Review Request User Summary')
+        verbose_name_plural = _('Review Request User Summaries')
+
+
 class LinkedAccount(models.Model):
     """A linked account on an external service.
 
@@ -1845,6 +1901,136 @@ def _call_unarchive_all_for_reply(sender, reply, **kwargs):
     ReviewRequestVisit.objects.unarchive_all(reply.review_request_id)
 
 
+@receiver(post_save, sender=ReviewRequestVisit)
+def _update_user_summary_for_visit(sender, instance, update_fields,
+                                   raw=False, **kwargs):
+    """Update a user's review request summary after a visit.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The model class that sent the signal.
+
+        instance (ReviewRequestVisit):
+            The visit that was saved.
+
+        update_fields (frozenset of str):
+            The fields that were specifically updated, if any.
+
+        raw (bool, optional):
+            Whether the visit is being loaded from a fixture.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    if not raw and (not update_fields or 'timestamp' in update_fields):
+        ReviewRequestUserSummary.objects.update_for_visit(instance)
+
+
+@receiver(post_save, sender=Review)
+def _update_user_summary_for_review_saved(sender, instance, update_fields,
+                                          raw=False, **kwargs):
+    """Update a user's review request summary after saving a review.
+
+    This handles creating draft reviews and replies, publishing them, and
+    revoking Ship It!. Saves that don't touch any fields affecting the
+    summary are skipped.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The model class that sent the signal.
+
+        instance (reviewboard.reviews.models.Review):
+            The review that was saved.
+
+        update_fields (frozenset of str):
+            The fields that were specifically updated, if any.
+
+        raw (bool, optional):
+            Whether the review is being loaded from a fixture.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    if (not raw and
+        instance.user_id is not None and
+        (not update_fields or
+         not update_fields.isdisjoint(
+             ReviewRequestUserSummary.objects.REVIEW_FIELDS))):
+        ReviewRequestUserSummary.objects.update_for_review_saved(instance)
+
+
+@receiver(post_delete, sender=Review)
+def _update_user_summaries_for_review_deleted(sender, instance, **kwargs):
+    """Update review request summaries after deleting a review.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The model class that sent the signal.
+
+        instance (reviewboard.reviews.models.Review):
+            The review that was deleted.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    ReviewRequestUserSummary.objects.remove_review(instance)
+
+
+@receiver(review_published)
+def _update_user_summaries_for_review(sender, review, **kwargs):
+    """Update review request summaries after publishing a review.
+
+    The review is counted as new for other users who last visited the
+    review request before it was published.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (object, unused):
+            The object that sent the signal.
+
+        review (reviewboard.reviews.models.Review):
+            The review that was published.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    ReviewRequestUserSummary.objects.add_published_review(review)
+
+
+@receiver(reply_published)
+def _update_user_summaries_for_reply(sender, reply, **kwargs):
+    """Update review request summaries after publishing a reply.
+
+    The reply is counted as new for other users who last visited the
+    review request before it was published.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (object, unused):
+            The object that sent the signal.
+
+        reply (reviewboard.reviews.models.Review):
+            The reply that was published.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    ReviewRequestUserSummary.objects.add_published_review(reply)
+
+
 @receiver(user_registered)
 @receiver(local_site_user_added)
 def _add_default_groups(sender, user, local_site=None, **kwargs):
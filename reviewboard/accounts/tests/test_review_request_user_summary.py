@@ -0,0 +1,179 @@
+"""Unit tests for reviewboard.accounts.models.ReviewRequestUserSummary."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from reviewboard.accounts.models import (ReviewRequestUserSummary,
+                                         ReviewRequestVisit)
+from reviewboard.testing import TestCase
+
+
+class ReviewRequestUserSummaryTests(TestCase):
+    """Unit tests for ReviewRequestUserSummary."""
+
+    fixtures = ['test_users']
+
+    def test_visit(self) -> None:
+        """Testing ReviewRequestUserSummary is created on visit"""
+        review_request = self.create_review_request(publish=True)
+        visit = self.create_visit(review_request, ReviewRequestVisit.VISIBLE,
+                                  user='doc')
+
+        summary = ReviewRequestUserSummary.objects.get(
+            user__username='doc',
+            review_request=review_request)
+        self.assertEqual(summary.last_visited, visit.timestamp)
+        self.assertEqual(summary.new_review_count, 0)
+        self.assertFalse(summary.has_draft_reviews)
+        self.assertFalse(summary.has_published_reviews)
+        self.assertFalse(summary.has_ship_it_reviews)
+
+    def test_new_reviews(self) -> None:
+        """Testing ReviewRequestUserSummary counts new reviews and resets
+        on visit
+        """
+        review_request = self.create_review_request(publish=True)
+        visit = self.create_visit(
+            review_request,
+            ReviewRequestVisit.VISIBLE,
+            user='doc',
+            timestamp=timezone.now() - timedelta(days=1))
+
+        self.create_review(review_request, user='dopey', publish=True)
+        self.create_review(review_request, user='grumpy', publish=True)
+
+        # Reviews by the visiting user shouldn't be counted.
+        self.create_review(review_request, user='doc', publish=True)
+
+        summary = ReviewRequestUserSummary.objects.get(
+            user__username='doc',
+            review_request=review_request)
+        self.assertEqual(summary.new_review_count, 2)
+
+        visit.timestamp = timezone.now()
+        visit.save(update_fields=('timestamp',))
+
+        summary.refresh_from_db()
+        self.assertEqual(summary.new_review_count, 0)
+
+    def test_review_flags(self) -> None:
+        """Testing ReviewRequestUserSummary tracks the user's draft,
+        published, and Ship It! reviews
+        """
+        review_request = self.create_review_request(publish=True)
+        review = self.create_review(review_request, user='doc')
+
+        summary = ReviewRequestUserSummary.objects.get(
+            user__username='doc',
+            review_request=review_request)
+        self.assertIsNone(summary.last_visited)
+        self.assertTrue(summary.has_draft_reviews)
+        self.assertFalse(summary.has_published_reviews)
+        self.assertFalse(summary.has_ship_it_reviews)
+
+        review.ship_it = True
+        review.publish()
+
+        summary.refresh_from_db()
+        self.assertFalse(summary.has_draft_reviews)
+        self.assertTrue(summary.has_published_reviews)
+        self.assertTrue(summary.has_ship_it_reviews)
+
+    def test_review_flags_without_summary(self) -> None:
+        """Testing ReviewRequestUserSummary created when saving a review
+        includes the user's existing visit
+        """
+        review_request = self.create_review_request(publish=True)
+        visit = self.create_visit(
+            review_request,
+            ReviewRequestVisit.VISIBLE,
+            user='doc',
+            timestamp=timezone.now() - timedelta(days=1))
+        self.create_review(review_request, user='dopey', publish=True)
+
+        # Simulate data from before summaries were maintained.
+        ReviewRequestUserSummary.objects.all().delete()
+
+        self.create_review(review_request, user='doc')
+
+        summary = ReviewRequestUserSummary.objects.get(
+            user__username='doc',
+            review_request=review_request)
+        self.assertEqual(summary.last_visited, visit.timestamp)
+        self.assertEqual(summary.new_review_count, 1)
+        self.assertTrue(summary.has_draft_reviews)
+        self.assertFalse(summary.has_published_reviews)
+
+    def test_delete_review(self) -> None:
+        """Testing ReviewRequestUserSummary is updated when reviews are
+        deleted
+        """
+        review_request = self.create_review_request(publish=True)
+        self.create_visit(review_request,
+                          ReviewRequestVisit.VISIBLE,
+                          user='doc',
+                          timestamp=timezone.now() - timedelta(days=1))
+
+        draft = self.create_review(review_request, user='dopey')
+        published = self.create_review(review_request, user='grumpy',
+                                       publish=True)
+
+        summaries = ReviewRequestUserSummary.objects.filter(
+            review_request=review_request)
+        self.assertTrue(summaries.get(user__username='dopey')
+                        .has_draft_reviews)
+        self.assertEqual(summaries.get(user__username='doc')
+                         .new_review_count, 1)
+
+        draft.delete()
+        published.delete()
+
+        self.assertFalse(summaries.get(user__username='dopey')
+                         .has_draft_reviews)
+        self.assertFalse(summaries.get(user__username='grumpy')
+                         .has_published_reviews)
+        self.assertEqual(summaries.get(user__username='doc')
+                         .new_review_count, 0)
+
+    def test_rebuild(self) -> None:
+        """Testing ReviewRequestUserSummaryManager.rebuild"""
+        review_request = self.create_review_request(publish=True)
+        self.create_visit(review_request,
+                          ReviewRequestVisit.VISIBLE,
+                          user='doc',
+                          timestamp=timezone.now() - timedelta(days=1))
+        self.create_review(review_request, user='dopey', ship_it=True,
+                           publish=True)
+        self.create_review(review_request, user='grumpy')
+
+        ReviewRequestUserSummary.objects.all().delete()
+
+        self.assertEqual(
+            ReviewRequestUserSummary.objects.rebuild(
+                review_request_ids=[review_request.pk]),
+            3)
+
+        summaries = {
+            summary.user_id: summary
+            for summary in ReviewRequestUserSummary.objects.filter(
+                review_request=review_request)
+        }
+        self.assertEqual(len(summaries), 3)
+
+        doc = User.objects.get(username='doc')
+        dopey = User.objects.get(username='dopey')
+        grumpy = User.objects.get(username='grumpy')
+
+        self.assertEqual(summaries[doc.pk].new_review_count, 1)
+        self.assertIsNotNone(summaries[doc.pk].last_visited)
+
+        self.assertTrue(summaries[dopey.pk].has_published_reviews)
+        self.assertTrue(summaries[dopey.pk].has_ship_it_reviews)
+        self.assertIsNone(summaries[dopey.pk].last_visited)
+
+        self.assertTrue(summaries[grumpy.pk].has_draft_reviews)
+        self.assertFalse(summaries[grumpy.pk].has_published_reviews)
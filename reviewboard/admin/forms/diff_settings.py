@@ -39,6 +39,17 @@ class DiffSettingsForm(SiteSettingsForm):
         required=False,
         widget=forms.TextInput(attrs={'size': '5'}))
 
+    diffviewer_syntax_highlighting_viewport_threshold = forms.IntegerField(
+        label=_('Max lines for full syntax highlighting'),
+        help_text=_(
+            'Files with lines greater than this number will only have the '
+            'lines being shown syntax-highlighted. Collapsed lines are '
+            'highlighted when expanded. Enter 0 to always highlight entire '
+            'files.'
+        ),
+        required=False,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
     diffviewer_custom_pygments_lexers = ListEditDictionaryField(
         label=_('Custom file highlighting'),
         help_text=_(
@@ -235,6 +246,7 @@ class DiffSettingsForm(SiteSettingsForm):
                     'diffviewer_max_diff_size',
                     'diffviewer_max_binary_size',
                     'diffviewer_syntax_highlighting_threshold',
+                    'diffviewer_syntax_highlighting_viewport_threshold',
                 ),
             },
             {
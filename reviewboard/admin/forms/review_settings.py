@@ -30,6 +30,18 @@ class ReviewSettingsForm(SiteSettingsForm):
         required=False,
     )
 
+    reviews_page_max_loaded_reviews = forms.IntegerField(
+        label=_('Maximum reviews to load with the review request page'),
+        help_text=_(
+            'On review requests with more reviews than this, only the most '
+            'recently active reviews and reviews with open issues will be '
+            'loaded with the page. Other reviews will be shown collapsed, '
+            'and loaded when expanded. Enter 0 to always load all reviews.'
+        ),
+        min_value=0,
+        required=False,
+        widget=forms.TextInput(attrs={'size': '5'}))
+
     class Meta:
         """Metadata for the form."""
 
@@ -133,23 +133,37 @@ defaults.update({
     'client_web_login': True,
     'sso_auto_login_backend': '',
 
+    # File attachment settings
+    'attachments_deduplicate_files': False,
+    'attachments_thumbnails_pregenerate_enabled': False,
+    'attachments_thumbnails_pregenerate_max_pending': 50,
+    'attachments_thumbnails_pregenerate_max_workers': 2,
+
     # Reviews settings
     'default_use_rich_text': True,
     'reviews_allow_self_shipit': True,
+    'reviews_page_max_loaded_reviews': 0,
 
     # Diff Viewer settings
     'code_safety_checkers': {},
     'diffviewer_context_num_lines': 5,
     'diffviewer_default_tab_size': DiffSettings.DEFAULT_TAB_SIZE,
+    'diffviewer_file_fetch_max_workers': 4,
     'diffviewer_include_space_patterns': [],
     'diffviewer_max_binary_size': 10_485_760,
     'diffviewer_max_diff_size': 2_097_152,
     'diffviewer_paginate_by': 20,
     'diffviewer_paginate_orphans': 10,
+    'diffviewer_prerender_enabled': False,
+    'diffviewer_prerender_max_lines': 50_000,
+    'diffviewer_prerender_max_pending': 20,
+    'diffviewer_prerender_max_workers': 2,
     'diffviewer_syntax_highlighting': True,
     'diffviewer_syntax_highlighting_threshold': 20_000,
+    'diffviewer_syntax_highlighting_viewport_threshold': 5_000,
     'diffviewer_custom_pygments_lexers': {'.less': 'LessCss'},
     'diffviewer_show_trailing_whitespace': True,
+    'diffviewer_treesitter_preload_languages': [],
 
     # E-mail settings
     'mail_send_review_mail': False,
@@ -157,6 +171,9 @@ defaults.update({
     'mail_send_password_changed_mail': False,
     'mail_enable_autogenerated_header': True,
     'mail_from_spoofing': EmailMessage.FROM_SPOOFING_SMART,
+    'mail_outbox_enabled': False,
+    'mail_outbox_flush_delay': 2,
+    'mail_outbox_max_batch_size': 100,
 
     # The number of days in which client API tokens should expire
     # after creation.
@@ -174,6 +191,21 @@ defaults.update({
     'search_backend_id': WhooshBackend.search_backend_id,
     'search_backend_settings': {},
     'search_on_the_fly_indexing': False,
+    'search_index_batching_enabled': False,
+    'search_index_flush_interval': 0,
+
+    # WebHook settings.
+    'webhooks_async_delivery_enabled': False,
+    'webhooks_delivery_max_attempts': 5,
+    'webhooks_delivery_max_workers': 4,
+    'webhooks_delivery_retry_delay': 30,
+    'webhooks_delivery_timeout': 10,
+
+    # Review request update notification settings.
+    'updates_push_enabled': False,
+    'updates_push_heartbeat_interval': 15,
+    'updates_push_max_duration': 60,
+    'updates_push_max_streams': 5,
 
     # Overwrite this.
     'site_media_url': f'{settings.SITE_ROOT}media/',
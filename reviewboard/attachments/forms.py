@@ -18,7 +18,6 @@ from reviewboard.attachments.mimetypes import get_uploaded_file_mimetype
 from reviewboard.attachments.models import (FileAttachment,
                                             FileAttachmentHistory)
 from reviewboard.deprecation import RemovedInReviewBoard90Warning
-from reviewboard.diffviewer.diffutils import get_sha256
 from reviewboard.reviews.models import ReviewRequestDraft
 
 if TYPE_CHECKING:
@@ -136,7 +135,6 @@ class UploadFileForm(forms.Form):
         if not extra_data:
             extra_data = {}
 
-        extra_data['sha256_checksum'] = get_sha256(file_obj)
         extra_data[FileAttachment.DEFINED_LOCAL_SITE_KEY] = True
 
         mimetype = get_uploaded_file_mimetype(file_obj)
@@ -196,7 +194,9 @@ class UploadFileForm(forms.Form):
             file_attachment = FileAttachment(**attachment_kwargs)
 
         file_attachment._review_request = review_request
-        file_attachment.file.save(filename, file_obj, save=True)
+        file_attachment.save_file(filename=filename,
+                                  content=file_obj,
+                                  compute_checksum=True)
 
         if not filediff:
             draft = ReviewRequestDraft.create(review_request)
@@ -259,7 +259,8 @@ class UploadUserFileForm(forms.Form):
             })
 
             file_attachment = FileAttachment(**attachment_kwargs)
-            file_attachment.file.save(filename, file_obj, save=True)
+            file_attachment.save_file(filename=filename,
+                                      content=file_obj)
         else:
             attachment_kwargs['caption'] = self.cleaned_data['caption'] or ''
 
@@ -289,8 +290,9 @@ class UploadUserFileForm(forms.Form):
         if file_obj:
             file_attachment.mimetype = get_uploaded_file_mimetype(file_obj)
             file_attachment.orig_filename = os.path.basename(file_obj.name)
-            file_attachment.file.save(get_unique_filename(file_obj.name),
-                                      file_obj, save=True)
+            file_attachment.save_file(
+                filename=get_unique_filename(file_obj.name),
+                content=file_obj)
 
         if extra_data:
             file_attachment.extra_data.update(extra_data)
@@ -0,0 +1,126 @@
+"""Management command to generate file attachment thumbnails.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.translation import gettext as _
+
+from reviewboard.attachments.models import FileAttachment
+from reviewboard.attachments.thumbnails import (generate_thumbnail_images,
+                                                needs_thumbnail_images)
+
+
+class Command(BaseCommand):
+    """Management command to generate file attachment thumbnails.
+
+    Thumbnails are normally generated in the background when files are
+    uploaded. This can be used to generate them for existing file
+    attachments, so that they don't need to be generated when first viewed.
+
+    Version Added:
+        9.0
+    """
+
+    help = _(
+        'Generate and record thumbnail images for file attachments that '
+        'don\'t yet have them.'
+    )
+
+    #: The number of file attachments to load at a time.
+    BATCH_SIZE = 100
+
+    def add_arguments(
+        self,
+        parser: argparse.ArgumentParser,
+    ) -> None:
+        """Add arguments to the command.
+
+        Args:
+            parser (argparse.ArgumentParser):
+                The argument parser for the command.
+        """
+        parser.add_argument(
+            'file_attachment_ids',
+            metavar='FILE_ATTACHMENT_ID',
+            nargs='*',
+            type=int,
+            help=_('Specific file attachment IDs to generate thumbnails '
+                   'for.'))
+        parser.add_argument(
+            '-a',
+            '--all',
+            action='store_true',
+            default=False,
+            dest='all',
+            help=_('Generate thumbnails for all file attachments.'))
+
+    def handle(
+        self,
+        **options,
+    ) -> None:
+        """Handle the command.
+
+        Args:
+            **options (dict):
+                Options parsed on the command line.
+
+        Raises:
+            django.core.management.CommandError:
+                There was an error with the provided options.
+        """
+        file_attachment_ids: list[int] = options['file_attachment_ids']
+        generate_all: bool = options['all']
+
+        file_attachments = (
+            FileAttachment.objects
+            .exclude(file='')
+            .order_by('pk')
+        )
+
+        if generate_all:
+            if file_attachment_ids:
+                raise CommandError(
+                    _('File attachment IDs cannot be used with --all.'))
+        elif file_attachment_ids:
+            file_attachments = file_attachments.filter(
+                pk__in=file_attachment_ids)
+        else:
+            raise CommandError(
+                _('One or more file attachment IDs must be provided, or '
+                  '--all must be used.'))
+
+        num_generated = 0
+        num_failed = 0
+
+        for file_attachment in file_attachments.iterator(
+            chunk_size=self.BATCH_SIZE,
+        ):
+            if not needs_thumbnail_images(file_attachment):
+                continue
+
+            try:
+                if generate_thumbnail_images(file_attachment):
+                    num_generated += 1
+            except Exception as e:
+                num_failed += 1
+                self.stderr.write(
+                    _('Unable to generate thumbnails for file attachment '
+                      '%(id)s: %(error)s')
+                    % {
+                        'error': e,
+                        'id': file_attachment.pk,
+                    })
+
+        self.stdout.write(
+            _('Generated thumbnails for %(num_generated)s file '
+              'attachment(s). %(num_failed)s failed.')
+            % {
+                'num_failed': num_failed,
+                'num_generated': num_generated,
+            })
@@ -357,6 +357,16 @@ class MimetypeHandler(object):
     #: A list of mimetypes supported by this handler.
     supported_mimetypes: ClassVar[list[str]] = []
 
+    #: Whether this handler supports generating thumbnail images.
+    #:
+    #: Handlers that override :py:meth:`generate_thumbnail_image` should set
+    #: this to ``True``, allowing thumbnails to be generated in the
+    #: background when files are uploaded.
+    #:
+    #: Version Added:
+    #:     9.0
+    supports_thumbnail_images: ClassVar[bool] = False
+
     #: Whether HD thumbnails are provided by this handler.
     #:
     #: Subclasses (especially in extensions) can use this to introspect what
@@ -544,9 +554,51 @@ class MimetypeHandler(object):
             raise ValueError(
                 _('Either a thumbnail width or height must be provided.'))
 
+        if width and not height:
+            url = self._get_recorded_thumbnail_image_url(width)
+
+            if url:
+                return url
+
         return self.generate_thumbnail_image(width=width,
                                              height=height)
 
+    def generate_thumbnail_images(self) -> dict[int, str]:
+        """Generate thumbnails for all supported scales.
+
+        This will generate a thumbnail for each scale in
+        :py:attr:`THUMBNAIL_IMAGE_SCALES`, based on
+        :py:attr:`BASE_THUMBNAIL_IMAGE_WIDTH`. Any thumbnails that already
+        exist will be reused.
+
+        Version Added:
+            9.0
+
+        Raises:
+            NotImplementedError:
+                The mimetype handler does not support thumbnail images.
+
+        Returns:
+            dict:
+            A mapping of thumbnail widths to file names in storage.
+            Thumbnails that could not be generated, or whose names aren't
+            known, will not be included.
+        """
+        base_size = self.BASE_THUMBNAIL_IMAGE_WIDTH
+        storage = self.attachment.file.storage
+        names: dict[int, str] = {}
+
+        for scale in self.THUMBNAIL_IMAGE_SCALES:
+            width = base_size * scale
+
+            if self.generate_thumbnail_image(width=width):
+                name = self._get_thumbnail_image_name(width)
+
+                if name and storage.exists(name):
+                    names[width] = name
+
+        return names
+
     def generate_thumbnail_image(
         self,
         *,
@@ -606,6 +658,70 @@ class MimetypeHandler(object):
         """
         pass
 
+    def _get_thumbnail_image_name(
+        self,
+        width: int,
+    ) -> str | None:
+        """Return the file name in storage for a thumbnail of a given width.
+
+        Subclasses that support thumbnail images can implement this to let
+        thumbnails generated in the background be looked up without checking
+        file storage.
+
+        Version Added:
+            9.0
+
+        Args:
+            width (int):
+                The width of the thumbnail.
+
+        Returns:
+            str:
+            The name of the thumbnail in storage, or ``None`` if not known.
+        """
+        return None
+
+    def _get_recorded_thumbnail_image_url(
+        self,
+        width: int,
+    ) -> str | None:
+        """Return a previously-generated thumbnail URL for a width.
+
+        This looks up the thumbnails recorded when thumbnails were generated
+        in the background. Thumbnails recorded for a previous version of the
+        attachment's file are ignored.
+
+        File names are recorded instead of URLs, since storage backends may
+        return URLs that expire.
+
+        Version Added:
+            9.0
+
+        Args:
+            width (int):
+                The width of the thumbnail.
+
+        Returns:
+            str:
+            The URL to the thumbnail, or ``None`` if one was not recorded.
+        """
+        attachment = self.attachment
+        file = attachment.file
+        thumbnail_images = (attachment.extra_data or {}).get(
+            attachment.THUMBNAIL_IMAGES_KEY)
+
+        if (not thumbnail_images or
+            not file or
+            thumbnail_images.get('file') != file.name):
+            return None
+
+        name = thumbnail_images.get('names', {}).get(str(width))
+
+        if not name:
+            return None
+
+        return file.storage.url(name)
+
     def _get_mimetype_file(self, name):
         return '%s/%s.png' % (self.MIMETYPES_DIR, name)
 
@@ -614,6 +730,7 @@ class ImageMimetype(MimetypeHandler):
     """Handles image mimetypes."""
 
     supported_mimetypes = ['image/*']
+    supports_thumbnail_images = True
 
     def get_thumbnail(self):
         """Return a thumbnail of the image.
@@ -696,6 +813,33 @@ class ImageMimetype(MimetypeHandler):
                          size=(width, height),
                          create_if_missing=create_if_missing)
 
+    def _get_thumbnail_image_name(
+        self,
+        width: int,
+    ) -> str | None:
+        """Return the file name in storage for a thumbnail of a given width.
+
+        Version Added:
+            9.0
+
+        Args:
+            width (int):
+                The width of the thumbnail.
+
+        Returns:
+            str:
+            The name of the thumbnail in storage, or ``None`` if not known.
+        """
+        file = self.attachment.file
+
+        if not file or not file.name:
+            return None
+
+        # This matches the naming used by djblets's thumbnail().
+        basename, ext = os.path.splitext(file.name)
+
+        return f'{basename}_{width}{ext}'
+
     def delete_associated_files(self) -> None:
         """Delete the thumbnail files for this attachment.
 
@@ -829,10 +973,20 @@ class TextMimetype(MimetypeHandler):
         # reload to:
         # 1) re-read the file attachment
         # 2) re-generate the html based on the data read
-        return mark_safe(
-            cache_memoize('file-attachment-thumbnail-%s-html-%s'
-                          % (self.__class__.__name__, self.attachment.pk),
-                          self._generate_thumbnail))
+        #
+        # If the content's checksum is known, the thumbnail is shared by all
+        # attachments with the same content.
+        attachment = self.attachment
+        checksum = (attachment.extra_data or {}).get('sha256_checksum')
+
+        if checksum:
+            cache_key = ('file-attachment-thumbnail-%s-html-sha256-%s'
+                         % (self.__class__.__name__, checksum))
+        else:
+            cache_key = ('file-attachment-thumbnail-%s-html-%s'
+                         % (self.__class__.__name__, attachment.pk))
+
+        return mark_safe(cache_memoize(cache_key, self._generate_thumbnail))
 
 
 class ReStructuredTextMimetype(TextMimetype):
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 from collections.abc import Sequence
 from inspect import signature
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.core.files import File
+from django.db import DEFAULT_DB_ALIAS, models, transaction
 from django.db.models import Max
 from django.utils.translation import gettext_lazy as _
 from djblets.db.fields import JSONField, RelationCounterField
+from djblets.siteconfig.models import SiteConfiguration
 from djblets.util.decorators import cached_property
 
 from reviewboard.admin.server import build_server_url
@@ -29,12 +33,98 @@ from reviewboard.site.urlresolvers import local_site_reverse
 if TYPE_CHECKING:
     from typing import ClassVar, TypeAlias
 
+    from django.core.files.storage import Storage
+
     from reviewboard.reviews.models import ReviewRequest
 
 
 logger = logging.getLogger(__name__)
 
 
+class _HashingFile(File):
+    """A file wrapper that computes a SHA256 checksum as it's read.
+
+    This lets the checksum of an upload be computed while storage writes
+    it, instead of reading it in a separate pass.
+
+    Version Added:
+        9.0
+    """
+
+    def __init__(
+        self,
+        file: File,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            file (django.core.files.File):
+                The file to wrap.
+        """
+        super().__init__(file, name=file.name)
+
+        self._sha256 = hashlib.sha256()
+        self._num_bytes = 0
+
+    def read(self, *args, **kwargs) -> bytes:
+        """Read from the file, hashing the data that was read.
+
+        Args:
+            *args (tuple):
+                Positional arguments to pass to the file's ``read()``.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the file's ``read()``.
+
+        Returns:
+            bytes:
+            The data that was read.
+        """
+        data = self.file.read(*args, **kwargs)
+        self._sha256.update(data)
+        self._num_bytes += len(data)
+
+        return data
+
+    def seek(self, *args, **kwargs) -> int:
+        """Seek within the file.
+
+        Seeking back to the start of the file restarts the checksum, since
+        the content will be read again.
+
+        Args:
+            *args (tuple):
+                Positional arguments to pass to the file's ``seek()``.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the file's ``seek()``.
+
+        Returns:
+            int:
+            The new position in the file.
+        """
+        pos = self.file.seek(*args, **kwargs)
+
+        if pos == 0:
+            self._sha256 = hashlib.sha256()
+            self._num_bytes = 0
+
+        return pos
+
+    def get_checksum(self) -> str | None:
+        """Return the checksum of the content that was read.
+
+        Returns:
+            str:
+            The SHA256 checksum, or ``None`` if the content wasn't read
+            from start to finish.
+        """
+        if self._num_bytes != self.size:
+            return None
+
+        return self._sha256.hexdigest()
+
+
 class FileAttachmentHistory(models.Model):
     """Revision history for a single file attachment.
 
@@ -162,6 +252,31 @@ class FileAttachment(models.Model):
     #:     8.1
     DEFINED_LOCAL_SITE_KEY = '__defined_local_site'
 
+    #: The extra_data key storing pre-generated thumbnail images.
+    #:
+    #: This is a dictionary with the following keys:
+    #:
+    #: ``file`` (:py:class:`str`):
+    #:     The storage name of the file the thumbnails were generated from.
+    #:
+    #: ``names`` (:py:class:`dict`):
+    #:     A mapping of thumbnail widths (as strings) to the storage names
+    #:     of the thumbnails. These are not URLs. They must be passed to the
+    #:     file storage's ``url()`` method to get URLs.
+    #:
+    #: Version Added:
+    #:     9.0
+    THUMBNAIL_IMAGES_KEY = '__thumbnail_images'
+
+    #: The storage directory for content-addressed files.
+    #:
+    #: Files stored here are named by the SHA256 hash of their content, and
+    #: may be shared by multiple file attachments.
+    #:
+    #: Version Added:
+    #:     9.0
+    SHARED_FILES_DIR = os.path.join('uploaded', 'files', 'blobs')
+
     @property
     def mimetype_handler(self):
         """Return the mimetype handler for this file."""
@@ -290,6 +405,416 @@ class FileAttachment(models.Model):
 
         return checksum
 
+    @property
+    def uses_shared_file(self) -> bool:
+        """Whether the file is in content-addressed storage.
+
+        Shared files may be referenced by other file attachments with the
+        same content, and are only deleted once no attachments reference
+        them.
+
+        Version Added:
+            9.0
+
+        Type:
+            bool
+        """
+        file = self.file
+
+        return bool(file and
+                    file.name and
+                    file.name.startswith(self.SHARED_FILES_DIR + os.sep))
+
+    def save_file(
+        self,
+        *,
+        filename: str,
+        content: File,
+        checksum: (str | None) = None,
+        compute_checksum: bool = False,
+        save: bool = True,
+    ) -> None:
+        """Store new content for the attachment's file.
+
+        If the ``attachments_deduplicate_files`` site configuration setting
+        is enabled, the file will be stored by the SHA256 checksum of its
+        content in :py:attr:`SHARED_FILES_DIR`. Any existing file with the
+        same content will be shared instead of storing a new copy, along
+        with any thumbnails already generated for it.
+
+        Checksums are computed from the content as it's written to storage,
+        rather than reading the content in a separate pass. The checksum, if
+        provided or computed, is recorded in :py:attr:`extra_data`.
+
+        If the attachment is saved and was previously using a shared file,
+        its reference to that file is released.
+
+        If the file is shared, this checks again once the attachment's row
+        is committed that the file wasn't deleted in the meantime by the
+        release of another attachment's reference. If it was, it's stored
+        again from ``content``.
+
+        Version Added:
+            9.0
+
+        Args:
+            filename (str):
+                The filename to store the file as, if not deduplicating.
+                The file extension is used for deduplicated files.
+
+            content (django.core.files.File):
+                The content of the file.
+
+            checksum (str, optional):
+                A pre-computed SHA256 checksum of the content. If not
+                provided, this will be computed when deduplicating files
+                or when ``compute_checksum`` is set.
+
+            compute_checksum (bool, optional):
+                Whether to compute and record the checksum when not
+                deduplicating files.
+
+            save (bool, optional):
+                Whether to save the attachment after storing the file.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        old_file_attachment: (FileAttachment | None) = None
+
+        if save and self.pk is not None and self.uses_shared_file:
+            # Fetch the stored state, so the old file's thumbnails can be
+            # found even if the mimetype is being changed.
+            old_file_attachment = (
+                FileAttachment.objects
+                .filter(pk=self.pk)
+                .only('file', 'mimetype')
+                .first()
+            )
+
+        if siteconfig.get('attachments_deduplicate_files'):
+            checksum = self._save_shared_file(
+                ext=os.path.splitext(filename)[1].lower(),
+                content=content,
+                checksum=checksum)
+        elif checksum is None and compute_checksum:
+            hashing_content = _HashingFile(content)
+            self.file.save(filename, hashing_content, save=False)
+            checksum = hashing_content.get_checksum()
+
+            if checksum is None:
+                # The storage backend didn't read the content sequentially,
+                # so fall back to hashing the stored file.
+                checksum = self._get_stored_checksum(self.file.name)
+        else:
+            self.file.save(filename, content, save=False)
+
+        if checksum is not None:
+            if self.extra_data is None:
+                self.extra_data = {}
+
+            self.extra_data['sha256_checksum'] = checksum
+            self.__dict__.pop('sha256_checksum', None)
+
+        if save:
+            self.save()
+
+            if self.uses_shared_file:
+                shared_name = self.file.name
+
+                transaction.on_commit(
+                    lambda: self._restore_shared_file(
+                        shared_name=shared_name,
+                        content=content))
+
+            if (old_file_attachment is not None and
+                old_file_attachment.file.name != self.file.name):
+                old_file_attachment.release_shared_file()
+
+    def release_shared_file(
+        self,
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> None:
+        """Release the attachment's reference to its shared file.
+
+        This is called once the attachment no longer references its shared
+        file, either because it was deleted or because its file was
+        replaced.
+
+        Once the current transaction commits, the file and any associated
+        files, such as thumbnails, are deleted if no other attachments
+        reference it. Nothing is deleted if the transaction is rolled back.
+
+        Version Added:
+            9.0
+
+        Args:
+            using (str, optional):
+                The database alias to use.
+        """
+        if self.uses_shared_file:
+            transaction.on_commit(
+                lambda: self._delete_unreferenced_shared_file(using=using),
+                using=using)
+
+    def _delete_unreferenced_shared_file(
+        self,
+        *,
+        using: str,
+    ) -> None:
+        """Delete the shared file if no attachments reference it.
+
+        The attachments referencing the file are locked while checking and
+        deleting, so an upload of the same content re-checking the file in
+        :py:meth:`_restore_shared_file` waits until this is done.
+
+        Version Added:
+            9.0
+
+        Args:
+            using (str):
+                The database alias to use.
+        """
+        with transaction.atomic(using=using):
+            referencing_ids = list(
+                FileAttachment.objects
+                .using(using)
+                .select_for_update()
+                .filter(file=self.file.name)
+                .values_list('pk', flat=True)
+            )
+
+            if referencing_ids:
+                return
+
+            handler = self.mimetype_handler
+
+            if handler:
+                handler.delete_associated_files()
+
+            self.file.delete(save=False)
+
+    def _restore_shared_file(
+        self,
+        *,
+        shared_name: str,
+        content: File,
+    ) -> None:
+        """Store the shared file again if it was deleted.
+
+        An upload may find an existing shared file just before the last
+        attachment referencing it is deleted. Until the upload's row is
+        committed, the deletion can't see it, and will delete the file.
+        This is called once the row is committed, and stores the file again
+        if that happened.
+
+        Any thumbnails recorded for the file were deleted along with it, so
+        they're cleared to be generated again.
+
+        Version Added:
+            9.0
+
+        Args:
+            shared_name (str):
+                The name of the shared file.
+
+            content (django.core.files.File):
+                The content of the file.
+        """
+        storage = self.file.storage
+
+        with transaction.atomic():
+            # Lock this attachment's row, so that a release of another
+            # attachment's reference waits to check for references until
+            # this is done.
+            list(
+                FileAttachment.objects
+                .select_for_update()
+                .filter(pk=self.pk)
+                .values_list('pk', flat=True)
+            )
+
+            if storage.exists(shared_name):
+                return
+
+            logger.warning('Shared file %s for file attachment %s was '
+                           'deleted while uploading. Storing it again.',
+                           shared_name, self.pk)
+
+            try:
+                content.seek(0)
+                self._store_shared_file(storage=storage,
+                                        shared_name=shared_name,
+                                        content=content)
+            except (OSError, ValueError) as e:
+                logger.error('Unable to store shared file %s again for '
+                             'file attachment %s: %s',
+                             shared_name, self.pk, e)
+                return
+
+            if (self.extra_data and
+                self.extra_data.pop(self.THUMBNAIL_IMAGES_KEY, None)):
+                self.save(update_fields=('extra_data',))
+
+    def _save_shared_file(
+        self,
+        *,
+        ext: str,
+        content: File,
+        checksum: (str | None),
+    ) -> str:
+        """Store content in content-addressed storage.
+
+        If the checksum isn't known, the content is first written to a
+        staging file while hashing it, and then moved into place.
+
+        Version Added:
+            9.0
+
+        Args:
+            ext (str):
+                The file extension to use.
+
+            content (django.core.files.File):
+                The content of the file.
+
+            checksum (str):
+                A pre-computed SHA256 checksum of the content, if known.
+
+        Returns:
+            str:
+            The SHA256 checksum of the content.
+        """
+        storage = self.file.storage
+        staged_name: (str | None) = None
+
+        if checksum is None:
+            hashing_content = _HashingFile(content)
+            staged_name = storage.save(
+                os.path.join(self.SHARED_FILES_DIR, 'incoming',
+                             f'{uuid4().hex}{ext}'),
+                hashing_content)
+            checksum = (hashing_content.get_checksum() or
+                        self._get_stored_checksum(staged_name))
+
+        shared_name = os.path.join(self.SHARED_FILES_DIR,
+                                   checksum[:2],
+                                   checksum[2:4],
+                                   f'{checksum}{ext}')
+
+        if storage.exists(shared_name):
+            if staged_name is not None:
+                storage.delete(staged_name)
+
+            self._share_thumbnail_images(shared_name)
+        elif staged_name is None:
+            self._store_shared_file(storage=storage,
+                                    shared_name=shared_name,
+                                    content=content)
+        else:
+            try:
+                staged_path = storage.path(staged_name)
+                shared_path = storage.path(shared_name)
+            except NotImplementedError:
+                # This storage has no local paths to move between, so the
+                # staged file has to be copied into place.
+                try:
+                    with storage.open(staged_name, 'rb') as fp:
+                        self._store_shared_file(storage=storage,
+                                                shared_name=shared_name,
+                                                content=File(fp))
+                finally:
+                    storage.delete(staged_name)
+            else:
+                # This is atomic, and safe if another upload with the same
+                # content got there first.
+                os.makedirs(os.path.dirname(shared_path), exist_ok=True)
+                os.replace(staged_path, shared_path)
+
+        self.file.name = shared_name
+
+        return checksum
+
+    def _store_shared_file(
+        self,
+        *,
+        storage: Storage,
+        shared_name: str,
+        content: File,
+    ) -> None:
+        """Write content to a file in content-addressed storage.
+
+        If another upload stored the same content at the same time, storage
+        may pick a different name for this copy. That copy is deleted, and
+        the existing file is used instead.
+
+        Version Added:
+            9.0
+
+        Args:
+            storage (django.core.files.storage.Storage):
+                The storage for the file.
+
+            shared_name (str):
+                The name of the file in content-addressed storage.
+
+            content (django.core.files.File):
+                The content of the file.
+        """
+        saved_name = storage.save(shared_name, content)
+
+        if saved_name != shared_name:
+            storage.delete(saved_name)
+
+    def _share_thumbnail_images(
+        self,
+        shared_name: str,
+    ) -> None:
+        """Copy recorded thumbnails from another attachment sharing a file.
+
+        Version Added:
+            9.0
+
+        Args:
+            shared_name (str):
+                The name of the shared file.
+        """
+        other = (
+            FileAttachment.objects
+            .filter(file=shared_name)
+            .exclude(pk=self.pk)
+            .only('extra_data')
+            .first()
+        )
+
+        if other is not None and other.extra_data:
+            thumbnail_images = other.extra_data.get(self.THUMBNAIL_IMAGES_KEY)
+
+            if thumbnail_images:
+                if self.extra_data is None:
+                    self.extra_data = {}
+
+                self.extra_data[self.THUMBNAIL_IMAGES_KEY] = thumbnail_images
+
+    def _get_stored_checksum(
+        self,
+        name: str,
+    ) -> str:
+        """Return the SHA256 checksum of a stored file.
+
+        Version Added:
+            9.0
+
+        Args:
+            name (str):
+                The name of the file in storage.
+
+        Returns:
+            str:
+            The SHA256 checksum of the file.
+        """
+        with self.file.storage.open(name, 'rb') as fp:
+            return get_sha256(File(fp))
+
     def __str__(self):
         """Return a string representation of this file for the admin list."""
         return self.caption
@@ -6,9 +6,10 @@ Version Added:
 
 from __future__ import annotations
 
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 
 from reviewboard.attachments.models import FileAttachment
+from reviewboard.attachments.thumbnails import thumbnail_generator
 
 
 def _on_file_attachment_deleted(
@@ -22,9 +23,16 @@ def _on_file_attachment_deleted(
     This will ensure that any files associated with the file attachment
     are removed from the filesystem.
 
+    Shared files are handled by :py:func:`_on_shared_file_attachment_deleted`
+    instead, once the attachment has been removed from the database.
+
     Version Added:
         6.0
 
+    Version Changed:
+        9.0:
+        Shared files in content-addressed storage are no longer deleted here.
+
     Args:
         sender (type, unused):
             The sender of the signal.
@@ -38,12 +46,83 @@ def _on_file_attachment_deleted(
         **kwargs (dict, unused):
             Unused additional keyword arguments.
     """
-    handler = instance.mimetype_handler
+    if not instance.uses_shared_file:
+        handler = instance.mimetype_handler
+
+        if handler:
+            handler.delete_associated_files()
+
+        instance.file.delete(save=False)
+
+
+def _on_shared_file_attachment_deleted(
+    sender: type[FileAttachment],
+    instance: FileAttachment,
+    using: str,
+    **kwargs,
+) -> None:
+    """Delete a shared file once it's no longer referenced.
+
+    Files in content-addressed storage may be shared by multiple file
+    attachments. They're reference-counted by the attachments pointing to
+    them, and deleted along with their thumbnails once the last of those
+    attachments is deleted.
 
-    if handler:
-        handler.delete_associated_files()
+    This runs after the attachment is removed from the database, so that
+    deleting several attachments sharing a file at once still deletes it.
+    The file is only deleted once the transaction commits, so a deletion
+    that's rolled back leaves it in place.
 
-    instance.file.delete(save=False)
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The sender of the signal.
+
+        instance (reviewboard.attachments.models.FileAttachment):
+            The file attachment that was deleted.
+
+        using (str):
+            The database alias being used.
+
+        **kwargs (dict, unused):
+            Unused additional keyword arguments.
+    """
+    instance.release_shared_file(using=using)
+
+
+def _on_file_attachment_saved(
+    sender: type[FileAttachment],
+    instance: FileAttachment,
+    raw: bool = False,
+    **kwargs,
+) -> None:
+    """Queue thumbnail generation when a file attachment is saved.
+
+    If the attachment has a new file that supports image thumbnails, the
+    thumbnails will be generated in the background once the transaction
+    commits.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The sender of the signal.
+
+        instance (reviewboard.attachments.models.FileAttachment):
+            The file attachment that was saved.
+
+        raw (bool, optional):
+            Whether the attachment was saved as-is, such as when loading
+            fixtures.
+
+        **kwargs (dict, unused):
+            Unused additional keyword arguments.
+    """
+    if not raw:
+        thumbnail_generator.queue_file_attachment(instance)
 
 
 def connect_signal_handlers() -> None:
@@ -52,5 +131,9 @@ def connect_signal_handlers() -> None:
     Version Added:
         6.0
     """
+    post_save.connect(_on_file_attachment_saved,
+                      sender=FileAttachment)
     pre_delete.connect(_on_file_attachment_deleted,
                        sender=FileAttachment)
+    post_delete.connect(_on_shared_file_attachment_deleted,
+                        sender=FileAttachment)
@@ -15,6 +15,7 @@ import kgb
 from django_assert_queries.testing import assert_queries
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.db.models import Q
 from djblets.testing.decorators import add_fixtures
 
@@ -22,6 +23,8 @@ from reviewboard.attachments.forms import UploadFileForm
 from reviewboard.attachments.models import (FileAttachment,
                                             FileAttachmentHistory)
 from reviewboard.attachments.tests.base import BaseFileAttachmentTestCase
+from reviewboard.attachments.thumbnails import (generate_thumbnail_images,
+                                                needs_thumbnail_images)
 from reviewboard.reviews.models import ReviewRequest, ReviewRequestDraft
 from reviewboard.reviews.ui.image import ImageReviewUI
 from reviewboard.site.models import LocalSite
@@ -380,6 +383,152 @@ class FileAttachmentTests(kgb.SpyAgency, BaseFileAttachmentTestCase):
         self.assertTrue(
             file_attachment.extra_data[self.DEFINED_LOCAL_SITE_KEY])
 
+    def test_upload_file_with_deduplicate_files(self) -> None:
+        """Testing uploading file attachments with identical content and
+        attachments_deduplicate_files enabled
+        """
+        review_request = self.create_review_request()
+        file_attachments: list[FileAttachment] = []
+
+        with self.siteconfig_settings({
+                'attachments_deduplicate_files': True,
+            }):
+            for i in range(2):
+                form = UploadFileForm(
+                    review_request,
+                    files={'path': self.make_uploaded_file()})
+                self.assertTrue(form.is_valid())
+
+                file_attachments.append(form.create())
+
+        file_attachment1, file_attachment2 = file_attachments
+        file = file_attachment1.file
+        storage = file.storage
+
+        self.assertTrue(file_attachment1.uses_shared_file)
+        self.assertEqual(
+            file.name,
+            os.path.join(FileAttachment.SHARED_FILES_DIR, '19', '31',
+                         '1931a3b367e2913d28f9587dbd0ccf79b2c'
+                         '2225de7c47550dd1cc49085077e49.png'))
+        self.assertEqual(file_attachment2.file.name, file.name)
+        self.assertEqual(file_attachment2.extra_data['sha256_checksum'],
+                         file_attachment1.extra_data['sha256_checksum'])
+
+        # The shared file should remain until nothing references it.
+        with self.captureOnCommitCallbacks(execute=True):
+            file_attachment1.delete()
+
+        self.assertTrue(storage.exists(file.name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            file_attachment2.delete()
+
+        self.assertFalse(storage.exists(file.name))
+
+    def test_delete_with_shared_file_and_rollback(self) -> None:
+        """Testing FileAttachment.delete with a shared file keeps the file
+        if the transaction is rolled back
+        """
+        review_request = self.create_review_request()
+
+        with self.siteconfig_settings({
+                'attachments_deduplicate_files': True,
+            }):
+            form = UploadFileForm(review_request,
+                                  files={'path': self.make_uploaded_file()})
+            self.assertTrue(form.is_valid())
+
+            file_attachment = form.create()
+
+        file = file_attachment.file
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    file_attachment.delete()
+
+                    raise ValueError('Roll back')
+            except ValueError:
+                pass
+
+        self.assertEqual(callbacks, [])
+        self.assertTrue(FileAttachment.objects.filter(
+            pk=file_attachment.pk).exists())
+        self.assertTrue(file.storage.exists(file.name))
+
+    def test_upload_file_with_deduplicate_files_restores_deleted_file(
+        self,
+    ) -> None:
+        """Testing uploading a file attachment with
+        attachments_deduplicate_files enabled stores the shared file again
+        if it's deleted before the upload commits
+        """
+        review_request = self.create_review_request()
+
+        with self.siteconfig_settings({
+                'attachments_deduplicate_files': True,
+            }):
+            form = UploadFileForm(review_request,
+                                  files={'path': self.make_uploaded_file()})
+            self.assertTrue(form.is_valid())
+
+            file_attachment1 = form.create()
+            file = file_attachment1.file
+            storage = file.storage
+
+            form = UploadFileForm(review_request,
+                                  files={'path': self.make_uploaded_file()})
+            self.assertTrue(form.is_valid())
+
+            with self.captureOnCommitCallbacks() as callbacks:
+                file_attachment2 = form.create()
+
+        self.assertEqual(file_attachment2.file.name, file.name)
+
+        # Simulate the release of the first attachment's reference deleting
+        # the file before the second attachment's row was committed.
+        storage.delete(file.name)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertTrue(storage.exists(file.name))
+
+        with storage.open(file.name, 'rb') as fp:
+            self.assertEqual(fp.read(),
+                             self.make_uploaded_file().read())
+
+    def test_upload_file_with_deduplicate_files_shares_thumbnails(
+        self,
+    ) -> None:
+        """Testing uploading a file attachment with
+        attachments_deduplicate_files enabled shares existing thumbnails
+        """
+        review_request = self.create_review_request()
+
+        with self.siteconfig_settings({
+                'attachments_deduplicate_files': True,
+            }):
+            form = UploadFileForm(review_request,
+                                  files={'path': self.make_uploaded_file()})
+            self.assertTrue(form.is_valid())
+
+            file_attachment1 = form.create()
+            generate_thumbnail_images(file_attachment1)
+
+            form = UploadFileForm(review_request,
+                                  files={'path': self.make_uploaded_file()})
+            self.assertTrue(form.is_valid())
+
+            file_attachment2 = form.create()
+
+        key = FileAttachment.THUMBNAIL_IMAGES_KEY
+
+        self.assertEqual(file_attachment2.extra_data[key],
+                         file_attachment1.extra_data[key])
+        self.assertFalse(needs_thumbnail_images(file_attachment2))
+
     def test_is_from_diff_with_no_association(self):
         """Testing FileAttachment.is_from_diff with standard attachment"""
         file_attachment = FileAttachment()
@@ -0,0 +1,203 @@
+"""Unit tests for reviewboard.attachments.thumbnails."""
+
+from __future__ import annotations
+
+import os
+from io import StringIO
+
+import kgb
+from django.core.management import call_command
+
+from reviewboard.attachments.mimetypes import ImageMimetype
+from reviewboard.attachments.models import FileAttachment
+from reviewboard.attachments.thumbnails import (ThumbnailGenerator,
+                                                generate_thumbnail_images,
+                                                needs_thumbnail_images)
+from reviewboard.testing import TestCase
+
+
+class ThumbnailImagesTests(kgb.SpyAgency, TestCase):
+    """Unit tests for thumbnail image generation."""
+
+    fixtures = ['test_users']
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+
+        review_request = self.create_review_request(publish=True)
+        self.file_attachment = self.create_file_attachment(review_request)
+
+    def test_generate_thumbnail_images(self) -> None:
+        """Testing generate_thumbnail_images records thumbnails for all
+        scales
+        """
+        file_attachment = self.file_attachment
+        storage = file_attachment.file.storage
+        filename_base = os.path.splitext(file_attachment.file.name)[0]
+
+        self.assertTrue(needs_thumbnail_images(file_attachment))
+        self.assertTrue(generate_thumbnail_images(file_attachment))
+        self.assertFalse(needs_thumbnail_images(file_attachment))
+
+        for width in (300, 600, 900):
+            self.assertTrue(storage.exists(f'{filename_base}_{width}.png'))
+
+        file_attachment = FileAttachment.objects.get(pk=file_attachment.pk)
+        thumbnail_images = \
+            file_attachment.extra_data[FileAttachment.THUMBNAIL_IMAGES_KEY]
+
+        self.assertEqual(thumbnail_images['file'], file_attachment.file.name)
+        self.assertEqual(thumbnail_images['names'], {
+            '300': f'{filename_base}_300.png',
+            '600': f'{filename_base}_600.png',
+            '900': f'{filename_base}_900.png',
+        })
+
+        # Recorded thumbnails shouldn't need to be looked up again.
+        self.spy_on(ImageMimetype.generate_thumbnail_image,
+                    owner=ImageMimetype)
+
+        self.assertEqual(
+            file_attachment.mimetype_handler.get_raw_thumbnail_image_url(
+                width=600),
+            storage.url(f'{filename_base}_600.png'))
+        self.assertSpyNotCalled(ImageMimetype.generate_thumbnail_image)
+
+    def test_generate_thumbnail_images_with_extra_data_changed(self) -> None:
+        """Testing generate_thumbnail_images preserves extra_data changes
+        made while generating thumbnails
+        """
+        file_attachment = self.file_attachment
+
+        # Simulate another process changing the attachment in the meantime.
+        other = FileAttachment.objects.get(pk=file_attachment.pk)
+        other.extra_data['foo'] = 'bar'
+        other.save(update_fields=['extra_data'])
+
+        self.assertTrue(generate_thumbnail_images(file_attachment))
+
+        file_attachment = FileAttachment.objects.get(pk=file_attachment.pk)
+
+        self.assertEqual(file_attachment.extra_data['foo'], 'bar')
+        self.assertIn(FileAttachment.THUMBNAIL_IMAGES_KEY,
+                      file_attachment.extra_data)
+
+    def test_generate_thumbnail_images_with_unsupported(self) -> None:
+        """Testing generate_thumbnail_images with an attachment that doesn't
+        support thumbnail images
+        """
+        file_attachment = self.create_file_attachment(
+            self.create_review_request(),
+            orig_filename='test.txt',
+            mimetype='text/plain',
+            file_content=b'Hello.\n')
+
+        self.assertFalse(needs_thumbnail_images(file_attachment))
+        self.assertFalse(generate_thumbnail_images(file_attachment))
+        self.assertNotIn(FileAttachment.THUMBNAIL_IMAGES_KEY,
+                         file_attachment.extra_data)
+
+    def test_needs_thumbnail_images_with_new_file(self) -> None:
+        """Testing needs_thumbnail_images after the file changes"""
+        file_attachment = self.file_attachment
+        generate_thumbnail_images(file_attachment)
+
+        file_attachment.file.name = 'uploaded/files/new-logo.png'
+
+        self.assertTrue(needs_thumbnail_images(file_attachment))
+        self.assertIsNone(
+            file_attachment.mimetype_handler
+            ._get_recorded_thumbnail_image_url(300))
+
+
+class ThumbnailGeneratorTests(kgb.SpyAgency, TestCase):
+    """Unit tests for ThumbnailGenerator."""
+
+    fixtures = ['test_users']
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+
+        review_request = self.create_review_request(publish=True)
+        self.file_attachment = self.create_file_attachment(review_request)
+        self.generator = ThumbnailGenerator()
+
+    def test_queue_file_attachment(self) -> None:
+        """Testing ThumbnailGenerator.queue_file_attachment"""
+        self.spy_on(generate_thumbnail_images)
+
+        with self.siteconfig_settings({
+                'attachments_thumbnails_pregenerate_enabled': True,
+                'attachments_thumbnails_pregenerate_max_workers': 0,
+            }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertTrue(self.generator.queue_file_attachment(
+                    self.file_attachment))
+
+                # Nothing should run until the transaction commits.
+                self.assertSpyNotCalled(generate_thumbnail_images)
+
+        self.assertSpyCallCount(generate_thumbnail_images, 1)
+        self.assertEqual(self.generator.num_pending, 0)
+        self.assertFalse(needs_thumbnail_images(
+            FileAttachment.objects.get(pk=self.file_attachment.pk)))
+
+    def test_queue_file_attachment_with_disabled(self) -> None:
+        """Testing ThumbnailGenerator.queue_file_attachment with background
+        generation disabled
+        """
+        self.spy_on(generate_thumbnail_images)
+
+        with self.siteconfig_settings({
+                'attachments_thumbnails_pregenerate_enabled': False,
+            }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertFalse(self.generator.queue_file_attachment(
+                    self.file_attachment))
+
+        self.assertSpyNotCalled(generate_thumbnail_images)
+
+    def test_queue_file_attachment_with_max_pending(self) -> None:
+        """Testing ThumbnailGenerator.queue_file_attachment skips
+        attachments past max_pending
+        """
+        self.spy_on(generate_thumbnail_images)
+        self.generator._num_pending = 2
+
+        with self.siteconfig_settings({
+                'attachments_thumbnails_pregenerate_enabled': True,
+                'attachments_thumbnails_pregenerate_max_pending': 2,
+                'attachments_thumbnails_pregenerate_max_workers': 0,
+            }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertTrue(self.generator.queue_file_attachment(
+                    self.file_attachment))
+
+        self.assertSpyNotCalled(generate_thumbnail_images)
+        self.assertEqual(self.generator.num_pending, 2)
+
+
+class GenerateThumbnailsCommandTests(TestCase):
+    """Unit tests for the generate-thumbnails management command."""
+
+    fixtures = ['test_users']
+
+    def test_all(self) -> None:
+        """Testing generate-thumbnails --all"""
+        review_request = self.create_review_request(publish=True)
+        file_attachment = self.create_file_attachment(review_request)
+        self.create_file_attachment(review_request,
+                                    orig_filename='test.txt',
+                                    mimetype='text/plain',
+                                    file_content=b'Hello.\n')
+
+        stdout = StringIO()
+        call_command('generate-thumbnails', '--all', stdout=stdout)
+
+        self.assertIn('Generated thumbnails for 1 file attachment(s). '
+                      '0 failed.',
+                      stdout.getvalue())
+        self.assertFalse(needs_thumbnail_images(
+            FileAttachment.objects.get(pk=file_attachment.pk)))
@@ -14,6 +14,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from django.contrib.auth.models import AnonymousUser, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+
 from reviewboard.attachments.forms import UploadUserFileForm
 from reviewboard.attachments.tests.base import BaseFileAttachmentTestCase
 from reviewboard.site.models import LocalSite
@@ -318,6 +320,41 @@ class UserFileAttachmentTests(kgb.SpyAgency, BaseFileAttachmentTestCase):
             **self.default_expected_extra_data,
         })
 
+    def test_user_file_update_with_deduplicate_files(self) -> None:
+        """Testing user FileAttachment update with
+        attachments_deduplicate_files enabled releases the old shared file
+        """
+        user = User.objects.get(username='doc')
+
+        with self.siteconfig_settings({
+                'attachments_deduplicate_files': True,
+            }):
+            form = UploadUserFileForm(
+                files={'path': self.make_uploaded_file()})
+            self.assertTrue(form.is_valid())
+
+            file_attachment = form.create(user)
+            old_file = file_attachment.file
+            old_name = old_file.name
+            storage = old_file.storage
+
+            self.assertTrue(file_attachment.uses_shared_file)
+            self.assertTrue(storage.exists(old_name))
+
+            form = UploadUserFileForm(files={
+                'path': SimpleUploadedFile('new.txt', b'New content\n',
+                                           content_type='text/plain'),
+            })
+            self.assertTrue(form.is_valid())
+
+            with self.captureOnCommitCallbacks(execute=True):
+                file_attachment = form.update(file_attachment)
+
+        self.assertTrue(file_attachment.uses_shared_file)
+        self.assertNotEqual(file_attachment.file.name, old_name)
+        self.assertTrue(storage.exists(file_attachment.file.name))
+        self.assertFalse(storage.exists(old_name))
+
     def test_user_file_is_accessible_by(self) -> None:
         """Testing user FileAttachment.is_accessible_by"""
         creating_user = User.objects.get(username='doc')
@@ -0,0 +1,224 @@
+"""Background generation of file attachment thumbnail images.
+
+When enabled, newly-uploaded file attachments that support image thumbnails
+will have thumbnails generated for every supported scale on a background
+worker pool, so that the first page load showing the attachment doesn't
+need to decode and resize the full image.
+
+Generated thumbnail file names are recorded in the file attachment's
+:py:attr:`~reviewboard.attachments.models.FileAttachment.extra_data`, letting
+later lookups avoid checking file storage. Attachments without recorded
+thumbnails continue to generate them on demand.
+
+This is controlled by the following site configuration settings:
+
+``attachments_thumbnails_pregenerate_enabled``:
+    Whether to generate thumbnails in the background.
+
+``attachments_thumbnails_pregenerate_max_workers``:
+    The number of worker threads used per process. If ``0``, thumbnails will
+    be generated synchronously when queued.
+
+``attachments_thumbnails_pregenerate_max_pending``:
+    The maximum number of queued or running jobs per process. Any file
+    attachments queued beyond this will be skipped.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+
+from reviewboard.background import BackgroundJobQueue
+
+if TYPE_CHECKING:
+    from reviewboard.attachments.models import FileAttachment
+
+
+logger = logging.getLogger(__name__)
+
+
+def needs_thumbnail_images(
+    file_attachment: FileAttachment,
+) -> bool:
+    """Return whether thumbnail images need to be generated for an attachment.
+
+    This will be ``True`` if the attachment has a file that supports image
+    thumbnails, and thumbnails haven't yet been recorded for that file.
+
+    Args:
+        file_attachment (reviewboard.attachments.models.FileAttachment):
+            The file attachment to check.
+
+    Returns:
+        bool:
+        Whether thumbnail images need to be generated.
+    """
+    file = file_attachment.file
+
+    if not file or not file.name:
+        return False
+
+    mimetype_handler = file_attachment.mimetype_handler
+
+    if (not mimetype_handler or
+        not mimetype_handler.supports_thumbnail_images):
+        return False
+
+    thumbnail_images = (file_attachment.extra_data or {}).get(
+        file_attachment.THUMBNAIL_IMAGES_KEY)
+
+    return (not thumbnail_images or
+            thumbnail_images.get('file') != file.name)
+
+
+def generate_thumbnail_images(
+    file_attachment: FileAttachment,
+) -> bool:
+    """Generate and record thumbnail images for a file attachment.
+
+    Thumbnails will be generated for every supported scale. Any that
+    already exist in file storage will be reused. The resulting file names
+    are then recorded in the attachment's
+    :py:attr:`~reviewboard.attachments.models.FileAttachment.extra_data`.
+
+    Since generating thumbnails may take a while, the attachment is re-read
+    before recording them, and only the thumbnail information is updated.
+    This avoids overwriting any other changes made to the attachment in the
+    meantime.
+
+    Args:
+        file_attachment (reviewboard.attachments.models.FileAttachment):
+            The file attachment to generate thumbnails for.
+
+    Returns:
+        bool:
+        ``True`` if thumbnails were generated. ``False`` if the attachment
+        doesn't support thumbnail images, or was changed or deleted while
+        generating them.
+    """
+    from reviewboard.attachments.models import FileAttachment
+
+    file = file_attachment.file
+    mimetype_handler = file_attachment.mimetype_handler
+
+    if (not file or
+        not file.name or
+        not mimetype_handler or
+        not mimetype_handler.supports_thumbnail_images):
+        return False
+
+    names = mimetype_handler.generate_thumbnail_images()
+    thumbnail_images = {
+        'file': file.name,
+        'names': {
+            str(width): name
+            for width, name in names.items()
+        },
+    }
+
+    with transaction.atomic():
+        try:
+            latest = (
+                FileAttachment.objects
+                .select_for_update()
+                .get(pk=file_attachment.pk)
+            )
+        except FileAttachment.DoesNotExist:
+            return False
+
+        if latest.file.name != file.name:
+            # The file was replaced while generating thumbnails.
+            return False
+
+        if latest.extra_data is None:
+            latest.extra_data = {}
+
+        latest.extra_data[FileAttachment.THUMBNAIL_IMAGES_KEY] = \
+            thumbnail_images
+        latest.save(update_fields=['extra_data'])
+
+    if file_attachment.extra_data is None:
+        file_attachment.extra_data = {}
+
+    file_attachment.extra_data[FileAttachment.THUMBNAIL_IMAGES_KEY] = \
+        thumbnail_images
+
+    return True
+
+
+class ThumbnailGenerator(BackgroundJobQueue):
+    """Manages background generation of file attachment thumbnails.
+
+    Jobs are queued through :py:meth:`queue_file_attachment` and run on a
+    per-process thread pool once the current transaction commits.
+
+    Version Added:
+        9.0
+    """
+
+    siteconfig_prefix = 'attachments_thumbnails_pregenerate'
+    thread_name_prefix = 'rb-attachment-thumbnails'
+
+    def queue_file_attachment(
+        self,
+        file_attachment: FileAttachment,
+    ) -> bool:
+        """Queue a file attachment for thumbnail generation.
+
+        The file attachment will be submitted to the worker pool once the
+        current transaction (if any) commits. If the maximum number of
+        pending jobs has been reached at that point, the file attachment will
+        be skipped, and its thumbnails will be generated on demand.
+
+        Args:
+            file_attachment (reviewboard.attachments.models.FileAttachment):
+                The file attachment to generate thumbnails for.
+
+        Returns:
+            bool:
+            ``True`` if the file attachment was queued. ``False`` if
+            background generation is disabled or the attachment doesn't
+            need thumbnails.
+        """
+        return (needs_thumbnail_images(file_attachment) and
+                self.queue_job(file_attachment.pk))
+
+    def run_job(
+        self,
+        file_attachment_id: int,
+    ) -> None:
+        """Run a thumbnail generation job.
+
+        Args:
+            file_attachment_id (int):
+                The ID of the file attachment to generate thumbnails for.
+        """
+        from reviewboard.attachments.models import FileAttachment
+
+        try:
+            file_attachment = FileAttachment.objects.get(
+                pk=file_attachment_id)
+        except FileAttachment.DoesNotExist:
+            # The file attachment was deleted before we got to it.
+            return
+
+        # The thumbnails may have been generated by another job since this
+        # was queued.
+        if needs_thumbnail_images(file_attachment):
+            generate_thumbnail_images(file_attachment)
+
+            logger.debug('Generated thumbnails for FileAttachment %s',
+                         file_attachment_id)
+
+
+#: The thumbnail generator for this process.
+#:
+#: Version Added:
+#:     9.0
+thumbnail_generator = ThumbnailGenerator()
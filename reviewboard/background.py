@@ -0,0 +1,215 @@
+"""Bounded per-process pools for running jobs in the background.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections, transaction
+from djblets.siteconfig.models import SiteConfiguration
+
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobQueue:
+    """Runs jobs on a bounded, per-process thread pool.
+
+    Jobs are queued through :py:meth:`queue_job` and submitted to the pool
+    once the current transaction (if any) commits, so that they'll see any
+    data saved in it.
+
+    Subclasses set :py:attr:`siteconfig_prefix` and
+    :py:attr:`thread_name_prefix`, and implement :py:meth:`run_job`. The
+    following site configuration settings are then used, named after
+    :py:attr:`siteconfig_prefix`:
+
+    ``<prefix>_enabled``:
+        Whether to run jobs at all.
+
+    ``<prefix>_max_workers``:
+        The number of worker threads used per process. If ``0``, jobs will
+        run synchronously when submitted.
+
+    ``<prefix>_max_pending``:
+        The maximum number of queued or running jobs per process. Any jobs
+        queued beyond this will be skipped.
+
+    Version Added:
+        9.0
+    """
+
+    #: The prefix for the site configuration settings controlling jobs.
+    siteconfig_prefix: str
+
+    #: The prefix for the names of the worker threads.
+    thread_name_prefix: str
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._executor: (ThreadPoolExecutor | None) = None
+        self._executor_pid: (int | None) = None
+        self._lock = threading.Lock()
+        self._num_pending = 0
+
+    @property
+    def num_pending(self) -> int:
+        """The number of queued or running jobs in this process.
+
+        Type:
+            int
+        """
+        return self._num_pending
+
+    def queue_job(self, *args) -> bool:
+        """Queue a job to run in the background.
+
+        The job will be submitted to the worker pool once the current
+        transaction (if any) commits. If the maximum number of pending jobs
+        has been reached at that point, the job will be skipped.
+
+        Args:
+            *args (tuple):
+                The arguments to pass to :py:meth:`run_job`. These should
+                be IDs or other simple values, rather than model instances,
+                since the job runs on another thread.
+
+        Returns:
+            bool:
+            ``True`` if the job was queued. ``False`` if jobs are disabled.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        prefix = self.siteconfig_prefix
+
+        if not siteconfig.get(f'{prefix}_enabled'):
+            return False
+
+        transaction.on_commit(lambda: self._submit(
+            args,
+            max_pending=siteconfig.get(f'{prefix}_max_pending'),
+            max_workers=siteconfig.get(f'{prefix}_max_workers')))
+
+        return True
+
+    def run_job(self, *args) -> None:
+        """Run a job.
+
+        This must be implemented by subclasses. Any exceptions raised will
+        be logged.
+
+        Args:
+            *args (tuple):
+                The arguments passed to :py:meth:`queue_job`.
+        """
+        raise NotImplementedError
+
+    def shutdown(
+        self,
+        wait: bool = True,
+    ) -> None:
+        """Shut down the worker pool.
+
+        Args:
+            wait (bool, optional):
+                Whether to wait for pending jobs to finish.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None and self._executor_pid == os.getpid():
+            executor.shutdown(wait=wait)
+
+    def _submit(
+        self,
+        args: tuple,
+        *,
+        max_pending: int,
+        max_workers: int,
+    ) -> None:
+        """Submit a job to the worker pool.
+
+        Args:
+            args (tuple):
+                The arguments to pass to :py:meth:`run_job`.
+
+            max_pending (int):
+                The maximum number of queued or running jobs.
+
+            max_workers (int):
+                The number of worker threads to use. If ``0``, the job will
+                run immediately in the current thread.
+        """
+        with self._lock:
+            if self._num_pending >= max_pending:
+                logger.warning('Skipping %s job %r. There are already %s '
+                               'jobs pending.',
+                               self.thread_name_prefix, args,
+                               self._num_pending)
+                return
+
+            self._num_pending += 1
+
+        if max_workers > 0:
+            self._get_executor(max_workers).submit(self._run_job, args)
+        else:
+            self._run_job(args, close_connections=False)
+
+    def _get_executor(
+        self,
+        max_workers: int,
+    ) -> ThreadPoolExecutor:
+        """Return the worker pool for this process.
+
+        Args:
+            max_workers (int):
+                The number of worker threads to use if creating the pool.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor:
+            The worker pool.
+        """
+        pid = os.getpid()
+
+        with self._lock:
+            if self._executor is None or self._executor_pid != pid:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=self.thread_name_prefix)
+                self._executor_pid = pid
+
+            return self._executor
+
+    def _run_job(
+        self,
+        args: tuple,
+        *,
+        close_connections: bool = True,
+    ) -> None:
+        """Run a job, tracking it as pending until it finishes.
+
+        Args:
+            args (tuple):
+                The arguments to pass to :py:meth:`run_job`.
+
+            close_connections (bool, optional):
+                Whether to close database connections opened by the job.
+                This is used when running on a worker thread.
+        """
+        try:
+            self.run_job(*args)
+        except Exception as e:
+            logger.exception('Unexpected error running %s job %r: %s',
+                             self.thread_name_prefix, args, e)
+        finally:
+            with self._lock:
+                self._num_pending -= 1
+
+            if close_connections:
+                connections.close_all()
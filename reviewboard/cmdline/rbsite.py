@@ -817,6 +817,27 @@ class Site(object):
             # a dedup is needed.
             return True
 
+    def get_review_request_summaries_needed(self) -> bool:
+        """Return whether review request summaries need to be built.
+
+        Summaries are needed for the dashboard when upgrading a database
+        that has existing visits or reviews, but no summaries yet.
+
+        Version Added:
+            9.0
+
+        Returns:
+            bool:
+            Whether summaries need to be built.
+        """
+        from reviewboard.accounts.models import (ReviewRequestUserSummary,
+                                                 ReviewRequestVisit)
+        from reviewboard.reviews.models import Review
+
+        return (not ReviewRequestUserSummary.objects.exists() and
+                (ReviewRequestVisit.objects.exists() or
+                 Review.objects.exists()))
+
     def get_settings_local(self):
         """Return the current local settings module.
 
@@ -2882,6 +2903,12 @@ class UpgradeCommand(Command):
                 'Resetting in-database caches',
                 lambda: site.run_manage_command('fixreviewcounts'))
 
+            if site.get_review_request_summaries_needed():
+                console.progress_step(
+                    'Building dashboard review request summaries',
+                    lambda: site.run_manage_command(
+                        'rebuild-review-request-summaries', ['--all']))
+
         siteconfig.save()
 
         site.harden_passwords()
@@ -916,6 +916,11 @@ class MyCommentsColumn(Column):
         This will add subqueries for determining whether there are
         posted reviews, draft reviews, or Ship It! reviews.
 
+        Version Changed:
+            9.0:
+            This now reads from the user's maintained review request
+            summary, rather than counting the user's reviews for each row.
+
         Args:
             state (djblets.datagrid.grids.StatefulColumn):
                 The state for the DataGrid instance.
@@ -936,30 +941,25 @@ class MyCommentsColumn(Column):
             'user_id': str(user.pk),
         }
 
-        return queryset.extra(select={
-            'mycomments_my_reviews': """
-                SELECT COUNT(1)
-                  FROM reviews_review
-                  WHERE reviews_review.user_id = %(user_id)s
-                    AND reviews_review.review_request_id =
-                        reviews_reviewrequest.id
-            """ % query_dict,
-            'mycomments_private_reviews': """
-                SELECT COUNT(1)
-                  FROM reviews_review
-                  WHERE reviews_review.user_id = %(user_id)s
-                    AND reviews_review.review_request_id =
+        summary_sql = """
+                SELECT %(field)s
+                  FROM accounts_reviewrequestusersummary AS summary
+                  WHERE summary.user_id = %(user_id)s
+                    AND summary.review_request_id =
                         reviews_reviewrequest.id
-                    AND NOT reviews_review.public
-            """ % query_dict,
-            'mycomments_shipit_reviews': """
-                SELECT COUNT(1)
-                  FROM reviews_review
-                  WHERE reviews_review.user_id = %(user_id)s
-                    AND reviews_review.review_request_id =
-                        reviews_reviewrequest.id
-                    AND reviews_review.ship_it
-            """ % query_dict,
+            """
+
+        return queryset.extra(select={
+            'mycomments_my_reviews': summary_sql % dict(
+                query_dict,
+                field=('summary.has_draft_reviews OR '
+                       'summary.has_published_reviews')),
+            'mycomments_private_reviews': summary_sql % dict(
+                query_dict,
+                field='summary.has_draft_reviews'),
+            'mycomments_shipit_reviews': summary_sql % dict(
+                query_dict,
+                field='summary.has_ship_it_reviews'),
         })
 
     def render_data(
@@ -1012,7 +1012,7 @@ class MyCommentsColumn(Column):
         """
         user = state.datagrid.request.user
 
-        if user.is_anonymous or obj.mycomments_my_reviews == 0:
+        if user.is_anonymous or not obj.mycomments_my_reviews:
             return {}
 
         has_draft_reviews = bool(getattr(obj, 'mycomments_private_reviews'))
@@ -1992,43 +1992,37 @@ class DashboardViewTests(kgb.SpyAgency, BaseViewTestCase):
 
         if include_new_review_count:
             extra['new_review_count'] = (f"""
-                SELECT COUNT(*)
-                  FROM reviews_review, accounts_reviewrequestvisit
-                  WHERE reviews_review.public
-                    AND reviews_review.review_request_id =
-                        reviews_reviewrequest.id
-                    AND accounts_reviewrequestvisit.review_request_id =
+                SELECT COALESCE(MAX(new_review_count), 0)
+                  FROM accounts_reviewrequestusersummary
+                  WHERE accounts_reviewrequestusersummary.review_request_id =
                         reviews_reviewrequest.id
-                    AND accounts_reviewrequestvisit.user_id = {user_id}
-                    AND reviews_review.timestamp >
-                        accounts_reviewrequestvisit.timestamp
-                    AND reviews_review.user_id != {user_id}
+                    AND accounts_reviewrequestusersummary.user_id =
+                        {user_id}
             """, [])
 
         if include_mycomments:
             extra.update({
                 'mycomments_my_reviews': (f"""
-                    SELECT COUNT(1)
-                      FROM reviews_review
-                      WHERE reviews_review.user_id = {user_id}
-                        AND reviews_review.review_request_id =
+                    SELECT summary.has_draft_reviews OR
+                           summary.has_published_reviews
+                      FROM accounts_reviewrequestusersummary AS summary
+                      WHERE summary.user_id = {user_id}
+                        AND summary.review_request_id =
                             reviews_reviewrequest.id
                 """, []),
                 'mycomments_private_reviews': (f"""
-                    SELECT COUNT(1)
-                      FROM reviews_review
-                      WHERE reviews_review.user_id = {user_id}
-                        AND reviews_review.review_request_id =
+                    SELECT summary.has_draft_reviews
+                      FROM accounts_reviewrequestusersummary AS summary
+                      WHERE summary.user_id = {user_id}
+                        AND summary.review_request_id =
                             reviews_reviewrequest.id
-                        AND NOT reviews_review.public
                 """, []),
                 'mycomments_shipit_reviews': (f"""
-                    SELECT COUNT(1)
-                      FROM reviews_review
-                      WHERE reviews_review.user_id = {user_id}
-                        AND reviews_review.review_request_id =
+                    SELECT summary.has_ship_it_reviews
+                      FROM accounts_reviewrequestusersummary AS summary
+                      WHERE summary.user_id = {user_id}
+                        AND summary.review_request_id =
                             reviews_reviewrequest.id
-                        AND reviews_review.ship_it
                 """, []),
             })
 
@@ -460,17 +460,12 @@ class SubmitterViewTests(BaseViewTestCase):
 
         extra: dict[str, Any] = {
             'new_review_count': ("""
-                SELECT COUNT(*)
-                  FROM reviews_review, accounts_reviewrequestvisit
-                  WHERE reviews_review.public
-                    AND reviews_review.review_request_id =
+                SELECT COALESCE(MAX(new_review_count), 0)
+                  FROM accounts_reviewrequestusersummary
+                  WHERE accounts_reviewrequestusersummary.review_request_id =
                         reviews_reviewrequest.id
-                    AND accounts_reviewrequestvisit.review_request_id =
-                        reviews_reviewrequest.id
-                    AND accounts_reviewrequestvisit.user_id = 2
-                    AND reviews_review.timestamp >
-                        accounts_reviewrequestvisit.timestamp
-                    AND reviews_review.user_id != 2
+                    AND accounts_reviewrequestusersummary.user_id =
+                        2
             """, []),
             'draft_summary': ("""
                 SELECT reviews_reviewrequestdraft.summary
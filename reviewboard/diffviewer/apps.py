@@ -0,0 +1,29 @@
+"""The app definition for reviewboard.diffviewer.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+from django.apps import AppConfig
+
+
+class DiffViewerAppConfig(AppConfig):
+    """App configuration for reviewboard.diffviewer.
+
+    Version Added:
+        9.0
+    """
+
+    name = 'reviewboard.diffviewer'
+
+    def ready(self) -> None:
+        """Configure the app once it's ready.
+
+        This will connect signal handlers for the app.
+        """
+        from reviewboard.diffviewer.signal_handlers import \
+            connect_signal_handlers
+
+        connect_signal_handlers()
@@ -11,11 +11,12 @@ from itertools import zip_longest
 from typing import Any, Literal, TYPE_CHECKING, TypedDict
 
 import pygments.util
+from django.core.cache import cache
 from django.utils.encoding import force_str
 from django.utils.html import escape
 from django.utils.translation import get_language, gettext as _
 from djblets.log import log_timed
-from djblets.cache.backend import cache_memoize
+from djblets.cache.backend import cache_memoize, make_cache_key
 from housekeeping.functions import deprecate_non_keyword_only_args
 from pygments import highlight
 from pygments.formatters import HtmlFormatter
@@ -27,7 +28,16 @@ from reviewboard.deprecation import (
     RemovedInReviewBoard90Warning,
     RemovedInReviewBoard11_0Warning,
 )
+from reviewboard.diffviewer.chunk_serialization import (
+    deserialize_diff_chunks,
+    serialize_diff_chunks,
+)
 from reviewboard.diffviewer.differ import DiffCompatVersion, get_differ
+from reviewboard.diffviewer.highlight_cache import (
+    get_highlighted_lines,
+    get_pygments_highlighter_id,
+    get_treesitter_highlighter_id,
+)
 from reviewboard.diffviewer.diffutils import (
     DiffRegions,
     convert_to_unicode,
@@ -50,13 +60,18 @@ from reviewboard.treesitter.highlight import highlight as ts_highlight
 from reviewboard.treesitter.language import get_language_name_for_file
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
     import tree_sitter
     from django.http import HttpRequest
+    from pygments.lexer import Lexer
     from typing_extensions import TypeAlias
 
-    from reviewboard.diffviewer.differ import Differ, DiffOpcodeTag
+    from reviewboard.diffviewer.differ import (
+        Differ,
+        DiffOpcodeTag,
+        DiffOpcodeWithMetadata,
+    )
     from reviewboard.diffviewer.models.filediff import FileDiff
     from reviewboard.diffviewer.opcode_generator import DiffOpcodeGenerator
     from reviewboard.treesitter.language import SupportedLanguage
@@ -183,6 +198,20 @@ class DiffChunk(TypedDict):
 HeaderInfo = Mapping[str, str] | None
 
 
+#: Ranges of lines to syntax-highlight in the original and modified files.
+#:
+#: This is a 2-tuple of the ranges in the original file and the ranges in
+#: the modified file. Each range is a tuple of the 0-based start line and the
+#: 0-based line after the end.
+#:
+#: Version Added:
+#:     9.0
+HighlightLineRanges: TypeAlias = tuple[
+    list[tuple[int, int]],
+    list[tuple[int, int]],
+]
+
+
 class RawDiffChunkGenerator:
     """A generator for chunks for a diff that can be used for rendering.
 
@@ -258,6 +287,16 @@ class RawDiffChunkGenerator:
     #: Whether to enable syntax highlighting
     enable_syntax_highlighting: bool
 
+    #: Additional ranges of lines to syntax-highlight.
+    #:
+    #: When only visible lines of a large file are highlighted, these lines
+    #: will be highlighted as well. This is used to highlight collapsed
+    #: lines on demand when they're expanded.
+    #:
+    #: Version Added:
+    #:     9.0
+    highlight_line_ranges: HighlightLineRanges | None
+
     #: A list of file encodings to try.
     encoding_list: Sequence[str]
 
@@ -319,9 +358,14 @@ class RawDiffChunkGenerator:
         diff_compat: int = DiffCompatVersion.DEFAULT,
         *,
         diff_settings: DiffSettings,
+        highlight_line_ranges: (HighlightLineRanges | None) = None,
     ) -> None:
         """Initialize the chunk generator.
 
+        Version Changed:
+            9.0:
+            Added ``highlight_line_ranges``.
+
         Version Changed:
             6.0:
             * Removed ``enable_syntax_highlighting``.
@@ -361,6 +405,14 @@ class RawDiffChunkGenerator:
 
                 Version Added:
                     5.0.2
+
+            highlight_line_ranges (tuple, optional):
+                Additional ranges of lines in the original and modified files
+                to syntax-highlight, when only visible lines are being
+                highlighted.
+
+                Version Added:
+                    9.0
         """
         # Check that the data coming in is in the formats we accept.
         for param, param_name in ((old, 'old'), (new, 'new')):
@@ -401,6 +453,7 @@ class RawDiffChunkGenerator:
         self.modified_filename = modified_filename
         self.diff_settings = diff_settings
         self.enable_syntax_highlighting = diff_settings.syntax_highlighting
+        self.highlight_line_ranges = highlight_line_ranges
         self.encoding_list = encoding_list or ['iso-8859-15']
         self.diff_compat = diff_compat
         self.differ = None
@@ -440,6 +493,11 @@ class RawDiffChunkGenerator:
         cache, they will be yielded. Otherwise, new chunks will be generated,
         stored in cache (given a cache key), and yielded.
 
+        Version Changed:
+            9.0:
+            Cached chunks are now stored in the compact format provided by
+            :py:mod:`reviewboard.diffviewer.chunk_serialization`.
+
         Args:
             cache_key (str, optional):
                 The cache key to use.
@@ -449,9 +507,26 @@ class RawDiffChunkGenerator:
             Each chunk in the diff.
         """
         if cache_key:
-            chunks = cache_memoize(cache_key,
-                                   lambda: list(self.get_chunks_uncached()),
-                                   large_data=True)
+            data = cache_memoize(
+                cache_key,
+                lambda: serialize_diff_chunks(
+                    list(self.get_chunks_uncached())),
+                large_data=True,
+                compress_large_data=False)
+
+            try:
+                chunks = deserialize_diff_chunks(data)
+            except ValueError:
+                # This was stored in a format we don't understand, such as by
+                # a newer version of Review Board. Regenerate it.
+                data = cache_memoize(
+                    cache_key,
+                    lambda: serialize_diff_chunks(
+                        list(self.get_chunks_uncached())),
+                    large_data=True,
+                    compress_large_data=False,
+                    force_overwrite=True)
+                chunks = deserialize_diff_chunks(data)
         else:
             chunks = self.get_chunks_uncached()
 
@@ -512,6 +587,8 @@ class RawDiffChunkGenerator:
         is_lists = isinstance(old, list)
         assert is_lists == isinstance(new, list)
 
+        highlight_viewport = False
+
         old_filename = self.normalize_path_for_display(self.orig_filename)
         new_filename = self.normalize_path_for_display(self.modified_filename)
 
@@ -567,29 +644,30 @@ class RawDiffChunkGenerator:
                 file_content=new_lines,
                 tree=self.new_tree)
 
-            if self._get_enable_syntax_highlighting(
-                old, new, old_lines, new_lines):
-
-                old_markup = self._highlight(
-                    data_str=old_str,
-                    data_lines=old_lines,
-                    filename=old_filename,
-                    tree=self.old_tree,
-                    language=old_language_name,
-                    mimetype=self.old_mimetype)
-                new_markup = self._highlight(
-                    data_str=new_str,
-                    data_lines=new_lines,
-                    filename=new_filename,
-                    tree=self.new_tree,
-                    language=new_language_name,
-                    mimetype=self.new_mimetype)
-
-            if not old_markup:
-                old_markup = self.NEWLINES_RE.split(escape(old_str))
+            highlight_viewport = self._get_use_viewport_highlighting(
+                old_lines, new_lines)
 
-            if not new_markup:
-                new_markup = self.NEWLINES_RE.split(escape(new_str))
+            if self._get_enable_syntax_highlighting(
+                old, new, old_lines, new_lines,
+                viewport=highlight_viewport):
+
+                if not highlight_viewport:
+                    old_markup = self._highlight(
+                        data_str=old_str,
+                        data_lines=old_lines,
+                        filename=old_filename,
+                        tree=self.old_tree,
+                        language=old_language_name,
+                        mimetype=self.old_mimetype)
+                    new_markup = self._highlight(
+                        data_str=new_str,
+                        data_lines=new_lines,
+                        filename=new_filename,
+                        tree=self.new_tree,
+                        language=new_language_name,
+                        mimetype=self.new_mimetype)
+            else:
+                highlight_viewport = False
 
         old_num_lines = len(old_lines)
         new_num_lines = len(new_lines)
@@ -612,7 +690,43 @@ class RawDiffChunkGenerator:
         collapse_threshold = 2 * context_num_lines + 3
 
         line_num = 1
+        opcode_generator: Iterable[DiffOpcodeWithMetadata]
         opcode_generator = self.get_opcode_generator()
+        highlighted_ranges: HighlightLineRanges | None = None
+
+        if highlight_viewport:
+            # Only the lines that will be shown are highlighted, so we need
+            # all the opcodes up-front in order to know which lines those are.
+            opcodes = list(opcode_generator)
+            opcode_generator = opcodes
+
+            highlighted_ranges = self._get_viewport_line_ranges(
+                opcodes=opcodes,
+                old_num_lines=old_num_lines,
+                new_num_lines=new_num_lines)
+
+            old_markup = self._highlight_line_ranges(
+                data_str=old_str,
+                data_lines=old_lines,
+                tree=self.old_tree,
+                language=self.old_language_name,
+                line_ranges=highlighted_ranges[0])
+            new_markup = self._highlight_line_ranges(
+                data_str=new_str,
+                data_lines=new_lines,
+                tree=self.new_tree,
+                language=self.new_language_name,
+                line_ranges=highlighted_ranges[1])
+
+            if old_markup is None or new_markup is None:
+                highlighted_ranges = None
+
+        if not is_lists:
+            if not old_markup:
+                old_markup = self.NEWLINES_RE.split(escape(old_str))
+
+            if not new_markup:
+                new_markup = self.NEWLINES_RE.split(escape(new_str))
 
         counts = {
             'equal': 0,
@@ -645,17 +759,36 @@ class RawDiffChunkGenerator:
                 last_range_start = num_lines - context_num_lines
 
                 if line_num == 1:
-                    yield self._new_chunk(lines, 0, last_range_start, True)
+                    yield self._new_chunk(
+                        lines, 0, last_range_start, True,
+                        meta=self._get_collapsed_chunk_meta(
+                            highlighted_ranges=highlighted_ranges,
+                            i1=i1,
+                            j1=j1,
+                            start=0,
+                            end=last_range_start))
                     yield self._new_chunk(lines, last_range_start, num_lines)
                 else:
                     yield self._new_chunk(lines, 0, context_num_lines)
 
                     if i2 == old_num_lines and j2 == new_num_lines:
-                        yield self._new_chunk(lines, context_num_lines,
-                                              num_lines, True)
+                        yield self._new_chunk(
+                            lines, context_num_lines, num_lines, True,
+                            meta=self._get_collapsed_chunk_meta(
+                                highlighted_ranges=highlighted_ranges,
+                                i1=i1,
+                                j1=j1,
+                                start=context_num_lines,
+                                end=num_lines))
                     else:
-                        yield self._new_chunk(lines, context_num_lines,
-                                              last_range_start, True)
+                        yield self._new_chunk(
+                            lines, context_num_lines, last_range_start, True,
+                            meta=self._get_collapsed_chunk_meta(
+                                highlighted_ranges=highlighted_ranges,
+                                i1=i1,
+                                j1=j1,
+                                start=context_num_lines,
+                                end=last_range_start))
                         yield self._new_chunk(lines, last_range_start,
                                               num_lines)
             else:
@@ -933,6 +1066,8 @@ class RawDiffChunkGenerator:
         new: bytes,
         old_lines: Sequence[str],
         new_lines: Sequence[str],
+        *,
+        viewport: bool = False,
     ) -> bool:
         """Return whether or not we'll be enabling syntax highlighting.
 
@@ -943,6 +1078,10 @@ class RawDiffChunkGenerator:
         The heuristics take into account the size of the files in bytes and
         the number of lines.
 
+        Version Changed:
+            9.0:
+            Added ``viewport``.
+
         Args:
             old (bytes):
                 The contents of the old file as a single bytestring.
@@ -956,6 +1095,13 @@ class RawDiffChunkGenerator:
             new_lines (list of str):
                 The list of lines in the new file.
 
+            viewport (bool, optional):
+                Whether only the visible lines will be highlighted. If set,
+                the size of the files in bytes will not be considered.
+
+                Version Added:
+                    9.0
+
         Returns:
             bool:
             Whether syntax highlighting should be applied for the file.
@@ -971,8 +1117,8 @@ class RawDiffChunkGenerator:
 
         # Very long files, especially XML files, can take a long time to
         # highlight. For files over a certain size, don't highlight them.
-        if (len(old) > self.STYLED_MAX_LIMIT_BYTES or
-            len(new) > self.STYLED_MAX_LIMIT_BYTES):
+        if not viewport and (len(old) > self.STYLED_MAX_LIMIT_BYTES or
+                             len(new) > self.STYLED_MAX_LIMIT_BYTES):
             return False
 
         # Don't style the file if we have any *really* long lines.
@@ -985,6 +1131,154 @@ class RawDiffChunkGenerator:
 
         return True
 
+    def _get_use_viewport_highlighting(
+        self,
+        old_lines: Sequence[str],
+        new_lines: Sequence[str],
+    ) -> bool:
+        """Return whether only visible lines should be highlighted.
+
+        This is used for files with more lines than the
+        :py:attr:`~reviewboard.diffviewer.settings.DiffSettings
+        .syntax_highlighting_viewport_threshold` setting, if tree-sitter can
+        parse both versions of the file.
+
+        Version Added:
+            9.0
+
+        Args:
+            old_lines (list of str):
+                The list of lines in the old file.
+
+            new_lines (list of str):
+                The list of lines in the new file.
+
+        Returns:
+            bool:
+            Whether only visible lines should be highlighted.
+        """
+        threshold = self.diff_settings.syntax_highlighting_viewport_threshold
+
+        return bool(threshold and
+                    (len(old_lines) > threshold or
+                     len(new_lines) > threshold) and
+                    self.old_tree is not None and
+                    self.old_language_name and
+                    self.new_tree is not None and
+                    self.new_language_name)
+
+    def _get_viewport_line_ranges(
+        self,
+        *,
+        opcodes: Sequence[DiffOpcodeWithMetadata],
+        old_num_lines: int,
+        new_num_lines: int,
+    ) -> HighlightLineRanges:
+        """Return the ranges of lines that will be visible in the diff.
+
+        This mirrors the chunk collapsing done in :py:meth:`generate_chunks`,
+        returning the lines in all chunks that aren't collapsed. Any ranges
+        in :py:attr:`highlight_line_ranges` are included as well.
+
+        Version Added:
+            9.0
+
+        Args:
+            opcodes (list of tuple):
+                The opcodes for the diff.
+
+            old_num_lines (int):
+                The number of lines in the old file.
+
+            new_num_lines (int):
+                The number of lines in the new file.
+
+        Returns:
+            tuple:
+            The merged ranges of lines to highlight in the old and new files.
+        """
+        context_num_lines = self.diff_settings.context_num_lines
+        collapse_threshold = 2 * context_num_lines + 3
+
+        old_ranges: list[tuple[int, int]] = []
+        new_ranges: list[tuple[int, int]] = []
+        is_first = True
+
+        for tag, i1, i2, j1, j2, meta in opcodes:
+            num_lines = max(i2 - i1, j2 - j1)
+
+            if tag == 'equal' and num_lines > collapse_threshold:
+                if not is_first:
+                    old_ranges.append((i1, i1 + context_num_lines))
+                    new_ranges.append((j1, j1 + context_num_lines))
+
+                if i2 != old_num_lines or j2 != new_num_lines:
+                    old_ranges.append((i2 - context_num_lines, i2))
+                    new_ranges.append((j2 - context_num_lines, j2))
+            else:
+                old_ranges.append((i1, i2))
+                new_ranges.append((j1, j2))
+
+            if num_lines:
+                is_first = False
+
+        if self.highlight_line_ranges:
+            old_ranges += self.highlight_line_ranges[0]
+            new_ranges += self.highlight_line_ranges[1]
+
+        return (_merge_line_ranges(old_ranges),
+                _merge_line_ranges(new_ranges))
+
+    def _get_collapsed_chunk_meta(
+        self,
+        *,
+        highlighted_ranges: HighlightLineRanges | None,
+        i1: int,
+        j1: int,
+        start: int,
+        end: int,
+    ) -> dict[str, Any] | None:
+        """Return metadata for a collapsed chunk.
+
+        If only visible lines are being highlighted and the chunk's lines
+        weren't highlighted, this will flag the chunk with
+        ``highlight_pending``, so its lines can be highlighted when expanded.
+
+        Version Added:
+            9.0
+
+        Args:
+            highlighted_ranges (tuple):
+                The ranges of lines that were highlighted, or ``None`` if the
+                whole files were highlighted.
+
+            i1 (int):
+                The 0-based line in the old file where the opcode starts.
+
+            j1 (int):
+                The 0-based line in the new file where the opcode starts.
+
+            start (int):
+                The offset within the opcode where the chunk starts.
+
+            end (int):
+                The offset within the opcode where the chunk ends.
+
+        Returns:
+            dict:
+            The metadata for the chunk, or ``None`` if there's nothing to add.
+        """
+        if (highlighted_ranges is None or
+            (_is_line_range_covered(highlighted_ranges[0],
+                                    i1 + start, i1 + end) and
+             _is_line_range_covered(highlighted_ranges[1],
+                                    j1 + start, j1 + end))):
+            return None
+
+        return {
+            'highlight_pending': True,
+        }
+
     def _diff_line(
         self,
         tag: DiffOpcodeTag,
@@ -1618,18 +1912,84 @@ class RawDiffChunkGenerator:
         """
         if tree and language:
             try:
-                highlighted = ts_highlight(
-                    data_str.encode(),
-                    data_lines,
-                    tree,
-                    language)
+                highlighted = get_highlighted_lines(
+                    content=data_str,
+                    highlighter_id=get_treesitter_highlighter_id(language),
+                    highlight_func=lambda: ts_highlight(
+                        data_str.encode(),
+                        data_lines,
+                        tree,
+                        language))
 
                 if highlighted:
                     return highlighted
             except Exception as e:
                 logger.exception('Tree sitter highlighting failed: %s', e)
 
-        return self._apply_pygments(data_str, filename)
+        lexer = self._get_pygments_lexer(data_str, filename)
+
+        if lexer is None:
+            return None
+
+        return get_highlighted_lines(
+            content=data_str,
+            highlighter_id=get_pygments_highlighter_id(lexer),
+            highlight_func=lambda: self._highlight_pygments(data_str, lexer))
+
+    def _highlight_line_ranges(
+        self,
+        *,
+        data_str: str,
+        data_lines: Sequence[str],
+        tree: tree_sitter.Tree | None,
+        language: SupportedLanguage | None,
+        line_ranges: Sequence[tuple[int, int]],
+    ) -> Sequence[str] | None:
+        """Apply syntax highlighting to ranges of lines in a file.
+
+        This uses tree-sitter's range-restricted queries to highlight only
+        the requested lines. All other lines are HTML-escaped.
+
+        Unlike :py:meth:`_highlight`, the results are not stored in the
+        highlight cache, as they only cover part of the file.
+
+        Version Added:
+            9.0
+
+        Args:
+            data_str (str):
+                The file's content, as a string.
+
+            data_lines (list of str):
+                The file's content, split into lines.
+
+            tree (tree_sitter.Tree):
+                The parsed tree-sitter tree for the file.
+
+            language (reviewboard.treesitter.language.SupportedLanguage):
+                The name of the language used for tree-sitter parsing.
+
+            line_ranges (list of tuple):
+                The ranges of lines to highlight.
+
+        Returns:
+            list of str:
+            A list of lines, with the requested lines syntax-highlighted, or
+            ``None`` if the file could not be highlighted.
+        """
+        if tree is None or language is None:
+            return None
+
+        try:
+            return ts_highlight(data_str.encode(),
+                                data_lines,
+                                tree,
+                                language,
+                                line_ranges=line_ranges)
+        except Exception as e:
+            logger.exception('Tree sitter highlighting failed: %s', e)
+
+            return None
 
     def _apply_pygments(
         self,
@@ -1654,6 +2014,35 @@ class RawDiffChunkGenerator:
             A list of lines, all syntax-highlighted, if a lexer is found.
             If no lexer is available, this will return ``None``.
         """
+        lexer = self._get_pygments_lexer(data, filename)
+
+        if lexer is None:
+            return None
+
+        return self._highlight_pygments(data, lexer)
+
+    def _get_pygments_lexer(
+        self,
+        data: str,
+        filename: str,
+    ) -> Lexer | None:
+        """Return the Pygments lexer used to highlight a file.
+
+        Version Added:
+            9.0
+
+        Args:
+            data (str):
+                The data to syntax highlight.
+
+            filename (str):
+                The name of the file. This is used to help determine a
+                suitable lexer.
+
+        Returns:
+            pygments.lexer.Lexer:
+            The lexer, or ``None`` if the file should not be highlighted.
+        """
         if filename.endswith(self.STYLED_EXT_BLACKLIST):
             return None
 
@@ -1682,6 +2071,29 @@ class RawDiffChunkGenerator:
             except pygments.util.ClassNotFound:
                 return None
 
+        return lexer
+
+    def _highlight_pygments(
+        self,
+        data: str,
+        lexer: Lexer,
+    ) -> Sequence[str]:
+        """Highlight a file's contents using a Pygments lexer.
+
+        Version Added:
+            9.0
+
+        Args:
+            data (str):
+                The data to syntax highlight.
+
+            lexer (pygments.lexer.Lexer):
+                The lexer to use.
+
+        Returns:
+            list of str:
+            A list of lines, all syntax-highlighted.
+        """
         lexer.add_filter('codetagify')
 
         return split_line_endings(
@@ -1736,7 +2148,7 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
     #:
     #: Version Added:
     #:     9.0
-    CACHE_FORMAT_VERSION = 1
+    CACHE_FORMAT_VERSION = 2
 
     ######################
     # Instance variables #
@@ -1764,9 +2176,14 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
         base_filediff: (FileDiff | None) = None,
         *,
         diff_settings: DiffSettings,
+        highlight_line_ranges: (HighlightLineRanges | None) = None,
     ) -> None:
         """Initialize the DiffChunkGenerator.
 
+        Version Changed:
+            9.0:
+            Added ``highlight_line_ranges``.
+
         Version Changed:
             6.0:
             * Removed the old ``enable_syntax_highlighting`` argument.
@@ -1796,6 +2213,14 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
 
             diff_settings (reviewboard.diffviewer.settings.DiffSettings):
                 The settings used to control the display of diffs.
+
+            highlight_line_ranges (tuple, optional):
+                Additional ranges of lines in the original and modified files
+                to syntax-highlight, when only visible lines are being
+                highlighted.
+
+                Version Added:
+                    9.0
         """
         assert filediff
 
@@ -1823,7 +2248,8 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
             modified_filename=filediff.dest_file,
             encoding_list=self.repository.get_encoding_list(),
             diff_compat=filediff.diffset.diffcompat,
-            diff_settings=diff_settings)
+            diff_settings=diff_settings,
+            highlight_line_ranges=highlight_line_ranges)
 
     def make_cache_key(self) -> str:
         """Return a new cache key for any generated chunks.
@@ -1851,6 +2277,12 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
             get_language(),
         ]
 
+        if self.highlight_line_ranges:
+            ranges_sha = hashlib.sha256(
+                repr(self.highlight_line_ranges).encode('utf-8')
+            ).hexdigest()
+            key.append(f'highlight-{ranges_sha}')
+
         return '-'.join(key)
 
     def get_opcode_generator(self) -> DiffOpcodeGenerator:
@@ -1892,21 +2324,53 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
             DiffChunk:
             Each chunk in the diff.
         """
-        filediff = self.filediff
-        counts = filediff.get_line_counts()
-
-        if (filediff.binary or
-            filediff.source_revision == '' or
-            ((filediff.is_new or filediff.deleted or
-              filediff.moved or filediff.copied) and
-             counts['raw_insert_count'] == 0 and
-             counts['raw_delete_count'] == 0)):
+        if self._is_chunkless():
             return
 
         cache_key = self.make_cache_key()
 
         yield from super().get_chunks(cache_key)
 
+    def has_cached_chunks(self) -> bool:
+        """Return whether chunks can be yielded without generating them.
+
+        This is the case if the file never has any chunks (such as a binary
+        file or a move with no changes), or if chunks for the diff are
+        already stored in cache. Callers can use this to avoid fetching
+        original files that won't be needed.
+
+        Version Added:
+            9.0
+
+        Returns:
+            bool:
+            ``True`` if :py:meth:`get_chunks` can yield chunks without
+            generating them. ``False`` if they need to be generated.
+        """
+        return (self._is_chunkless() or
+                cache.get(make_cache_key(self.make_cache_key())) is not None)
+
+    def _is_chunkless(self) -> bool:
+        """Return whether the file never has any chunks to display.
+
+        Version Added:
+            9.0
+
+        Returns:
+            bool:
+            ``True`` if the file is binary, has no source revision, or is an
+            added, deleted, moved, or copied file with no line changes.
+        """
+        filediff = self.filediff
+        counts = filediff.get_line_counts()
+
+        return (filediff.binary or
+                filediff.source_revision == '' or
+                ((filediff.is_new or filediff.deleted or
+                  filediff.moved or filediff.copied) and
+                 counts['raw_insert_count'] == 0 and
+                 counts['raw_delete_count'] == 0))
+
     def get_chunks_uncached(self) -> Iterator[DiffChunk]:
         """Yield the list of chunks, bypassing the cache.
 
@@ -2179,6 +2643,113 @@ class DiffChunkGenerator(RawDiffChunkGenerator):
         return force_str(hashlib.sha1(content).hexdigest())
 
 
+def get_highlight_pending_line_ranges(
+    chunks: Iterable[DiffChunk],
+) -> HighlightLineRanges | None:
+    """Return the ranges of lines in chunks that are pending highlighting.
+
+    When only visible lines in a large file are syntax-highlighted, collapsed
+    chunks are flagged with ``highlight_pending`` in their metadata. This
+    returns the lines in any of the provided chunks that are flagged, which
+    can then be passed to the chunk generator's ``highlight_line_ranges``
+    argument to highlight them.
+
+    Version Added:
+        9.0
+
+    Args:
+        chunks (list of DiffChunk):
+            The chunks being displayed. These may contain a subset of the
+            lines in the generated chunk.
+
+    Returns:
+        tuple:
+        The ranges of lines in the original and modified files, or ``None``
+        if there are no lines pending highlighting.
+    """
+    old_ranges: list[tuple[int, int]] = []
+    new_ranges: list[tuple[int, int]] = []
+
+    for chunk in chunks:
+        if not chunk['meta'].get('highlight_pending') or not chunk['lines']:
+            continue
+
+        for ranges, linenum_index in ((old_ranges, 1), (new_ranges, 4)):
+            linenums = [
+                line[linenum_index]
+                for line in chunk['lines']
+                if line[linenum_index]
+            ]
+
+            if linenums:
+                ranges.append((min(linenums) - 1, max(linenums)))
+
+    if not old_ranges and not new_ranges:
+        return None
+
+    return _merge_line_ranges(old_ranges), _merge_line_ranges(new_ranges)
+
+
+def _merge_line_ranges(
+    line_ranges: Iterable[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """Return sorted ranges of lines, with overlapping ranges merged.
+
+    Version Added:
+        9.0
+
+    Args:
+        line_ranges (list of tuple):
+            The ranges of lines to merge.
+
+    Returns:
+        list of tuple:
+        The merged ranges of lines.
+    """
+    result: list[tuple[int, int]] = []
+
+    for start, end in sorted(line_ranges):
+        if start >= end:
+            continue
+
+        if result and start <= result[-1][1]:
+            result[-1] = (result[-1][0], max(end, result[-1][1]))
+        else:
+            result.append((start, end))
+
+    return result
+
+
+def _is_line_range_covered(
+    line_ranges: Sequence[tuple[int, int]],
+    start: int,
+    end: int,
+) -> bool:
+    """Return whether a range of lines is covered by merged ranges.
+
+    Version Added:
+        9.0
+
+    Args:
+        line_ranges (list of tuple):
+            The merged ranges of lines.
+
+        start (int):
+            The 0-based start line of the range to check.
+
+        end (int):
+            The 0-based line after the end of the range to check.
+
+    Returns:
+        bool:
+        Whether the range is fully covered.
+    """
+    return start >= end or any(
+        range_start <= start and end <= range_end
+        for range_start, range_end in line_ranges
+    )
+
+
 @deprecate_non_keyword_only_args(RemovedInReviewBoard11_0Warning)
 def compute_chunk_last_header(
     *,
@@ -0,0 +1,372 @@
+"""Compact serialization of diff chunks for caching.
+
+Rendered diff chunks are large, deeply-nested structures. Pickling them
+directly stores the dictionary keys for every chunk and a tuple for every
+line, and results in many memcached round trips for large files.
+
+This module stores chunks in a versioned, columnar format instead. Each
+field of a line is stored in its own column, line numbers are
+delta-encoded, change tags are stored as small integers, modified-file
+markup identical to the original-file markup is stored only once, and the
+whole payload (including the highlighted HTML) is compressed.
+
+Chunks are rehydrated into
+:py:class:`~reviewboard.diffviewer.chunk_generator.DiffChunk` dictionaries
+lazily, as they're accessed.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import pickle
+import zlib
+from collections.abc import Sequence
+from typing import Any, TYPE_CHECKING, overload
+
+if TYPE_CHECKING:
+    from reviewboard.diffviewer.chunk_generator import (DiffChunk,
+                                                        DiffChunkTag,
+                                                        DiffLine)
+
+
+#: The magic header identifying serialized chunk data.
+_MAGIC = b'RBDC'
+
+#: The current version of the serialized format.
+#:
+#: This must be increased whenever the format changes.
+_FORMAT_VERSION = 1
+
+#: The zlib compression level used for serialized chunk data.
+_COMPRESSION_LEVEL = 6
+
+#: The change tags, in the order they're encoded.
+_CHANGE_TAGS: tuple[DiffChunkTag, ...] = (
+    'equal',
+    'insert',
+    'delete',
+    'replace',
+)
+
+_CHANGE_TAG_IDS: dict[str, int] = {
+    tag: i
+    for i, tag in enumerate(_CHANGE_TAGS)
+}
+
+
+def _delta_encode(
+    values: list[int | None],
+) -> list[int | None]:
+    """Delta-encode a column of line numbers.
+
+    Each number is stored as the difference from the previous number in
+    the column. ``None`` values are preserved.
+
+    Args:
+        values (list of int):
+            The values to encode.
+
+    Returns:
+        list of int:
+        The encoded values.
+    """
+    result: list[int | None] = []
+    prev = 0
+
+    for value in values:
+        if value is None:
+            result.append(None)
+        else:
+            result.append(value - prev)
+            prev = value
+
+    return result
+
+
+def _delta_decode(
+    values: list[int | None],
+) -> list[int | None]:
+    """Decode a delta-encoded column of line numbers.
+
+    Args:
+        values (list of int):
+            The values to decode.
+
+    Returns:
+        list of int:
+        The decoded values.
+    """
+    result: list[int | None] = []
+    prev = 0
+
+    for value in values:
+        if value is None:
+            result.append(None)
+        else:
+            prev += value
+            result.append(prev)
+
+    return result
+
+
+def serialize_diff_chunks(
+    chunks: Sequence[DiffChunk],
+) -> bytes:
+    """Serialize a list of diff chunks into the compact format.
+
+    Args:
+        chunks (list of reviewboard.diffviewer.chunk_generator.DiffChunk):
+            The chunks to serialize.
+
+    Returns:
+        bytes:
+        The serialized chunk data.
+    """
+    chunk_rows: list[tuple[Any, ...]] = []
+    v_line_nums: list[int] = []
+    old_line_nums: list[int | None] = []
+    old_markups: list[str] = []
+    old_regions: list[Any] = []
+    new_line_nums: list[int | None] = []
+    new_markups: list[str | None] = []
+    new_regions: list[Any] = []
+    whitespace = bytearray()
+    line_metas: dict[int, Any] = {}
+
+    for chunk in chunks:
+        lines = chunk['lines']
+
+        chunk_rows.append((
+            chunk['index'],
+            _CHANGE_TAG_IDS[chunk['change']],
+            chunk['collapsable'],
+            chunk['numlines'],
+            chunk['meta'],
+            len(lines),
+        ))
+
+        for line in lines:
+            if line[8]:
+                line_metas[len(v_line_nums)] = line[8]
+
+            old_markup = line[2]
+            new_markup = line[5]
+
+            v_line_nums.append(line[0])
+            old_line_nums.append(line[1])
+            old_markups.append(old_markup)
+            old_regions.append(line[3])
+            new_line_nums.append(line[4])
+            new_regions.append(line[6])
+            whitespace.append(line[7])
+
+            if new_markup == old_markup:
+                new_markups.append(None)
+            else:
+                new_markups.append(new_markup)
+
+    columns = (
+        chunk_rows,
+        _delta_encode(v_line_nums),
+        _delta_encode(old_line_nums),
+        old_markups,
+        old_regions,
+        _delta_encode(new_line_nums),
+        new_markups,
+        new_regions,
+        bytes(whitespace),
+        line_metas,
+    )
+
+    return b'%s%c%s' % (
+        _MAGIC,
+        _FORMAT_VERSION,
+        zlib.compress(pickle.dumps(columns, protocol=pickle.HIGHEST_PROTOCOL),
+                      _COMPRESSION_LEVEL),
+    )
+
+
+def deserialize_diff_chunks(
+    data: bytes | Sequence[DiffChunk],
+) -> Sequence[DiffChunk]:
+    """Deserialize diff chunks from the compact format.
+
+    Decompression is deferred until the chunks are first accessed, and
+    each chunk is only built once it's accessed.
+
+    Args:
+        data (bytes or list):
+            The serialized chunk data. For compatibility with older cache
+            entries, this may also be a list of chunks, which will be
+            returned as-is.
+
+    Returns:
+        list of reviewboard.diffviewer.chunk_generator.DiffChunk:
+        The sequence of chunks.
+
+    Raises:
+        ValueError:
+            The data was not in a supported format.
+    """
+    if not isinstance(data, bytes):
+        return data
+
+    if (not data.startswith(_MAGIC) or
+        len(data) <= len(_MAGIC) or
+        data[len(_MAGIC)] != _FORMAT_VERSION):
+        raise ValueError('Unsupported serialized diff chunk format.')
+
+    return CompactDiffChunks(data)
+
+
+class CompactDiffChunks(Sequence['DiffChunk']):
+    """A lazily-rehydrated sequence of serialized diff chunks.
+
+    Version Added:
+        9.0
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+    ) -> None:
+        """Initialize the sequence.
+
+        Args:
+            data (bytes):
+                The serialized chunk data, including the header.
+        """
+        self._data: (bytes | None) = data
+        self._columns: (tuple[Any, ...] | None) = None
+        self._line_offsets: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of chunks.
+
+        Returns:
+            int:
+            The number of chunks.
+        """
+        return len(self._get_columns()[0])
+
+    @overload
+    def __getitem__(self, index: int) -> DiffChunk:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[DiffChunk]:
+        ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> DiffChunk | Sequence[DiffChunk]:
+        """Return a chunk or a slice of chunks.
+
+        Args:
+            index (int or slice):
+                The index or slice of chunks to return.
+
+        Returns:
+            reviewboard.diffviewer.chunk_generator.DiffChunk or list:
+            The chunk, or a list of chunks for a slice.
+
+        Raises:
+            IndexError:
+                The index was out of range.
+        """
+        if isinstance(index, slice):
+            return [
+                self._build_chunk(i)
+                for i in range(*index.indices(len(self)))
+            ]
+
+        num_chunks = len(self)
+
+        if index < 0:
+            index += num_chunks
+
+        if not 0 <= index < num_chunks:
+            raise IndexError('chunk index out of range')
+
+        return self._build_chunk(index)
+
+    def _get_columns(self) -> tuple[Any, ...]:
+        """Return the decoded columns, decoding them if needed.
+
+        Returns:
+            tuple:
+            The decoded columns.
+        """
+        columns = self._columns
+
+        if columns is None:
+            data = self._data
+            assert data is not None
+
+            columns = list(pickle.loads(
+                zlib.decompress(data[len(_MAGIC) + 1:])))
+
+            for i in (1, 2, 5):
+                columns[i] = _delta_decode(columns[i])
+
+            columns = tuple(columns)
+            offset = 0
+
+            for chunk_row in columns[0]:
+                self._line_offsets.append(offset)
+                offset += chunk_row[5]
+
+            self._columns = columns
+            self._data = None
+
+        return columns
+
+    def _build_chunk(
+        self,
+        index: int,
+    ) -> DiffChunk:
+        """Build a chunk from the decoded columns.
+
+        Args:
+            index (int):
+                The index of the chunk to build.
+
+        Returns:
+            reviewboard.diffviewer.chunk_generator.DiffChunk:
+            The chunk.
+        """
+        (chunk_rows, v_line_nums, old_line_nums, old_markups, old_regions,
+         new_line_nums, new_markups, new_regions, whitespace,
+         line_metas) = self._get_columns()
+
+        (chunk_index, change_id, collapsable, numlines, meta,
+         num_lines) = chunk_rows[index]
+        start = self._line_offsets[index]
+
+        lines: list[DiffLine] = [
+            (
+                v_line_nums[i],
+                old_line_nums[i],
+                old_markups[i],
+                old_regions[i],
+                new_line_nums[i],
+                (old_markups[i] if new_markups[i] is None
+                 else new_markups[i]),
+                new_regions[i],
+                bool(whitespace[i]),
+                line_metas.get(i),
+            )
+            for i in range(start, start + num_lines)
+        ]
+
+        return {
+            'change': _CHANGE_TAGS[change_id],
+            'collapsable': collapsable,
+            'index': chunk_index,
+            'lines': lines,
+            'meta': meta,
+            'numlines': numlines,
+        }
@@ -279,6 +279,8 @@ def get_differ(
     b: Sequence[str],
     ignore_space: bool = False,
     compat_version: int = DiffCompatVersion.DEFAULT,
+    *,
+    accelerated: bool = True,
 ) -> Differ:
     """Return a differ for with the given settings.
 
@@ -286,6 +288,14 @@ def get_differ(
     by specifying a compat_version, but this is only for *really* ancient
     diffs, currently.
 
+    If NumPy is installed, large files will be diffed using
+    :py:class:`~reviewboard.diffviewer.numpy_myersdiff.NumPyMyersDiffer`,
+    which produces identical results more quickly.
+
+    Version Changed:
+        9.0:
+        Added the ``accelerated`` argument.
+
     Args:
         a (list of str):
             The original file, split into lines.
@@ -299,6 +309,10 @@ def get_differ(
         compat_version (int):
             The diff compatibility version.
 
+        accelerated (bool, optional):
+            Whether to use an accelerated differ, if one is available for
+            the diff.
+
     Returns:
         Differ:
         The new differ instance.
@@ -307,11 +321,19 @@ def get_differ(
         reviewboard.diffviewer.errors.DiffCompatError:
             The compatibility version was not valid.
     """
-    cls = None
+    cls: type[Differ]
 
     if compat_version in DiffCompatVersion.MYERS_VERSIONS:
         from reviewboard.diffviewer.myersdiff import MyersDiffer
-        cls = MyersDiffer
+        from reviewboard.diffviewer.numpy_myersdiff import (NumPyMyersDiffer,
+                                                            has_numpy)
+
+        if (accelerated and
+            has_numpy and
+            len(a) + len(b) >= NumPyMyersDiffer.MIN_LINES):
+            cls = NumPyMyersDiffer
+        else:
+            cls = MyersDiffer
     elif compat_version == DiffCompatVersion.SMDIFFER:
         from reviewboard.diffviewer.smdiff import SMDiffer
         cls = SMDiffer
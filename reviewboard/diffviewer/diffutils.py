@@ -10,7 +10,7 @@ import re
 import shutil
 import subprocess
 import tempfile
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from difflib import SequenceMatcher
 from typing import Any, AnyStr, Callable, Iterator, TYPE_CHECKING, TypeVar
 
@@ -31,6 +31,9 @@ from reviewboard.diffviewer.commit_utils import exclude_ancestor_filediffs
 from reviewboard.diffviewer.errors import DiffTooBigError, PatchError
 from reviewboard.diffviewer.filetypes import (HEADER_EXTENSIONS,
                                               IMPL_EXTENSIONS)
+from reviewboard.diffviewer.patcher import (PatchResult,
+                                            UnsupportedPatchError,
+                                            apply_patch)
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.scmtools.core import FileLookupContext, PRE_CREATION, HEAD
 
@@ -39,12 +42,16 @@ if TYPE_CHECKING:
 
     from typing_extensions import TypeAlias
 
-    from reviewboard.diffviewer.chunk_generator import DiffChunk
+    from reviewboard.diffviewer.chunk_generator import (
+        DiffChunk,
+        HighlightLineRanges,
+    )
     from reviewboard.diffviewer.models import (
         DiffCommit,
         DiffSet,
         FileDiff,
     )
+    from reviewboard.scmtools.models import Repository
 
 
 logger = logging.getLogger(__name__)
@@ -361,8 +368,10 @@ def patch(
 ) -> bytes:
     """Apply a diff to a file.
 
-    This delegates out to ``patch`` because no one except Larry Wall knows how
-    to patch.
+    Unified diffs are applied in-process using
+    :py:func:`reviewboard.diffviewer.patcher.apply_patch`. Any diffs that
+    can't be handled there are delegated out to ``patch``, because no one
+    except Larry Wall knows how to patch.
 
     If patching fails, this may attempt to work around the patch error,
     depending on the nature of the error. The end result may be a viewable
@@ -382,6 +391,11 @@ def patch(
         Added mitigation workarounds for certain types of bad diffs. This
         is controlled via the new ``workaround_errors``.
 
+    Version Changed:
+        9.0:
+        Unified diffs are now applied in-process, without writing temporary
+        files or invoking ``patch``.
+
     Args:
         diff (bytes):
             The contents of the diff to apply.
@@ -417,86 +431,136 @@ def patch(
     with log_timed(f'Patching file {filename}',
                    logger=logger,
                    request=request):
-        # Prepare the temporary directory if none is available
-        tempdir = tempfile.mkdtemp(prefix='reviewboard.')
+        orig_file = convert_line_endings(orig_file)
+        diff = convert_line_endings(diff)
 
         try:
-            orig_file = convert_line_endings(orig_file)
-            diff = convert_line_endings(diff)
+            result = apply_patch(diff=diff,
+                                 orig_file=orig_file,
+                                 filename=filename)
+        except UnsupportedPatchError as e:
+            logger.debug('Unable to apply the diff for %s in-process (%s). '
+                         'Falling back to patch(1).',
+                         filename, e,
+                         extra={'request': request})
 
-            (fd, oldfile) = tempfile.mkstemp(dir=tempdir)
-            f = os.fdopen(fd, 'w+b')
-            f.write(orig_file)
-            f.close()
+            result = _run_patch_command(diff=diff,
+                                        orig_file=orig_file,
+                                        filename=filename)
+
+        if result.failed and workaround_errors:
+            # Let's see if this is a diff error we can work around.
+            if (not orig_file.endswith(b'\n') and
+                not diff.rfind(br'\ No newline at end of file') != -1):
+                # The file doesn't end with a newline, and this isn't
+                # reflected in the diff. See if we can patch if we add a
+                # trailing newline. This is not going to be a completely
+                # accurate representation of the resulting file, but it's
+                # suitable for viewing.
+                try:
+                    return patch(diff=diff,
+                                 orig_file=orig_file + b'\n',
+                                 filename=filename,
+                                 request=request,
+                                 workaround_errors=False)
+                except Exception:
+                    # Ignore this and fall back to the original error.
+                    pass
 
-            newfile = '%s-new' % oldfile
+        if result.failed:
+            raise PatchError(filename=filename,
+                             error_output=result.error_output,
+                             orig_file=orig_file,
+                             new_file=result.new_file,
+                             diff=diff,
+                             rejects=result.rejects)
 
-            process = subprocess.Popen(['patch', '-o', newfile, oldfile],
-                                       stdin=subprocess.PIPE,
-                                       stdout=subprocess.PIPE,
-                                       stderr=subprocess.PIPE,
-                                       cwd=tempdir)
+        return result.new_file
 
-            with controlled_subprocess('patch', process) as p:
-                stdout, stderr = p.communicate(diff)
-                failure = p.returncode
 
-            try:
-                with open(newfile, 'rb') as f:
-                    new_file = f.read()
-            except Exception:
-                new_file = None
-
-            if failure and workaround_errors:
-                # Let's see if this is a diff error we can work around.
-                if (not orig_file.endswith(b'\n') and
-                    not diff.rfind(br'\ No newline at end of file') != -1):
-                    # The file doesn't end with a newline, and this isn't
-                    # reflected in the diff. See if we can patch if we add a
-                    # trailing newline. This is not going to be a completely
-                    # accurate representation of the resulting file, but it's
-                    # suitable for viewing.
-                    try:
-                        return patch(diff=diff,
-                                     orig_file=orig_file + b'\n',
-                                     filename=filename,
-                                     request=request,
-                                     workaround_errors=False)
-                    except Exception:
-                        # Ignore this and fall back to the original error.
-                        pass
-
-            if failure:
-                rejects_file = '%s.rej' % newfile
+def _run_patch_command(
+    *,
+    diff: bytes,
+    orig_file: bytes,
+    filename: str,
+) -> PatchResult:
+    """Apply a diff to a file using patch(1).
 
-                try:
-                    with open(rejects_file, 'rb') as f:
-                        rejects = f.read()
-                except Exception:
-                    rejects = None
+    This is used for any diffs that can't be applied in-process.
 
-                error_output = force_str(stderr.strip() or stdout.strip())
+    Version Added:
+        9.0
+
+    Args:
+        diff (bytes):
+            The contents of the diff to apply, with normalized newlines.
 
-                # Munge the output to show the filename instead of
-                # randomly-generated tempdir locations.
-                base_filename = os.path.basename(filename)
+        orig_file (bytes):
+            The contents of the original file, with normalized newlines.
 
-                error_output = (
-                    error_output
-                    .replace(rejects_file, '%s.rej' % base_filename)
-                    .replace(oldfile, base_filename)
-                )
+        filename (str):
+            The name of the file being patched.
 
-                raise PatchError(filename=filename,
-                                 error_output=error_output,
-                                 orig_file=orig_file,
-                                 new_file=new_file,
-                                 diff=diff,
-                                 rejects=rejects)
+    Returns:
+        reviewboard.diffviewer.patcher.PatchResult:
+        The result of the patch.
+    """
+    # Prepare the temporary directory if none is available
+    tempdir = tempfile.mkdtemp(prefix='reviewboard.')
+
+    try:
+        (fd, oldfile) = tempfile.mkstemp(dir=tempdir)
+        f = os.fdopen(fd, 'w+b')
+        f.write(orig_file)
+        f.close()
+
+        newfile = '%s-new' % oldfile
+
+        process = subprocess.Popen(['patch', '-o', newfile, oldfile],
+                                   stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE,
+                                   cwd=tempdir)
+
+        with controlled_subprocess('patch', process) as p:
+            stdout, stderr = p.communicate(diff)
+            failure = p.returncode
+
+        try:
+            with open(newfile, 'rb') as f:
+                new_file = f.read()
+        except Exception:
+            new_file = None
+
+        if not failure:
+            return PatchResult(new_file=new_file)
+
+        rejects_file = '%s.rej' % newfile
+
+        try:
+            with open(rejects_file, 'rb') as f:
+                rejects = f.read()
+        except Exception:
+            rejects = None
+
+        error_output = force_str(stderr.strip() or stdout.strip())
 
-            return new_file
-        finally:
-            shutil.rmtree(tempdir)
+        # Munge the output to show the filename instead of
+        # randomly-generated tempdir locations.
+        base_filename = os.path.basename(filename)
+
+        error_output = (
+            error_output
+            .replace(rejects_file, '%s.rej' % base_filename)
+            .replace(oldfile, base_filename)
+        )
+
+        return PatchResult(new_file=new_file,
+                           failed=True,
+                           error_output=error_output,
+                           rejects=rejects)
+    finally:
+        shutil.rmtree(tempdir)
 
 
 def get_original_file_from_repo(filediff, request=None):
@@ -534,44 +598,15 @@ def get_original_file_from_repo(filediff, request=None):
             An error occurred while computing the pre-patch file.
     """
     data = b''
-    extra_data = filediff.extra_data or {}
 
     # If the file has a parent source filename/revision recorded, we're
     # going to need to fetch that, since that'll be (potentially) the
     # latest commit in the repository.
-    #
-    # This information was added in Review Board 3.0.19. Prior versions
-    # stored the parent source revision as filediff.source_revision
-    # (rather than leaving that as identifying information for the actual
-    # file being shown in the review). It did not store the parent
-    # filename at all (which impacted diffs that contained a moved/renamed
-    # file on any type of repository that required a filename for lookup,
-    # such as Mercurial -- Git was not affected, since it only needs
-    # blob SHAs).
-    #
-    # If we're not working with a parent diff, or this is a FileDiff
-    # with legacy parent diff information, we just use the FileDiff
-    # FileDiff filename/revision fields as normal.
-    source_filename = extra_data.get('parent_source_filename',
-                                     filediff.source_file)
-    source_revision = extra_data.get('parent_source_revision',
-                                     filediff.source_revision)
+    source_filename, source_revision, context = \
+        _get_original_file_lookup(filediff, request=request)
 
     if source_revision != PRE_CREATION:
         repository = filediff.get_repository()
-
-        if filediff.commit_id is not None:
-            commit_extra_data = filediff.commit.extra_data
-        else:
-            commit_extra_data = {}
-
-        context = FileLookupContext(
-            request=request,
-            base_commit_id=filediff.diffset.base_commit_id,
-            diff_extra_data=filediff.diffset.extra_data,
-            commit_extra_data=commit_extra_data,
-            file_extra_data=extra_data)
-
         data = repository.get_file(path=source_filename,
                                    revision=source_revision,
                                    context=context)
@@ -620,6 +655,221 @@ def get_original_file_from_repo(filediff, request=None):
     return data
 
 
+def prefetch_original_files(
+    filediffs: Iterable[FileDiff],
+    *,
+    request: (HttpRequest | None) = None,
+) -> None:
+    """Prefetch the repository files needed for the pre-patch files.
+
+    Computing the pre-patch file for each FileDiff may require fetching a
+    file from the repository. For remote repositories, fetching these one at
+    a time as each file is rendered means one round-trip per file.
+
+    This fetches all the needed files into the cache up-front, concurrently
+    where the repository supports it, so that later calls to
+    :py:func:`get_original_file` will find them in the cache.
+
+    Errors are logged and ignored. They'll be raised again when computing
+    the pre-patch file for the affected FileDiff.
+
+    Version Added:
+        9.0
+
+    Args:
+        filediffs (list of reviewboard.diffviewer.models.filediff.FileDiff):
+            The FileDiffs that will be shown.
+
+        request (django.http.HttpRequest, optional):
+            The HTTP request from the client.
+    """
+    files_by_repository: dict[int, list[tuple[str, str,
+                                              FileLookupContext]]] = {}
+    repositories: dict[int, Repository] = {}
+
+    for filediff in filediffs:
+        try:
+            repo_filediff = _get_original_file_repo_filediff(filediff)
+
+            if repo_filediff is None:
+                continue
+
+            source_filename, source_revision, context = \
+                _get_original_file_lookup(repo_filediff, request=request)
+        except Exception as e:
+            logger.warning('Unable to determine the original file to '
+                           'prefetch for FileDiff %s: %s',
+                           filediff.pk, e)
+            continue
+
+        if source_revision == PRE_CREATION:
+            continue
+
+        repository = repo_filediff.get_repository()
+        repositories[repository.pk] = repository
+        files_by_repository.setdefault(repository.pk, []).append(
+            (source_filename, source_revision, context))
+
+    for repository_id, files in files_by_repository.items():
+        repositories[repository_id].prefetch_files(files=files)
+
+
+def prefetch_uncached_original_files(
+    files: Iterable[SerializedDiffFile],
+    *,
+    diff_settings: DiffSettings,
+    request: (HttpRequest | None) = None,
+) -> None:
+    """Prefetch the original files for diff files that aren't yet rendered.
+
+    This works like :py:func:`prefetch_original_files`, but only fetches
+    files for diffs whose chunks aren't already in the cache. Diffs with
+    cached chunks never need their original files, so fetching them would
+    only add repository round-trips.
+
+    Version Added:
+        9.0
+
+    Args:
+        files (list of SerializedDiffFile):
+            The diff files that will be shown.
+
+        diff_settings (reviewboard.diffviewer.settings.DiffSettings):
+            The settings used to control the display of diffs.
+
+        request (django.http.HttpRequest, optional):
+            The HTTP request from the client.
+    """
+    from reviewboard.diffviewer.chunk_generator import get_diff_chunk_generator
+
+    filediffs: list[FileDiff] = []
+
+    for diff_file in files:
+        filediff = diff_file['filediff']
+        interfilediff = diff_file['interfilediff']
+
+        chunk_generator = get_diff_chunk_generator(
+            request=request,
+            filediff=filediff,
+            interfilediff=interfilediff,
+            force_interdiff=diff_file['force_interdiff'],
+            base_filediff=diff_file.get('base_filediff'),
+            diff_settings=diff_settings)
+
+        if not chunk_generator.has_cached_chunks():
+            filediffs.append(filediff)
+
+            if interfilediff is not None:
+                filediffs.append(interfilediff)
+
+    if filediffs:
+        prefetch_original_files(filediffs, request=request)
+
+
+def _get_original_file_repo_filediff(
+    filediff: FileDiff,
+) -> FileDiff | None:
+    """Return the FileDiff whose source file must be fetched.
+
+    This mirrors the logic in :py:func:`get_original_file` for determining
+    which FileDiff's source file (if any) comes from the repository.
+
+    Version Added:
+        9.0
+
+    Args:
+        filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The FileDiff to compute the pre-patch file for.
+
+    Returns:
+        reviewboard.diffviewer.models.filediff.FileDiff:
+        The FileDiff whose source file must be fetched from the repository,
+        or ``None`` if nothing needs to be fetched.
+    """
+    if filediff.parent_diff:
+        return filediff
+
+    ancestors = filediff.get_ancestors(minimal=True)
+
+    if ancestors:
+        filediff = ancestors[0]
+
+    if filediff.is_new:
+        return None
+
+    return filediff
+
+
+def _get_original_file_lookup(
+    filediff: FileDiff,
+    *,
+    request: (HttpRequest | None) = None,
+) -> tuple[str, str, FileLookupContext]:
+    """Return information used to fetch a FileDiff's source file.
+
+    If the file has a parent source filename/revision recorded, that will
+    be returned, since that'll be (potentially) the latest commit in the
+    repository.
+
+    Version Added:
+        9.0
+
+    Args:
+        filediff (reviewboard.diffviewer.models.filediff.FileDiff):
+            The FileDiff to fetch the source file for.
+
+        request (django.http.HttpRequest, optional):
+            The HTTP request from the client.
+
+    Returns:
+        tuple:
+        A 3-tuple of:
+
+        Tuple:
+            0 (str):
+                The path of the file to fetch.
+
+            1 (str):
+                The revision of the file to fetch. This may be
+                :py:data:`~reviewboard.scmtools.core.PRE_CREATION`.
+
+            2 (reviewboard.scmtools.core.FileLookupContext):
+                The context for the file lookup.
+    """
+    extra_data = filediff.extra_data or {}
+
+    # This information was added in Review Board 3.0.19. Prior versions
+    # stored the parent source revision as filediff.source_revision
+    # (rather than leaving that as identifying information for the actual
+    # file being shown in the review). It did not store the parent
+    # filename at all (which impacted diffs that contained a moved/renamed
+    # file on any type of repository that required a filename for lookup,
+    # such as Mercurial -- Git was not affected, since it only needs
+    # blob SHAs).
+    #
+    # If we're not working with a parent diff, or this is a FileDiff
+    # with legacy parent diff information, we just use the FileDiff
+    # FileDiff filename/revision fields as normal.
+    source_filename = extra_data.get('parent_source_filename',
+                                     filediff.source_file)
+    source_revision = extra_data.get('parent_source_revision',
+                                     filediff.source_revision)
+
+    if filediff.commit_id is not None:
+        commit_extra_data = filediff.commit.extra_data
+    else:
+        commit_extra_data = {}
+
+    context = FileLookupContext(
+        request=request,
+        base_commit_id=filediff.diffset.base_commit_id,
+        diff_extra_data=filediff.diffset.extra_data,
+        commit_extra_data=commit_extra_data,
+        file_extra_data=extra_data)
+
+    return source_filename, source_revision, context
+
+
 def get_original_file(
     filediff: FileDiff,
     request: (HttpRequest | None) = None,
@@ -1609,6 +1859,7 @@ def populate_diff_chunks(
     *,
     request: (HttpRequest | None) = None,
     diff_settings: DiffSettings,
+    highlight_line_ranges: (HighlightLineRanges | None) = None,
 ) -> None:
     """Populate a list of diff files with chunk data.
 
@@ -1616,6 +1867,10 @@ def populate_diff_chunks(
     generates diff chunk data for each file in the list. The chunk data is
     stored in memory in the file state.
 
+    Version Changed:
+        9.0:
+        Added the ``highlight_line_ranges`` argument.
+
     Version Changed:
         6.0:
         * Made all arguments other than ``files`` keyword-only.
@@ -1633,9 +1888,25 @@ def populate_diff_chunks(
 
             Version Added:
                 5.0.2
+
+        highlight_line_ranges (tuple, optional):
+            Additional ranges of lines in the original and modified files to
+            syntax-highlight, for files where only visible lines are
+            highlighted. This is generally used along with a single file,
+            in order to highlight lines being expanded. See
+            :py:func:`~reviewboard.diffviewer.chunk_generator.
+            get_highlight_pending_line_ranges`.
+
+            Version Added:
+                9.0
     """
     from reviewboard.diffviewer.chunk_generator import get_diff_chunk_generator
 
+    generator_kwargs: dict[str, Any] = {}
+
+    if highlight_line_ranges:
+        generator_kwargs['highlight_line_ranges'] = highlight_line_ranges
+
     for diff_file in files:
         chunk_generator = get_diff_chunk_generator(
             request=request,
@@ -1643,7 +1914,8 @@ def populate_diff_chunks(
             interfilediff=diff_file['interfilediff'],
             force_interdiff=diff_file['force_interdiff'],
             base_filediff=diff_file.get('base_filediff'),
-            diff_settings=diff_settings)
+            diff_settings=diff_settings,
+            **generator_kwargs)
         chunks = list(chunk_generator.get_chunks())
 
         diff_file.update({
@@ -2218,9 +2490,27 @@ def get_file_chunks_in_range(
                                        tip_commit=tip_commit)
 
     if diff_file:
-        yield from get_chunks_in_range(chunks=diff_file['chunks'],
-                                       first_line=first_line,
-                                       num_lines=num_lines)
+        from reviewboard.diffviewer.chunk_generator import \
+            get_highlight_pending_line_ranges
+
+        chunks = list(get_chunks_in_range(chunks=diff_file['chunks'],
+                                          first_line=first_line,
+                                          num_lines=num_lines))
+        highlight_line_ranges = get_highlight_pending_line_ranges(chunks)
+
+        if highlight_line_ranges:
+            # Some of these lines were collapsed in a large file, and haven't
+            # been syntax-highlighted yet. Regenerate the chunks with them
+            # highlighted.
+            populate_diff_chunks(files=[diff_file],
+                                 request=context.get('request'),
+                                 diff_settings=diff_settings,
+                                 highlight_line_ranges=highlight_line_ranges)
+            chunks = list(get_chunks_in_range(chunks=diff_file['chunks'],
+                                              first_line=first_line,
+                                              num_lines=num_lines))
+
+        yield from chunks
 
 
 def get_chunks_in_range(chunks, first_line, num_lines):
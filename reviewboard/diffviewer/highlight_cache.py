@@ -0,0 +1,214 @@
+"""Content-addressed caching of syntax-highlighted source files.
+
+Syntax highlighting is often the most expensive part of generating diff
+chunks, and the same file content is highlighted over and over again:
+once per FileDiff containing it, once per interdiff, and once per set of
+diff settings.
+
+This module caches highlighted lines keyed off of a SHA-256 of the file
+content, the highlighter used (a tree-sitter language or a Pygments lexer)
+and the highlighter's version. Any file with the same content is
+highlighted only once for each way it's shown. The text file review UI
+processes highlighted output differently from the diff viewer, so it uses
+its own variant of the highlighter ID and keeps separate cache entries.
+
+Highlighted lines are stored as a compressed, pickled list.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+import zlib
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
+
+import pygments
+from djblets.cache.backend import cache_memoize
+
+from reviewboard import get_package_version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pygments.lexer import Lexer
+
+    from reviewboard.treesitter.language import SupportedLanguage
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The version of the format stored in the highlight cache.
+#:
+#: This must be increased whenever the format of the cached data changes,
+#: or whenever highlighting output changes in a way not covered by the
+#: Review Board or Pygments versions.
+HIGHLIGHT_CACHE_VERSION = 1
+
+#: The zlib compression level used for cached highlighted lines.
+_COMPRESSION_LEVEL = 6
+
+
+def get_pygments_highlighter_id(
+    lexer: Lexer,
+    variant: str = '',
+) -> str:
+    """Return a highlighter ID for a Pygments lexer.
+
+    Args:
+        lexer (pygments.lexer.Lexer):
+            The lexer used for highlighting.
+
+        variant (str, optional):
+            An optional identifier for how the lexer output is processed.
+            Callers that format or split lines differently must use
+            different variants.
+
+    Returns:
+        str:
+        The highlighter ID.
+    """
+    lexer_cls = type(lexer)
+    highlighter_id = (
+        f'pygments-{pygments.__version__}-'
+        f'{lexer_cls.__module__}.{lexer_cls.__qualname__}'
+    )
+
+    if variant:
+        highlighter_id = f'{highlighter_id}-{variant}'
+
+    return highlighter_id
+
+
+def get_treesitter_highlighter_id(
+    language: SupportedLanguage,
+) -> str:
+    """Return a highlighter ID for a tree-sitter language.
+
+    The ID includes the versions of tree-sitter and the language pack
+    providing the grammars, so that upgrading either one invalidates any
+    cached highlighting.
+
+    Args:
+        language (reviewboard.treesitter.language.SupportedLanguage):
+            The language used for highlighting.
+
+    Returns:
+        str:
+        The highlighter ID.
+    """
+    return f'treesitter-{_get_treesitter_versions()}-{language}'
+
+
+@lru_cache(maxsize=1)
+def _get_treesitter_versions() -> str:
+    """Return the installed versions of tree-sitter and its grammars.
+
+    Returns:
+        str:
+        The versions, for use in a highlighter ID.
+    """
+    versions: list[str] = []
+
+    for package_name in ('tree-sitter', 'tree-sitter-language-pack'):
+        try:
+            versions.append(version(package_name))
+        except PackageNotFoundError:
+            versions.append('unknown')
+
+    return '-'.join(versions)
+
+
+def make_highlight_cache_key(
+    *,
+    content: bytes | str,
+    highlighter_id: str,
+) -> str:
+    """Return the cache key for highlighted content.
+
+    Args:
+        content (bytes or str):
+            The content being highlighted.
+
+        highlighter_id (str):
+            The ID of the highlighter. This must identify the highlighter
+            and any options that affect its output.
+
+    Returns:
+        str:
+        The cache key.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'surrogatepass')
+
+    content_sha256 = hashlib.sha256(content).hexdigest()
+
+    return (
+        f'highlight-{HIGHLIGHT_CACHE_VERSION}-{get_package_version()}-'
+        f'{highlighter_id}-{content_sha256}'
+    )
+
+
+def get_highlighted_lines(
+    *,
+    content: bytes | str,
+    highlighter_id: str,
+    highlight_func: Callable[[], Sequence[str] | None],
+) -> Sequence[str] | None:
+    """Return highlighted lines for content, using the cache if possible.
+
+    If the content has already been highlighted by the same highlighter,
+    the cached lines will be returned. Otherwise, ``highlight_func`` will be
+    called and its result cached.
+
+    If ``highlight_func`` raises an exception, nothing will be cached.
+
+    Args:
+        content (bytes or str):
+            The content being highlighted.
+
+        highlighter_id (str):
+            The ID of the highlighter. This must identify the highlighter
+            and any options that affect its output.
+
+        highlight_func (callable):
+            The function used to highlight the content on a cache miss.
+
+    Returns:
+        list of str:
+        The highlighted lines, or ``None`` if the highlighter could not
+        highlight the content.
+    """
+    def _highlight() -> bytes:
+        lines = highlight_func()
+
+        if lines is None:
+            return b''
+
+        return zlib.compress(pickle.dumps(list(lines),
+                                          protocol=pickle.HIGHEST_PROTOCOL),
+                             _COMPRESSION_LEVEL)
+
+    data = cache_memoize(
+        make_highlight_cache_key(content=content,
+                                 highlighter_id=highlighter_id),
+        _highlight,
+        large_data=True,
+        compress_large_data=False)
+
+    if not data:
+        return None
+
+    try:
+        return pickle.loads(zlib.decompress(data))
+    except Exception as e:
+        logger.warning('Unable to load cached highlighting for %s: %s',
+                       highlighter_id, e)
+
+        return highlight_func()
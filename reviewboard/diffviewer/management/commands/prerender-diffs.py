@@ -0,0 +1,156 @@
+"""Management command to pre-render diffs for review requests.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.translation import gettext as _
+
+from reviewboard.diffviewer.models import DiffSet
+from reviewboard.diffviewer.prerender import prerender_diffset
+from reviewboard.reviews.models import ReviewRequest
+
+
+class Command(BaseCommand):
+    """Management command to pre-render diffs for review requests.
+
+    This generates and caches the diff chunks for the latest diff on each
+    review request, along with the interdiff against the previous diff.
+    This can be used to warm the cache for review requests that are about
+    to be reviewed.
+
+    Version Added:
+        9.0
+    """
+
+    help = _(
+        'Generate and cache rendered diffs for the given review requests.'
+    )
+
+    def add_arguments(
+        self,
+        parser: argparse.ArgumentParser,
+    ) -> None:
+        """Add arguments to the command.
+
+        Args:
+            parser (argparse.ArgumentParser):
+                The argument parser for the command.
+        """
+        parser.add_argument(
+            'review_request_ids',
+            metavar='REVIEW_REQUEST_ID',
+            nargs='+',
+            type=int,
+            help=_('The IDs of the review requests to pre-render.'))
+        parser.add_argument(
+            '--all-revisions',
+            action='store_true',
+            default=False,
+            help=_(
+                'Pre-render every diff revision and the interdiffs between '
+                'each consecutive revision, instead of only the latest.'
+            ))
+        parser.add_argument(
+            '--max-lines',
+            type=int,
+            default=None,
+            help=_(
+                'The maximum number of changed lines to pre-render per diff. '
+                'Defaults to no limit.'
+            ))
+
+    def handle(
+        self,
+        **options,
+    ) -> None:
+        """Handle the command.
+
+        Args:
+            **options (dict):
+                Options parsed on the command line.
+
+        Raises:
+            django.core.management.CommandError:
+                A review request could not be found.
+        """
+        review_request_ids: list[int] = options['review_request_ids']
+        all_revisions: bool = options['all_revisions']
+        max_lines: (int | None) = options['max_lines']
+
+        review_requests = {
+            review_request.pk: review_request
+            for review_request in (
+                ReviewRequest.objects
+                .filter(pk__in=review_request_ids)
+                .only('pk', 'diffset_history')
+            )
+        }
+
+        for review_request_id in review_request_ids:
+            if review_request_id not in review_requests:
+                raise CommandError(
+                    _('Review request %s does not exist.')
+                    % review_request_id)
+
+        for review_request_id in review_request_ids:
+            review_request = review_requests[review_request_id]
+            diffsets = list(
+                DiffSet.objects
+                .filter(history=review_request.diffset_history_id)
+                .select_related('repository')
+                .order_by('revision')
+            )
+
+            if not all_revisions:
+                diffsets = diffsets[-2:]
+
+            jobs: list[tuple[DiffSet, DiffSet | None]] = []
+
+            for i, diffset in enumerate(diffsets):
+                if all_revisions or i == len(diffsets) - 1:
+                    jobs.append((diffset, None))
+
+                if i > 0:
+                    jobs.append((diffsets[i - 1], diffset))
+
+            for diffset, interdiffset in jobs:
+                if interdiffset is None:
+                    label = _('Review request %(id)s, diff %(revision)s') % {
+                        'id': review_request_id,
+                        'revision': diffset.revision,
+                    }
+                else:
+                    label = (
+                        _('Review request %(id)s, interdiff %(revision)s-'
+                          '%(interdiff_revision)s')
+                        % {
+                            'id': review_request_id,
+                            'interdiff_revision': interdiffset.revision,
+                            'revision': diffset.revision,
+                        })
+
+                start_time = time.monotonic()
+                stats = prerender_diffset(diffset=diffset,
+                                          interdiffset=interdiffset,
+                                          max_lines=max_lines)
+                elapsed = time.monotonic() - start_time
+
+                self.stdout.write(
+                    _('%(label)s: %(rendered)s of %(total)s files rendered, '
+                      '%(skipped)s skipped, %(failed)s failed '
+                      '(%(elapsed).2fs)')
+                    % {
+                        'elapsed': elapsed,
+                        'failed': stats.num_failed,
+                        'label': label,
+                        'rendered': stats.num_rendered,
+                        'skipped': stats.num_skipped,
+                        'total': stats.num_files,
+                    })
@@ -1084,6 +1084,55 @@ class DiffSetManager(BaseDiffManager):
 
         return diffset
 
+    def create_from_upload(self, *args, **kwargs):
+        """Create a DiffSet from a form upload.
+
+        This works like :py:meth:`BaseDiffManager.create_from_upload`, but
+        will also queue the new DiffSet for pre-rendering, if enabled.
+
+        Version Added:
+            9.0
+
+        Args:
+            *args (tuple):
+                Positional arguments to pass to the parent method.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the parent method.
+
+        Returns:
+            reviewboard.diffviewer.models.diffset.DiffSet:
+            The resulting DiffSet stored in the database, if processing
+            succeeded and ``validate_only=False``.
+
+        Raises:
+            reviewboard.diffviewer.errors.DiffParserError:
+                There was an error parsing the main diff or parent diff.
+
+            reviewboard.diffviewer.errors.DiffTooBigError:
+                The diff file was too big to be uploaded, based on the
+                configured maximum diff size in settings.
+
+            reviewboard.diffviewer.errors.EmptyDiffError:
+                The provided diff file did not contain any file changes.
+
+            reviewboard.scmtools.core.FileNotFoundError:
+                A file specified in the diff could not be found in the
+                repository.
+
+            reviewboard.scmtools.core.SCMError:
+                There was an error talking to the repository when validating
+                the existence of a file.
+        """
+        from reviewboard.diffviewer.prerender import diff_prerenderer
+
+        diffset = super().create_from_upload(*args, **kwargs)
+
+        if diffset is not None:
+            diff_prerenderer.queue_diffset(diffset)
+
+        return diffset
+
     def create_empty(self, repository, diffset_history=None, **kwargs):
         """Create a DiffSet with no attached FileDiffs.
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from itertools import chain
-from typing import ClassVar, TYPE_CHECKING
+from typing import ClassVar, Iterator, TYPE_CHECKING
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
@@ -362,6 +362,25 @@ class FileDiff(models.Model):
 
     diff = property(_get_diff, _set_diff)
 
+    def iter_diff(self) -> Iterator[bytes]:
+        """Iterate through the diff content in chunks.
+
+        This is equivalent to :py:attr:`diff`, but decompresses the stored
+        diff incrementally, avoiding holding the entire uncompressed diff in
+        memory.
+
+        Version Added:
+            9.0
+
+        Yields:
+            bytes:
+            Each chunk of diff content.
+        """
+        if self._needs_diff_migration():
+            self._migrate_diff_data()
+
+        yield from self.diff_hash.iter_content()
+
     @property
     def is_diff_empty(self):
         """Whether or not the diff is empty."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import bz2
 import logging
-from typing import ClassVar
+from typing import ClassVar, Iterator
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -56,6 +56,48 @@ class RawFileDiffData(models.Model):
                 'Unsupported compression method %s for RawFileDiffData %s'
                 % (self.compression, self.pk))
 
+    def iter_content(
+        self,
+        *,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """Iterate through the content of the diff.
+
+        Compressed content is decompressed incrementally, allowing large
+        diffs to be streamed without holding the entire uncompressed diff
+        in memory.
+
+        Version Added:
+            9.0
+
+        Args:
+            chunk_size (int, optional):
+                The number of bytes of stored data to process at a time.
+
+        Yields:
+            bytes:
+            Each chunk of uncompressed content.
+
+        Raises:
+            NotImplementedError:
+                The compression method for the data isn't supported.
+        """
+        if self.compression == self.COMPRESSION_BZIP2:
+            decompressor = bz2.BZ2Decompressor()
+            binary = memoryview(self.binary)
+
+            for i in range(0, len(binary), chunk_size):
+                data = decompressor.decompress(binary[i:i + chunk_size])
+
+                if data:
+                    yield data
+        elif self.compression is None:
+            yield bytes(self.binary)
+        else:
+            raise NotImplementedError(
+                'Unsupported compression method %s for RawFileDiffData %s'
+                % (self.compression, self.pk))
+
     @property
     def insert_count(self):
         return self.extra_data.get('insert_count')
@@ -170,6 +170,11 @@ class MyersDiffer(Differ):
             # There's nothing to process or yield. Bail.
             return
 
+        a_length = a_data.length
+        b_length = b_data.length
+        a_modified = a_data.modified
+        b_modified = b_data.modified
+
         a_line = b_line = 0
         last_group: (DiffOpcode | None) = None
 
@@ -184,11 +189,19 @@ class MyersDiffer(Differ):
                 a_line not in a_data.modified and
                 b_line < b_data.length and
                 b_line not in b_data.modified):
-                # Equal
-                a_changed = b_changed = 1
-                tag = 'equal'
+                # Equal. Consume the whole run of equal lines at once.
                 a_line += 1
                 b_line += 1
+
+                while (a_line < a_length and
+                       a_line not in a_modified and
+                       b_line < b_length and
+                       b_line not in b_modified):
+                    a_line += 1
+                    b_line += 1
+
+                a_changed = b_changed = a_line - a_start
+                tag = 'equal'
             else:
                 # Deleted, inserted or replaced
 
@@ -331,27 +344,36 @@ class MyersDiffer(Differ):
             #       special hooks
 
             raw_line = line
-            stripped_line = line.lstrip()
 
-            # We still want to show lines that contain only whitespace.
-            if ignore_space and len(stripped_line) > 0:
-                line = stripped_line
+            if ignore_space:
+                stripped_line = line.lstrip()
+
+                # We still want to show lines that contain only whitespace.
+                if stripped_line:
+                    line = stripped_line
 
-            interesting_line_name = None
+            code = code_table.get(line)
 
-            try:
-                code = code_table[line]
-                interesting_line_name = \
-                    interesting_line_table.get(code, None)
-            except KeyError:
+            if code is not None:
+                # Most lines in large files are repeats of lines we've
+                # already seen, so avoid any further work for them.
+                codes.append(code)
+
+                if not interesting_line_table:
+                    continue
+
+                interesting_line_name = interesting_line_table.get(code)
+            else:
                 # This is a new, unrecorded line, so mark it and store it.
                 last_code += 1
                 code = last_code
                 code_table[line] = code
+                codes.append(code)
+                interesting_line_name = None
 
                 # Check to see if this is an interesting line that the caller
                 # wants recorded.
-                if stripped_line:
+                if raw_line.lstrip():
                     for name, regex in interesting_line_regexes:
                         if regex.match(raw_line):
                             interesting_line_name = name
@@ -362,8 +384,6 @@ class MyersDiffer(Differ):
                 interesting_lines[interesting_line_name].append(
                     (linenum, raw_line))
 
-            codes.append(code)
-
         self.last_code = last_code
 
         return codes
@@ -417,13 +437,22 @@ class MyersDiffer(Differ):
         """
         down_vector = self.fdiag  # The vector for the (0, 0) to (x, y) search
         up_vector = self.bdiag    # The vector for the (u, v) to (N, M) search
+        downoff = self.downoff
+        upoff = self.upoff
+        max_lines = self.max_lines
+        snake_limit = self.SNAKE_LIMIT
+
+        # These are looked up for every compared line, so keep them local.
+        a_undiscarded = self.a_data.undiscarded
+        b_undiscarded = self.b_data.undiscarded
+
 
         down_k = a_lower - b_lower  # The k-line to start the forward search
         up_k = a_upper - b_upper    # The k-line to start the reverse search
         odd_delta = (down_k - up_k) % 2 != 0
 
-        down_vector[self.downoff + down_k] = a_lower
-        up_vector[self.upoff + up_k] = a_upper
+        down_vector[downoff + down_k] = a_lower
+        up_vector[upoff + up_k] = a_upper
 
         dmin = a_lower - b_upper
         dmax = a_upper - b_lower
@@ -432,7 +461,7 @@ class MyersDiffer(Differ):
         up_min = up_max = up_k
 
         cost = 0
-        max_cost = max(256, self._very_approx_sqrt(self.max_lines * 4))
+        max_cost = max(256, self._very_approx_sqrt(max_lines * 4))
 
         while True:
             cost += 1
@@ -440,20 +469,20 @@ class MyersDiffer(Differ):
 
             if down_min > dmin:
                 down_min -= 1
-                down_vector[self.downoff + down_min - 1] = -1
+                down_vector[downoff + down_min - 1] = -1
             else:
                 down_min += 1
 
             if down_max < dmax:
                 down_max += 1
-                down_vector[self.downoff + down_max + 1] = -1
+                down_vector[downoff + down_max + 1] = -1
             else:
                 down_max -= 1
 
             # Extend the forward path
             for k in range(down_max, down_min - 1, -2):
-                tlo = down_vector[self.downoff + k - 1]
-                thi = down_vector[self.downoff + k + 1]
+                tlo = down_vector[downoff + k - 1]
+                thi = down_vector[downoff + k + 1]
 
                 if tlo >= thi:
                     x = tlo + 1
@@ -466,36 +495,35 @@ class MyersDiffer(Differ):
                 # Find the end of the furthest reaching forward D-path in
                 # diagonal k
                 while (x < a_upper and y < b_upper and
-                       (self.a_data.undiscarded[x] ==
-                        self.b_data.undiscarded[y])):
+                       a_undiscarded[x] == b_undiscarded[y]):
                     x += 1
                     y += 1
 
                 if odd_delta and up_min <= k <= up_max and \
-                   up_vector[self.upoff + k] <= x:
+                   up_vector[upoff + k] <= x:
                     return x, y, True, True
 
-                if x - old_x > self.SNAKE_LIMIT:
+                if x - old_x > snake_limit:
                     big_snake = True
 
-                down_vector[self.downoff + k] = x
+                down_vector[downoff + k] = x
 
             # Extend the reverse path
             if up_min > dmin:
                 up_min -= 1
-                up_vector[self.upoff + up_min - 1] = self.max_lines
+                up_vector[upoff + up_min - 1] = max_lines
             else:
                 up_min += 1
 
             if up_max < dmax:
                 up_max += 1
-                up_vector[self.upoff + up_max + 1] = self.max_lines
+                up_vector[upoff + up_max + 1] = max_lines
             else:
                 up_max -= 1
 
             for k in range(up_max, up_min - 1, -2):
-                tlo = up_vector[self.upoff + k - 1]
-                thi = up_vector[self.upoff + k + 1]
+                tlo = up_vector[upoff + k - 1]
+                thi = up_vector[upoff + k + 1]
 
                 if tlo < thi:
                     x = tlo
@@ -506,19 +534,18 @@ class MyersDiffer(Differ):
                 old_x = x
 
                 while (x > a_lower and y > b_lower and
-                       (self.a_data.undiscarded[x - 1] ==
-                        self.b_data.undiscarded[y - 1])):
+                       a_undiscarded[x - 1] == b_undiscarded[y - 1]):
                     x -= 1
                     y -= 1
 
                 if (not odd_delta and down_min <= k <= down_max and
-                        x <= down_vector[self.downoff + k]):
+                        x <= down_vector[downoff + k]):
                     return x, y, True, True
 
-                if old_x - x > self.SNAKE_LIMIT:
+                if old_x - x > snake_limit:
                     big_snake = True
 
-                up_vector[self.upoff + k] = x
+                up_vector[upoff + k] = x
 
             if find_minimal:
                 continue
@@ -535,10 +562,10 @@ class MyersDiffer(Differ):
             if cost > 200 and big_snake:
                 ret_x, ret_y, best = self._find_diagonal(
                     down_min, down_max, down_k, 0,
-                    self.downoff, down_vector,
+                    downoff, down_vector,
                     lambda x: x - a_lower,
-                    lambda x: a_lower + self.SNAKE_LIMIT <= x < a_upper,
-                    lambda y: b_lower + self.SNAKE_LIMIT <= y < b_upper,
+                    lambda x: a_lower + snake_limit <= x < a_upper,
+                    lambda y: b_lower + snake_limit <= y < b_upper,
                     lambda i, k: i - k,
                     1, cost)
 
@@ -546,11 +573,11 @@ class MyersDiffer(Differ):
                     return ret_x, ret_y, True, False
 
                 ret_x, ret_y, best = self._find_diagonal(
-                    up_min, up_max, up_k, best, self.upoff,
+                    up_min, up_max, up_k, best, upoff,
                     up_vector,
                     lambda x: a_upper - x,
-                    lambda x: a_lower < x <= a_upper - self.SNAKE_LIMIT,
-                    lambda y: b_lower < y <= b_upper - self.SNAKE_LIMIT,
+                    lambda x: a_lower < x <= a_upper - snake_limit,
+                    lambda y: b_lower < y <= b_upper - snake_limit,
                     lambda i, k: i + k,
                     0, cost)
 
@@ -566,7 +593,7 @@ class MyersDiffer(Differ):
                 # Find the forward diagonal that maximized x + y
                 fxy_best = -1
                 for d in range(down_max, down_min - 1, -2):
-                    x = min(down_vector[self.downoff + d], a_upper)
+                    x = min(down_vector[downoff + d], a_upper)
                     y = x - d
 
                     if b_upper < y:
@@ -578,9 +605,9 @@ class MyersDiffer(Differ):
                         fx_best = x
 
                 # Find the backward diagonal that minimizes x + y
-                bxy_best = self.max_lines
+                bxy_best = max_lines
                 for d in range(up_max, up_min - 1, -2):
-                    x = max(a_lower, up_vector[self.upoff + d])
+                    x = max(a_lower, up_vector[upoff + d])
                     y = x - d
 
                     if y < b_lower:
@@ -727,30 +754,29 @@ class MyersDiffer(Differ):
             find_minimal (bool):
                 Whether to iterate until a minimal diff is found.
         """
+        a_data = self.a_data
+        b_data = self.b_data
+        a_undiscarded = a_data.undiscarded
+        b_undiscarded = b_data.undiscarded
+
         # Fast walkthrough equal lines at the start.
         while (a_lower < a_upper and b_lower < b_upper and
-               (self.a_data.undiscarded[a_lower] ==
-                self.b_data.undiscarded[b_lower])):
+               a_undiscarded[a_lower] == b_undiscarded[b_lower]):
             a_lower += 1
             b_lower += 1
 
         # Fast walkthrough equal lines at the end.
         while (a_upper > a_lower and b_upper > b_lower and
-               (self.a_data.undiscarded[a_upper - 1] ==
-                self.b_data.undiscarded[b_upper - 1])):
+               a_undiscarded[a_upper - 1] == b_undiscarded[b_upper - 1]):
             a_upper -= 1
             b_upper -= 1
 
         if a_lower == a_upper:
             # Purely inserted lines.
-            while b_lower < b_upper:
-                self.b_data.modified.add(self.b_data.real_indexes[b_lower])
-                b_lower += 1
+            b_data.modified.update(b_data.real_indexes[b_lower:b_upper])
         elif b_lower == b_upper:
             # Purely deleted lines.
-            while a_lower < a_upper:
-                self.a_data.modified.add(self.a_data.real_indexes[a_lower])
-                a_lower += 1
+            a_data.modified.update(a_data.real_indexes[a_lower:a_upper])
         else:
             # Find the middle snake and length of an optimal path for A and B.
             x, y, low_minimal, high_minimal = \
@@ -875,201 +901,233 @@ class MyersDiffer(Differ):
                     j -= 1
 
     def _discard_confusing_lines(self) -> None:
-        """Discard lines that may make the diff confusing."""
-        def build_discard_list(
-            data: _DiffData,
-            discards: list[int],
-            counts: Sequence[int],
-        ) -> None:
-            """Populate the discard list.
-
-            Args:
-                data (_DiffData):
-                    The data to operate on.
-
-                discards (list of int):
-                    The discards. This will be modified.
-
-                counts (list of int):
-                    The number of times each unique line appears in the data.
-            """
-            many = 5 * self._very_approx_sqrt(data.length // 64)
-
-            for i, item in enumerate(data.data):
-                if item != 0:
-                    num_matches = counts[item]
-
-                    if num_matches == 0:
-                        discards[i] = self.DISCARD_FOUND
-                    elif num_matches > many:
-                        discards[i] = self.DISCARD_CANCEL
-
-        def scan_run(
-            discards: list[int],
-            i: int,
-            length: int,
-            index_func: Callable[[int, int], int],
-        ) -> None:
-            """Scan a run of discarded lines.
-
-            Args:
-                discards (list of int):
-                    The discards. This will be modified.
-
-                i (int):
-                    The index to start at.
-
-                length (int):
-                    The length of the run to scan.
-
-                index_func (callable):
-                    A function to create an index into the ``discards`` list.
-            """
-            consec = 0
-
-            for j in range(length):
-                index = index_func(i, j)
-                discard = discards[index]
-
-                if j >= 8 and discard == self.DISCARD_FOUND:
-                    break
+        """Discard lines that may make the diff confusing.
 
-                if discard == self.DISCARD_FOUND:
-                    consec += 1
-                else:
-                    consec = 0
+        Version Changed:
+            9.0:
+            The individual steps were split out into methods, so that
+            subclasses can provide optimized implementations.
+        """
+        a_data = self.a_data
+        b_data = self.b_data
+        last_code = self.last_code
 
-                    if discard == self.DISCARD_CANCEL:
-                        discards[index] = self.DISCARD_NONE
+        a_code_counts = [0] * (1 + last_code)
+        b_code_counts = [0] * (1 + last_code)
 
-                if consec == 3:
-                    break
+        for item in a_data.data:
+            a_code_counts[item] += 1
 
-        def check_discard_runs(
-            data: _DiffData,
-            discards: list[int],
-        ) -> None:
-            """Check runs of discarded lines.
-
-            Args:
-                data (_DiffData):
-                    The data to operate on.
-
-                discards (list of int):
-                    The discards. This will be modified.
-            """
-            i = 0
-            while i < data.length:
-                # Cancel the provisional discards that are not in the middle
-                # of a run of discards
-                if discards[i] == self.DISCARD_CANCEL:
-                    discards[i] = self.DISCARD_NONE
-                elif discards[i] == self.DISCARD_FOUND:
-                    # We found a provisional discard
-                    provisional = 0
-
-                    # Find the end of this run of discardable lines and count
-                    # how many are provisionally discardable.
-                    j = i
-                    while j < data.length:
-                        if discards[j] == self.DISCARD_NONE:
-                            break
-                        elif discards[j] == self.DISCARD_CANCEL:
-                            provisional += 1
-                        j += 1
+        for item in b_data.data:
+            b_code_counts[item] += 1
 
-                    # Cancel the provisional discards at the end and shrink
-                    # the run.
-                    while j > i and discards[j - 1] == self.DISCARD_CANCEL:
-                        j -= 1
-                        discards[j] = 0
-                        provisional -= 1
-
-                    length = j - i
-
-                    # If 1/4 of the lines are provisional, cancel discarding
-                    # all the provisional lines in the run.
-                    if provisional * 4 > length:
-                        while j > i:
-                            j -= 1
-                            if discards[j] == self.DISCARD_CANCEL:
-                                discards[j] = self.DISCARD_NONE
-                    else:
-                        minimum = 1 + self._very_approx_sqrt(length // 4)
-                        j = 0
-                        consec = 0
-                        while j < length:
-                            if discards[i + j] != self.DISCARD_CANCEL:
-                                consec = 0
-                            else:
-                                consec += 1
-                                if minimum == consec:
-                                    j -= consec
-                                elif minimum < consec:
-                                    discards[i + j] = self.DISCARD_NONE
-
-                            j += 1
-
-                        scan_run(discards, i, length, lambda x, y: x + y)
-                        i += length - 1
-                        scan_run(discards, i, length, lambda x, y: x - y)
+        a_discards = self._build_discard_list(a_data, b_code_counts)
+        b_discards = self._build_discard_list(b_data, a_code_counts)
 
-                i += 1
+        self._check_discard_runs(a_discards, 0, a_data.length)
+        self._check_discard_runs(b_discards, 0, b_data.length)
+
+        self._discard_lines(a_data, a_discards)
+        self._discard_lines(b_data, b_discards)
+
+    def _build_discard_list(
+        self,
+        data: _DiffData,
+        counts: Sequence[int],
+    ) -> list[int]:
+        """Build the list of provisional discards for one side of the diff.
+
+        Version Added:
+            9.0
+
+        Args:
+            data (_DiffData):
+                The data to operate on.
+
+            counts (list of int):
+                The number of times each unique line appears in the other
+                side of the diff.
+
+        Returns:
+            list of int:
+            The discard state for each line.
+        """
+        discards = [self.DISCARD_NONE] * data.length
+        many = 5 * self._very_approx_sqrt(data.length // 64)
+
+        for i, item in enumerate(data.data):
+            if item != 0:
+                num_matches = counts[item]
+
+                if num_matches == 0:
+                    discards[i] = self.DISCARD_FOUND
+                elif num_matches > many:
+                    discards[i] = self.DISCARD_CANCEL
 
-        def discard_lines(
-            data: _DiffData,
-            discards: Sequence[int],
-        ) -> None:
-            """Perform the actual discard.
-
-            Args:
-                data (_DiffData):
-                    The data for the file. This will be modified.
-
-                discards (list of int):
-                    The discard information.
-            """
-            j = 0
-
-            for i, item in enumerate(data.data):
-                if discards[i] == self.DISCARD_NONE:
-                    data.undiscarded[j] = item
-                    data.real_indexes[j] = i
+        return discards
+
+    def _check_discard_runs(
+        self,
+        discards: list[int],
+        start: int,
+        end: int,
+    ) -> None:
+        """Check runs of discarded lines.
+
+        The range being checked must end either at the end of the data or
+        at a line that is not being discarded.
+
+        Version Added:
+            9.0
+
+        Args:
+            discards (list of int):
+                The discards. This will be modified.
+
+            start (int):
+                The index of the first line to check.
+
+            end (int):
+                The index after the last line to check.
+        """
+        i = start
+
+        while i < end:
+            # Cancel the provisional discards that are not in the middle
+            # of a run of discards
+            if discards[i] == self.DISCARD_CANCEL:
+                discards[i] = self.DISCARD_NONE
+            elif discards[i] == self.DISCARD_FOUND:
+                # We found a provisional discard
+                provisional = 0
+
+                # Find the end of this run of discardable lines and count
+                # how many are provisionally discardable.
+                j = i
+                while j < end:
+                    if discards[j] == self.DISCARD_NONE:
+                        break
+                    elif discards[j] == self.DISCARD_CANCEL:
+                        provisional += 1
                     j += 1
+
+                # Cancel the provisional discards at the end and shrink
+                # the run.
+                while j > i and discards[j - 1] == self.DISCARD_CANCEL:
+                    j -= 1
+                    discards[j] = 0
+                    provisional -= 1
+
+                length = j - i
+
+                # If 1/4 of the lines are provisional, cancel discarding
+                # all the provisional lines in the run.
+                if provisional * 4 > length:
+                    while j > i:
+                        j -= 1
+                        if discards[j] == self.DISCARD_CANCEL:
+                            discards[j] = self.DISCARD_NONE
                 else:
-                    data.modified.add(i)
+                    minimum = 1 + self._very_approx_sqrt(length // 4)
+                    j = 0
+                    consec = 0
+                    while j < length:
+                        if discards[i + j] != self.DISCARD_CANCEL:
+                            consec = 0
+                        else:
+                            consec += 1
+                            if minimum == consec:
+                                j -= consec
+                            elif minimum < consec:
+                                discards[i + j] = self.DISCARD_NONE
 
-            data.undiscarded_lines = j
+                        j += 1
 
-        a_data = self.a_data
-        b_data = self.b_data
-        a_length = a_data.length
-        b_length = b_data.length
-        last_code = self.last_code
+                    self._scan_discard_run(discards, i, length, 1)
+                    i += length - 1
+                    self._scan_discard_run(discards, i, length, -1)
 
-        a_data.undiscarded = [0] * a_length
-        b_data.undiscarded = [0] * b_length
-        a_data.real_indexes = [0] * a_length
-        b_data.real_indexes = [0] * b_length
-        a_discarded = [0] * a_length
-        b_discarded = [0] * b_length
-        a_code_counts = [0] * (1 + last_code)
-        b_code_counts = [0] * (1 + last_code)
+            i += 1
 
-        for item in a_data.data:
-            a_code_counts[item] += 1
+    def _scan_discard_run(
+        self,
+        discards: list[int],
+        i: int,
+        length: int,
+        step: int,
+    ) -> None:
+        """Scan a run of discarded lines.
 
-        for item in b_data.data:
-            b_code_counts[item] += 1
+        Version Added:
+            9.0
+
+        Args:
+            discards (list of int):
+                The discards. This will be modified.
+
+            i (int):
+                The index to start at.
+
+            length (int):
+                The length of the run to scan.
+
+            step (int):
+                The direction to scan in. This is ``1`` to scan forward, or
+                ``-1`` to scan backward.
+        """
+        consec = 0
+
+        for j in range(length):
+            index = i + j * step
+            discard = discards[index]
+
+            if j >= 8 and discard == self.DISCARD_FOUND:
+                break
 
-        build_discard_list(a_data, a_discarded, b_code_counts)
-        build_discard_list(b_data, b_discarded, a_code_counts)
+            if discard == self.DISCARD_FOUND:
+                consec += 1
+            else:
+                consec = 0
+
+                if discard == self.DISCARD_CANCEL:
+                    discards[index] = self.DISCARD_NONE
+
+            if consec == 3:
+                break
+
+    def _discard_lines(
+        self,
+        data: _DiffData,
+        discards: Sequence[int],
+    ) -> None:
+        """Perform the actual discard.
 
-        check_discard_runs(a_data, a_discarded)
-        check_discard_runs(b_data, b_discarded)
+        Version Added:
+            9.0
+
+        Args:
+            data (_DiffData):
+                The data for the file. This will be modified.
+
+            discards (list of int):
+                The discard information.
+        """
+        undiscarded = [0] * data.length
+        real_indexes = [0] * data.length
+        modified = data.modified
+        j = 0
+
+        for i, item in enumerate(data.data):
+            if discards[i] == self.DISCARD_NONE:
+                undiscarded[j] = item
+                real_indexes[j] = i
+                j += 1
+            else:
+                modified.add(i)
 
-        discard_lines(a_data, a_discarded)
-        discard_lines(b_data, b_discarded)
+        data.undiscarded = undiscarded
+        data.real_indexes = real_indexes
+        data.undiscarded_lines = j
 
     def _very_approx_sqrt(
         self,
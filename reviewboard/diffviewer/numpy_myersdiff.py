@@ -0,0 +1,158 @@
+"""Myers differ with NumPy-accelerated preprocessing.
+
+This provides a :py:class:`~reviewboard.diffviewer.myersdiff.MyersDiffer`
+that performs the line counting and confusing-line discard phases using
+NumPy, which speeds up diffs of very large files. The results are identical
+to those of the pure-Python implementation.
+
+This is only available if NumPy is installed.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reviewboard.diffviewer.myersdiff import MyersDiffer
+
+try:
+    import numpy as np
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
+if TYPE_CHECKING:
+    from reviewboard.diffviewer.myersdiff import _DiffData
+
+
+class NumPyMyersDiffer(MyersDiffer):
+    """Myers differ with NumPy-accelerated preprocessing.
+
+    This produces the same opcodes as
+    :py:class:`~reviewboard.diffviewer.myersdiff.MyersDiffer`. The
+    overhead of converting to NumPy arrays only pays off for larger files,
+    so :py:func:`~reviewboard.diffviewer.differ.get_differ` only uses this
+    for diffs with at least :py:attr:`MIN_LINES` lines.
+
+    Version Added:
+        9.0
+    """
+
+    #: The minimum number of combined lines for this differ to be used.
+    MIN_LINES = 2000
+
+    def _discard_confusing_lines(self) -> None:
+        """Discard lines that may make the diff confusing."""
+        a_data = self.a_data
+        b_data = self.b_data
+        num_codes = self.last_code + 1
+
+        a_codes = np.array(a_data.data, dtype=np.intp)
+        b_codes = np.array(b_data.data, dtype=np.intp)
+        a_code_counts = np.bincount(a_codes, minlength=num_codes)
+        b_code_counts = np.bincount(b_codes, minlength=num_codes)
+
+        a_discards = self._check_discard_array(
+            self._build_discard_array(a_data, a_codes, b_code_counts))
+        b_discards = self._check_discard_array(
+            self._build_discard_array(b_data, b_codes, a_code_counts))
+
+        self._discard_lines_array(a_data, a_codes, a_discards)
+        self._discard_lines_array(b_data, b_codes, b_discards)
+
+    def _build_discard_array(
+        self,
+        data: _DiffData,
+        codes: np.ndarray,
+        counts: np.ndarray,
+    ) -> np.ndarray:
+        """Build the array of provisional discards for one side of the diff.
+
+        Args:
+            data (reviewboard.diffviewer.myersdiff._DiffData):
+                The data to operate on.
+
+            codes (numpy.ndarray):
+                The line codes for this side of the diff.
+
+            counts (numpy.ndarray):
+                The number of times each unique line appears in the other
+                side of the diff.
+
+        Returns:
+            numpy.ndarray:
+            The discard state for each line.
+        """
+        many = 5 * self._very_approx_sqrt(data.length // 64)
+        num_matches = counts[codes]
+
+        discards = np.full(data.length, self.DISCARD_NONE, dtype=np.int8)
+        discards[num_matches > many] = self.DISCARD_CANCEL
+        discards[num_matches == 0] = self.DISCARD_FOUND
+        discards[codes == 0] = self.DISCARD_NONE
+
+        return discards
+
+    def _check_discard_array(
+        self,
+        discards: np.ndarray,
+    ) -> np.ndarray:
+        """Check runs of discarded lines.
+
+        Only the runs of provisionally-discarded lines are checked, skipping
+        over the (usually much larger) ranges of lines that are kept.
+
+        Args:
+            discards (numpy.ndarray):
+                The provisional discards.
+
+        Returns:
+            numpy.ndarray:
+            The final discards.
+        """
+        is_discarded = np.concatenate(([False], discards != self.DISCARD_NONE,
+                                       [False]))
+        edges = np.flatnonzero(is_discarded[1:] != is_discarded[:-1])
+
+        if len(edges) == 0:
+            return discards
+
+        discard_list = discards.tolist()
+
+        for start, end in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+            self._check_discard_runs(discard_list, start, end)
+
+        return np.array(discard_list, dtype=np.int8)
+
+    def _discard_lines_array(
+        self,
+        data: _DiffData,
+        codes: np.ndarray,
+        discards: np.ndarray,
+    ) -> None:
+        """Perform the actual discard.
+
+        Args:
+            data (reviewboard.diffviewer.myersdiff._DiffData):
+                The data for the file. This will be modified.
+
+            codes (numpy.ndarray):
+                The line codes for this side of the diff.
+
+            discards (numpy.ndarray):
+                The discard information.
+        """
+        is_kept = (discards == self.DISCARD_NONE)
+        kept = np.flatnonzero(is_kept)
+        num_kept = len(kept)
+
+        # The pure-Python implementation leaves unused space at the end of
+        # these lists. Keep them the same size, for compatibility.
+        padding = [0] * (data.length - num_kept)
+
+        data.undiscarded = codes[kept].tolist() + padding
+        data.real_indexes = kept.tolist() + padding
+        data.undiscarded_lines = num_kept
+        data.modified.update(np.flatnonzero(~is_kept).tolist())
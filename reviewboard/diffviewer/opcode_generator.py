@@ -124,6 +124,17 @@ class DiffOpcodeGenerator:
     MOVE_PREFERRED_MIN_LINES = 2
     MOVE_MIN_LINE_LENGTH = 20
 
+    #: The maximum amount of work to spend detecting moved lines.
+    #:
+    #: Each inserted line checked, and each group of removed lines checked
+    #: for a match, counts as one unit of work. Once this is exceeded, no
+    #: further moves will be detected for the diff, rather than holding up
+    #: the request on very large refactors.
+    #:
+    #: Version Added:
+    #:     9.0
+    MOVE_DETECTION_MAX_WORK = 1_000_000
+
     #: The default width for a tabstop.
     TAB_SIZE = DiffSettings.DEFAULT_TAB_SIZE
 
@@ -187,6 +198,29 @@ class DiffOpcodeGenerator:
     #:     8.0
     _filter_interdiffs: bool
 
+    #: The remaining amount of work allowed for move detection.
+    #:
+    #: Version Added:
+    #:     9.0
+    _move_work_remaining: int
+
+    #: An index of removed lines used for move detection.
+    #:
+    #: This maps the content of a removed line to a mapping of group indexes
+    #: to the line numbers within that group with that content. Line numbers
+    #: are stored in reverse order, so that lines can be removed from the
+    #: front of the list once they've been used in a move.
+    #:
+    #: Version Added:
+    #:     9.0
+    _remove_index: dict[str, dict[int, list[int]]]
+
+    #: A mapping of removed line numbers to their content and group index.
+    #:
+    #: Version Added:
+    #:     9.0
+    _remove_lines: dict[int, tuple[str, int]]
+
     def __init__(
         self,
         differ: Differ,
@@ -723,10 +757,40 @@ class DiffOpcodeGenerator:
         #
         # The algorithm will be documented as we go in the code.
         #
+        # To avoid scanning every removed line matching an inserted line, we
+        # first index the removed lines by content and then by the group
+        # they're in. Within a group, only the first unused line or the line
+        # following an existing move range can start or extend a range, so
+        # each group can be checked without walking all of its lines.
+        remove_index: dict[str, dict[int, list[int]]] = {}
+        remove_lines: dict[int, tuple[str, int]] = {}
+
+        for line, removes in self.removes.items():
+            line_groups: dict[int, list[int]] = {}
+
+            for ri, rgroup, rgroup_index in removes:
+                line_groups.setdefault(rgroup_index, []).append(ri)
+                remove_lines[ri] = (line, rgroup_index)
+
+            for ris in line_groups.values():
+                ris.reverse()
+
+            remove_index[line] = line_groups
+
+        self._remove_index = remove_index
+        self._remove_lines = remove_lines
+        self._move_work_remaining = self.MOVE_DETECTION_MAX_WORK
+
         # We start by looping through all the inserted groups.
         r_move_indexes_used: set[int] = set()
 
         for insert in self.inserts:
+            if self._move_work_remaining <= 0:
+                logger.debug('Stopped detecting moved lines after reaching '
+                             'the maximum amount of work (%s)',
+                             self.MOVE_DETECTION_MAX_WORK)
+                break
+
             self._compute_move_for_insert(r_move_indexes_used, *insert)
 
     def _compute_move_for_insert(
@@ -777,19 +841,29 @@ class DiffOpcodeGenerator:
         # Each line in this range has a corresponding consecutive delete line.
         i_move_range = MoveRange(i_move_cur, i_move_cur)
 
-        # The deleted move ranges. The key is a string in the form of
-        # "{i1}-{i2}-{j1}-{j2}", with those positions taken from the remove
-        # group for the line. The value is an instance of MoveRange. The values
-        # in MoveRange are used to quickly locate deleted lines we've found
-        # that match the inserted lines, so we can assemble ranges later.
-        r_move_ranges: dict[str, MoveRange] = {}  # key -> (start, end, group)
+        # The deleted move ranges. The key is the index of the remove group
+        # the range started in. The value is an instance of MoveRange. The
+        # values in MoveRange are used to quickly locate deleted lines we've
+        # found that match the inserted lines, so we can assemble ranges
+        # later.
+        r_move_ranges: dict[int, MoveRange] = {}
 
-        move_key = None
+        move_key: (int | None) = None
         is_replace = (itag == 'replace')
+        groups = self.groups
+        remove_index = self._remove_index
+        remove_lines = self._remove_lines
 
         # Loop through every location from ij1 through ij2 - 1 until we've
         # reached the end.
         while i_move_cur < ij2:
+            if self._move_work_remaining <= 0:
+                # We've spent as long as we're allowed to. Any range in
+                # progress will be discarded.
+                break
+
+            self._move_work_remaining -= 1
+
             try:
                 iline = self.differ.b[i_move_cur].strip()
             except IndexError:
@@ -797,7 +871,7 @@ class DiffOpcodeGenerator:
 
             updated_range = False
 
-            if iline and iline in self.removes:
+            if iline and iline in remove_index:
                 # The inserted line at this location has a corresponding
                 # removed line.
                 #
@@ -813,52 +887,82 @@ class DiffOpcodeGenerator:
                 #
                 # If there isn't any move information for this line, we'll
                 # simply add it to the move ranges.
-                for ri, rgroup, rgroup_index in self.removes[iline]:
-                    # Ignore any lines that have already been processed as
-                    # part of a move, so we don't end up with incorrect blocks
-                    # of lines being matched.
-                    if ri in r_move_indexes_used:
+                #
+                # Removed lines are checked one group at a time, in order.
+                # Lines already processed as part of a move are ignored, so
+                # we don't end up with incorrect blocks of lines being
+                # matched.
+                line_groups = remove_index[iline]
+                exhausted_group_indexes: list[int] = []
+
+                for rgroup_index, ris in line_groups.items():
+                    self._move_work_remaining -= 1
+
+                    while ris and ris[-1] in r_move_indexes_used:
+                        ris.pop()
+
+                    if not ris:
+                        exhausted_group_indexes.append(rgroup_index)
                         continue
 
-                    if move_key:
+                    rgroup = groups[rgroup_index]
+                    ri = ris[-1]
+
+                    if move_key is not None:
                         r_move_range = r_move_ranges.get(move_key)
                     else:
                         r_move_range = None
 
-                    if not r_move_range or ri != r_move_range.end + 1:
-                        # We either didn't have a previous range, or this
-                        # group didn't immediately follow it, so we need
-                        # to start a new one.
-                        move_key = '{}-{}-{}-{}'.format(*rgroup[1:5])
-                        r_move_range = r_move_ranges.get(move_key)
+                    if r_move_range and ri == r_move_range.end + 1:
+                        # This is part of the current range, so update the
+                        # end of the range to include it.
+                        r_move_range.end = ri
+                        r_move_range.add_group(rgroup, rgroup_index)
+                        updated_range = True
+                        break
+
+                    # This group didn't immediately follow the current range,
+                    # so we'll be working with a range started in this group.
+                    move_key = rgroup_index
+                    r_move_range = r_move_ranges.get(move_key)
 
                     if r_move_range:
-                        # If the remove information for the line is next in
-                        # the sequence for this calculated move range...
-                        if ri == r_move_range.end + 1:
-                            # This is part of the current range, so update
-                            # the end of the range to include it.
+                        # Only the line immediately following this range
+                        # can extend it.
+                        ri = r_move_range.end + 1
+
+                        if (ri not in r_move_indexes_used and
+                            remove_lines.get(ri) == (iline, rgroup_index)):
                             r_move_range.end = ri
                             r_move_range.add_group(rgroup, rgroup_index)
                             updated_range = True
+                            break
                     else:
                         # Check that this isn't a replace line that's just
                         # "replacing" itself (which would happen if it's just
-                        # changing whitespace).
-                        if not is_replace or i_move_cur - ij1 != ri - ii1:
-                            # We don't have any move ranges yet, or we're done
-                            # with the existing range, so it's time to build
-                            # one based on any removed lines we find that
-                            # match the inserted line.
-                            assert move_key is not None
-                            r_move_ranges[move_key] = \
-                                MoveRange(ri, ri, [(rgroup, rgroup_index)])
+                        # changing whitespace). If it is, try the next
+                        # unused line in the group.
+                        start_ri: (int | None) = ri
+
+                        if is_replace and i_move_cur - ij1 == ri - ii1:
+                            start_ri = None
+
+                            for k in range(len(ris) - 2, -1, -1):
+                                if ris[k] not in r_move_indexes_used:
+                                    start_ri = ris[k]
+                                    break
+
+                        if start_ri is not None:
+                            # We don't have any move ranges yet, or we're
+                            # done with the existing range, so it's time to
+                            # build one based on the removed line we found.
+                            r_move_ranges[move_key] = MoveRange(
+                                start_ri, start_ri, [(rgroup, rgroup_index)])
                             updated_range = True
+                            break
 
-                    if updated_range:
-                        # We found a range we were able to update. Don't
-                        # attempt any more matches for removed lines.
-                        break
+                for rgroup_index in exhausted_group_indexes:
+                    del line_groups[rgroup_index]
 
                 if not updated_range and r_move_ranges:
                     # We didn't find a move range that this line is a part
@@ -874,7 +978,7 @@ class DiffOpcodeGenerator:
                     # the increment below.
                     i_move_cur -= 1
                     move_key = None
-            elif iline == '' and move_key:
+            elif iline == '' and move_key is not None:
                 # This is a blank or whitespace-only line, which would not
                 # be in the list of removed lines above. We also have been
                 # working on a move range.
@@ -979,7 +1083,7 @@ class DiffOpcodeGenerator:
 
     def _find_longest_move_range(
         self,
-        r_move_ranges: Mapping[str, MoveRange],
+        r_move_ranges: Mapping[Any, MoveRange],
     ) -> MoveRange | None:
         """Find the longest move range.
 
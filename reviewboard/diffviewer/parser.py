@@ -21,13 +21,14 @@ from reviewboard.diffviewer.errors import DiffParserError
 from reviewboard.scmtools.core import HEAD, PRE_CREATION, Revision, UNKNOWN
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from pydiffx import BaseDiffXSection
     from typelets.json import JSONDict
 
     from reviewboard.diffviewer.models import DiffCommit
     from reviewboard.diffviewer.models import DiffSet
+    from reviewboard.diffviewer.models import FileDiff
 
 
 logger = logging.getLogger(__name__)
@@ -680,6 +681,41 @@ class BaseDiffParser:
         """
         raise NotImplementedError
 
+    def iter_raw_diff(
+        self,
+        diffset_or_commit: DiffCommit | DiffSet,
+    ) -> Iterator[bytes]:
+        """Iterate through the pieces of a raw diff.
+
+        This generates the same content as :py:meth:`raw_diff`, but in
+        pieces, allowing large diffs to be streamed to a client without
+        building the entire diff in memory.
+
+        By default, this yields the result of :py:meth:`raw_diff` as a single
+        piece. Subclasses can override this to generate the diff
+        incrementally.
+
+        Version Added:
+            9.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render.
+
+                See :py:meth:`raw_diff` for details.
+
+        Yields:
+            bytes:
+            Each piece of the diff.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        yield self.raw_diff(diffset_or_commit)
+
     def normalize_diff_filename(
         self,
         filename: str,
@@ -1329,6 +1365,72 @@ class DiffParser(BaseDiffParser):
             bytes:
             The diff composed of all the component FileDiffs.
 
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        return b''.join(
+            filediff.diff
+            for filediff in self._get_raw_diff_filediffs(diffset_or_commit)
+        )
+
+    def iter_raw_diff(
+        self,
+        diffset_or_commit: DiffCommit | DiffSet,
+    ) -> Iterator[bytes]:
+        """Iterate through the pieces of a raw diff.
+
+        This generates the same content as :py:meth:`raw_diff`, one
+        FileDiff at a time, decompressing each stored diff incrementally.
+
+        If a subclass overrides :py:meth:`raw_diff`, its result will be
+        used instead, in order to preserve any special logic for building
+        the diff.
+
+        Version Added:
+            9.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render.
+
+                See :py:meth:`raw_diff` for details.
+
+        Yields:
+            bytes:
+            Each piece of the diff.
+
+        Raises:
+            TypeError:
+                The provided ``diffset_or_commit`` wasn't of a supported type.
+        """
+        if type(self).raw_diff is not DiffParser.raw_diff:
+            yield from super().iter_raw_diff(diffset_or_commit)
+        else:
+            for filediff in self._get_raw_diff_filediffs(diffset_or_commit):
+                yield from filediff.iter_diff()
+
+    def _get_raw_diff_filediffs(
+        self,
+        diffset_or_commit: DiffCommit | DiffSet,
+    ) -> Iterable[FileDiff]:
+        """Return the FileDiffs making up a raw diff.
+
+        Version Added:
+            9.0
+
+        Args:
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to render.
+
+        Returns:
+            list of reviewboard.diffviewer.models.filediff.FileDiff:
+            The FileDiffs to include in the raw diff.
+
         Raises:
             TypeError:
                 The provided ``diffset_or_commit`` wasn't of a supported type.
@@ -1338,23 +1440,18 @@ class DiffParser(BaseDiffParser):
             if TYPE_CHECKING:
                 assert isinstance(diffset_or_commit, DiffSet)
 
-            filediffs = diffset_or_commit.cumulative_files
+            return diffset_or_commit.cumulative_files
         elif hasattr(diffset_or_commit, 'files'):
             # This will be a DiffCommit.
             if TYPE_CHECKING:
                 assert isinstance(diffset_or_commit, DiffCommit)
 
-            filediffs = diffset_or_commit.files.order_by('pk')
+            return diffset_or_commit.files.order_by('pk')
         else:
             raise TypeError('%r is not a valid value. Please pass a DiffSet '
                             'or DiffCommit.'
                             % diffset_or_commit)
 
-        return b''.join(
-            filediff.diff
-            for filediff in filediffs
-        )
-
 
 class DiffXParser(BaseDiffParser):
     """Parser for DiffX files.
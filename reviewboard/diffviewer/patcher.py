@@ -0,0 +1,598 @@
+"""In-process application of unified diffs.
+
+This provides a pure-Python implementation of the subset of
+:command:`patch` used by the diff viewer: applying a single file's unified
+diff to the contents of the original file.
+
+Diffs that can't be handled here (such as context diffs, ed scripts,
+malformed hunks, or diffs spanning multiple files) raise
+:py:class:`UnsupportedPatchError`, allowing callers to fall back to
+:command:`patch`.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+
+
+#: The maximum number of context lines that can be ignored when matching.
+#:
+#: This matches the default ``--fuzz`` used by :command:`patch`.
+MAX_FUZZ = 2
+
+
+_HUNK_HEADER_RE = re.compile(
+    br'^@@ -(?P<old_start>\d+)(?:,(?P<old_len>\d+))? '
+    br'\+(?P<new_start>\d+)(?:,(?P<new_len>\d+))? @@')
+
+_FILE_HEADER_PREFIXES = (b'--- ', b'+++ ', b'*** ', b'diff ', b'Index: ')
+
+
+class UnsupportedPatchError(Exception):
+    """A diff could not be applied by the in-process patcher.
+
+    This indicates that the diff was not in a form the in-process patcher
+    understands. It does not mean that the diff fails to apply, and callers
+    should fall back to :command:`patch`.
+
+    Version Added:
+        9.0
+    """
+
+
+@dataclass
+class PatchHunk:
+    """A hunk parsed from a unified diff.
+
+    Version Added:
+        9.0
+    """
+
+    #: The 1-based line number in the original file where the hunk starts.
+    old_start: int
+
+    #: The number of original lines covered by the hunk.
+    old_len: int
+
+    #: The 1-based line number in the new file where the hunk starts.
+    new_start: int = 0
+
+    #: The number of new lines covered by the hunk.
+    new_len: int = 0
+
+    #: The lines expected in the original file.
+    old_lines: list[bytes] = field(default_factory=list)
+
+    #: The lines that replace the original lines.
+    new_lines: list[bytes] = field(default_factory=list)
+
+    #: The number of context lines at the start of the hunk.
+    leading_context: int = 0
+
+    #: The number of context lines at the end of the hunk.
+    trailing_context: int = 0
+
+    #: The raw lines of the hunk, including the header.
+    raw_lines: list[bytes] = field(default_factory=list)
+
+
+@dataclass
+class PatchResult:
+    """The result of applying a diff.
+
+    Version Added:
+        9.0
+    """
+
+    #: The patched file.
+    #:
+    #: If any hunks were rejected, this will contain the result of applying
+    #: all other hunks.
+    new_file: bytes
+
+    #: Whether any hunks failed to apply.
+    failed: bool = False
+
+    #: Output describing any failures, in the style of :command:`patch`.
+    error_output: str = ''
+
+    #: The contents of the rejects file, if any hunks failed to apply.
+    rejects: (bytes | None) = None
+
+
+def _split_lines(
+    data: bytes,
+) -> list[bytes]:
+    """Split data into lines, preserving the trailing newlines.
+
+    Args:
+        data (bytes):
+            The data to split. This must only use ``\\n`` newlines.
+
+    Returns:
+        list of bytes:
+        The lines in the data.
+    """
+    lines = data.split(b'\n')
+
+    if lines[-1]:
+        last_line = lines.pop()
+    else:
+        lines.pop()
+        last_line = None
+
+    result = [
+        line + b'\n'
+        for line in lines
+    ]
+
+    if last_line is not None:
+        result.append(last_line)
+
+    return result
+
+
+def parse_hunks(
+    diff: bytes,
+) -> tuple[list[bytes], list[PatchHunk]]:
+    """Parse the hunks out of a single file's unified diff.
+
+    Args:
+        diff (bytes):
+            The diff to parse. This must only use ``\\n`` newlines.
+
+    Returns:
+        tuple:
+        A 2-tuple containing:
+
+        Tuple:
+            0 (list of bytes):
+                The ``---`` and ``+++`` header lines of the diff.
+
+            1 (list of PatchHunk):
+                The parsed hunks.
+
+    Raises:
+        UnsupportedPatchError:
+            The diff is not a single-file unified diff that can be applied
+            in-process.
+    """
+    lines = _split_lines(diff)
+
+    if lines and not lines[-1].endswith(b'\n'):
+        # Like patch(1), treat a missing newline at the end of the diff as
+        # if it were present.
+        lines[-1] += b'\n'
+
+    num_lines = len(lines)
+    headers: list[bytes] = []
+    hunks: list[PatchHunk] = []
+    i = 0
+
+    while i < num_lines:
+        line = lines[i]
+        m = _HUNK_HEADER_RE.match(line)
+
+        if m is None:
+            if hunks and line.startswith(_FILE_HEADER_PREFIXES):
+                raise UnsupportedPatchError(
+                    'Diffs covering multiple files are not supported.')
+
+            if not hunks and line.startswith((b'--- ', b'+++ ')):
+                headers.append(line)
+
+            i += 1
+            continue
+
+        old_len = int(m.group('old_len') or 1)
+        new_len = int(m.group('new_len') or 1)
+        hunk = PatchHunk(old_start=int(m.group('old_start')),
+                         old_len=old_len,
+                         new_start=int(m.group('new_start')),
+                         new_len=new_len,
+                         raw_lines=[line])
+        old_lines = hunk.old_lines
+        new_lines = hunk.new_lines
+
+        # The previous line's kind, used for "\ No newline" markers.
+        prev_kind: (bytes | None) = None
+        seen_change = False
+        i += 1
+
+        while i < num_lines:
+            line = lines[i]
+            kind = line[:1]
+
+            if kind == b'\\':
+                # The previous line has no trailing newline.
+                if prev_kind is None:
+                    raise UnsupportedPatchError(
+                        'Unexpected "No newline" marker.')
+
+                if prev_kind in (b' ', b'-'):
+                    old_lines[-1] = old_lines[-1].rstrip(b'\n')
+
+                if prev_kind in (b' ', b'+'):
+                    new_lines[-1] = new_lines[-1].rstrip(b'\n')
+
+                hunk.raw_lines.append(line)
+                prev_kind = None
+                i += 1
+                continue
+
+            if old_len == 0 and new_len == 0:
+                break
+
+            if kind == b' ' or line == b'\n':
+                if old_len == 0 or new_len == 0:
+                    raise UnsupportedPatchError(
+                        'Hunk line counts do not match the hunk header.')
+
+                # patch(1) accepts a bare newline as an empty context line,
+                # which is common in diffs that had trailing whitespace
+                # stripped.
+                text = line[1:] or b'\n'
+                old_lines.append(text)
+                new_lines.append(text)
+                old_len -= 1
+                new_len -= 1
+
+                if seen_change:
+                    hunk.trailing_context += 1
+                else:
+                    hunk.leading_context += 1
+
+                kind = b' '
+            elif kind == b'-':
+                if old_len == 0:
+                    raise UnsupportedPatchError(
+                        'Hunk line counts do not match the hunk header.')
+
+                old_lines.append(line[1:])
+                old_len -= 1
+                seen_change = True
+                hunk.trailing_context = 0
+            elif kind == b'+':
+                if new_len == 0:
+                    raise UnsupportedPatchError(
+                        'Hunk line counts do not match the hunk header.')
+
+                new_lines.append(line[1:])
+                new_len -= 1
+                seen_change = True
+                hunk.trailing_context = 0
+            else:
+                raise UnsupportedPatchError('Malformed hunk line.')
+
+            hunk.raw_lines.append(line)
+            prev_kind = kind
+            i += 1
+
+        if old_len > 0 or new_len > 0:
+            raise UnsupportedPatchError('Unexpected end of hunk.')
+
+        hunks.append(hunk)
+
+    return headers, hunks
+
+
+def _hunk_matches(
+    *,
+    orig_lines: list[bytes],
+    hunk: PatchHunk,
+    pos: int,
+    prefix_fuzz: int,
+    suffix_fuzz: int,
+) -> bool:
+    """Return whether a hunk's original lines match at a position.
+
+    Args:
+        orig_lines (list of bytes):
+            The lines of the original file.
+
+        hunk (PatchHunk):
+            The hunk to match.
+
+        pos (int):
+            The 0-based position of the hunk's first original line.
+
+        prefix_fuzz (int):
+            The number of leading lines to ignore.
+
+        suffix_fuzz (int):
+            The number of trailing lines to ignore.
+
+    Returns:
+        bool:
+        ``True`` if the lines match.
+    """
+    old_lines = hunk.old_lines
+    start = pos + prefix_fuzz
+    end = pos + len(old_lines) - suffix_fuzz
+
+    return (start >= 0 and
+            end <= len(orig_lines) and
+            orig_lines[start:end] == old_lines[prefix_fuzz:len(old_lines) -
+                                                            suffix_fuzz])
+
+
+def _reverse_hunk(
+    hunk: PatchHunk,
+) -> PatchHunk:
+    """Return a hunk that reverses the changes in a hunk.
+
+    Args:
+        hunk (PatchHunk):
+            The hunk to reverse.
+
+    Returns:
+        PatchHunk:
+        The reversed hunk.
+    """
+    return PatchHunk(old_start=hunk.new_start,
+                     old_len=hunk.new_len,
+                     new_start=hunk.old_start,
+                     new_len=hunk.old_len,
+                     old_lines=hunk.new_lines,
+                     new_lines=hunk.old_lines,
+                     leading_context=hunk.leading_context,
+                     trailing_context=hunk.trailing_context)
+
+
+def _locate_hunk(
+    *,
+    orig_lines: list[bytes],
+    hunk: PatchHunk,
+    expected_pos: int,
+    frozen_pos: int,
+    fuzz: int,
+) -> int | None:
+    """Return the position in the file where a hunk applies.
+
+    This follows the rules used by :command:`patch`. The search starts at
+    the expected position and moves outward, trying the later position
+    before the earlier one at each distance.
+
+    A hunk with less leading context than trailing context is anchored to
+    the start of the file if it starts at the first line, and a hunk with
+    less trailing context than leading context is anchored to the end of
+    the file. These can only apply at the start or end of the file, unless
+    enough fuzz is allowed to ignore the extra context.
+
+    Args:
+        orig_lines (list of bytes):
+            The lines of the original file.
+
+        hunk (PatchHunk):
+            The hunk to locate.
+
+        expected_pos (int):
+            The 0-based position where the hunk's first original line is
+            expected, including the offset of prior hunks.
+
+        frozen_pos (int):
+            The number of original lines that have already been written.
+            The hunk can't start before this point. This doesn't include the
+            trailing context of the prior hunk, which may be shared.
+
+        fuzz (int):
+            The number of context lines that may be ignored.
+
+    Returns:
+        int:
+        The 0-based position of the hunk's first original line, or
+        ``None`` if the hunk could not be located.
+    """
+    num_old = len(hunk.old_lines)
+
+    if num_old == 0:
+        # There's nothing to match, so this always applies where expected.
+        return expected_pos
+
+    context = max(hunk.leading_context, hunk.trailing_context)
+    prefix_fuzz = fuzz + hunk.leading_context - context
+    suffix_fuzz = fuzz + hunk.trailing_context - context
+
+    max_pos = len(orig_lines) - num_old + suffix_fuzz
+    max_forward = max_pos - expected_pos
+    max_backward = expected_pos - frozen_pos
+
+    if prefix_fuzz < 0:
+        if hunk.old_start <= 1:
+            # This can only match the start of the file.
+            if (frozen_pos <= hunk.leading_context and
+                max_pos >= 0 and
+                _hunk_matches(orig_lines=orig_lines,
+                              hunk=hunk,
+                              pos=0,
+                              prefix_fuzz=0,
+                              suffix_fuzz=suffix_fuzz)):
+                return 0
+
+            return None
+
+        prefix_fuzz = 0
+
+    if suffix_fuzz < 0:
+        # This can only match the end of the file.
+        pos = len(orig_lines) - num_old
+
+        if (expected_pos - pos <= max_backward and
+            _hunk_matches(orig_lines=orig_lines,
+                          hunk=hunk,
+                          pos=pos,
+                          prefix_fuzz=prefix_fuzz,
+                          suffix_fuzz=0)):
+            return pos
+
+        return None
+
+    for distance in range(max(max_forward, max_backward) + 1):
+        if (distance <= max_forward and
+            _hunk_matches(orig_lines=orig_lines,
+                          hunk=hunk,
+                          pos=expected_pos + distance,
+                          prefix_fuzz=prefix_fuzz,
+                          suffix_fuzz=suffix_fuzz)):
+            return expected_pos + distance
+
+        if (0 < distance <= max_backward and
+            _hunk_matches(orig_lines=orig_lines,
+                          hunk=hunk,
+                          pos=expected_pos - distance,
+                          prefix_fuzz=prefix_fuzz,
+                          suffix_fuzz=suffix_fuzz)):
+            return expected_pos - distance
+
+    return None
+
+
+def apply_patch(
+    diff: bytes,
+    orig_file: bytes,
+    filename: str,
+) -> PatchResult:
+    """Apply a single file's unified diff to a file in memory.
+
+    Hunks are matched at their expected location first, and then at
+    increasing offsets, accounting for the offsets of prior hunks. If a hunk
+    can't be matched exactly, up to :py:data:`MAX_FUZZ` lines of leading and
+    trailing context will be ignored. Hunks with uneven context are anchored
+    to the start or end of the file, as with :command:`patch`.
+
+    Hunks that can't be applied are rejected and reported in the result,
+    in the same form as :command:`patch`.
+
+    Both the diff and the file must already have normalized newlines (see
+    :py:func:`reviewboard.diffviewer.diffutils.convert_line_endings`).
+
+    Args:
+        diff (bytes):
+            The unified diff to apply.
+
+        orig_file (bytes):
+            The contents of the original file.
+
+        filename (str):
+            The name of the file being patched, for error output.
+
+    Returns:
+        PatchResult:
+        The result of the patch.
+
+    Raises:
+        UnsupportedPatchError:
+            The diff can't be applied in-process.
+    """
+    headers, hunks = parse_hunks(diff)
+
+    if not hunks:
+        raise UnsupportedPatchError('No hunks were found in the diff.')
+
+    orig_lines = _split_lines(orig_file) if orig_file else []
+    new_lines: list[bytes] = []
+    rejected: list[tuple[int, PatchHunk]] = []
+
+    # The number of original lines written so far.
+    pos = 0
+
+    # The offset of the last applied hunk from its expected position.
+    offset = 0
+
+    for hunk_num, hunk in enumerate(hunks, start=1):
+        if hunk.old_len == 0:
+            # Pure insertions reference the line they're inserted after.
+            base_pos = hunk.old_start
+        else:
+            base_pos = hunk.old_start - 1
+
+        hunk_pos: (int | None) = None
+        max_fuzz = min(MAX_FUZZ, max(hunk.leading_context,
+                                     hunk.trailing_context))
+
+        for fuzz in range(max_fuzz + 1):
+            hunk_pos = _locate_hunk(orig_lines=orig_lines,
+                                    hunk=hunk,
+                                    expected_pos=base_pos + offset,
+                                    frozen_pos=pos,
+                                    fuzz=fuzz)
+
+            if hunk_pos is not None:
+                break
+
+            if (hunk_num == 1 and
+                _locate_hunk(orig_lines=orig_lines,
+                             hunk=_reverse_hunk(hunk),
+                             expected_pos=(hunk.new_start
+                                           if hunk.new_len == 0
+                                           else hunk.new_start - 1),
+                             frozen_pos=pos,
+                             fuzz=fuzz) is not None):
+                # patch(1) treats this as a reversed or already-applied
+                # diff, and skips it. Let it handle this.
+                raise UnsupportedPatchError(
+                    'The diff appears to be reversed or already applied.')
+
+        if hunk_pos is None:
+            rejected.append((hunk_num, hunk))
+            continue
+
+        num_old = len(hunk.old_lines)
+        changes_pos = hunk_pos + hunk.leading_context
+
+        if changes_pos < pos or hunk_pos + num_old > len(orig_lines):
+            # patch(1) treats this as a fatal error. Let it report it.
+            raise UnsupportedPatchError(
+                'Hunk #%d would change lines before a prior hunk or past '
+                'the end of the file.'
+                % hunk_num)
+
+        if (hunk_pos + num_old < len(orig_lines) and
+            not all(line.endswith(b'\n')
+                    for line in hunk.old_lines[-1:] + hunk.new_lines[-1:])):
+            # The hunk expects to end the file, but there are lines after
+            # it. patch(1) has its own rules for this.
+            raise UnsupportedPatchError(
+                'Hunk #%d is missing a newline at the end, but does not '
+                'apply to the end of the file.'
+                % hunk_num)
+
+        # Context lines are copied from the original file, since they may
+        # have been ignored through fuzz.
+        new_lines += orig_lines[pos:changes_pos]
+        new_lines += hunk.new_lines[hunk.leading_context:
+                                    len(hunk.new_lines) -
+                                    hunk.trailing_context]
+        pos = hunk_pos + num_old - hunk.trailing_context
+        offset = hunk_pos - base_pos
+
+    new_lines += orig_lines[pos:]
+    result = PatchResult(new_file=b''.join(new_lines))
+
+    if rejected:
+        base_filename = os.path.basename(filename)
+        num_hunks = len(hunks)
+        num_rejected = len(rejected)
+        error_lines = [f'patching file {base_filename}']
+        rejects = list(headers)
+
+        for hunk_num, hunk in rejected:
+            error_lines.append(
+                f'Hunk #{hunk_num} FAILED at {hunk.old_start}.')
+            rejects += hunk.raw_lines
+
+        error_lines.append(
+            f'{num_rejected} out of {num_hunks} '
+            f'hunk{"s" if num_hunks != 1 else ""} FAILED -- saving rejects '
+            f'to file {base_filename}.rej')
+
+        result.failed = True
+        result.error_output = '\n'.join(error_lines)
+        result.rejects = b''.join(rejects)
+
+    return result
@@ -0,0 +1,252 @@
+"""Background pre-rendering of diff chunks.
+
+When enabled, newly-uploaded and newly-published diffs will have their
+chunks generated and cached on a background worker pool, so that the first
+reviewer opening the diff doesn't pay for fetching, patching, diffing, and
+highlighting every file.
+
+This is controlled by the following site configuration settings:
+
+``diffviewer_prerender_enabled``:
+    Whether to pre-render diffs in the background.
+
+``diffviewer_prerender_max_workers``:
+    The number of worker threads used per process. If ``0``, diffs will be
+    pre-rendered synchronously when queued.
+
+``diffviewer_prerender_max_pending``:
+    The maximum number of queued or running jobs per process. Any diffs
+    queued beyond this will be skipped.
+
+``diffviewer_prerender_max_lines``:
+    The maximum number of changed lines to pre-render per diff. Files beyond
+    this budget will be left to render on demand.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils import translation
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.background import BackgroundJobQueue
+
+if TYPE_CHECKING:
+    from reviewboard.diffviewer.models import DiffSet
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DiffPrerenderStats:
+    """Statistics on a pre-rendered diff.
+
+    Version Added:
+        9.0
+    """
+
+    #: The number of files in the diff.
+    num_files: int = 0
+
+    #: The number of files that were rendered and cached.
+    num_rendered: int = 0
+
+    #: The number of files skipped due to the size budget.
+    num_skipped: int = 0
+
+    #: The number of files that failed to render.
+    num_failed: int = 0
+
+
+def prerender_diffset(
+    diffset: DiffSet,
+    interdiffset: (DiffSet | None) = None,
+    *,
+    max_lines: (int | None) = None,
+) -> DiffPrerenderStats:
+    """Generate and cache the chunks for all files in a diff.
+
+    Chunks are generated using the default diff settings for the
+    repository's Local Site and the site's default language, matching the
+    cache keys used when viewing the diff with default settings.
+
+    Files that are already cached will not be regenerated.
+
+    Args:
+        diffset (reviewboard.diffviewer.models.DiffSet):
+            The diffset to render.
+
+        interdiffset (reviewboard.diffviewer.models.DiffSet, optional):
+            The diffset to render an interdiff against.
+
+        max_lines (int, optional):
+            The maximum number of changed lines to render. Files past this
+            budget will be skipped. If not provided, all files are rendered.
+
+    Returns:
+        DiffPrerenderStats:
+        Statistics on the rendered diff.
+    """
+    from reviewboard.diffviewer.chunk_generator import \
+        get_diff_chunk_generator
+    from reviewboard.diffviewer.diffutils import (
+        get_diff_files,
+        prefetch_uncached_original_files,
+    )
+    from reviewboard.diffviewer.settings import DiffSettings
+
+    repository = diffset.repository
+    diff_settings = DiffSettings.create(local_site=repository.local_site)
+    files = get_diff_files(diffset=diffset,
+                           interdiffset=interdiffset,
+                           diff_settings=diff_settings)
+    stats = DiffPrerenderStats(num_files=len(files))
+    num_lines = 0
+    render_files = []
+
+    for diff_file in files:
+        for line_filediff in (diff_file['filediff'],
+                              diff_file['interfilediff']):
+            if line_filediff is not None:
+                counts = line_filediff.get_line_counts()
+                num_lines += (counts['raw_insert_count'] +
+                              counts['raw_delete_count'])
+
+        if max_lines is not None and num_lines > max_lines:
+            stats.num_skipped += 1
+        else:
+            render_files.append(diff_file)
+
+    # Fetch the original files for everything we'll render up-front, so
+    # that each file doesn't need its own round-trip to the repository.
+    prefetch_uncached_original_files(render_files,
+                                     diff_settings=diff_settings)
+
+    with translation.override(settings.LANGUAGE_CODE):
+        for diff_file in render_files:
+            filediff = diff_file['filediff']
+            interfilediff = diff_file['interfilediff']
+
+            chunk_generator = get_diff_chunk_generator(
+                request=None,
+                filediff=filediff,
+                interfilediff=interfilediff,
+                force_interdiff=diff_file['force_interdiff'],
+                base_filediff=diff_file.get('base_filediff'),
+                diff_settings=diff_settings)
+
+            try:
+                for chunk in chunk_generator.get_chunks():
+                    pass
+            except Exception as e:
+                logger.warning('Unable to pre-render diff chunks for '
+                               'FileDiff %s (interfilediff %s): %s',
+                               filediff.pk,
+                               interfilediff and interfilediff.pk,
+                               e)
+                stats.num_failed += 1
+            else:
+                stats.num_rendered += 1
+
+    return stats
+
+
+class DiffPrerenderer(BackgroundJobQueue):
+    """Manages background pre-rendering of diffs.
+
+    Jobs are queued through :py:meth:`queue_diffset` and run on a
+    per-process thread pool once the current transaction commits.
+
+    Version Added:
+        9.0
+    """
+
+    siteconfig_prefix = 'diffviewer_prerender'
+    thread_name_prefix = 'rb-diff-prerender'
+
+    def queue_diffset(
+        self,
+        diffset: DiffSet,
+        interdiffset: (DiffSet | None) = None,
+    ) -> bool:
+        """Queue a diff for pre-rendering.
+
+        The diff will be submitted to the worker pool once the current
+        transaction (if any) commits. If the maximum number of pending jobs
+        has been reached at that point, the diff will be skipped.
+
+        Args:
+            diffset (reviewboard.diffviewer.models.DiffSet):
+                The diffset to render.
+
+            interdiffset (reviewboard.diffviewer.models.DiffSet, optional):
+                The diffset to render an interdiff against.
+
+        Returns:
+            bool:
+            ``True`` if the diff was queued. ``False`` if pre-rendering is
+            disabled.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return self.queue_job(diffset.pk,
+                              interdiffset and interdiffset.pk,
+                              siteconfig.get('diffviewer_prerender_max_lines'))
+
+    def run_job(
+        self,
+        diffset_id: int,
+        interdiffset_id: (int | None),
+        max_lines: int,
+    ) -> None:
+        """Run a pre-rendering job.
+
+        Args:
+            diffset_id (int):
+                The ID of the diffset to render.
+
+            interdiffset_id (int):
+                The ID of the diffset to render an interdiff against, if any.
+
+            max_lines (int):
+                The maximum number of changed lines to render.
+        """
+        from reviewboard.diffviewer.models import DiffSet
+
+        diffsets = {
+            diffset.pk: diffset
+            for diffset in (
+                DiffSet.objects
+                .filter(pk__in=[diffset_id, interdiffset_id])
+                .select_related('repository')
+            )
+        }
+
+        try:
+            diffset = diffsets[diffset_id]
+        except KeyError:
+            # The diffset was deleted before we got to it.
+            return
+
+        stats = prerender_diffset(
+            diffset=diffset,
+            interdiffset=diffsets.get(interdiffset_id),
+            max_lines=max_lines)
+
+        logger.debug('Pre-rendered DiffSet %s (interdiff %s): %r',
+                     diffset_id, interdiffset_id, stats)
+
+
+#: The diff pre-renderer for this process.
+#:
+#: Version Added:
+#:     9.0
+diff_prerenderer = DiffPrerenderer()
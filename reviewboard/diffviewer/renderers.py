@@ -8,7 +8,10 @@ from djblets.cache.backend import cache_memoize
 from housekeeping.functions import deprecate_non_keyword_only_args
 
 from reviewboard.deprecation import RemovedInReviewBoard90Warning
-from reviewboard.diffviewer.chunk_generator import compute_chunk_last_header
+from reviewboard.diffviewer.chunk_generator import (
+    compute_chunk_last_header,
+    get_highlight_pending_line_ranges,
+)
 from reviewboard.diffviewer.diffutils import (
     find_last_line_numbers,
     populate_diff_chunks,
@@ -182,6 +185,17 @@ class DiffRenderer(object):
                     _('Invalid chunk index %s specified.')
                     % self.chunk_index)
 
+        highlight_line_ranges = self._get_highlight_pending_line_ranges()
+
+        if highlight_line_ranges:
+            # Some of the lines being shown were collapsed in a large file,
+            # and haven't been syntax-highlighted yet. Regenerate the chunks
+            # with them highlighted.
+            populate_diff_chunks(files=[self.diff_file],
+                                 request=request,
+                                 diff_settings=self.diff_settings,
+                                 highlight_line_ranges=highlight_line_ranges)
+
         rendered = render_to_string(template_name=self.template_name,
                                     context=self.make_context())
 
@@ -192,6 +206,42 @@ class DiffRenderer(object):
         # to turn it into an str, because SafeString.__str__ just returns self.
         return rendered[:]
 
+    def _get_highlight_pending_line_ranges(self):
+        """Return the lines to be shown that are pending highlighting.
+
+        Version Added:
+            9.0
+
+        Returns:
+            tuple:
+            The ranges of lines in the original and modified files, or
+            ``None`` if all lines being shown are already highlighted.
+        """
+        chunks = self.diff_file['chunks']
+
+        if self.chunk_index is not None:
+            chunk = chunks[self.chunk_index]
+            lines = chunk['lines']
+
+            if self.lines_of_context:
+                # Only the lines of context surrounding the collapsed region
+                # will be shown.
+                before, after = self.lines_of_context[:2]
+
+                if before + after < len(lines):
+                    lines = (list(lines[:before]) +
+                             list(lines[len(lines) - after:]))
+
+            chunks = [{
+                'lines': lines,
+                'meta': chunk['meta'],
+            }]
+        elif self.collapse_all:
+            # Collapsed chunks won't be shown.
+            return None
+
+        return get_highlight_pending_line_ranges(chunks)
+
     def make_cache_key(self):
         """Creates and returns a cache key representing the diff to render."""
         filediff = self.diff_file['filediff']
@@ -329,9 +379,10 @@ class DiffRenderer(object):
                                         if header[0] <= last_linenum
                                     ]
 
-                            meta['headers'] = \
-                                compute_chunk_last_header(new_lines, num_lines,
-                                                          meta)
+                            meta['headers'] = compute_chunk_last_header(
+                                lines=new_lines,
+                                numlines=num_lines,
+                                meta=meta)
                     else:
                         self.diff_file['chunks'].remove(chunk)
 
@@ -0,0 +1,73 @@
+"""HTTP responses for serving diffs.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.http import StreamingHttpResponse
+
+if TYPE_CHECKING:
+    from reviewboard.diffviewer.models import DiffCommit, DiffSet
+    from reviewboard.diffviewer.parser import BaseDiffParser
+
+
+class RawDiffResponse(StreamingHttpResponse):
+    """A response that streams a raw diff to the client.
+
+    The diff is generated one piece at a time using
+    :py:meth:`BaseDiffParser.iter_raw_diff()
+    <reviewboard.diffviewer.parser.BaseDiffParser.iter_raw_diff>`, so
+    large diffs never need to be held in memory in full.
+
+    For compatibility with code expecting a standard
+    :py:class:`~django.http.HttpResponse`, :py:attr:`content` can still be
+    accessed. Doing so will generate and store the entire diff.
+
+    Version Added:
+        9.0
+    """
+
+    def __init__(
+        self,
+        *,
+        parser: BaseDiffParser,
+        diffset_or_commit: DiffCommit | DiffSet,
+        content_type: str = 'text/x-patch',
+        **kwargs,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            parser (reviewboard.diffviewer.parser.BaseDiffParser):
+                The diff parser used to generate the raw diff.
+
+            diffset_or_commit (reviewboard.diffviewer.models.diffset.DiffSet or
+                               reviewboard.diffviewer.models.diffcommit
+                               .DiffCommit):
+                The DiffSet or DiffCommit to send.
+
+            content_type (str, optional):
+                The content type of the response.
+
+            **kwargs (dict):
+                Additional keyword arguments for the parent class.
+        """
+        super().__init__(parser.iter_raw_diff(diffset_or_commit),
+                         content_type=content_type,
+                         **kwargs)
+
+    @property
+    def content(self) -> bytes:
+        """The full content of the diff.
+
+        Accessing this will consume the stream. The content will be
+        stored, and sent in full if the response is later streamed.
+        """
+        content = b''.join(self.streaming_content)
+        self.streaming_content = [content]
+
+        return content
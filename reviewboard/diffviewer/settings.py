@@ -121,6 +121,23 @@ class DiffSettings:
     #:     int
     syntax_highlighting_threshold: int
 
+    #: The number of lines in a file beyond which only visible lines are
+    #: highlighted.
+    #:
+    #: If a file has lines beyond this threshold, syntax highlighting will
+    #: only be applied to the lines shown when the diff is first rendered.
+    #: Lines in collapsed regions will be highlighted when expanded. This
+    #: requires tree-sitter support for the file's language.
+    #:
+    #: A value of 0 disables this.
+    #:
+    #: Version Added:
+    #:     9.0
+    #:
+    #: Type:
+    #:     int
+    syntax_highlighting_viewport_threshold: int
+
     #: The default tabstop width for diffs.
     #:
     #: Version Added:
@@ -264,6 +281,11 @@ class DiffSettings:
                 int,
                 siteconfig.get('diffviewer_syntax_highlighting_threshold',
                                layers=config_layers)),
+            syntax_highlighting_viewport_threshold=cast(
+                int,
+                siteconfig.get(
+                    'diffviewer_syntax_highlighting_viewport_threshold',
+                    layers=config_layers)),
             tab_size=tab_size,
         )
 
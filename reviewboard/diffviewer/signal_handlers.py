@@ -0,0 +1,41 @@
+"""Signal handlers for the diff viewer.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.signals import initializing
+from reviewboard.treesitter.core import warm_registry
+
+
+def _on_initializing(**kwargs) -> None:
+    """Load tree-sitter grammars and queries for configured languages.
+
+    The languages are listed in the ``diffviewer_treesitter_preload_languages``
+    site configuration setting.
+
+    Version Added:
+        9.0
+
+    Args:
+        **kwargs (dict, unused):
+            Keyword arguments sent by the signal.
+    """
+    language_names = SiteConfiguration.objects.get_current().get(
+        'diffviewer_treesitter_preload_languages')
+
+    if language_names:
+        warm_registry(language_names)
+
+
+def connect_signal_handlers() -> None:
+    """Connect diff viewer related signal handlers.
+
+    Version Added:
+        9.0
+    """
+    initializing.connect(_on_initializing)
@@ -0,0 +1,120 @@
+"""Unit tests for reviewboard.diffviewer.chunk_serialization."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reviewboard.diffviewer.chunk_serialization import (
+    CompactDiffChunks,
+    deserialize_diff_chunks,
+    serialize_diff_chunks,
+)
+from reviewboard.testing import TestCase
+
+if TYPE_CHECKING:
+    from reviewboard.diffviewer.chunk_generator import DiffChunk
+
+
+class ChunkSerializationTests(TestCase):
+    """Unit tests for diff chunk serialization."""
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+
+        self.chunks: list[DiffChunk] = [
+            {
+                'change': 'equal',
+                'collapsable': True,
+                'index': 0,
+                'lines': [
+                    (1, 1, '<span class="k">int</span> a;', None,
+                     1, '<span class="k">int</span> a;', None, False,
+                     None),
+                    (2, 2, 'b();', None, 2, 'b();', None, False, None),
+                ],
+                'meta': {
+                    'left_headers': [],
+                    'right_headers': [],
+                    'whitespace_chunk': False,
+                    'whitespace_lines': [],
+                },
+                'numlines': 2,
+            },
+            {
+                'change': 'replace',
+                'collapsable': False,
+                'index': 1,
+                'lines': [
+                    (3, 3, 'c(1);', [(2, 3)], 3, 'c(2);', [(2, 3)], False,
+                     {'from': (10, True)}),
+                ],
+                'meta': {
+                    'left_headers': [(3, 'c')],
+                    'right_headers': [],
+                    'whitespace_chunk': False,
+                    'whitespace_lines': [],
+                },
+                'numlines': 1,
+            },
+            {
+                'change': 'insert',
+                'collapsable': False,
+                'index': 2,
+                'lines': [
+                    (4, None, '', None, 4, ' ', None, True, None),
+                ],
+                'meta': {
+                    'left_headers': [],
+                    'right_headers': [],
+                    'whitespace_chunk': True,
+                    'whitespace_lines': [(None, 4)],
+                },
+                'numlines': 1,
+            },
+        ]
+
+    def test_round_trip(self) -> None:
+        """Testing serialize_diff_chunks and deserialize_diff_chunks round
+        trip
+        """
+        data = serialize_diff_chunks(self.chunks)
+        self.assertIsInstance(data, bytes)
+
+        chunks = deserialize_diff_chunks(data)
+        self.assertIsInstance(chunks, CompactDiffChunks)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(list(chunks), self.chunks)
+        self.assertEqual(chunks[-1], self.chunks[-1])
+        self.assertEqual(chunks[1:], self.chunks[1:])
+
+    def test_round_trip_empty(self) -> None:
+        """Testing serialize_diff_chunks and deserialize_diff_chunks with no
+        chunks
+        """
+        chunks = deserialize_diff_chunks(serialize_diff_chunks([]))
+
+        self.assertEqual(len(chunks), 0)
+        self.assertEqual(list(chunks), [])
+
+    def test_deserialize_is_lazy(self) -> None:
+        """Testing deserialize_diff_chunks defers decoding until accessed"""
+        chunks = deserialize_diff_chunks(serialize_diff_chunks(self.chunks))
+
+        assert isinstance(chunks, CompactDiffChunks)
+        self.assertIsNone(chunks._columns)
+
+        self.assertEqual(chunks[0], self.chunks[0])
+        self.assertIsNotNone(chunks._columns)
+
+    def test_deserialize_with_legacy_list(self) -> None:
+        """Testing deserialize_diff_chunks with a legacy list of chunks"""
+        self.assertIs(deserialize_diff_chunks(self.chunks), self.chunks)
+
+    def test_deserialize_with_unknown_format(self) -> None:
+        """Testing deserialize_diff_chunks with unknown data"""
+        with self.assertRaises(ValueError):
+            deserialize_diff_chunks(b'RBDC\xffabc')
+
+        with self.assertRaises(ValueError):
+            deserialize_diff_chunks(b'garbage')
@@ -8,7 +8,10 @@ import os
 import kgb
 
 from reviewboard.diffviewer.myersdiff import MyersDiffer
-from reviewboard.diffviewer.opcode_generator import get_diff_opcode_generator
+from reviewboard.diffviewer.opcode_generator import (
+    DiffOpcodeGenerator,
+    get_diff_opcode_generator,
+)
 from reviewboard.diffviewer.processors import (filter_interdiff_opcodes,
                                                post_process_filtered_equals)
 from reviewboard.diffviewer.settings import DiffSettings
@@ -723,6 +726,87 @@ class MoveDetectionTests(TestCase):
             ]
         )
 
+    def test_move_detection_with_common_lines(self) -> None:
+        """Testing DiffOpcodeGenerator move detection with moved blocks
+        sharing common lines
+        """
+        self._test_move_detection(
+            self._build_functions(['alpha', 'beta', 'gamma', 'delta']),
+            self._build_functions(['gamma', 'alpha', 'beta', 'delta']),
+            [
+                {
+                    1: 15,
+                    2: 16,
+                },
+                {
+                    8: 1,
+                    9: 2,
+                },
+                {
+                    15: 8,
+                    16: 9,
+                },
+            ],
+            [
+                {
+                    1: 8,
+                    2: 9,
+                },
+                {
+                    8: 15,
+                    9: 16,
+                },
+                {
+                    15: 1,
+                    16: 2,
+                },
+            ])
+
+    def test_move_detection_with_max_work(self) -> None:
+        """Testing DiffOpcodeGenerator move detection stops after
+        MOVE_DETECTION_MAX_WORK is reached
+        """
+        class NoMovesDiffOpcodeGenerator(DiffOpcodeGenerator):
+            MOVE_DETECTION_MAX_WORK = 0
+
+        differ = MyersDiffer(
+            self._build_functions(['alpha', 'beta', 'gamma', 'delta']),
+            self._build_functions(['gamma', 'alpha', 'beta', 'delta']))
+
+        for opcodes in NoMovesDiffOpcodeGenerator(differ):
+            meta = opcodes[-1]
+
+            self.assertNotIn('moved-from', meta)
+            self.assertNotIn('moved-to', meta)
+
+    def _build_functions(
+        self,
+        names: list[str],
+    ) -> list[str]:
+        """Return lines for a series of functions with common lines.
+
+        Args:
+            names (list of str):
+                The names of the functions, in order.
+
+        Returns:
+            list of str:
+            The lines for the functions.
+        """
+        return [
+            line
+            for name in names
+            for line in (
+                f'def {name}():',
+                f'    value = compute_{name}()',
+                '    if not value:',
+                '        return None',
+                '',
+                '    return value',
+                '',
+            )
+        ]
+
     def _test_move_detection(self, a, b, expected_i_moves, expected_r_moves):
         differ = MyersDiffer(a, b)
         opcode_generator = get_diff_opcode_generator(differ)
@@ -187,6 +187,60 @@ class DiffParserTest(DiffParserTestingMixin, TestCase):
         parser = DiffParser(b'')
         self.assertEqual(parser.raw_diff(diffset), cumulative_diff)
 
+    @add_fixtures(['test_scmtools'])
+    def test_iter_raw_diff_with_diffset(self):
+        """Testing DiffParser.iter_raw_diff with DiffSet"""
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+
+        diff1 = (
+            b'diff --git a/ABC b/ABC\n'
+            b'index 94bdd3e..197009f 100644\n'
+            b'--- ABC\n'
+            b'+++ ABC\n'
+            b'@@ -1,1 +1,1 @@\n'
+            b'-line!\n'
+            b'+line..\n'
+        )
+        diff2 = (
+            b'diff --git a/README b/README\n'
+            b'index 94bdd3e..197009f 100644\n'
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -1,1 +1,1 @@\n'
+            b'-Hello, world!\n'
+            b'+Hi, world!\n'
+        )
+
+        self.create_filediff(diffset, source_file='ABC', dest_file='ABC',
+                             diff=diff1)
+        self.create_filediff(diffset, source_file='README',
+                             dest_file='README', diff=diff2)
+
+        parser = DiffParser(b'')
+
+        self.assertEqual(list(parser.iter_raw_diff(diffset)),
+                         [diff1, diff2])
+        self.assertEqual(parser.raw_diff(diffset), diff1 + diff2)
+
+    @add_fixtures(['test_scmtools'])
+    def test_iter_raw_diff_with_raw_diff_override(self):
+        """Testing DiffParser.iter_raw_diff with subclass overriding
+        raw_diff
+        """
+        class MyDiffParser(DiffParser):
+            def raw_diff(self, diffset_or_commit):
+                return b'custom:' + super().raw_diff(diffset_or_commit)
+
+        repository = self.create_repository(tool_name='Test')
+        diffset = self.create_diffset(repository=repository)
+        filediff = self.create_filediff(diffset)
+
+        parser = MyDiffParser(b'')
+
+        self.assertEqual(list(parser.iter_raw_diff(diffset)),
+                         [b'custom:' + filediff.diff])
+
     @add_fixtures(['test_scmtools'])
     def test_raw_diff_with_diffcommit(self):
         """Testing DiffParser.raw_diff with DiffCommit"""
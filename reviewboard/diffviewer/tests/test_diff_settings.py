@@ -35,6 +35,7 @@ class DiffSettingsTests(TestCase):
             'diffviewer_paginate_orphans': 5,
             'diffviewer_syntax_highlighting': True,
             'diffviewer_syntax_highlighting_threshold': 10_000,
+            'diffviewer_syntax_highlighting_viewport_threshold': 5_000,
         }
 
         with self.siteconfig_settings(siteconfig_settings):
@@ -57,6 +58,9 @@ class DiffSettingsTests(TestCase):
         self.assertTrue(diff_settings.syntax_highlighting)
         self.assertEqual(diff_settings.syntax_highlighting_threshold,
                          10_000)
+        self.assertEqual(
+            diff_settings.syntax_highlighting_viewport_threshold,
+            5_000)
 
     def test_create_with_siteconfig_syntax_highlighting_true(self) -> None:
         """Testing DiffSettings.create with
@@ -196,6 +200,7 @@ class DiffSettingsTests(TestCase):
             'diffviewer_paginate_orphans': 5,
             'diffviewer_syntax_highlighting': True,
             'diffviewer_syntax_highlighting_threshold': 10_000,
+            'diffviewer_syntax_highlighting_viewport_threshold': 5_000,
         }
 
         with self.siteconfig_settings(siteconfig_settings):
@@ -203,4 +208,4 @@ class DiffSettingsTests(TestCase):
 
         self.assertEqual(
             diff_settings.state_hash,
-            '7723b408c3a75c3be994f20b946ed34945831490ea1f1d6d703e197140923a28')
+            '2e6eb33b3ff9b029850da1e2c1dee24653bd13900585635a7732c2829dad534e')
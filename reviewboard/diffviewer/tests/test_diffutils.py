@@ -10,6 +10,7 @@ from django.contrib.auth.models import User
 from django.test.client import RequestFactory
 from djblets.testing.decorators import add_fixtures
 
+from reviewboard.diffviewer.chunk_generator import DiffChunkGenerator
 from reviewboard.diffviewer.diffutils import (
     convert_line_endings,
     convert_to_unicode,
@@ -27,15 +28,19 @@ from reviewboard.diffviewer.diffutils import (
     get_original_file_from_repo,
     get_sorted_filediffs,
     patch,
+    prefetch_original_files,
+    prefetch_uncached_original_files,
     split_line_endings,
     _PATCH_GARBAGE_INPUT,
-    _get_last_header_in_chunks_before_line)
+    _get_last_header_in_chunks_before_line,
+    _run_patch_command)
 from reviewboard.diffviewer.filetypes import (HEADER_EXTENSIONS,
                                               IMPL_EXTENSIONS)
 from reviewboard.diffviewer.errors import PatchError
 from reviewboard.diffviewer.models import DiffCommit, FileDiff
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.scmtools.core import PRE_CREATION
+from reviewboard.scmtools.models import Repository
 from reviewboard.testing.testcase import BaseFileDiffAncestorTests, TestCase
 
 if TYPE_CHECKING:
@@ -3768,6 +3773,67 @@ class PatchTests(kgb.SpyAgency, TestCase):
             filename='README')
 
 
+    def test_patch_in_process(self) -> None:
+        """Testing patch applies unified diffs without patch(1)"""
+        self.spy_on(_run_patch_command)
+
+        patched = patch(diff=(b'--- README\n'
+                              b'+++ README\n'
+                              b'@@ -1,2 +1,2 @@\n'
+                              b' line 1\n'
+                              b'-line 2\n'
+                              b'+line 2 changed\n'),
+                        orig_file=b'line 1\nline 2\n',
+                        filename='README')
+
+        self.assertEqual(patched, b'line 1\nline 2 changed\n')
+        self.assertSpyNotCalled(_run_patch_command)
+
+    def test_patch_in_process_with_rejects(self) -> None:
+        """Testing patch with in-process rejected hunks raises PatchError"""
+        self.spy_on(_run_patch_command)
+
+        diff = (
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -1,2 +1,2 @@\n'
+            b' line 1\n'
+            b'-line 2\n'
+            b'+line 2 changed\n'
+        )
+
+        with self.assertRaises(PatchError) as ctx:
+            patch(diff=diff,
+                  orig_file=b'something\nelse\n',
+                  filename='README')
+
+        e = ctx.exception
+        self.assertEqual(e.diff, diff)
+        self.assertEqual(e.new_file, b'something\nelse\n')
+        self.assertEqual(e.rejects, diff)
+        self.assertIn('1 out of 1 hunk FAILED', e.error_output)
+        self.assertSpyNotCalled(_run_patch_command)
+
+    def test_patch_falls_back_to_patch_command(self) -> None:
+        """Testing patch falls back to patch(1) for non-unified diffs"""
+        self.spy_on(_run_patch_command)
+
+        patched = patch(diff=(b'*** README\n'
+                              b'--- README\n'
+                              b'***************\n'
+                              b'*** 1,2 ****\n'
+                              b'  line 1\n'
+                              b'! line 2\n'
+                              b'--- 1,2 ----\n'
+                              b'  line 1\n'
+                              b'! line 2 changed\n'),
+                        orig_file=b'line 1\nline 2\n',
+                        filename='README')
+
+        self.assertEqual(patched, b'line 1\nline 2 changed\n')
+        self.assertSpyCalled(_run_patch_command)
+
+
 class GetFileDiffEncodingsTests(TestCase):
     """Unit tests for get_filediff_encodings."""
 
@@ -4158,6 +4224,117 @@ class GetOriginalFileTests(BaseFileDiffAncestorTests):
                          'filediff_value')
 
 
+class PrefetchOriginalFilesTests(kgb.SpyAgency, TestCase):
+    """Unit tests for prefetch_original_files."""
+
+    fixtures = ['test_scmtools']
+
+    def test_prefetch_original_files(self) -> None:
+        """Testing prefetch_original_files"""
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository,
+                                      base_commit_id='abc123')
+        self.create_filediff(diffset,
+                             source_file='/README',
+                             dest_file='/README',
+                             source_revision='123')
+        self.create_filediff(diffset,
+                             source_file='/new-file',
+                             dest_file='/new-file',
+                             source_revision=PRE_CREATION,
+                             status=FileDiff.COPIED)
+        self.create_filediff(diffset,
+                             source_file='/main.c',
+                             dest_file='/main.c',
+                             source_revision='456')
+
+        self.spy_on(Repository.prefetch_files,
+                    owner=Repository,
+                    call_original=False)
+
+        request = self.create_http_request()
+        prefetch_original_files(diffset.files.all(),
+                                request=request)
+
+        self.assertSpyCallCount(Repository.prefetch_files, 1)
+
+        files = Repository.prefetch_files.last_call.kwargs['files']
+        self.assertEqual(
+            [
+                (path, revision)
+                for path, revision, context in files
+            ],
+            [
+                ('/README', '123'),
+                ('/main.c', '456'),
+            ])
+
+        for path, revision, context in files:
+            self.assertIs(context.request, request)
+            self.assertEqual(context.base_commit_id, 'abc123')
+
+    def test_prefetch_uncached_original_files(self) -> None:
+        """Testing prefetch_uncached_original_files skips diffs with cached
+        chunks
+        """
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+        cached_filediff = self.create_filediff(diffset,
+                                               source_file='/README',
+                                               dest_file='/README',
+                                               source_revision='123')
+        self.create_filediff(diffset,
+                             source_file='/main.c',
+                             dest_file='/main.c',
+                             source_revision='456')
+
+        self.spy_on(
+            DiffChunkGenerator.has_cached_chunks,
+            owner=DiffChunkGenerator,
+            call_fake=lambda self: self.filediff.pk == cached_filediff.pk)
+        self.spy_on(Repository.prefetch_files,
+                    owner=Repository,
+                    call_original=False)
+
+        prefetch_uncached_original_files(
+            get_diff_files(diffset=diffset),
+            diff_settings=DiffSettings.create())
+
+        self.assertSpyCallCount(Repository.prefetch_files, 1)
+
+        files = Repository.prefetch_files.last_call.kwargs['files']
+        self.assertEqual(
+            [
+                (path, revision)
+                for path, revision, context in files
+            ],
+            [
+                ('/main.c', '456'),
+            ])
+
+    def test_prefetch_uncached_original_files_with_all_cached(self) -> None:
+        """Testing prefetch_uncached_original_files with all chunks cached"""
+        repository = self.create_repository(tool_name='Git')
+        diffset = self.create_diffset(repository=repository)
+        self.create_filediff(diffset,
+                             source_file='/README',
+                             dest_file='/README',
+                             source_revision='123')
+
+        self.spy_on(DiffChunkGenerator.has_cached_chunks,
+                    owner=DiffChunkGenerator,
+                    op=kgb.SpyOpReturn(True))
+        self.spy_on(Repository.prefetch_files,
+                    owner=Repository,
+                    call_original=False)
+
+        prefetch_uncached_original_files(
+            get_diff_files(diffset=diffset),
+            diff_settings=DiffSettings.create())
+
+        self.assertSpyNotCalled(Repository.prefetch_files)
+
+
 class SplitLineEndingsTests(TestCase):
     """Unit tests for reviewboard.diffviewer.diffutils.split_line_endings."""
 
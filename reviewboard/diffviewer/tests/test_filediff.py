@@ -125,6 +125,32 @@ class FileDiffTests(TestCase):
 
         self.assertEqual(filediff1.diff_hash, filediff2.diff_hash)
 
+    def test_iter_diff(self):
+        """Testing FileDiff.iter_diff"""
+        self.filediff.save()
+
+        self.assertEqual(b''.join(self.filediff.iter_diff()),
+                         self.filediff.diff)
+
+    def test_iter_diff_with_compressed(self):
+        """Testing FileDiff.iter_diff with compressed diff data"""
+        data = (
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -1 +1,20000 @@\n'
+            b'-blah\n'
+        ) + b'+blah blah blah\n' * 20000
+
+        filediff = FileDiff.objects.create(diff=data, diffset=self.diffset)
+        raw_file_diff_data = filediff.diff_hash
+
+        self.assertEqual(raw_file_diff_data.compression,
+                         raw_file_diff_data.COMPRESSION_BZIP2)
+        self.assertEqual(b''.join(filediff.iter_diff()), data)
+        self.assertEqual(
+            b''.join(raw_file_diff_data.iter_content(chunk_size=16)),
+            data)
+
     def test_get_base_filediff(self):
         """Testing FileDiff.get_base_filediff"""
         commit1 = self.create_diffcommit(
@@ -0,0 +1,150 @@
+"""Unit tests for reviewboard.diffviewer.highlight_cache."""
+
+from __future__ import annotations
+
+from importlib.metadata import version
+
+import kgb
+from pygments.lexers import PythonLexer, TextLexer
+
+from reviewboard.diffviewer.chunk_generator import RawDiffChunkGenerator
+from reviewboard.diffviewer.highlight_cache import (
+    get_highlighted_lines,
+    get_pygments_highlighter_id,
+    get_treesitter_highlighter_id,
+    make_highlight_cache_key,
+    _get_treesitter_versions,
+)
+from reviewboard.diffviewer.settings import DiffSettings
+from reviewboard.testing import TestCase
+from reviewboard.treesitter.language import get_language_name_for_file
+
+
+class HighlightCacheTests(kgb.SpyAgency, TestCase):
+    """Unit tests for the highlight cache."""
+
+    def test_get_highlighted_lines(self) -> None:
+        """Testing get_highlighted_lines caches results by content"""
+        def _highlight() -> list[str]:
+            return ['<span class="k">def</span> f():', '    pass']
+
+        self.spy_on(_highlight)
+
+        for i in range(2):
+            self.assertEqual(
+                get_highlighted_lines(content='def f():\n    pass\n',
+                                      highlighter_id='test',
+                                      highlight_func=_highlight),
+                ['<span class="k">def</span> f():', '    pass'])
+
+        self.assertSpyCallCount(_highlight, 1)
+
+    def test_get_highlighted_lines_with_none(self) -> None:
+        """Testing get_highlighted_lines caches a None result"""
+        def _highlight() -> None:
+            return None
+
+        self.spy_on(_highlight)
+
+        for i in range(2):
+            self.assertIsNone(
+                get_highlighted_lines(content='abc',
+                                      highlighter_id='test',
+                                      highlight_func=_highlight))
+
+        self.assertSpyCallCount(_highlight, 1)
+
+    def test_get_highlighted_lines_with_exception(self) -> None:
+        """Testing get_highlighted_lines does not cache exceptions"""
+        def _highlight() -> list[str]:
+            raise ValueError('Oh no')
+
+        for i in range(2):
+            with self.assertRaises(ValueError):
+                get_highlighted_lines(content='abc',
+                                      highlighter_id='test',
+                                      highlight_func=_highlight)
+
+        self.assertEqual(
+            get_highlighted_lines(content='abc',
+                                  highlighter_id='test',
+                                  highlight_func=lambda: ['abc']),
+            ['abc'])
+
+    def test_make_highlight_cache_key(self) -> None:
+        """Testing make_highlight_cache_key varies by content and
+        highlighter
+        """
+        key = make_highlight_cache_key(content='abc',
+                                       highlighter_id='test')
+
+        self.assertEqual(
+            key,
+            make_highlight_cache_key(content=b'abc',
+                                     highlighter_id='test'))
+        self.assertNotEqual(
+            key,
+            make_highlight_cache_key(content='abcd',
+                                     highlighter_id='test'))
+        self.assertNotEqual(
+            key,
+            make_highlight_cache_key(content='abc',
+                                     highlighter_id='test2'))
+
+    def test_get_pygments_highlighter_id(self) -> None:
+        """Testing get_pygments_highlighter_id"""
+        python_id = get_pygments_highlighter_id(PythonLexer())
+
+        self.assertIn('pygments.lexers.python.PythonLexer', python_id)
+        self.assertNotEqual(python_id,
+                            get_pygments_highlighter_id(TextLexer()))
+        self.assertNotEqual(python_id,
+                            get_pygments_highlighter_id(PythonLexer(),
+                                                        'textui'))
+
+    def test_get_treesitter_highlighter_id(self) -> None:
+        """Testing get_treesitter_highlighter_id varies by tree-sitter and
+        grammar versions
+        """
+        package_versions = {
+            'tree-sitter': '0.25.0',
+            'tree-sitter-language-pack': '0.9.0',
+        }
+
+        self.spy_on(version,
+                    call_fake=lambda name: package_versions[name])
+        self.addCleanup(_get_treesitter_versions.cache_clear)
+
+        _get_treesitter_versions.cache_clear()
+        python_id = get_treesitter_highlighter_id('python')
+
+        self.assertEqual(python_id, 'treesitter-0.25.0-0.9.0-python')
+        self.assertNotEqual(python_id, get_treesitter_highlighter_id('c'))
+
+        # Upgrading the grammars must change the ID.
+        package_versions['tree-sitter-language-pack'] = '0.10.0'
+        _get_treesitter_versions.cache_clear()
+
+        self.assertEqual(get_treesitter_highlighter_id('python'),
+                         'treesitter-0.25.0-0.10.0-python')
+
+    def test_shared_across_chunk_generators(self) -> None:
+        """Testing RawDiffChunkGenerator shares highlighted content across
+        generators
+        """
+        self.spy_on(get_language_name_for_file,
+                    op=kgb.SpyOpReturn(None))
+        self.spy_on(RawDiffChunkGenerator._highlight_pygments,
+                    owner=RawDiffChunkGenerator)
+
+        for new in (b'int i = 2;\n', b'int i = 3;\n'):
+            generator = RawDiffChunkGenerator(
+                old=b'int i = 1;\n',
+                new=new,
+                orig_filename='main.c',
+                modified_filename='main.c',
+                diff_settings=DiffSettings.create(syntax_highlighting=True))
+            list(generator.get_chunks())
+
+        # The original file is highlighted once, and each modified file once.
+        self.assertSpyCallCount(RawDiffChunkGenerator._highlight_pygments, 3)
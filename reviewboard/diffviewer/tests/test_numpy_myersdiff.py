@@ -0,0 +1,96 @@
+"""Unit tests for reviewboard.diffviewer.numpy_myersdiff."""
+
+from __future__ import annotations
+
+import os
+import random
+import unittest
+
+from reviewboard.diffviewer.differ import get_differ
+from reviewboard.diffviewer.myersdiff import MyersDiffer
+from reviewboard.diffviewer.numpy_myersdiff import NumPyMyersDiffer, has_numpy
+from reviewboard.testing import TestCase
+
+
+@unittest.skipIf(not has_numpy, 'NumPy is not installed')
+class NumPyMyersDifferTests(TestCase):
+    """Unit tests for NumPyMyersDiffer."""
+
+    def test_testdata_parity(self) -> None:
+        """Testing NumPyMyersDiffer produces the same opcodes as MyersDiffer
+        for the diff viewer test data
+        """
+        testdata_path = os.path.abspath(
+            os.path.join(__file__, '..', '..', 'testdata', 'move_detection'))
+
+        with open(os.path.join(testdata_path, 'bug-4371-old.js'), 'r') as fp:
+            old = fp.readlines()
+
+        with open(os.path.join(testdata_path, 'bug-4371-new.js'), 'r') as fp:
+            new = fp.readlines()
+
+        self._check_parity(old, new)
+        self._check_parity(old, new, ignore_space=True)
+
+    def test_generated_parity(self) -> None:
+        """Testing NumPyMyersDiffer produces the same opcodes as MyersDiffer
+        for generated files with repeated and discarded lines
+        """
+        rand = random.Random(42)
+
+        for i in range(50):
+            old = [
+                '%s\n' % rand.choice('abcdefghij')
+                for j in range(rand.randint(0, 200))
+            ]
+            new = list(old)
+
+            for j in range(rand.randint(0, 10)):
+                pos = rand.randint(0, len(new))
+                new[pos:pos + rand.randint(0, 5)] = [
+                    '%s\n' % rand.choice('abcxyz')
+                    for k in range(rand.randint(0, 8))
+                ]
+
+            self._check_parity(old, new)
+
+    def test_empty(self) -> None:
+        """Testing NumPyMyersDiffer with empty files"""
+        self._check_parity([], [])
+        self._check_parity([], ['1\n', '2\n'])
+        self._check_parity(['1\n', '2\n'], [])
+
+    def test_get_differ(self) -> None:
+        """Testing get_differ returns NumPyMyersDiffer for large files"""
+        old = ['%s\n' % i for i in range(NumPyMyersDiffer.MIN_LINES)]
+
+        self.assertIs(type(get_differ(old, old)), NumPyMyersDiffer)
+        self.assertIs(type(get_differ(old[:10], old[:10])), MyersDiffer)
+        self.assertIs(type(get_differ(old, old, accelerated=False)),
+                      MyersDiffer)
+
+    def _check_parity(
+        self,
+        old: list[str],
+        new: list[str],
+        ignore_space: bool = False,
+    ) -> None:
+        """Check that both differs produce the same opcodes.
+
+        Args:
+            old (list of str):
+                The lines in the original file.
+
+            new (list of str):
+                The lines in the modified file.
+
+            ignore_space (bool, optional):
+                Whether to ignore whitespace.
+
+        Raises:
+            AssertionError:
+                The opcodes did not match.
+        """
+        self.assertEqual(
+            list(NumPyMyersDiffer(old, new, ignore_space).get_opcodes()),
+            list(MyersDiffer(old, new, ignore_space).get_opcodes()))
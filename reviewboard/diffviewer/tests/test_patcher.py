@@ -0,0 +1,358 @@
+"""Unit tests for reviewboard.diffviewer.patcher."""
+
+from __future__ import annotations
+
+from reviewboard.diffviewer.patcher import (UnsupportedPatchError,
+                                            apply_patch,
+                                            parse_hunks)
+from reviewboard.testing import TestCase
+
+
+class ParseHunksTests(TestCase):
+    """Unit tests for parse_hunks."""
+
+    def test_with_headers(self) -> None:
+        """Testing parse_hunks with file headers"""
+        headers, hunks = parse_hunks(
+            b'diff --git a/README b/README\n'
+            b'--- a/README\n'
+            b'+++ b/README\n'
+            b'@@ -1,3 +1,3 @@\n'
+            b' line 1\n'
+            b'-line 2\n'
+            b'+line 2 changed\n'
+            b' line 3\n')
+
+        self.assertEqual(headers, [b'--- a/README\n', b'+++ b/README\n'])
+        self.assertEqual(len(hunks), 1)
+
+        hunk = hunks[0]
+        self.assertEqual(hunk.old_start, 1)
+        self.assertEqual(hunk.old_len, 3)
+        self.assertEqual(hunk.old_lines,
+                         [b'line 1\n', b'line 2\n', b'line 3\n'])
+        self.assertEqual(hunk.new_lines,
+                         [b'line 1\n', b'line 2 changed\n', b'line 3\n'])
+        self.assertEqual(hunk.leading_context, 1)
+        self.assertEqual(hunk.trailing_context, 1)
+
+    def test_with_no_newline_markers(self) -> None:
+        """Testing parse_hunks with "No newline at end of file" markers"""
+        headers, hunks = parse_hunks(
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -1,2 +1,2 @@\n'
+            b' line 1\n'
+            b'-line 2\n'
+            b'\\ No newline at end of file\n'
+            b'+line 2 changed\n'
+            b'\\ No newline at end of file\n')
+
+        hunk = hunks[0]
+        self.assertEqual(hunk.old_lines, [b'line 1\n', b'line 2'])
+        self.assertEqual(hunk.new_lines, [b'line 1\n', b'line 2 changed'])
+
+    def test_with_omitted_line_counts(self) -> None:
+        """Testing parse_hunks with omitted hunk line counts"""
+        headers, hunks = parse_hunks(
+            b'@@ -1 +1 @@\n'
+            b'-old\n'
+            b'+new\n')
+
+        self.assertEqual(hunks[0].old_lines, [b'old\n'])
+        self.assertEqual(hunks[0].new_lines, [b'new\n'])
+
+    def test_with_truncated_hunk(self) -> None:
+        """Testing parse_hunks with a truncated hunk"""
+        with self.assertRaises(UnsupportedPatchError):
+            parse_hunks(
+                b'@@ -1,4 +1,4 @@\n'
+                b' line 1\n'
+                b'-line 2\n'
+                b'+line 2 changed\n')
+
+    def test_with_multiple_files(self) -> None:
+        """Testing parse_hunks with a diff covering multiple files"""
+        with self.assertRaises(UnsupportedPatchError):
+            parse_hunks(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1 +1 @@\n'
+                b'-old\n'
+                b'+new\n'
+                b'--- README2\n'
+                b'+++ README2\n'
+                b'@@ -1 +1 @@\n'
+                b'-old\n'
+                b'+new\n')
+
+
+class ApplyPatchTests(TestCase):
+    """Unit tests for apply_patch."""
+
+    def test_apply(self) -> None:
+        """Testing apply_patch"""
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,3 +1,4 @@\n'
+                b' line 1\n'
+                b'-line 2\n'
+                b'+line 2 changed\n'
+                b'+line 2.5\n'
+                b' line 3\n'
+            ),
+            orig_file=b'line 1\nline 2\nline 3\n',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file,
+                         b'line 1\nline 2 changed\nline 2.5\nline 3\n')
+
+    def test_apply_new_file(self) -> None:
+        """Testing apply_patch with a newly-created file"""
+        result = apply_patch(
+            diff=(
+                b'--- /dev/null\n'
+                b'+++ README\n'
+                b'@@ -0,0 +1,2 @@\n'
+                b'+line 1\n'
+                b'+line 2\n'
+            ),
+            orig_file=b'',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file, b'line 1\nline 2\n')
+
+    def test_apply_with_offset(self) -> None:
+        """Testing apply_patch with hunks at an offset"""
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' a\n'
+                b'-b\n'
+                b'+B\n'
+                b' c\n'
+                b'@@ -6,3 +6,3 @@\n'
+                b' f\n'
+                b'-g\n'
+                b'+G\n'
+                b' h\n'
+            ),
+            orig_file=b'new 1\nnew 2\na\nb\nc\nd\ne\nf\ng\nh\n',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file,
+                         b'new 1\nnew 2\na\nB\nc\nd\ne\nf\nG\nh\n')
+
+    def test_apply_with_fuzz(self) -> None:
+        """Testing apply_patch with context requiring fuzz"""
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,5 +1,5 @@\n'
+                b' a\n'
+                b' b\n'
+                b'-c\n'
+                b'+C\n'
+                b' d\n'
+                b' e\n'
+            ),
+            orig_file=b'a\nchanged\nc\nd\ne\n',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file, b'a\nchanged\nC\nd\ne\n')
+
+    def test_apply_with_no_newline(self) -> None:
+        """Testing apply_patch with "No newline at end of file" markers"""
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,2 +1,2 @@\n'
+                b' line 1\n'
+                b'-line 2\n'
+                b'\\ No newline at end of file\n'
+                b'+line 2 changed\n'
+            ),
+            orig_file=b'line 1\nline 2',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file, b'line 1\nline 2 changed\n')
+
+    def test_apply_with_rejects(self) -> None:
+        """Testing apply_patch with hunks that fail to apply"""
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' a\n'
+                b'-b\n'
+                b'+B\n'
+                b' c\n'
+                b'@@ -10,3 +10,3 @@\n'
+                b' x\n'
+                b'-y\n'
+                b'+Y\n'
+                b' z\n'
+            ),
+            orig_file=b'a\nb\nc\n',
+            filename='/path/to/README')
+
+        self.assertTrue(result.failed)
+        self.assertEqual(result.new_file, b'a\nB\nc\n')
+        self.assertEqual(
+            result.error_output,
+            'patching file README\n'
+            'Hunk #2 FAILED at 10.\n'
+            '1 out of 2 hunks FAILED -- saving rejects to file README.rej')
+        self.assertEqual(
+            result.rejects,
+            b'--- README\n'
+            b'+++ README\n'
+            b'@@ -10,3 +10,3 @@\n'
+            b' x\n'
+            b'-y\n'
+            b'+Y\n'
+            b' z\n')
+
+    def test_apply_with_start_anchored_hunk(self) -> None:
+        """Testing apply_patch with a hunk anchored to the start of the file
+        """
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,4 +1,4 @@\n'
+                b'-a\n'
+                b'+A\n'
+                b' b\n'
+                b' c\n'
+                b' d\n'
+            ),
+            orig_file=b'a\nb\nc\nd\ne\n',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file, b'A\nb\nc\nd\ne\n')
+
+    def test_apply_with_start_anchored_hunk_at_offset(self) -> None:
+        """Testing apply_patch with a hunk anchored to the start of the file
+        that only matches at an offset
+        """
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,4 +1,4 @@\n'
+                b'-a\n'
+                b'+A\n'
+                b' b\n'
+                b' c\n'
+                b' d\n'
+            ),
+            orig_file=b'x\na\nb\nc\nd\ne\n',
+            filename='README')
+
+        self.assertTrue(result.failed)
+        self.assertEqual(result.new_file, b'x\na\nb\nc\nd\ne\n')
+        self.assertEqual(
+            result.error_output,
+            'patching file README\n'
+            'Hunk #1 FAILED at 1.\n'
+            '1 out of 1 hunk FAILED -- saving rejects to file README.rej')
+
+    def test_apply_with_end_anchored_hunk(self) -> None:
+        """Testing apply_patch with a hunk anchored to the end of the file"""
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' a\n'
+                b'-b\n'
+                b'+B\n'
+                b' c\n'
+                b'@@ -5,3 +5,4 @@\n'
+                b' e\n'
+                b' f\n'
+                b' g\n'
+                b'+h\n'
+            ),
+            orig_file=b'a\nb\nc\nd\ne\nf\ng\nx\ne\nf\ng\n',
+            filename='README')
+
+        self.assertFalse(result.failed)
+        self.assertEqual(result.new_file,
+                         b'a\nB\nc\nd\ne\nf\ng\nx\ne\nf\ng\nh\n')
+
+    def test_apply_with_end_anchored_hunk_not_at_end(self) -> None:
+        """Testing apply_patch with a hunk anchored to the end of the file
+        that only matches before the end
+        """
+        result = apply_patch(
+            diff=(
+                b'--- README\n'
+                b'+++ README\n'
+                b'@@ -1,3 +1,3 @@\n'
+                b' a\n'
+                b'-b\n'
+                b'+B\n'
+                b' c\n'
+                b'@@ -5,3 +5,4 @@\n'
+                b' e\n'
+                b' f\n'
+                b' g\n'
+                b'+h\n'
+            ),
+            orig_file=b'a\nb\nc\nd\ne\nf\ng\nx\n',
+            filename='README')
+
+        self.assertTrue(result.failed)
+        self.assertEqual(result.new_file, b'a\nB\nc\nd\ne\nf\ng\nx\n')
+        self.assertEqual(
+            result.error_output,
+            'patching file README\n'
+            'Hunk #2 FAILED at 5.\n'
+            '1 out of 2 hunks FAILED -- saving rejects to file README.rej')
+
+    def test_apply_with_reversed_diff(self) -> None:
+        """Testing apply_patch with a diff that appears to be reversed"""
+        with self.assertRaises(UnsupportedPatchError):
+            apply_patch(
+                diff=(
+                    b'--- README\n'
+                    b'+++ README\n'
+                    b'@@ -1,3 +1,3 @@\n'
+                    b' a\n'
+                    b'-b\n'
+                    b'+B\n'
+                    b' c\n'
+                ),
+                orig_file=b'a\nB\nc\n',
+                filename='README')
+
+    def test_apply_without_hunks(self) -> None:
+        """Testing apply_patch with a diff that has no unified hunks"""
+        with self.assertRaises(UnsupportedPatchError):
+            apply_patch(
+                diff=(
+                    b'*** README\n'
+                    b'--- README\n'
+                    b'***************\n'
+                    b'*** 1 ****\n'
+                    b'! old\n'
+                    b'--- 1 ----\n'
+                    b'! new\n'
+                ),
+                orig_file=b'old\n',
+                filename='README')
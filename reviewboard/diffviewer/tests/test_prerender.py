@@ -0,0 +1,123 @@
+"""Unit tests for reviewboard.diffviewer.prerender."""
+
+from __future__ import annotations
+
+import kgb
+
+from reviewboard.diffviewer.chunk_generator import DiffChunkGenerator
+from reviewboard.diffviewer.prerender import (DiffPrerenderer,
+                                              prerender_diffset)
+from reviewboard.diffviewer.settings import DiffSettings
+from reviewboard.testing import TestCase
+
+
+class PrerenderDiffSetTests(kgb.SpyAgency, TestCase):
+    """Unit tests for prerender_diffset."""
+
+    fixtures = ['test_scmtools']
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+
+        self.repository = self.create_repository(tool_name='Test')
+        self.diffset = self.create_diffset(repository=self.repository)
+        self.filediff = self.create_filediff(diffset=self.diffset)
+
+    def test_prerender_diffset(self) -> None:
+        """Testing prerender_diffset caches chunks for the diff viewer"""
+        self.spy_on(DiffChunkGenerator.get_chunks_uncached,
+                    owner=DiffChunkGenerator)
+
+        stats = prerender_diffset(self.diffset)
+
+        self.assertEqual(stats.num_files, 1)
+        self.assertEqual(stats.num_rendered, 1)
+        self.assertEqual(stats.num_skipped, 0)
+        self.assertEqual(stats.num_failed, 0)
+        self.assertSpyCallCount(DiffChunkGenerator.get_chunks_uncached, 1)
+
+        # A viewer with default settings should now hit the cache.
+        generator = DiffChunkGenerator(request=None,
+                                       filediff=self.filediff,
+                                       diff_settings=DiffSettings.create())
+        self.assertEqual(len(list(generator.get_chunks())), 1)
+        self.assertSpyCallCount(DiffChunkGenerator.get_chunks_uncached, 1)
+
+    def test_prerender_diffset_with_max_lines(self) -> None:
+        """Testing prerender_diffset skips files past max_lines"""
+        self.spy_on(DiffChunkGenerator.get_chunks_uncached,
+                    owner=DiffChunkGenerator)
+
+        stats = prerender_diffset(self.diffset, max_lines=1)
+
+        self.assertEqual(stats.num_files, 1)
+        self.assertEqual(stats.num_rendered, 0)
+        self.assertEqual(stats.num_skipped, 1)
+        self.assertSpyNotCalled(DiffChunkGenerator.get_chunks_uncached)
+
+
+class DiffPrerendererTests(kgb.SpyAgency, TestCase):
+    """Unit tests for DiffPrerenderer."""
+
+    fixtures = ['test_scmtools']
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+
+        self.repository = self.create_repository(tool_name='Test')
+        self.diffset = self.create_diffset(repository=self.repository)
+        self.create_filediff(diffset=self.diffset)
+        self.prerenderer = DiffPrerenderer()
+
+    def test_queue_diffset(self) -> None:
+        """Testing DiffPrerenderer.queue_diffset"""
+        self.spy_on(prerender_diffset)
+
+        with self.siteconfig_settings({
+                'diffviewer_prerender_enabled': True,
+                'diffviewer_prerender_max_workers': 0,
+            }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertTrue(self.prerenderer.queue_diffset(self.diffset))
+
+                # Nothing should run until the transaction commits.
+                self.assertSpyNotCalled(prerender_diffset)
+
+        self.assertSpyCallCount(prerender_diffset, 1)
+        self.assertEqual(prerender_diffset.last_call.kwargs['diffset'],
+                         self.diffset)
+        self.assertEqual(self.prerenderer.num_pending, 0)
+
+    def test_queue_diffset_with_disabled(self) -> None:
+        """Testing DiffPrerenderer.queue_diffset with pre-rendering disabled
+        """
+        self.spy_on(prerender_diffset)
+
+        with self.siteconfig_settings({
+                'diffviewer_prerender_enabled': False,
+            }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertFalse(
+                    self.prerenderer.queue_diffset(self.diffset))
+
+        self.assertSpyNotCalled(prerender_diffset)
+
+    def test_queue_diffset_with_max_pending(self) -> None:
+        """Testing DiffPrerenderer.queue_diffset skips diffs past
+        max_pending
+        """
+        self.spy_on(prerender_diffset)
+        self.prerenderer._num_pending = 2
+
+        with self.siteconfig_settings({
+                'diffviewer_prerender_enabled': True,
+                'diffviewer_prerender_max_pending': 2,
+                'diffviewer_prerender_max_workers': 0,
+            }):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertTrue(self.prerenderer.queue_diffset(self.diffset))
+
+        self.assertSpyNotCalled(prerender_diffset)
+        self.assertEqual(self.prerenderer.num_pending, 2)
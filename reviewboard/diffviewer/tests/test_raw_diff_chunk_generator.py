@@ -3,7 +3,10 @@ from __future__ import annotations
 import kgb
 from tree_sitter import QueryError
 
-from reviewboard.diffviewer.chunk_generator import RawDiffChunkGenerator
+from reviewboard.diffviewer.chunk_generator import (
+    RawDiffChunkGenerator,
+    get_highlight_pending_line_ranges,
+)
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.testing import TestCase
 from reviewboard.treesitter.highlight import highlight
@@ -304,6 +307,101 @@ class RawDiffChunkGeneratorTests(kgb.SpyAgency, TestCase):
             }
         )
 
+    def test_get_chunks_with_viewport_highlighting(self):
+        """Testing RawDiffChunkGenerator.get_chunks with
+        DiffSettings.syntax_highlighting_viewport_threshold only highlighting
+        visible lines
+        """
+        old = b''.join(
+            b'x%d = %d\n' % (i, i)
+            for i in range(100)
+        )
+        new = old.replace(b'x50 = 50\n', b'x50 = 51\n')
+
+        diff_settings = DiffSettings.create(syntax_highlighting=True)
+        diff_settings.syntax_highlighting_viewport_threshold = 50
+
+        self.spy_on(RawDiffChunkGenerator._highlight,
+                    owner=RawDiffChunkGenerator)
+
+        generator = RawDiffChunkGenerator(old=old,
+                                          new=new,
+                                          orig_filename='file.py',
+                                          modified_filename='file.py',
+                                          diff_settings=diff_settings)
+        chunks = list(generator.get_chunks())
+
+        self.assertSpyNotCalled(RawDiffChunkGenerator._highlight)
+        self.assertEqual(
+            [
+                (chunk['change'], chunk['collapsable'], chunk['numlines'])
+                for chunk in chunks
+            ],
+            [
+                ('equal', True, 45),
+                ('equal', False, 5),
+                ('replace', False, 1),
+                ('equal', False, 5),
+                ('equal', True, 44),
+            ])
+
+        # Collapsed lines are left unhighlighted.
+        for i in (0, 4):
+            self.assertTrue(chunks[i]['meta']['highlight_pending'])
+            self.assertNotIn('<span', chunks[i]['lines'][0][2])
+
+        # Visible lines are highlighted.
+        for i in (1, 2, 3):
+            self.assertNotIn('highlight_pending', chunks[i]['meta'])
+            self.assertIn('<span', chunks[i]['lines'][0][2])
+            self.assertIn('<span', chunks[i]['lines'][0][5])
+
+        # Expanding the first chunk should highlight its lines.
+        highlight_line_ranges = get_highlight_pending_line_ranges(
+            [chunks[0]])
+        self.assertEqual(highlight_line_ranges, ([(0, 45)], [(0, 45)]))
+
+        generator = RawDiffChunkGenerator(
+            old=old,
+            new=new,
+            orig_filename='file.py',
+            modified_filename='file.py',
+            diff_settings=diff_settings,
+            highlight_line_ranges=highlight_line_ranges)
+        chunks = list(generator.get_chunks())
+
+        self.assertNotIn('highlight_pending', chunks[0]['meta'])
+        self.assertIn('<span', chunks[0]['lines'][0][2])
+        self.assertTrue(chunks[4]['meta']['highlight_pending'])
+        self.assertNotIn('<span', chunks[4]['lines'][0][2])
+
+    def test_get_chunks_with_viewport_highlighting_below_threshold(self):
+        """Testing RawDiffChunkGenerator.get_chunks with
+        DiffSettings.syntax_highlighting_viewport_threshold and file below
+        the threshold
+        """
+        old = b''.join(
+            b'x%d = %d\n' % (i, i)
+            for i in range(100)
+        )
+        new = old.replace(b'x50 = 50\n', b'x50 = 51\n')
+
+        diff_settings = DiffSettings.create(syntax_highlighting=True)
+        diff_settings.syntax_highlighting_viewport_threshold = 1000
+
+        generator = RawDiffChunkGenerator(old=old,
+                                          new=new,
+                                          orig_filename='file.py',
+                                          modified_filename='file.py',
+                                          diff_settings=diff_settings)
+        chunks = list(generator.get_chunks())
+
+        self.assertEqual(len(chunks), 5)
+
+        for chunk in chunks:
+            self.assertNotIn('highlight_pending', chunk['meta'])
+            self.assertIn('<span', chunk['lines'][0][2])
+
     def test_generate_chunks_with_encodings(self):
         """Testing RawDiffChunkGenerator.generate_chunks with explicit
         encodings for old and new
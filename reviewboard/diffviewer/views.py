@@ -37,7 +37,10 @@ from reviewboard.deprecation import (
 from reviewboard.diffviewer.commit_utils import (
     SerializedCommitHistoryDiffEntry,
     diff_histories)
-from reviewboard.diffviewer.diffutils import get_diff_files
+from reviewboard.diffviewer.diffutils import (
+    get_diff_files,
+    prefetch_uncached_original_files,
+)
 from reviewboard.diffviewer.errors import PatchError, UserVisibleError
 from reviewboard.diffviewer.models import DiffCommit, DiffSet, FileDiff
 from reviewboard.diffviewer.renderers import (
@@ -412,6 +415,15 @@ class DiffViewerView(TemplateView):
         except InvalidPage:
             page = paginator.page(paginator.num_pages)
 
+        # Fetch the original files for this page up-front, so that rendering
+        # each file doesn't need its own round-trip to the repository. Files
+        # that are already rendered and cached are skipped, so that a warm
+        # cache doesn't block the page on the repository.
+        prefetch_uncached_original_files(
+            page.object_list,
+            diff_settings=diff_settings,
+            request=self.request)
+
         diff_context: SerializedDiffContext = {
             'commits': None,
             'commit_history_diff': None,
@@ -280,6 +280,22 @@ class BaseHostingService(Generic[THostingServiceClient]):
     #:     bool
     supports_list_remote_repositories: ClassVar[bool] = False
 
+    #: Whether files can be fetched from multiple threads at once.
+    #:
+    #: This should be set to ``True`` if :py:meth:`get_file` is safe to call
+    #: concurrently for the same repository (for instance, if it's
+    #: implemented through stateless HTTP API requests). This allows
+    #: :py:meth:`Repository.get_files()
+    #: <reviewboard.scmtools.models.Repository.get_files>` to fetch several
+    #: files in parallel.
+    #:
+    #: Version Added:
+    #:     9.0
+    #:
+    #: Type:
+    #:     bool
+    supports_concurrent_file_fetches: ClassVar[bool] = False
+
     #: Whether this service provides repository hook instructions.
     #:
     #: This should be set to ``True`` if the subclass implements instructions'
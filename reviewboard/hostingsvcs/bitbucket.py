@@ -842,6 +842,7 @@ class Bitbucket(BaseHostingService[BitbucketClient]):
     supports_repositories = True
     supports_bug_trackers = True
     supports_post_commit = True
+    supports_concurrent_file_fetches = True
 
     has_repository_hook_instructions = True
 
@@ -172,6 +172,7 @@ class GitHub(BaseHostingService[GitHubClient], BaseBugTracker):
     supports_post_commit = True
     supports_repositories = True
     supports_list_remote_repositories = True
+    supports_concurrent_file_fetches = True
     supported_scmtools: ClassVar[Sequence[str]] = ['Git']
 
     has_repository_hook_instructions = True
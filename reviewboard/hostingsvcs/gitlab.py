@@ -264,6 +264,7 @@ class GitLab(BaseHostingService):
     supports_bug_trackers = True
     supports_post_commit = True
     supports_repositories = True
+    supports_concurrent_file_fetches = True
     supported_scmtools = ['Git']
 
     # Pagination links (in GitLab 6.8.0+) take the form:
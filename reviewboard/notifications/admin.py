@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from django.contrib import admin
+from django.db.models import Avg, Count, Q
 from django.utils.translation import gettext_lazy as _
 
 from reviewboard.admin import ModelAdmin, admin_site
 from reviewboard.notifications.forms import WebHookTargetForm
-from reviewboard.notifications.models import WebHookTarget
+from reviewboard.notifications.models import WebHookDelivery, WebHookTarget
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from django.http import HttpRequest
 
 
 class WebHookTargetAdmin(ModelAdmin):
     form = WebHookTargetForm
 
-    list_display = ('url', 'enabled')
+    list_display = ('url', 'enabled', 'num_deliveries',
+                    'num_failed_deliveries', 'average_latency')
     filter_horizontal = ('repositories',)
     fieldsets = (
         (_('General Information'), {
@@ -40,5 +49,140 @@ class WebHookTargetAdmin(ModelAdmin):
     )
     raw_id_fields = ('local_site',)
 
+    def get_queryset(
+        self,
+        request: HttpRequest,
+    ) -> QuerySet[WebHookTarget]:
+        """Return the queryset for the WebHook targets.
+
+        This includes the delivery statistics for each target.
+
+        Version Added:
+            9.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            django.db.models.QuerySet:
+            The queryset for the WebHook targets.
+        """
+        return (
+            super().get_queryset(request)
+            .annotate(
+                _num_deliveries=Count('deliveries'),
+                _num_failed_deliveries=Count(
+                    'deliveries',
+                    filter=Q(deliveries__status=(
+                        WebHookDelivery.STATUS_FAILED))),
+                _average_latency=Avg('deliveries__latency'))
+        )
+
+    @admin.display(description=_('Deliveries'),
+                   ordering='_num_deliveries')
+    def num_deliveries(
+        self,
+        obj: WebHookTarget,
+    ) -> int:
+        """Return the number of stored deliveries for the target.
+
+        Version Added:
+            9.0
+
+        Args:
+            obj (reviewboard.notifications.models.WebHookTarget):
+                The WebHook target.
+
+        Returns:
+            int:
+            The number of deliveries.
+        """
+        return obj._num_deliveries
+
+    @admin.display(description=_('Failed deliveries'),
+                   ordering='_num_failed_deliveries')
+    def num_failed_deliveries(
+        self,
+        obj: WebHookTarget,
+    ) -> int:
+        """Return the number of failed deliveries for the target.
+
+        Version Added:
+            9.0
+
+        Args:
+            obj (reviewboard.notifications.models.WebHookTarget):
+                The WebHook target.
+
+        Returns:
+            int:
+            The number of failed deliveries.
+        """
+        return obj._num_failed_deliveries
+
+    @admin.display(description=_('Average latency'),
+                   ordering='_average_latency')
+    def average_latency(
+        self,
+        obj: WebHookTarget,
+    ) -> str:
+        """Return the average latency of deliveries for the target.
+
+        Version Added:
+            9.0
+
+        Args:
+            obj (reviewboard.notifications.models.WebHookTarget):
+                The WebHook target.
+
+        Returns:
+            str:
+            The average latency, or an empty string if there have been no
+            delivery attempts.
+        """
+        latency = obj._average_latency
+
+        if latency is None:
+            return ''
+
+        return _('%.0f ms') % (latency * 1000)
+
+
+class WebHookDeliveryAdmin(ModelAdmin):
+    """Admin definitions for the WebHookDelivery model.
+
+    Version Added:
+        9.0
+    """
+
+    list_display = ('target', 'event', 'status', 'attempts', 'response_code',
+                    'latency', 'timestamp', 'last_attempt')
+    list_filter = ('status', 'event')
+    list_select_related = ('target',)
+    raw_id_fields = ('target',)
+    readonly_fields = ('target', 'event', 'headers', 'status', 'attempts',
+                       'timestamp', 'next_attempt', 'last_attempt',
+                       'response_code', 'latency', 'error')
+    exclude = ('body',)
+
+    def has_add_permission(
+        self,
+        request: HttpRequest,
+    ) -> bool:
+        """Return whether deliveries can be added through the admin UI.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+        Returns:
+            bool:
+            ``False``, always. Deliveries are only created when dispatching
+            WebHooks.
+        """
+        return False
+
 
 admin_site.register(WebHookTarget, WebHookTargetAdmin)
+admin_site.register(WebHookDelivery, WebHookDeliveryAdmin)
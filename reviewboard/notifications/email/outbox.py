@@ -0,0 +1,344 @@
+"""Deferred and batched sending of e-mail messages.
+
+When enabled, e-mail messages are placed in a per-process outbox once the
+current transaction commits, rather than being sent on the request path. A
+background sender collects messages for a short period and then sends them
+all over a single connection to the mail server, so that publishing isn't
+held up by the mail relay and bursts of activity (such as closing many
+review requests at once) don't open a connection per message.
+
+This is controlled by the following site configuration settings:
+
+``mail_outbox_enabled``:
+    Whether to send e-mail through the outbox.
+
+``mail_outbox_flush_delay``:
+    The number of seconds to collect messages before sending them. If
+    ``0``, messages will be sent synchronously when the transaction
+    commits.
+
+``mail_outbox_max_batch_size``:
+    The maximum number of messages to send over a single connection.
+
+Messages are held in memory. Any pending messages are sent when the process
+exits normally.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, TYPE_CHECKING
+
+from django.core.mail import get_connection
+from django.db import connections, transaction
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.notifications.email.message import EmailMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.core.mail.backends.base import BaseEmailBackend
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The type for a callback invoked after a message has been sent.
+#:
+#: The callback is passed the message that was sent.
+#:
+#: Version Added:
+#:     9.0
+EmailSentCallback = Callable[[EmailMessage], None]
+
+
+@dataclass
+class OutboxEntry:
+    """A message waiting in the outbox.
+
+    Version Added:
+        9.0
+    """
+
+    #: The message to send.
+    message: EmailMessage
+
+    #: An optional callback to invoke once the message has been sent.
+    on_sent: EmailSentCallback | None = None
+
+
+class EmailOutbox:
+    """Manages deferred and batched sending of e-mail.
+
+    Messages are queued through :py:meth:`queue_message`, and sent by a
+    per-process sender thread once the current transaction commits.
+
+    Version Added:
+        9.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize the outbox."""
+        self._pending: list[OutboxEntry] = []
+        self._condition = threading.Condition()
+        self._thread: (threading.Thread | None) = None
+        self._thread_pid: (int | None) = None
+        self._stopping = False
+
+    @property
+    def num_pending(self) -> int:
+        """The number of messages waiting to be sent.
+
+        Type:
+            int
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def is_enabled(self) -> bool:
+        """Return whether e-mail should be sent through the outbox.
+
+        Returns:
+            bool:
+            ``True`` if messages should be queued.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return bool(siteconfig.get('mail_outbox_enabled'))
+
+    def queue_message(
+        self,
+        message: EmailMessage,
+        *,
+        on_sent: (EmailSentCallback | None) = None,
+    ) -> None:
+        """Queue a message for sending.
+
+        The message will be added to the outbox once the current transaction
+        (if any) commits.
+
+        Args:
+            message (reviewboard.notifications.email.message.EmailMessage):
+                The message to send.
+
+            on_sent (callable, optional):
+                A callback to invoke once the message has been sent. This
+                may be called on the sender thread.
+        """
+        entry = OutboxEntry(message=message,
+                            on_sent=on_sent)
+
+        transaction.on_commit(lambda: self._enqueue(entry))
+
+    def flush(self) -> tuple[int, int]:
+        """Send all pending messages.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (int):
+                    The number of messages sent successfully.
+
+                1 (int):
+                    The number of messages that could not be sent.
+        """
+        with self._condition:
+            entries = self._pending
+            self._pending = []
+
+        if not entries:
+            return 0, 0
+
+        siteconfig = SiteConfiguration.objects.get_current()
+        batch_size = max(siteconfig.get('mail_outbox_max_batch_size'), 1)
+
+        num_sent = 0
+        num_failed = 0
+
+        for i in range(0, len(entries), batch_size):
+            batch_sent, batch_failed = \
+                self._send_batch(entries[i:i + batch_size])
+            num_sent += batch_sent
+            num_failed += batch_failed
+
+        return num_sent, num_failed
+
+    def shutdown(self) -> None:
+        """Stop the sender thread, sending any pending messages."""
+        with self._condition:
+            thread = self._thread
+            self._thread = None
+            self._stopping = True
+            self._condition.notify_all()
+
+        if thread is not None and self._thread_pid == os.getpid():
+            thread.join()
+
+        with self._condition:
+            self._stopping = False
+
+        self.flush()
+
+    def _enqueue(
+        self,
+        entry: OutboxEntry,
+    ) -> None:
+        """Add a message to the outbox.
+
+        Args:
+            entry (OutboxEntry):
+                The entry to add.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        with self._condition:
+            self._pending.append(entry)
+
+            if siteconfig.get('mail_outbox_flush_delay') > 0:
+                self._ensure_sender()
+                self._condition.notify()
+                return
+
+        self.flush()
+
+    def _ensure_sender(self) -> None:
+        """Start the sender thread for this process, if not running.
+
+        This must be called with the lock held.
+        """
+        pid = os.getpid()
+
+        if self._thread is None or self._thread_pid != pid:
+            if self._thread_pid is None:
+                atexit.register(self.shutdown)
+
+            self._thread = threading.Thread(target=self._run_sender,
+                                            name='rb-email-outbox',
+                                            daemon=True)
+            self._thread_pid = pid
+            self._thread.start()
+
+    def _run_sender(self) -> None:
+        """Send messages as they're queued.
+
+        This runs on the sender thread until :py:meth:`shutdown` is called.
+        """
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+
+                if self._stopping:
+                    return
+
+            # Give any other messages in this burst a chance to arrive, so
+            # they can be sent over the same connection.
+            siteconfig = SiteConfiguration.objects.get_current()
+
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping,
+                    timeout=siteconfig.get('mail_outbox_flush_delay'))
+
+                if self._stopping:
+                    # shutdown() will send anything left over.
+                    return
+
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception('Unexpected error sending queued e-mail: %s',
+                                 e)
+            finally:
+                connections.close_all()
+
+    def _send_batch(
+        self,
+        entries: Sequence[OutboxEntry],
+    ) -> tuple[int, int]:
+        """Send a batch of messages over a single connection.
+
+        If the connection fails partway through, it will be re-opened for
+        the remaining messages.
+
+        Args:
+            entries (list of OutboxEntry):
+                The entries to send.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (int):
+                    The number of messages sent successfully.
+
+                1 (int):
+                    The number of messages that could not be sent.
+        """
+        connection: (BaseEmailBackend | None) = None
+        num_sent = 0
+        num_failed = 0
+        start_time = time.monotonic()
+
+        try:
+            for entry in entries:
+                message = entry.message
+
+                try:
+                    if connection is None:
+                        connection = get_connection()
+                        connection.open()
+
+                    connection.send_messages([message])
+                except Exception:
+                    logger.exception(
+                        'Could not send e-mail message with subject "%s" '
+                        'from "%s" to "%s"',
+                        message.subject,
+                        message.from_email,
+                        message.to + (message.cc or []))
+                    num_failed += 1
+
+                    if connection is not None:
+                        connection.close()
+                        connection = None
+
+                    continue
+
+                num_sent += 1
+
+                if entry.on_sent is not None:
+                    try:
+                        entry.on_sent(message)
+                    except Exception as e:
+                        logger.exception(
+                            'Unexpected error handling sent e-mail message '
+                            'with subject "%s": %s',
+                            message.subject, e)
+        finally:
+            if connection is not None:
+                connection.close()
+
+        logger.debug('Sent %s queued e-mail message(s) in %.3fs (%s failed)',
+                     num_sent, time.monotonic() - start_time, num_failed)
+
+        return num_sent, num_failed
+
+
+#: The e-mail outbox for this process.
+#:
+#: Version Added:
+#:     9.0
+email_outbox = EmailOutbox()
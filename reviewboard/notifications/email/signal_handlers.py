@@ -97,15 +97,13 @@ def send_reply_published_mail(
 
     review = reply.base_reply_to
 
-    message, sent = send_email(prepare_reply_published_mail,
-                               user=user,
-                               reply=reply,
-                               review=review,
-                               review_request=review_request)
-
-    if sent:
-        assert message is not None
-        _update_email_info(reply, message.message_id)
+    send_email(prepare_reply_published_mail,
+               user=user,
+               reply=reply,
+               review=review,
+               review_request=review_request,
+               on_sent=lambda message: _update_email_info(
+                   reply, message.message_id))
 
 
 def send_review_published_mail(
@@ -152,16 +150,14 @@ def send_review_published_mail(
     if not review_request.public:
         return
 
-    message, sent = send_email(prepare_review_published_mail,
-                               user=user,
-                               review=review,
-                               review_request=review_request,
-                               request=request,
-                               to_owner_only=to_owner_only)
-
-    if sent:
-        assert message is not None
-        _update_email_info(review, message.message_id)
+    send_email(prepare_review_published_mail,
+               user=user,
+               review=review,
+               review_request=review_request,
+               request=request,
+               to_owner_only=to_owner_only,
+               on_sent=lambda message: _update_email_info(
+                   review, message.message_id))
 
 
 def send_review_request_closed_mail(
@@ -197,14 +193,12 @@ def send_review_request_closed_mail(
             review_request.public):
         return
 
-    message, sent = send_email(prepare_review_request_mail,
-                               user=user,
-                               review_request=review_request,
-                               close_type=close_type)
-
-    if sent:
-        assert message is not None
-        _update_email_info(review_request, message.message_id)
+    send_email(prepare_review_request_mail,
+               user=user,
+               review_request=review_request,
+               close_type=close_type,
+               on_sent=lambda message: _update_email_info(
+                   review_request, message.message_id))
 
 
 def send_review_request_published_mail(
@@ -251,14 +245,12 @@ def send_review_request_published_mail(
         review_request.status == ReviewRequest.DISCARDED):
         return
 
-    message, sent = send_email(prepare_review_request_mail,
-                               user=user,
-                               review_request=review_request,
-                               changedesc=changedesc)
-
-    if sent:
-        assert message is not None
-        _update_email_info(review_request, message.message_id)
+    send_email(prepare_review_request_mail,
+               user=user,
+               review_request=review_request,
+               changedesc=changedesc,
+               on_sent=lambda message: _update_email_info(
+                   review_request, message.message_id))
 
 
 def send_user_registered_mail(
@@ -306,14 +306,34 @@ def recipients_to_addresses(
 
 def send_email(
     email_builder: Callable,
+    *,
+    on_sent: (Callable[[EmailMessage], None] | None) = None,
     **kwargs,
 ) -> tuple[EmailMessage | None, bool]:
     """Attempt to send an e-mail, logging any exceptions that occur.
 
+    If the e-mail outbox is enabled (through the ``mail_outbox_enabled``
+    site configuration setting), the message will be queued and sent in the
+    background instead. See :py:mod:`reviewboard.notifications.email.outbox`.
+
+    Version Changed:
+        9.0:
+        Added the ``on_sent`` argument, and support for the e-mail outbox.
+
     Args:
         email_builder (callable):
             A function that generates an :py:class:`EmailMessage`.
 
+        on_sent (callable, optional):
+            A callback to invoke with the message once it has been sent.
+
+            This should be used instead of the returned message for any
+            work that depends on the message having been sent (such as
+            storing the message ID), as queued messages are sent later.
+
+            Version Added:
+                9.0
+
         **kwargs (dict):
             Keyword arguments to provide to ``email_builder``.
 
@@ -322,13 +342,21 @@ def send_email(
         A tuple of:
 
         * The message that was generated (:py:class`EmailMessage`).
-        * Whether or not the message was sent successfully (:py:class:`bool`).
+        * Whether or not the message was sent (or queued) successfully
+          (:py:class:`bool`).
     """
+    from reviewboard.notifications.email.outbox import email_outbox
+
     message = email_builder(**kwargs)
 
     if message is None:
         return None, False
 
+    if email_outbox.is_enabled():
+        email_outbox.queue_message(message, on_sent=on_sent)
+
+        return message, True
+
     try:
         message.send()
     except Exception:
@@ -341,4 +369,7 @@ def send_email(
 
         return message, False
 
+    if on_sent is not None:
+        on_sent(message)
+
     return message, True
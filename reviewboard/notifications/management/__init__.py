@@ -0,0 +1,5 @@
+"""Management for notifications.
+
+Version Added:
+    9.0
+"""
@@ -0,0 +1,5 @@
+"""Management commands for notifications.
+
+Version Added:
+    9.0
+"""
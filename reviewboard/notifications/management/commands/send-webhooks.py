@@ -0,0 +1,86 @@
+"""Management command to send pending WebHook deliveries.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from reviewboard.notifications.models import WebHookDelivery
+from reviewboard.notifications.webhook_delivery import webhook_delivery_queue
+
+
+class Command(BaseCommand):
+    """Management command to send pending WebHook deliveries.
+
+    This sends any queued WebHook deliveries that are due, including
+    retries that weren't sent by the process that queued them. It can be
+    run periodically (for instance, from cron) when asynchronous WebHook
+    delivery is enabled.
+
+    Version Added:
+        9.0
+    """
+
+    help = _('Send pending WebHook deliveries that are due.')
+
+    def add_arguments(
+        self,
+        parser: argparse.ArgumentParser,
+    ) -> None:
+        """Add arguments to the command.
+
+        Args:
+            parser (argparse.ArgumentParser):
+                The argument parser for the command.
+        """
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=None,
+            help=_('The maximum number of deliveries to send.'))
+        parser.add_argument(
+            '--prune-days',
+            type=int,
+            default=None,
+            help=_(
+                'Delete completed and failed deliveries older than this '
+                'many days.'
+            ))
+
+    def handle(
+        self,
+        **options,
+    ) -> None:
+        """Handle the command.
+
+        Args:
+            **options (dict):
+                Options parsed on the command line.
+        """
+        num_delivered, num_failed = \
+            webhook_delivery_queue.send_due_deliveries(limit=options['limit'])
+
+        self.stdout.write(
+            _('%(delivered)s WebHook(s) delivered, %(failed)s could not be '
+              'sent.')
+            % {
+                'delivered': num_delivered,
+                'failed': num_failed,
+            })
+
+        prune_days = options['prune_days']
+
+        if prune_days is not None:
+            num_deleted = WebHookDelivery.objects.prune(
+                before=timezone.now() - timedelta(days=prune_days))
+
+            self.stdout.write(
+                _('%s old WebHook deliveries deleted.') % num_deleted)
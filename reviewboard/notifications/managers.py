@@ -1,4 +1,4 @@
-"""Manager for WebHookTarget models."""
+"""Managers for WebHook models."""
 
 from __future__ import annotations
 
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from django.db.models import Manager, Q
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from django.contrib.auth.models import User
     from django.db.models.query import QuerySet
 
@@ -103,3 +105,56 @@ class WebHookTargetManager(Manager):
                 (user.is_authenticated and
                  local_site is not None and
                  local_site.is_mutable_by(user)))
+
+
+class WebHookDeliveryManager(Manager):
+    """Manages WebHookDelivery models.
+
+    Version Added:
+        9.0
+    """
+
+    def get_due(
+        self,
+        now: datetime,
+    ) -> QuerySet:
+        """Return the pending deliveries that are due to be sent.
+
+        Args:
+            now (datetime.datetime):
+                The current time.
+
+        Returns:
+            django.db.models.query.QuerySet:
+            The pending deliveries, oldest first.
+        """
+        return (
+            self
+            .filter(Q(status=self.model.STATUS_PENDING) &
+                    (Q(next_attempt__isnull=True) |
+                     Q(next_attempt__lte=now)))
+            .order_by('pk')
+        )
+
+    def prune(
+        self,
+        before: datetime,
+    ) -> int:
+        """Delete completed deliveries older than the given time.
+
+        Pending deliveries are never deleted.
+
+        Args:
+            before (datetime.datetime):
+                The time before which completed deliveries will be deleted.
+
+        Returns:
+            int:
+            The number of deliveries deleted.
+        """
+        return (
+            self
+            .filter(timestamp__lt=before)
+            .exclude(status=self.model.STATUS_PENDING)
+            .delete()
+        )[0]
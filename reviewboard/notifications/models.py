@@ -6,10 +6,12 @@ from typing import ClassVar
 
 from django.core.validators import URLValidator
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from djblets.db.fields import CommaSeparatedValuesField, JSONField
 
-from reviewboard.notifications.managers import WebHookTargetManager
+from reviewboard.notifications.managers import (WebHookDeliveryManager,
+                                                WebHookTargetManager)
 from reviewboard.scmtools.models import Repository
 from reviewboard.site.models import LocalSite
 
@@ -177,3 +179,64 @@ class WebHookTarget(models.Model):
         db_table = 'notifications_webhooktarget'
         verbose_name = _('Webhook')
         verbose_name_plural = _('Webhooks')
+
+
+class WebHookDelivery(models.Model):
+    """A queued or completed delivery of a WebHook payload.
+
+    When asynchronous WebHook delivery is enabled, each payload sent to a
+    :py:class:`WebHookTarget` is stored as a delivery, so that it can be
+    sent off the request path, retried if it fails, and used to report
+    latency and failure statistics for the target.
+
+    Version Added:
+        9.0
+    """
+
+    STATUS_PENDING = 'P'
+    STATUS_DELIVERED = 'D'
+    STATUS_FAILED = 'F'
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _('Pending')),
+        (STATUS_DELIVERED, _('Delivered')),
+        (STATUS_FAILED, _('Failed')),
+    )
+
+    target = models.ForeignKey(
+        WebHookTarget,
+        on_delete=models.CASCADE,
+        related_name='deliveries')
+    event = models.CharField(_('event'), max_length=64)
+    body = models.BinaryField()
+    headers = JSONField()
+    status = models.CharField(
+        _('status'),
+        max_length=1,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        db_index=True)
+    attempts = models.PositiveIntegerField(_('attempts'), default=0)
+    timestamp = models.DateTimeField(_('timestamp'), default=timezone.now)
+    next_attempt = models.DateTimeField(_('next attempt'), null=True,
+                                        blank=True)
+    last_attempt = models.DateTimeField(_('last attempt'), null=True,
+                                        blank=True)
+    response_code = models.PositiveIntegerField(_('response code'),
+                                                null=True, blank=True)
+    latency = models.FloatField(
+        _('latency'),
+        null=True,
+        blank=True,
+        help_text=_('The duration of the last attempt, in seconds.'))
+    error = models.TextField(_('error'), blank=True)
+
+    objects: ClassVar[WebHookDeliveryManager] = WebHookDeliveryManager()
+
+    def __str__(self):
+        return '%s: %s' % (self.event, self.target_id)
+
+    class Meta:
+        db_table = 'notifications_webhookdelivery'
+        verbose_name = _('Webhook delivery')
+        verbose_name_plural = _('Webhook deliveries')
@@ -0,0 +1,527 @@
+"""Publish/subscribe brokers for real-time notifications.
+
+Brokers deliver short messages published on named channels to any
+subscribers listening on those channels. They're used to push notifications
+(such as updates to a review request) to clients holding a long-lived
+connection open, instead of having each client poll for changes.
+
+The broker is configured through the ``PUBSUB_BROKER`` setting in
+:file:`settings_local.py`:
+
+.. code-block:: python
+
+   PUBSUB_BROKER = {
+       'BACKEND': 'reviewboard.notifications.pubsub.RedisPubSubBroker',
+       'OPTIONS': {
+           'url': 'redis://localhost:6379/0',
+       },
+   }
+
+The default :py:class:`LocalPubSubBroker` only delivers messages within the
+process that published them. Installations running more than one web server
+process should configure a shared broker, such as
+:py:class:`RedisPubSubBroker`. Single-process installations (such as the
+development server) can instead set the broker's ``single_process`` option.
+Features that push to clients are refused until one of these is done. See
+:py:attr:`BasePubSubBroker.delivers_to_all_processes`.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+logger = logging.getLogger(__name__)
+
+
+class PubSubSubscription:
+    """A subscription to one or more channels on a broker.
+
+    Subscriptions must be closed when no longer needed. They can be used as
+    context managers to do this automatically.
+
+    Version Added:
+        9.0
+    """
+
+    def get(
+        self,
+        timeout: float,
+    ) -> str | None:
+        """Return the next message published to the subscribed channels.
+
+        Args:
+            timeout (float):
+                The maximum number of seconds to wait for a message.
+
+        Returns:
+            str:
+            The message, or ``None`` if no message arrived in time.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the subscription.
+
+        No further messages will be received.
+        """
+        raise NotImplementedError
+
+    def __enter__(self) -> Self:
+        """Enter the subscription's context.
+
+        Returns:
+            PubSubSubscription:
+            This subscription.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the subscription's context, closing it.
+
+        Args:
+            exc_type (type, unused):
+                The type of exception raised in the context, if any.
+
+            exc_value (BaseException, unused):
+                The exception raised in the context, if any.
+
+            traceback (types.TracebackType, unused):
+                The traceback for the exception, if any.
+        """
+        self.close()
+
+
+class BasePubSubBroker:
+    """Base class for a publish/subscribe broker.
+
+    Subclasses must implement :py:meth:`publish` and :py:meth:`subscribe`.
+
+    Version Added:
+        9.0
+    """
+
+    #: Whether messages reach subscribers in every web server process.
+    #:
+    #: Clients may be connected to a different process than the one that
+    #: publishes a message. Pushing notifications to clients is only
+    #: reliable if this is ``True``.
+    #:
+    #: Type:
+    #:     bool
+    delivers_to_all_processes: bool = False
+
+    def publish(
+        self,
+        channel: str,
+        message: str,
+    ) -> None:
+        """Publish a message to all subscribers of a channel.
+
+        Publishing must not block waiting on subscribers, and must not fail
+        if there are no subscribers.
+
+        Args:
+            channel (str):
+                The channel to publish to.
+
+            message (str):
+                The message to publish.
+        """
+        raise NotImplementedError
+
+    def subscribe(
+        self,
+        channels: Sequence[str],
+    ) -> PubSubSubscription:
+        """Subscribe to messages on one or more channels.
+
+        Args:
+            channels (list of str):
+                The channels to subscribe to.
+
+        Returns:
+            PubSubSubscription:
+            The new subscription.
+        """
+        raise NotImplementedError
+
+
+class LocalPubSubSubscription(PubSubSubscription):
+    """A subscription on a :py:class:`LocalPubSubBroker`.
+
+    Version Added:
+        9.0
+    """
+
+    #: The maximum number of undelivered messages to hold.
+    #:
+    #: Older messages will be dropped if a subscriber falls behind.
+    max_pending = 100
+
+    def __init__(
+        self,
+        broker: LocalPubSubBroker,
+        channels: Sequence[str],
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            broker (LocalPubSubBroker):
+                The broker owning the subscription.
+
+            channels (list of str):
+                The subscribed channels.
+        """
+        self.broker = broker
+        self.channels = list(channels)
+        self._messages: deque[str] = deque(maxlen=self.max_pending)
+        self._condition = threading.Condition()
+
+    def get(
+        self,
+        timeout: float,
+    ) -> str | None:
+        """Return the next message published to the subscribed channels.
+
+        Args:
+            timeout (float):
+                The maximum number of seconds to wait for a message.
+
+        Returns:
+            str:
+            The message, or ``None`` if no message arrived in time.
+        """
+        with self._condition:
+            if self._condition.wait_for(lambda: self._messages,
+                                        timeout=timeout):
+                return self._messages.popleft()
+
+        return None
+
+    def close(self) -> None:
+        """Close the subscription.
+
+        No further messages will be received.
+        """
+        self.broker._unsubscribe(self)
+
+    def _deliver(
+        self,
+        message: str,
+    ) -> None:
+        """Deliver a message to the subscription.
+
+        Args:
+            message (str):
+                The message to deliver.
+        """
+        with self._condition:
+            self._messages.append(message)
+            self._condition.notify()
+
+
+class LocalPubSubBroker(BasePubSubBroker):
+    """An in-process publish/subscribe broker.
+
+    Messages are only delivered to subscribers in the same process. This is
+    suitable for single-process deployments and for development, which must
+    set the ``single_process`` option to say so.
+
+    Version Added:
+        9.0
+    """
+
+    def __init__(
+        self,
+        *,
+        single_process: bool = False,
+    ) -> None:
+        """Initialize the broker.
+
+        Args:
+            single_process (bool, optional):
+                Whether the site is served by a single process.
+
+                If set, in-process delivery reaches every subscriber, so
+                :py:attr:`delivers_to_all_processes` will be ``True``.
+        """
+        self.delivers_to_all_processes = single_process
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, set[LocalPubSubSubscription]] = {}
+
+    def publish(
+        self,
+        channel: str,
+        message: str,
+    ) -> None:
+        """Publish a message to all subscribers of a channel.
+
+        Args:
+            channel (str):
+                The channel to publish to.
+
+            message (str):
+                The message to publish.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            subscription._deliver(message)
+
+    def subscribe(
+        self,
+        channels: Sequence[str],
+    ) -> LocalPubSubSubscription:
+        """Subscribe to messages on one or more channels.
+
+        Args:
+            channels (list of str):
+                The channels to subscribe to.
+
+        Returns:
+            LocalPubSubSubscription:
+            The new subscription.
+        """
+        subscription = LocalPubSubSubscription(self, channels)
+
+        with self._lock:
+            for channel in channels:
+                self._subscriptions.setdefault(channel, set()).add(
+                    subscription)
+
+        return subscription
+
+    def _unsubscribe(
+        self,
+        subscription: LocalPubSubSubscription,
+    ) -> None:
+        """Remove a subscription from the broker.
+
+        Args:
+            subscription (LocalPubSubSubscription):
+                The subscription to remove.
+        """
+        with self._lock:
+            for channel in subscription.channels:
+                subscriptions = self._subscriptions.get(channel)
+
+                if subscriptions is not None:
+                    subscriptions.discard(subscription)
+
+                    if not subscriptions:
+                        del self._subscriptions[channel]
+
+
+class RedisPubSubSubscription(PubSubSubscription):
+    """A subscription on a :py:class:`RedisPubSubBroker`.
+
+    Version Added:
+        9.0
+    """
+
+    def __init__(
+        self,
+        pubsub,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            pubsub (redis.client.PubSub):
+                The Redis pub/sub connection.
+        """
+        self._pubsub = pubsub
+
+    def get(
+        self,
+        timeout: float,
+    ) -> str | None:
+        """Return the next message published to the subscribed channels.
+
+        Args:
+            timeout (float):
+                The maximum number of seconds to wait for a message.
+
+        Returns:
+            str:
+            The message, or ``None`` if no message arrived in time.
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return None
+
+            # Subscribe confirmations are filtered out, but still cause this
+            # to return early, so keep waiting until a real message arrives.
+            message = self._pubsub.get_message(ignore_subscribe_messages=True,
+                                               timeout=remaining)
+
+            if message is not None and message['type'] == 'message':
+                return message['data'].decode('utf-8')
+
+    def close(self) -> None:
+        """Close the subscription.
+
+        No further messages will be received.
+        """
+        self._pubsub.close()
+
+
+class RedisPubSubBroker(BasePubSubBroker):
+    """A publish/subscribe broker backed by Redis.
+
+    This delivers messages across all processes and servers connected to
+    the same Redis server. It requires the :pypi:`redis` package.
+
+    Version Added:
+        9.0
+    """
+
+    delivers_to_all_processes = True
+
+    def __init__(
+        self,
+        url: str = 'redis://localhost:6379/0',
+        channel_prefix: str = 'reviewboard:',
+    ) -> None:
+        """Initialize the broker.
+
+        Args:
+            url (str, optional):
+                The URL of the Redis server.
+
+            channel_prefix (str, optional):
+                A prefix for all channel names, to keep them separate from
+                other users of the Redis server.
+
+        Raises:
+            django.core.exceptions.ImproperlyConfigured:
+                The :pypi:`redis` package is not installed.
+        """
+        try:
+            import redis
+        except ImportError:
+            raise ImproperlyConfigured(
+                'The redis package must be installed to use '
+                'RedisPubSubBroker.')
+
+        self.channel_prefix = channel_prefix
+        self._client = redis.Redis.from_url(url)
+
+    def publish(
+        self,
+        channel: str,
+        message: str,
+    ) -> None:
+        """Publish a message to all subscribers of a channel.
+
+        Args:
+            channel (str):
+                The channel to publish to.
+
+            message (str):
+                The message to publish.
+        """
+        self._client.publish(self.channel_prefix + channel, message)
+
+    def subscribe(
+        self,
+        channels: Sequence[str],
+    ) -> RedisPubSubSubscription:
+        """Subscribe to messages on one or more channels.
+
+        Args:
+            channels (list of str):
+                The channels to subscribe to.
+
+        Returns:
+            RedisPubSubSubscription:
+            The new subscription.
+        """
+        pubsub = self._client.pubsub()
+        pubsub.subscribe(*[
+            self.channel_prefix + channel
+            for channel in channels
+        ])
+
+        return RedisPubSubSubscription(pubsub)
+
+
+_broker: BasePubSubBroker | None = None
+_broker_lock = threading.Lock()
+
+
+def get_pubsub_broker() -> BasePubSubBroker:
+    """Return the configured publish/subscribe broker.
+
+    The broker is created on first use, based on the ``PUBSUB_BROKER``
+    setting.
+
+    Version Added:
+        9.0
+
+    Returns:
+        BasePubSubBroker:
+        The broker.
+
+    Raises:
+        django.core.exceptions.ImproperlyConfigured:
+            The broker could not be loaded.
+    """
+    global _broker
+
+    with _broker_lock:
+        if _broker is None:
+            config = settings.PUBSUB_BROKER
+
+            try:
+                broker_cls = import_string(config['BACKEND'])
+            except ImportError as e:
+                raise ImproperlyConfigured(
+                    'Unable to load the pub/sub broker "%s": %s'
+                    % (config['BACKEND'], e))
+
+            _broker = broker_cls(**config.get('OPTIONS', {}))
+
+        return _broker
+
+
+def reset_pubsub_broker() -> None:
+    """Reset the configured publish/subscribe broker.
+
+    The broker will be re-created from settings on next use. This is
+    primarily intended for unit tests.
+
+    Version Added:
+        9.0
+    """
+    global _broker
+
+    with _broker_lock:
+        _broker = None
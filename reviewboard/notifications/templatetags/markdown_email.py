@@ -5,6 +5,8 @@ from django import template
 from django.utils.safestring import mark_safe
 from djblets.markdown import markdown_unescape
 
+from reviewboard.reviews.markdown_utils import get_cached_rendered_markdown
+
 
 register = template.Library()
 
@@ -14,7 +16,27 @@ def markdown_email_html(text, is_rich_text):
     if not is_rich_text:
         return text
 
-    return mark_safe(markdown.markdown(
+    return mark_safe(get_cached_rendered_markdown(
+        text,
+        renderer_id='email-html',
+        render_func=_render_markdown_email_html))
+
+
+def _render_markdown_email_html(text):
+    """Render Markdown text to HTML for an e-mail.
+
+    Version Added:
+        9.0
+
+    Args:
+        text (str):
+            The Markdown text to render.
+
+    Returns:
+        str:
+        The rendered HTML.
+    """
+    return markdown.markdown(
         text,
         output_format='html',
         extensions=[
@@ -30,7 +52,7 @@ def markdown_email_html(text, is_rich_text):
             'codehilite': {
                 'noclasses': True,
             },
-        }))
+        })
 
 
 @register.filter
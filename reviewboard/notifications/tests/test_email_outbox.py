@@ -0,0 +1,167 @@
+"""Unit tests for reviewboard.notifications.email.outbox."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from kgb import SpyAgency
+
+from reviewboard.notifications.email.message import EmailMessage
+from reviewboard.notifications.email.outbox import email_outbox
+from reviewboard.notifications.tests.mixins import EmailTestHelper
+from reviewboard.testing import TestCase
+
+
+class EmailOutboxTests(EmailTestHelper, SpyAgency, TestCase):
+    """Unit tests for EmailOutbox."""
+
+    fixtures = ['test_users']
+
+    email_siteconfig_settings = {
+        'mail_send_review_mail': True,
+    }
+
+    def tearDown(self) -> None:
+        """Tear down a test case."""
+        # Make sure nothing leaks into other tests.
+        email_outbox.flush()
+
+        super().tearDown()
+
+    def test_review_request_published(self) -> None:
+        """Testing e-mail outbox with a published review request"""
+        review_request = self.create_review_request(summary='My change')
+        review_request.target_people.add(User.objects.get(username='grumpy'))
+
+        with self.siteconfig_settings({
+            'mail_outbox_enabled': True,
+            'mail_outbox_flush_delay': 0,
+        }):
+            with self.captureOnCommitCallbacks(execute=True):
+                review_request.publish(review_request.submitter)
+
+                self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(len(mail.outbox), 1)
+
+        review_request.refresh_from_db()
+        self.assertEqual(review_request.email_message_id,
+                         mail.outbox[0].message_id)
+        self.assertIsNotNone(review_request.time_emailed)
+
+    def test_flush_reuses_connection(self) -> None:
+        """Testing EmailOutbox.flush sends a batch over one connection"""
+        self.spy_on(get_connection)
+        self.spy_on(EmailBackend.open, owner=EmailBackend)
+
+        sent_messages: list[EmailMessage] = []
+
+        with self._queue_messages():
+            for i in range(3):
+                email_outbox.queue_message(
+                    self._create_message(subject='Message %s' % i,
+                                         to=['user%s@example.com' % i]),
+                    on_sent=sent_messages.append)
+
+        self.assertEqual(email_outbox.num_pending, 3)
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(email_outbox.flush(), (3, 0))
+
+        self.assertEqual(email_outbox.num_pending, 0)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(sent_messages, mail.outbox)
+        self.assertSpyCalledOnce(get_connection)
+        self.assertSpyCalledOnce(EmailBackend.open)
+
+    def test_flush_with_max_batch_size(self) -> None:
+        """Testing EmailOutbox.flush with mail_outbox_max_batch_size"""
+        self.spy_on(get_connection)
+
+        with self._queue_messages():
+            for i in range(5):
+                email_outbox.queue_message(self._create_message())
+
+        with self.siteconfig_settings({'mail_outbox_max_batch_size': 2}):
+            self.assertEqual(email_outbox.flush(), (5, 0))
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertSpyCallCount(get_connection, 3)
+
+    def test_flush_with_send_error(self) -> None:
+        """Testing EmailOutbox.flush with an error sending a message"""
+        def _send_messages(_self, messages):
+            if messages[0].subject == 'Bad':
+                raise OSError('Connection lost')
+
+            return EmailBackend.send_messages.call_original(_self, messages)
+
+        self.spy_on(EmailBackend.send_messages,
+                    owner=EmailBackend,
+                    call_fake=_send_messages)
+
+        sent_messages: list[EmailMessage] = []
+
+        with self._queue_messages():
+            for subject in ('Good 1', 'Bad', 'Good 2'):
+                email_outbox.queue_message(
+                    self._create_message(subject=subject),
+                    on_sent=sent_messages.append)
+
+        self.assertEqual(email_outbox.flush(), (2, 1))
+
+        self.assertEqual(
+            [message.subject for message in mail.outbox],
+            ['Good 1', 'Good 2'])
+        self.assertEqual(sent_messages, mail.outbox)
+
+    @contextmanager
+    def _queue_messages(self) -> Iterator[None]:
+        """Queue messages in the outbox without sending them.
+
+        Messages queued in this context will be added to the outbox when
+        the context exits. The sender thread won't be started, allowing
+        tests to flush the outbox explicitly.
+
+        Context:
+            The messages can be queued.
+        """
+        self.spy_on(email_outbox._ensure_sender, call_original=False)
+
+        with self.siteconfig_settings({'mail_outbox_flush_delay': 60}):
+            with self.captureOnCommitCallbacks(execute=True):
+                yield
+
+    def _create_message(
+        self,
+        *,
+        subject: str = 'Subject',
+        text_body: str = 'Body',
+        to: (list[str] | None) = None,
+    ) -> EmailMessage:
+        """Return a new message.
+
+        Args:
+            subject (str, optional):
+                The message subject.
+
+            text_body (str, optional):
+                The plain text body.
+
+            to (list of str, optional):
+                The recipients.
+
+        Returns:
+            reviewboard.notifications.email.message.EmailMessage:
+            The new message.
+        """
+        return EmailMessage(subject=subject,
+                            text_body=text_body,
+                            html_body='<p>%s</p>' % text_body,
+                            from_email='doc@example.com',
+                            to=to or ['user@example.com'])
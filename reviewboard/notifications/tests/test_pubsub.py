@@ -0,0 +1,104 @@
+"""Unit tests for reviewboard.notifications.pubsub."""
+
+from __future__ import annotations
+
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+
+from reviewboard.notifications.pubsub import (LocalPubSubBroker,
+                                              get_pubsub_broker,
+                                              reset_pubsub_broker)
+from reviewboard.testing import TestCase
+
+
+class LocalPubSubBrokerTests(TestCase):
+    """Unit tests for LocalPubSubBroker."""
+
+    def setUp(self) -> None:
+        """Set up a test case."""
+        super().setUp()
+
+        self.broker = LocalPubSubBroker()
+
+    def test_publish(self) -> None:
+        """Testing LocalPubSubBroker.publish delivers to subscribers"""
+        with self.broker.subscribe(['a', 'b']) as subscription1, \
+             self.broker.subscribe(['b']) as subscription2:
+            self.broker.publish('a', 'message 1')
+            self.broker.publish('b', 'message 2')
+            self.broker.publish('c', 'message 3')
+
+            self.assertEqual(subscription1.get(timeout=0), 'message 1')
+            self.assertEqual(subscription1.get(timeout=0), 'message 2')
+            self.assertIsNone(subscription1.get(timeout=0))
+
+            self.assertEqual(subscription2.get(timeout=0), 'message 2')
+            self.assertIsNone(subscription2.get(timeout=0))
+
+    def test_publish_from_thread(self) -> None:
+        """Testing LocalPubSubBroker.publish from another thread wakes up
+        waiting subscribers
+        """
+        with self.broker.subscribe(['a']) as subscription:
+            timer = threading.Timer(0.05, self.broker.publish,
+                                    args=('a', 'message'))
+            timer.start()
+
+            try:
+                self.assertEqual(subscription.get(timeout=5), 'message')
+            finally:
+                timer.join()
+
+    def test_close(self) -> None:
+        """Testing LocalPubSubSubscription.close unsubscribes"""
+        subscription = self.broker.subscribe(['a'])
+        subscription.close()
+
+        self.broker.publish('a', 'message')
+
+        self.assertIsNone(subscription.get(timeout=0))
+        self.assertEqual(self.broker._subscriptions, {})
+
+
+class GetPubSubBrokerTests(TestCase):
+    """Unit tests for get_pubsub_broker."""
+
+    def tearDown(self) -> None:
+        """Tear down a test case."""
+        reset_pubsub_broker()
+
+        super().tearDown()
+
+    def test_default(self) -> None:
+        """Testing get_pubsub_broker with the default settings"""
+        reset_pubsub_broker()
+        broker = get_pubsub_broker()
+
+        self.assertIsInstance(broker, LocalPubSubBroker)
+        self.assertIs(get_pubsub_broker(), broker)
+        self.assertFalse(broker.delivers_to_all_processes)
+
+    def test_with_options(self) -> None:
+        """Testing get_pubsub_broker with OPTIONS"""
+        reset_pubsub_broker()
+
+        with self.settings(PUBSUB_BROKER={
+            'BACKEND': 'reviewboard.notifications.pubsub.LocalPubSubBroker',
+            'OPTIONS': {
+                'single_process': True,
+            },
+        }):
+            broker = get_pubsub_broker()
+
+        self.assertIsInstance(broker, LocalPubSubBroker)
+        self.assertTrue(broker.delivers_to_all_processes)
+
+    def test_with_invalid_backend(self) -> None:
+        """Testing get_pubsub_broker with an invalid backend"""
+        reset_pubsub_broker()
+
+        with self.settings(PUBSUB_BROKER={'BACKEND': 'invalid.Broker'}):
+            with self.assertRaisesMessage(ImproperlyConfigured,
+                                          'invalid.Broker'):
+                get_pubsub_broker()
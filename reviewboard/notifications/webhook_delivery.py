@@ -0,0 +1,777 @@
+"""Asynchronous delivery of WebHook payloads.
+
+When enabled, WebHook payloads are stored as
+:py:class:`~reviewboard.notifications.models.WebHookDelivery` entries and
+sent from a per-process worker pool once the current transaction commits,
+rather than on the request path. Connections to each host are kept alive
+and reused, and failed deliveries are retried with exponential backoff.
+
+This is controlled by the following site configuration settings:
+
+``webhooks_async_delivery_enabled``:
+    Whether to deliver WebHooks asynchronously.
+
+``webhooks_delivery_max_workers``:
+    The number of worker threads used per process. If ``0``, deliveries
+    will be sent synchronously when the transaction commits.
+
+``webhooks_delivery_max_attempts``:
+    The maximum number of times to attempt a delivery before giving up.
+
+``webhooks_delivery_retry_delay``:
+    The number of seconds to wait before the first retry. This doubles
+    with each subsequent attempt.
+
+``webhooks_delivery_timeout``:
+    The socket timeout for each attempt, in seconds.
+
+Retries are scheduled within the process that queued the delivery. Any
+deliveries left pending (for instance, if the process exited before a
+retry) can be sent with the :command:`send-webhooks` management command.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from http.client import HTTPConnection, HTTPSConnection
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, urlunsplit
+from urllib.request import Request, getproxies, proxy_bypass
+
+from django.db import connections, transaction
+from django.utils import timezone
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.certs.http import urlopen
+from reviewboard.certs.manager import cert_manager
+from reviewboard.notifications.models import WebHookDelivery
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from reviewboard.notifications.models import WebHookTarget
+    from reviewboard.site.models import LocalSite
+
+
+logger = logging.getLogger(__name__)
+
+
+def build_webhook_request(
+    url: str,
+    headers: Mapping[str, str],
+) -> tuple[str, dict[str, str]]:
+    """Return the URL and headers used to send a WebHook request.
+
+    Any credentials embedded in the URL are removed from it and sent in an
+    ``Authorization`` header instead.
+
+    Args:
+        url (str):
+            The WebHook target URL.
+
+        headers (dict):
+            The headers for the request.
+
+    Returns:
+        tuple:
+        A 2-tuple of:
+
+        Tuple:
+            0 (str):
+                The URL to send the request to.
+
+            1 (dict):
+                The headers to send.
+    """
+    headers = dict(headers)
+    url_parts = urlsplit(url)
+
+    if url_parts.username or url_parts.password:
+        credentials, netloc = url_parts.netloc.split('@', 1)
+        url = urlunsplit(
+            (url_parts.scheme, netloc, url_parts.path,
+             url_parts.query, url_parts.fragment))
+        headers['Authorization'] = \
+            'Basic %s' % b64encode(credentials.encode('utf-8')).decode('ascii')
+
+    return url, headers
+
+
+@dataclass
+class WebHookResponse:
+    """A response from a WebHook endpoint.
+
+    Version Added:
+        9.0
+    """
+
+    #: The HTTP status code.
+    status: int
+
+    #: The HTTP reason phrase.
+    reason: str
+
+    #: The start of the response body, for diagnostics.
+    content: bytes
+
+
+class WebHookConnectionPool:
+    """A pool of keep-alive HTTP connections for sending WebHooks.
+
+    Idle connections are kept per scheme, host, port, and Local Site (which
+    determines the certificates used for HTTPS), and reused for later
+    requests to the same host.
+
+    Connections are only ever used by one thread at a time.
+
+    Version Added:
+        9.0
+    """
+
+    #: The maximum number of idle connections kept per host.
+    max_idle_per_host: int = 4
+
+    #: The number of seconds an idle connection will be kept.
+    max_idle_time: float = 30
+
+    #: The maximum number of bytes of a response body to keep.
+    max_content_size: int = 4096
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        self._idle: dict[tuple, list[tuple[HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        *,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        timeout: float,
+        local_site: (LocalSite | None) = None,
+    ) -> WebHookResponse:
+        """Send a POST request.
+
+        If the URL must be accessed through a proxy, the request will be
+        sent without a pooled connection.
+
+        Args:
+            url (str):
+                The URL to send the request to.
+
+            body (bytes):
+                The request body.
+
+            headers (dict):
+                The request headers.
+
+            timeout (float):
+                The socket timeout, in seconds.
+
+            local_site (reviewboard.site.models.LocalSite, optional):
+                The Local Site used to look up certificates.
+
+        Returns:
+            WebHookResponse:
+            The response from the server.
+
+        Raises:
+            OSError:
+                There was an error communicating with the server.
+
+            ValueError:
+                The URL was not a valid HTTP or HTTPS URL.
+
+            http.client.HTTPException:
+                The server sent an invalid response.
+        """
+        url_parts = urlsplit(url)
+        scheme = url_parts.scheme.lower()
+        hostname = url_parts.hostname
+
+        if scheme not in ('http', 'https') or not hostname:
+            raise ValueError('"%s" is not a valid WebHook URL.' % url)
+
+        if scheme in getproxies() and not proxy_bypass(hostname):
+            return self._post_with_urlopen(url=url,
+                                           body=body,
+                                           headers=headers,
+                                           timeout=timeout,
+                                           local_site=local_site)
+
+        port = url_parts.port or (443 if scheme == 'https' else 80)
+        path = urlunsplit(('', '', url_parts.path or '/', url_parts.query,
+                           ''))
+        key = (scheme, hostname, port, local_site and local_site.pk)
+
+        while True:
+            conn = self._acquire(key)
+            reused = conn is not None
+
+            if conn is None:
+                conn = self._connect(scheme=scheme,
+                                     hostname=hostname,
+                                     port=port,
+                                     timeout=timeout,
+                                     local_site=local_site)
+            elif conn.sock is not None:
+                conn.sock.settimeout(timeout)
+
+            try:
+                conn.request('POST', path, body=body, headers=dict(headers))
+                response = conn.getresponse()
+                content = response.read()
+            except (BrokenPipeError, ConnectionResetError):
+                conn.close()
+
+                if reused:
+                    # The server closed the idle connection before we sent
+                    # the request. Try again on another connection.
+                    continue
+
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+
+            return WebHookResponse(
+                status=response.status,
+                reason=response.reason,
+                content=content[:self.max_content_size])
+
+    def close_all(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+
+        for conns in idle.values():
+            for conn, last_used in conns:
+                conn.close()
+
+    def _acquire(
+        self,
+        key: tuple,
+    ) -> HTTPConnection | None:
+        """Return an idle connection for a host, if one is available.
+
+        Args:
+            key (tuple):
+                The key identifying the host.
+
+        Returns:
+            http.client.HTTPConnection:
+            The connection, or ``None`` if there were no usable idle
+            connections.
+        """
+        expired: list[HTTPConnection] = []
+        result: (HTTPConnection | None) = None
+        now = time.monotonic()
+
+        with self._lock:
+            conns = self._idle.get(key)
+
+            while conns:
+                conn, last_used = conns.pop()
+
+                if now - last_used > self.max_idle_time:
+                    expired.append(conn)
+                else:
+                    result = conn
+                    break
+
+        for conn in expired:
+            conn.close()
+
+        return result
+
+    def _release(
+        self,
+        key: tuple,
+        conn: HTTPConnection,
+    ) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            key (tuple):
+                The key identifying the host.
+
+            conn (http.client.HTTPConnection):
+                The connection to return.
+        """
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+
+            if len(conns) < self.max_idle_per_host:
+                conns.append((conn, time.monotonic()))
+                conn = None
+
+        if conn is not None:
+            conn.close()
+
+    def _connect(
+        self,
+        *,
+        scheme: str,
+        hostname: str,
+        port: int,
+        timeout: float,
+        local_site: (LocalSite | None),
+    ) -> HTTPConnection:
+        """Create a new connection.
+
+        Args:
+            scheme (str):
+                The URL scheme.
+
+            hostname (str):
+                The hostname to connect to.
+
+            port (int):
+                The port to connect to.
+
+            timeout (float):
+                The socket timeout, in seconds.
+
+            local_site (reviewboard.site.models.LocalSite):
+                The Local Site used to look up certificates.
+
+        Returns:
+            http.client.HTTPConnection:
+            The new connection. It will connect when first used.
+        """
+        if scheme == 'https':
+            return HTTPSConnection(
+                hostname,
+                port,
+                timeout=timeout,
+                context=cert_manager.build_ssl_context(
+                    hostname=hostname,
+                    port=port,
+                    local_site=local_site))
+        else:
+            return HTTPConnection(hostname, port, timeout=timeout)
+
+    def _post_with_urlopen(
+        self,
+        *,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        timeout: float,
+        local_site: (LocalSite | None),
+    ) -> WebHookResponse:
+        """Send a POST request using urlopen.
+
+        This is used for URLs that must be accessed through a proxy.
+
+        Args:
+            url (str):
+                The URL to send the request to.
+
+            body (bytes):
+                The request body.
+
+            headers (dict):
+                The request headers.
+
+            timeout (float):
+                The socket timeout, in seconds.
+
+            local_site (reviewboard.site.models.LocalSite):
+                The Local Site used to look up certificates.
+
+        Returns:
+            WebHookResponse:
+            The response from the server.
+
+        Raises:
+            OSError:
+                There was an error communicating with the server.
+        """
+        try:
+            with urlopen(Request(url, body, dict(headers)),
+                         timeout=timeout,
+                         local_site=local_site) as response:
+                return WebHookResponse(
+                    status=response.status,
+                    reason=response.reason,
+                    content=response.read(self.max_content_size))
+        except HTTPError as e:
+            return WebHookResponse(status=e.code,
+                                   reason=e.reason,
+                                   content=e.read(self.max_content_size))
+
+
+class WebHookDeliveryQueue:
+    """Manages asynchronous delivery of WebHooks.
+
+    Deliveries are queued through :py:meth:`queue_delivery`, and sent on a
+    per-process thread pool once the current transaction commits.
+
+    Version Added:
+        9.0
+    """
+
+    #: HTTP status codes that will be retried, in addition to 5xx codes.
+    RETRY_STATUS_CODES = {408, 429}
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self.connection_pool = WebHookConnectionPool()
+        self._executor: (ThreadPoolExecutor | None) = None
+        self._executor_pid: (int | None) = None
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        """Return whether asynchronous delivery is enabled.
+
+        Returns:
+            bool:
+            ``True`` if WebHooks should be queued for delivery.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return bool(siteconfig.get('webhooks_async_delivery_enabled'))
+
+    def queue_delivery(
+        self,
+        *,
+        webhook_target: WebHookTarget,
+        event: str,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> WebHookDelivery:
+        """Queue a payload for delivery.
+
+        The delivery will be stored immediately, and submitted to the worker
+        pool once the current transaction (if any) commits.
+
+        Args:
+            webhook_target (reviewboard.notifications.models.WebHookTarget):
+                The target to deliver to.
+
+            event (str):
+                The name of the event being dispatched.
+
+            body (bytes):
+                The encoded payload.
+
+            headers (dict):
+                The headers to send with the payload.
+
+        Returns:
+            reviewboard.notifications.models.WebHookDelivery:
+            The stored delivery.
+        """
+        delivery = WebHookDelivery.objects.create(
+            target=webhook_target,
+            event=event,
+            body=body,
+            headers=dict(headers),
+            next_attempt=timezone.now())
+        delivery_id = delivery.pk
+
+        transaction.on_commit(lambda: self._submit(delivery_id))
+
+        return delivery
+
+    def deliver(
+        self,
+        delivery: WebHookDelivery,
+    ) -> bool:
+        """Attempt to send a delivery.
+
+        The attempt is claimed in the database first, so that a delivery is
+        never sent by two workers at once. After the attempt, the delivery is
+        marked as delivered, failed, or scheduled for a retry.
+
+        Args:
+            delivery (reviewboard.notifications.models.WebHookDelivery):
+                The delivery to send.
+
+        Returns:
+            bool:
+            ``True`` if the delivery was sent successfully. ``False`` if it
+            failed or was already being handled elsewhere.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        attempts = delivery.attempts
+        now = timezone.now()
+
+        claimed = (
+            WebHookDelivery.objects
+            .filter(pk=delivery.pk,
+                    status=WebHookDelivery.STATUS_PENDING,
+                    attempts=attempts)
+            .update(attempts=attempts + 1,
+                    last_attempt=now)
+        )
+
+        if not claimed:
+            return False
+
+        attempts += 1
+        target = delivery.target
+        url, headers = build_webhook_request(target.url, delivery.headers)
+        response: (WebHookResponse | None) = None
+        error = ''
+        can_retry = True
+        start_time = time.monotonic()
+
+        try:
+            response = self.connection_pool.post(
+                url=url,
+                body=bytes(delivery.body),
+                headers=headers,
+                timeout=siteconfig.get('webhooks_delivery_timeout'),
+                local_site=target.local_site)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+
+        latency = time.monotonic() - start_time
+        delivered = False
+
+        if response is not None:
+            if response.status < 400:
+                delivered = True
+            else:
+                error = '%s %s\n%s' % (
+                    response.status,
+                    response.reason,
+                    response.content.decode('utf-8', 'replace'))
+                can_retry = (response.status >= 500 or
+                             response.status in self.RETRY_STATUS_CODES)
+
+        delivery.attempts = attempts
+        delivery.last_attempt = now
+        delivery.latency = latency
+        delivery.response_code = response and response.status
+        delivery.error = error
+        delivery.next_attempt = None
+
+        if delivered:
+            delivery.status = WebHookDelivery.STATUS_DELIVERED
+
+            logger.debug('Delivered WebHook %s for event %s to %s in %.3fs',
+                         delivery.pk, delivery.event, target.url, latency)
+        elif (can_retry and
+              attempts < siteconfig.get('webhooks_delivery_max_attempts')):
+            retry_delay = (siteconfig.get('webhooks_delivery_retry_delay') *
+                           2 ** (attempts - 1))
+            delivery.next_attempt = now + timedelta(seconds=retry_delay)
+
+            logger.warning('Could not deliver WebHook %s for event %s to '
+                           '%s (attempt %s). Retrying in %s seconds: %s',
+                           delivery.pk, delivery.event, target.url,
+                           attempts, retry_delay, error)
+        else:
+            delivery.status = WebHookDelivery.STATUS_FAILED
+
+            logger.error('Could not deliver WebHook %s for event %s to %s '
+                         'after %s attempt(s): %s',
+                         delivery.pk, delivery.event, target.url, attempts,
+                         error)
+
+        delivery.save(update_fields=('attempts', 'error', 'last_attempt',
+                                     'latency', 'next_attempt',
+                                     'response_code', 'status'))
+
+        return delivered
+
+    def send_due_deliveries(
+        self,
+        limit: (int | None) = None,
+    ) -> tuple[int, int]:
+        """Send all pending deliveries that are due.
+
+        Args:
+            limit (int, optional):
+                The maximum number of deliveries to send.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (int):
+                    The number of deliveries sent successfully.
+
+                1 (int):
+                    The number of deliveries that could not be sent.
+        """
+        deliveries = (
+            WebHookDelivery.objects
+            .get_due(timezone.now())
+            .select_related('target', 'target__local_site')
+        )
+
+        if limit is not None:
+            deliveries = deliveries[:limit]
+
+        num_delivered = 0
+        num_failed = 0
+
+        for delivery in deliveries:
+            if self.deliver(delivery):
+                num_delivered += 1
+            else:
+                num_failed += 1
+
+        return num_delivered, num_failed
+
+    def shutdown(
+        self,
+        wait: bool = True,
+    ) -> None:
+        """Shut down the worker pool and close all idle connections.
+
+        Args:
+            wait (bool, optional):
+                Whether to wait for in-progress deliveries to finish.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None and self._executor_pid == os.getpid():
+            executor.shutdown(wait=wait)
+
+        self.connection_pool.close_all()
+
+    def _submit(
+        self,
+        delivery_id: int,
+    ) -> None:
+        """Submit a delivery to the worker pool.
+
+        Args:
+            delivery_id (int):
+                The ID of the delivery to send.
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+        max_workers = siteconfig.get('webhooks_delivery_max_workers')
+
+        if max_workers > 0:
+            self._get_executor(max_workers).submit(self._run_job,
+                                                   delivery_id)
+        else:
+            self._run_job(delivery_id, close_connections=False)
+
+    def _schedule_retry(
+        self,
+        delivery: WebHookDelivery,
+    ) -> None:
+        """Schedule a retry of a delivery on this process's worker pool.
+
+        If there's no worker pool, the retry will be left for the
+        :command:`send-webhooks` management command.
+
+        Args:
+            delivery (reviewboard.notifications.models.WebHookDelivery):
+                The delivery to retry.
+        """
+        assert delivery.next_attempt is not None
+
+        siteconfig = SiteConfiguration.objects.get_current()
+        max_workers = siteconfig.get('webhooks_delivery_max_workers')
+
+        if max_workers <= 0:
+            return
+
+        delay = (delivery.next_attempt - timezone.now()).total_seconds()
+        timer = threading.Timer(
+            max(delay, 0),
+            lambda: self._get_executor(max_workers).submit(self._run_job,
+                                                           delivery.pk))
+        timer.daemon = True
+        timer.start()
+
+    def _get_executor(
+        self,
+        max_workers: int,
+    ) -> ThreadPoolExecutor:
+        """Return the worker pool for this process.
+
+        Args:
+            max_workers (int):
+                The number of worker threads to use if creating the pool.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor:
+            The worker pool.
+        """
+        pid = os.getpid()
+
+        with self._lock:
+            if self._executor is None or self._executor_pid != pid:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix='rb-webhook-delivery')
+                self._executor_pid = pid
+
+            return self._executor
+
+    def _run_job(
+        self,
+        delivery_id: int,
+        *,
+        close_connections: bool = True,
+    ) -> None:
+        """Send a delivery, scheduling a retry if needed.
+
+        Args:
+            delivery_id (int):
+                The ID of the delivery to send.
+
+            close_connections (bool, optional):
+                Whether to close database connections opened by the job.
+                This is used when running on a worker thread.
+        """
+        try:
+            try:
+                delivery = (
+                    WebHookDelivery.objects
+                    .select_related('target', 'target__local_site')
+                    .get(pk=delivery_id)
+                )
+            except WebHookDelivery.DoesNotExist:
+                # The delivery or its target was deleted.
+                return
+
+            attempts = delivery.attempts
+
+            if (not self.deliver(delivery) and
+                delivery.attempts > attempts and
+                delivery.status == WebHookDelivery.STATUS_PENDING):
+                self._schedule_retry(delivery)
+        except Exception as e:
+            logger.exception('Unexpected error delivering WebHook %s: %s',
+                             delivery_id, e)
+        finally:
+            if close_connections:
+                connections.close_all()
+
+
+#: The WebHook delivery queue for this process.
+#:
+#: Version Added:
+#:     9.0
+webhook_delivery_queue = WebHookDeliveryQueue()
@@ -5,12 +5,11 @@ from __future__ import annotations
 import hashlib
 import hmac
 import logging
-from base64 import b64encode
 from collections import OrderedDict
 from datetime import datetime
 from typing import TYPE_CHECKING
 from urllib.error import HTTPError
-from urllib.parse import urlencode, urlsplit, urlunsplit
+from urllib.parse import urlencode
 from urllib.request import Request
 
 from django.contrib.sites.models import Site
@@ -32,6 +31,10 @@ from djblets.webapi.encoders import (BasicAPIEncoder, JSONEncoderAdapter,
 from reviewboard import get_package_version
 from reviewboard.certs.http import urlopen
 from reviewboard.notifications.models import WebHookTarget
+from reviewboard.notifications.webhook_delivery import (
+    build_webhook_request,
+    webhook_delivery_queue,
+)
 from reviewboard.reviews.models import Review, ReviewRequest
 from reviewboard.reviews.signals import (review_request_closed,
                                          review_request_published,
@@ -292,6 +295,15 @@ def dispatch_webhook_event(
 ) -> None:
     """Dispatch the given event and payload to the given WebHook targets.
 
+    If asynchronous WebHook delivery is enabled, the encoded payloads will
+    be queued for delivery once the current transaction commits. Otherwise,
+    they will be sent immediately.
+
+    Version Changed:
+        9.0:
+        Added support for asynchronous delivery, through
+        :py:mod:`reviewboard.notifications.webhook_delivery`.
+
     Args:
         request (django.http.HttpRequest):
             The HTTP request from the client.
@@ -314,6 +326,7 @@ def dispatch_webhook_event(
     """
     encoder = BasicAPIEncoder()
     bodies = {}
+    async_delivery = webhook_delivery_queue.is_enabled()
 
     raw_norm_payload = None
     json_norm_payload = None
@@ -413,36 +426,72 @@ def dispatch_webhook_event(
                               hashlib.sha1)
             headers['X-Hub-Signature'] = 'sha1=%s' % signer.hexdigest()
 
-        with log_timed(f'Dispatching webhook for event {event} to '
-                       f'{webhook_target.url}',
-                       logger=logger,
-                       request=request) as log_timer:
-            try:
-                url = webhook_target.url
-                url_parts = urlsplit(url)
-
-                if url_parts.username or url_parts.password:
-                    credentials, netloc = url_parts.netloc.split('@', 1)
-                    url = urlunsplit(
-                        (url_parts.scheme, netloc, url_parts.path,
-                         url_parts.query, url_parts.fragment))
-                    headers['Authorization'] = \
-                        'Basic %s' % b64encode(credentials.encode('utf-8'))
-
-                urlopen(
-                    Request(url, body, headers),
-                    local_site=webhook_target.local_site,
-                )
-            except Exception as e:
-                logger.exception('[%s] Could not dispatch WebHook to %s: %s',
-                                 log_timer.trace_id, webhook_target.url, e,
-                                 extra={'request': request})
+        if webhook_target.pk is not None and async_delivery:
+            webhook_delivery_queue.queue_delivery(
+                webhook_target=webhook_target,
+                event=event,
+                body=body,
+                headers=headers)
+        else:
+            _send_webhook(request=request,
+                          webhook_target=webhook_target,
+                          event=event,
+                          body=body,
+                          headers=headers)
+
+
+def _send_webhook(
+    *,
+    request: HttpRequest,
+    webhook_target: WebHookTarget,
+    event: str,
+    body: bytes,
+    headers: dict[str, str],
+) -> None:
+    """Send a WebHook payload immediately.
+
+    Errors are logged, rather than raised.
+
+    Version Added:
+        9.0
 
-                if isinstance(e, HTTPError):
-                    logger.info('[%s] Error response from %s: %s %s\n%s',
-                                log_timer.trace_id, webhook_target.url,
-                                e.code, e.reason, e.read(),
-                                extra={'request': request})
+    Args:
+        request (django.http.HttpRequest):
+            The HTTP request from the client.
+
+        webhook_target (reviewboard.notifications.models.WebHookTarget):
+            The target to send the payload to.
+
+        event (str):
+            The name of the event being dispatched.
+
+        body (bytes):
+            The encoded payload.
+
+        headers (dict):
+            The headers to send with the payload.
+    """
+    with log_timed(f'Dispatching webhook for event {event} to '
+                   f'{webhook_target.url}',
+                   logger=logger,
+                   request=request) as log_timer:
+        try:
+            url, headers = build_webhook_request(webhook_target.url, headers)
+
+            urlopen(
+                Request(url, body, headers),
+                local_site=webhook_target.local_site,
+            )
+        except Exception as e:
+            logger.exception('[%s] Could not dispatch WebHook to %s: %s',
+                             log_timer.trace_id, webhook_target.url, e,
+                             extra={'request': request})
+
+            if isinstance(e, HTTPError):
+                logger.info('[%s] Error response from %s: %s %s\n%s',
+                            log_timer.trace_id, webhook_target.url,
+                            e.code, e.reason, e.read(),
+                            extra={'request': request})
 
 
 def _serialize_review(review, request):
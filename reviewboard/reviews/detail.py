@@ -10,11 +10,14 @@ from itertools import chain
 from typing import (Any, ClassVar, Final, Iterable, Iterator, Sequence,
                     TYPE_CHECKING, TypeVar)
 
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser, User
 from django.db.models import Model, Q
 from django.template.loader import render_to_string
+from django.utils import timezone as django_timezone
 from django.utils.safestring import mark_safe
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
+from djblets.cache.backend import cache_memoize
 from djblets.registries.registry import (ALREADY_REGISTERED,
                                          ATTRIBUTE_REGISTERED,
                                          NOT_REGISTERED)
@@ -22,6 +25,8 @@ from djblets.util.dates import get_latest_timestamp
 from djblets.util.decorators import cached_property
 from typing_extensions import TypedDict
 
+from reviewboard import get_package_version
+from reviewboard.admin.read_only import is_site_read_only_for
 from reviewboard.diffviewer.models import DiffCommit
 from reviewboard.registries.registry import OrderedRegistry
 from reviewboard.reviews.builtin_fields import (CommitListField,
@@ -38,7 +43,7 @@ from reviewboard.reviews.models import (BaseComment,
                                         StatusUpdate)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Collection, Mapping
 
     from django.http import HttpRequest
     from django.template.context import Context
@@ -218,6 +223,16 @@ class ReviewRequestPageData:
     #: The timestamp of the most recent review on the page.
     latest_review_timestamp: datetime | None
 
+    #: The total number of reviews and replies on the page.
+    #:
+    #: When only a window of reviews is loaded, this still counts all
+    #: reviews, and can be used in place of :py:attr:`reviews` when
+    #: computing ETags.
+    #:
+    #: Version Added:
+    #:     9.0
+    review_count: int
+
     #: A mapping from review IDs to the latest reply timestamp.
     latest_timestamps_by_review_id: Mapping[int, datetime]
 
@@ -267,6 +282,16 @@ class ReviewRequestPageData:
     #: review request.
     status_updates_enabled: bool
 
+    #: Top-level reviews shown as stubs on the page.
+    #:
+    #: These are public reviews outside of the window of loaded reviews. Their
+    #: comments and replies are not loaded, and their entries are rendered
+    #: collapsed, with content loaded on demand.
+    #:
+    #: Version Added:
+    #:     9.0
+    stub_reviews: Sequence[Review]
+
     def __init__(
         self,
         review_request: ReviewRequest,
@@ -275,6 +300,9 @@ class ReviewRequestPageData:
         entry_classes: (
             Sequence[type[BaseReviewRequestPageEntry]] | None
         ) = None,
+        *,
+        max_loaded_reviews: int = 0,
+        review_ids: (Collection[int] | None) = None,
     ) -> None:
         """Initialize the data object.
 
@@ -292,6 +320,29 @@ class ReviewRequestPageData:
                 The list of entry classes that should be used for data
                 generation. If not provided, all registered entry classes
                 will be used.
+
+            max_loaded_reviews (int, optional):
+                The maximum number of top-level reviews to fully load.
+
+                If there are more reviews than this, only the most recently
+                active reviews, reviews with open issues, and reviews with
+                draft replies will be loaded. The rest will be available in
+                :py:attr:`stub_reviews`.
+
+                If 0, all reviews will be loaded.
+
+                Version Added:
+                    9.0
+
+            review_ids (list of int, optional):
+                The IDs of the only top-level reviews to fully load.
+
+                This is used when loading specific entries, and takes
+                precedence over ``max_loaded_reviews``. No stub reviews
+                will be generated.
+
+                Version Added:
+                    9.0
         """
         self.review_request = review_request
         self.request = request
@@ -308,6 +359,7 @@ class ReviewRequestPageData:
         self.latest_review_timestamp = None
         self.latest_changedesc_timestamp = None
         self.draft = None
+        self.review_count = 0
 
         # These are populated in query_data_post_etag().
         self.initial_status_updates = []
@@ -330,6 +382,7 @@ class ReviewRequestPageData:
         self.draft_body_top_replies = {}
         self.draft_body_bottom_replies = {}
         self.issues = []
+        self.stub_reviews = []
         self.issue_counts = {
             'total': 0,
             'open': 0,
@@ -369,6 +422,14 @@ class ReviewRequestPageData:
         self._needs_file_attachments = needs_file_attachments
         self._needs_screenshots = needs_screenshots
 
+        self._max_loaded_reviews = max_loaded_reviews
+        self._review_ids = review_ids
+
+        # These are populated in query_data_pre_etag() when only a window of
+        # reviews is loaded.
+        self._loaded_review_ids: (set[int] | None) = None
+        self._reply_timestamps_by_review_id: dict[int, datetime] = {}
+
     def query_data_pre_etag(self) -> None:
         """Perform initial queries for the page.
 
@@ -394,22 +455,39 @@ class ReviewRequestPageData:
             reviews_query |= Q(user_id=user.pk)
 
         reviews: list[Review] = []
+        loaded_review_ids: (set[int] | None) = None
 
         if needs_reviews or needs_status_updates:
-            reviews = list(
+            reviews_queryset = (
                 review_request.reviews
                 .filter(reviews_query)
                 .order_by('-timestamp')
                 .select_related('user', 'user__profile')
             )
 
+            if self._review_ids is not None or self._max_loaded_reviews > 0:
+                loaded_review_ids = self._query_review_window(reviews_query)
+
+                if loaded_review_ids is not None:
+                    reviews_queryset = reviews_queryset.filter(
+                        Q(pk__in=loaded_review_ids) |
+                        Q(base_reply_to__in=loaded_review_ids))
+
+            reviews = list(reviews_queryset)
+
         self.reviews = reviews
+        self._loaded_review_ids = loaded_review_ids
 
-        if len(reviews) == 0:
-            self.latest_review_timestamp = \
-                datetime.fromtimestamp(0, timezone.utc)
-        else:
-            self.latest_review_timestamp = reviews[0].timestamp
+        if loaded_review_ids is None:
+            # The latest review timestamp and the count are otherwise set
+            # when computing the window, since not all reviews are loaded.
+            self.review_count = len(reviews)
+
+            if len(reviews) == 0:
+                self.latest_review_timestamp = \
+                    datetime.fromtimestamp(0, timezone.utc)
+            else:
+                self.latest_review_timestamp = reviews[0].timestamp
 
         # Get all the public ChangeDescriptions.
         changedescs: list[ChangeDescription] = []
@@ -600,6 +678,33 @@ class ReviewRequestPageData:
             if not hasattr(review, '_status_update_cache'):
                 review._status_update_cache = None
 
+        # Fetch the reviews outside of the loaded window. These are only
+        # needed for stub entries, so their comments and replies are not
+        # loaded.
+        loaded_review_ids = self._loaded_review_ids
+
+        if (loaded_review_ids is not None and
+            self._review_ids is None and
+            self._needs_reviews):
+            stub_reviews = list(
+                review_request.reviews
+                .filter(public=True,
+                        base_reply_to__isnull=True)
+                .exclude(pk__in=loaded_review_ids)
+                .select_related('user', 'user__profile')
+            )
+            reply_timestamps = self._reply_timestamps_by_review_id
+
+            for review in stub_reviews:
+                review._status_update_cache = None
+
+                if review.pk in reply_timestamps:
+                    latest_timestamps_by_review_id[review.pk] = \
+                        reply_timestamps[review.pk].replace(
+                            tzinfo=timezone.utc)
+
+            self.stub_reviews = stub_reviews
+
         self.body_bottom_replies = body_bottom_replies
         self.body_top_replies = body_top_replies
         self.draft_body_bottom_replies = draft_body_bottom_replies
@@ -752,8 +857,20 @@ class ReviewRequestPageData:
                 related_field = Review._meta.get_field(review_field_name)
                 comment_field_name = related_field.m2m_reverse_field_name()
                 through = related_field.remote_field.through
+                through_q = Q(review__in=review_ids)
+
+                if loaded_review_ids is not None:
+                    # Only a window of reviews has been loaded. The issue
+                    # summary table still needs the issues from all the
+                    # other reviews, so include those comments as well.
+                    through_q |= Q(**{
+                        'review__review_request': review_request,
+                        'review__public': True,
+                        f'{comment_field_name}__issue_opened': True,
+                    })
+
                 objs = list(
-                    through.objects.filter(review__in=review_ids)
+                    through.objects.filter(through_q)
                     .select_related()
                     .order_by(*ordering)
                 )
@@ -775,8 +892,17 @@ class ReviewRequestPageData:
 
                     # Short-circuit some object fetches for the comment by
                     # setting some internal state on them.
-                    assert obj.review_id in reviews_by_id
-                    review = reviews_by_id[obj.review_id]
+                    try:
+                        review = reviews_by_id[obj.review_id]
+                        is_loaded = True
+                    except KeyError:
+                        # This is an issue on a review outside of the loaded
+                        # window, which is only shown in the issue summary
+                        # table.
+                        assert loaded_review_ids is not None
+                        review = obj.review
+                        is_loaded = False
+
                     comment.review_obj = review
                     comment._review = review
                     comment._review_request = review_request
@@ -792,7 +918,7 @@ class ReviewRequestPageData:
                     # ignore anything we don't expect.
                     is_reply = review.is_reply()
 
-                    if is_reply == comment.is_reply():
+                    if is_loaded and is_reply == comment.is_reply():
                         if is_reply:
                             replied_comment = comment_map[comment.reply_to_id]
                             replied_comment._replies.append(comment)
@@ -895,6 +1021,152 @@ class ReviewRequestPageData:
             'main': main_entries,
         }
 
+    def _query_review_window(
+        self,
+        reviews_query: Q,
+    ) -> set[int] | None:
+        """Return the IDs of the top-level reviews to fully load.
+
+        This fetches a lightweight summary of all the reviews and replies on
+        the review request, which is used to set
+        :py:attr:`latest_review_timestamp` and :py:attr:`review_count` and
+        to choose the reviews to load.
+
+        If specific review IDs were requested, those will be loaded.
+        Otherwise, the most recently active reviews will be loaded, along with
+        any reviews containing open issues.
+
+        Reviews associated with status updates and reviews containing draft
+        replies (or draft reviews) owned by the user are always loaded.
+
+        Version Added:
+            9.0
+
+        Args:
+            reviews_query (django.db.models.Q):
+                The query used to filter the reviews shown on the page.
+
+        Returns:
+            set of int:
+            The IDs of the top-level reviews to load, or ``None`` if all
+            reviews should be loaded.
+        """
+        review_request = self.review_request
+        max_loaded_reviews = self._max_loaded_reviews
+        review_ids = self._review_ids
+
+        summary = list(
+            review_request.reviews
+            .filter(reviews_query)
+            .values_list('pk', 'base_reply_to_id', 'public', 'timestamp')
+        )
+
+        latest_timestamp: (datetime | None) = None
+        activity_by_review_id: dict[int, datetime] = {}
+        reply_timestamps_by_review_id: dict[int, datetime] = {}
+        required_review_ids: set[int] = set()
+
+        for review_id, parent_id, public, timestamp in summary:
+            if latest_timestamp is None or timestamp > latest_timestamp:
+                latest_timestamp = timestamp
+
+            if parent_id is None:
+                top_level_id = review_id
+            else:
+                top_level_id = parent_id
+
+                if (parent_id not in reply_timestamps_by_review_id or
+                    reply_timestamps_by_review_id[parent_id] < timestamp):
+                    reply_timestamps_by_review_id[parent_id] = timestamp
+
+            if not public:
+                # This is a draft review or reply owned by the user.
+                required_review_ids.add(top_level_id)
+            elif (top_level_id not in activity_by_review_id or
+                  activity_by_review_id[top_level_id] < timestamp):
+                activity_by_review_id[top_level_id] = timestamp
+
+        self.review_count = len(summary)
+        self.latest_review_timestamp = (
+            latest_timestamp or
+            datetime.fromtimestamp(0, timezone.utc))
+        self._reply_timestamps_by_review_id = reply_timestamps_by_review_id
+
+        if (review_ids is None and
+            len(activity_by_review_id) <= max_loaded_reviews):
+            # Everything fits in the window.
+            return None
+
+        if self.status_updates_enabled and self._needs_status_updates:
+            required_review_ids.update(
+                review_request.status_updates
+                .filter(review__isnull=False)
+                .values_list('review_id', flat=True)
+            )
+
+        if review_ids is None:
+            candidate_review_ids = sorted(
+                (
+                    review_id
+                    for review_id in activity_by_review_id
+                    if review_id not in required_review_ids
+                ),
+                key=lambda review_id: activity_by_review_id[review_id],
+                reverse=True)
+
+            loaded_review_ids = set(candidate_review_ids[:max_loaded_reviews])
+            loaded_review_ids.update(self._query_open_issue_review_ids())
+        else:
+            loaded_review_ids = set(review_ids)
+
+        loaded_review_ids.update(required_review_ids)
+
+        return loaded_review_ids
+
+    def _query_open_issue_review_ids(self) -> set[int]:
+        """Return the IDs of all reviews containing open issues.
+
+        Issues waiting on verification are considered open.
+
+        Version Added:
+            9.0
+
+        Returns:
+            set of int:
+            The IDs of the reviews containing open issues.
+        """
+        review_request = self.review_request
+        review_ids: set[int] = set()
+
+        if (not review_request.issue_open_count and
+            not review_request.issue_verifying_count):
+            return review_ids
+
+        for review_field_name in ('general_comments',
+                                  'screenshot_comments',
+                                  'file_attachment_comments',
+                                  'comments'):
+            related_field = Review._meta.get_field(review_field_name)
+            comment_field_name = related_field.m2m_reverse_field_name()
+            through = related_field.remote_field.through
+
+            review_ids.update(
+                through.objects
+                .filter(**{
+                    'review__review_request': review_request,
+                    'review__public': True,
+                    f'{comment_field_name}__issue_opened': True,
+                    f'{comment_field_name}__issue_status__in': (
+                        BaseComment.OPEN,
+                        BaseComment.VERIFYING_RESOLVED,
+                        BaseComment.VERIFYING_DROPPED,
+                    ),
+                })
+                .values_list('review_id', flat=True)
+            )
+
+        return review_ids
+
     def _build_id_map(
         self,
         objects: Sequence[_TModel],
@@ -1008,6 +1280,17 @@ class BaseReviewRequestPageEntry:
     #: the entry, or disabled altogether.
     has_content: ClassVar[bool] = True
 
+    #: Whether the rendered HTML for this entry can be cached.
+    #:
+    #: If set, the rendered HTML will be cached, keyed off of the data
+    #: from :py:meth:`get_render_cache_data` and the user viewing the page.
+    #: Subclasses enabling this must ensure that data reflects all state
+    #: shown in the entry.
+    #:
+    #: Version Added:
+    #:     9.0
+    render_cacheable: ClassVar[bool] = False
+
     ######################
     # Instance variables #
     ######################
@@ -1030,6 +1313,15 @@ class BaseReviewRequestPageEntry:
     #: database object ID.
     entry_id: str
 
+    #: Whether this entry is a stub.
+    #:
+    #: Stub entries are rendered collapsed and without their content, which
+    #: is loaded from the server when the entry is expanded.
+    #:
+    #: Version Added:
+    #:     9.0
+    stub: bool = False
+
     #: The timestamp when the entry was last updated.
     #:
     #: This reflects new updates or activity on the entry.
@@ -1273,6 +1565,82 @@ class BaseReviewRequestPageEntry:
         """
         return {}
 
+    def get_render_cache_data(self) -> list[object]:
+        """Return data representing the rendered content of the entry.
+
+        This is used to build the cache key for the rendered HTML when
+        :py:attr:`render_cacheable` is set. Any change to the content of the
+        entry must result in a change to this data.
+
+        By default, this contains the entry's ETag data and timestamps.
+        Subclasses should include any other state shown in the entry.
+
+        Version Added:
+            9.0
+
+        Returns:
+            list:
+            The data for the cache key. Each item will be converted to a
+            string.
+        """
+        return [
+            self.build_etag_data(self.data, entry=self),
+            self.added_timestamp,
+            self.updated_timestamp,
+        ]
+
+    def get_render_cache_key(
+        self,
+        *,
+        request: HttpRequest,
+        entry_is_new: bool,
+    ) -> str | None:
+        """Return the cache key for the rendered HTML for the entry.
+
+        The key combines :py:meth:`get_render_cache_data` with state specific
+        to the user viewing the page, such as the collapsed state, their
+        language and time zone, and the user themselves (which covers any
+        permissions and draft state).
+
+        Version Added:
+            9.0
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            entry_is_new (bool):
+                Whether the entry is being shown as new to the user.
+
+        Returns:
+            str:
+            The cache key, or ``None`` if the entry can't be cached.
+        """
+        if not self.render_cacheable or self.stub:
+            return None
+
+        user = request.user
+        key_data = ':'.join(
+            str(value)
+            for value in (
+                user.pk,
+                self.collapsed,
+                entry_is_new,
+                get_language(),
+                django_timezone.get_current_timezone_name(),
+                is_site_read_only_for(user),
+                get_package_version(),
+                settings.AJAX_SERIAL,
+                *self.get_render_cache_data(),
+            )
+        )
+        key_hash = hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+        return (
+            f'review-request-page-entry-{self.data.review_request.pk}-'
+            f'{self.entry_type_id}-{self.entry_id}-{key_hash}'
+        )
+
     def render_to_string(
         self,
         request: HttpRequest,
@@ -1284,6 +1652,13 @@ class BaseReviewRequestPageEntry:
         any content (as determined by :py:attr:`has_content`), then this
         will return an empty string.
 
+        If :py:attr:`render_cacheable` is set, the rendered HTML will be
+        cached, and re-used until the entry or the viewer's state changes.
+
+        Version Changed:
+            9.0:
+            Added caching of the rendered HTML.
+
         Args:
             request (django.http.HttpRequest):
                 The HTTP request from the client.
@@ -1309,18 +1684,23 @@ class BaseReviewRequestPageEntry:
         new_context: dict[Any, Any] = context.flatten()
 
         try:
+            entry_is_new = bool(
+                user.is_authenticated and
+                last_visited is not None and
+                self.is_entry_new(last_visited=last_visited,
+                                  user=user))
+
             new_context.update({
                 'entry': self,
-                'entry_is_new': (
-                    user.is_authenticated and
-                    last_visited is not None and
-                    self.is_entry_new(last_visited=last_visited,
-                                      user=user)),
+                'entry_is_new': entry_is_new,
                 'show_entry_statuses_area': (
                     self.entry_pos !=
                     BaseReviewRequestPageEntry.ENTRY_POS_INITIAL),
             })
             new_context.update(self.get_extra_context(request, context))
+
+            cache_key = self.get_render_cache_key(request=request,
+                                                  entry_is_new=entry_is_new)
         except Exception as e:
             logger.exception('Error generating template context for %s '
                              '(ID=%s): %s',
@@ -1328,10 +1708,18 @@ class BaseReviewRequestPageEntry:
                              extra={'request': request})
             return mark_safe('')
 
-        try:
-            return render_to_string(template_name=self.template_name,
+        template_name = self.template_name
+
+        def _render() -> str:
+            return render_to_string(template_name=template_name,
                                     context=new_context,
                                     request=request)
+
+        try:
+            if cache_key is None:
+                return _render()
+
+            return mark_safe(cache_memoize(cache_key, _render))
         except Exception as e:
             logger.exception('Error rendering template for %s (ID=%s): %s',
                              self.__class__.__name__, self.entry_id, e,
@@ -1403,6 +1791,55 @@ class ReviewEntryMixin(ReviewEntryMixinParent):
             )
         )
 
+    def get_review_render_cache_data(
+        self,
+        review: Review,
+    ) -> list[object]:
+        """Return data representing the rendered content of a review.
+
+        This covers the review itself, its comments and issue states, and
+        all replies to the review.
+
+        Version Added:
+            9.0
+
+        Args:
+            review (reviewboard.reviews.models.review.Review):
+                The review to return data for.
+
+        Returns:
+            list:
+            The data for the render cache key.
+        """
+        data = self.data
+
+        return [
+            review.pk,
+            review.timestamp,
+            review.ship_it,
+            review.body_top,
+            review.body_bottom,
+            data.latest_timestamps_by_review_id.get(review.pk),
+            [
+                (reply.pk, reply.timestamp, reply.public)
+                for reply in chain(
+                    getattr(review, '_body_top_replies', []),
+                    getattr(review, '_body_bottom_replies', []))
+            ],
+            [
+                (
+                    comment.pk,
+                    comment.timestamp,
+                    comment.issue_status,
+                    [
+                        (reply.pk, reply.timestamp, reply.review_obj.public)
+                        for reply in comment._replies
+                    ],
+                )
+                for comment in data.review_comments.get(review.pk, [])
+            ],
+        ]
+
     def serialize_review_js_model_data(
         self,
         review: Review,
@@ -1534,7 +1971,8 @@ class StatusUpdatesEntryMixin(DiffCommentsSerializerMixin, ReviewEntryMixin):
         if entry is not None:
             assert isinstance(entry, StatusUpdatesEntryMixin)
 
-            status_updates = entry.status_updates
+            # Entries only track status updates if the feature is enabled.
+            status_updates = getattr(entry, 'status_updates', [])
         elif data.status_updates_enabled:
             status_updates = data.all_status_updates
         else:
@@ -1561,6 +1999,35 @@ class StatusUpdatesEntryMixin(DiffCommentsSerializerMixin, ReviewEntryMixin):
         self.status_updates_by_review = {}
         self.state_counts = Counter()
 
+    def get_render_cache_data(self) -> list[object]:
+        """Return data representing the rendered content of the entry.
+
+        This includes the state of each status update and the content of
+        any reviews they've posted.
+
+        Version Added:
+            9.0
+
+        Returns:
+            list:
+            The data for the cache key.
+        """
+        cache_data = super().get_render_cache_data()
+
+        for status_update in getattr(self, 'status_updates', []):
+            cache_data += [
+                status_update.pk,
+                status_update.effective_state,
+                status_update.timestamp,
+                status_update.description,
+            ]
+
+            if status_update.review_id is not None:
+                cache_data += self.get_review_render_cache_data(
+                    status_update.review)
+
+        return cache_data
+
     def are_status_updates_collapsed(
         self,
         status_updates: Sequence[StatusUpdate],
@@ -1841,6 +2308,7 @@ class InitialStatusUpdatesEntry(StatusUpdatesEntryMixin,
     entry_type_id = 'initial_status_updates'
     entry_pos = BaseReviewRequestPageEntry.ENTRY_POS_INITIAL
     template_name = 'reviews/entries/initial_status_updates.html'
+    render_cacheable = True
     js_model_class = 'RB.ReviewRequestPage.StatusUpdatesEntry'
     js_view_class = 'RB.ReviewRequestPage.InitialStatusUpdatesEntryView'
 
@@ -1971,6 +2439,7 @@ class ReviewEntry(ReviewEntryMixin, DiffCommentsSerializerMixin,
     entry_type_id = 'review'
     needs_reviews = True
     template_name = 'reviews/entries/review.html'
+    render_cacheable = True
     js_model_class = 'RB.ReviewRequestPage.ReviewEntry'
     js_view_class = 'RB.ReviewRequestPage.ReviewEntryView'
 
@@ -2025,10 +2494,17 @@ class ReviewEntry(ReviewEntryMixin, DiffCommentsSerializerMixin,
 
             yield entry
 
+        for review in data.stub_reviews:
+            yield cls(data=data,
+                      review=review,
+                      stub=True)
+
     def __init__(
         self,
         data: ReviewRequestPageData,
         review: Review,
+        *,
+        stub: bool = False,
     ) -> None:
         """Initialize the entry.
 
@@ -2038,8 +2514,16 @@ class ReviewEntry(ReviewEntryMixin, DiffCommentsSerializerMixin,
 
             review (reviewboard.reviews.models.Review):
                 The review.
+
+            stub (bool, optional):
+                Whether this is a stub entry, with comments and replies
+                loaded on demand.
+
+                Version Added:
+                    9.0
         """
         self.review = review
+        self.stub = stub
         self.issue_open_count = 0
         self.has_issues = False
         self.comments = {
@@ -2074,6 +2558,24 @@ class ReviewEntry(ReviewEntryMixin, DiffCommentsSerializerMixin,
         """
         return f'{self.entry_type_id}{self.review.pk}'
 
+    def get_render_cache_data(self) -> list[object]:
+        """Return data representing the rendered content of the entry.
+
+        Version Added:
+            9.0
+
+        Returns:
+            list:
+            The data for the cache key.
+        """
+        review_request = self.data.review_request
+
+        return [
+            *super().get_render_cache_data(),
+            review_request.status,
+            *self.get_review_render_cache_data(self.review),
+        ]
+
     def is_entry_new(
         self,
         last_visited: datetime,
@@ -2156,12 +2658,14 @@ class ReviewEntry(ReviewEntryMixin, DiffCommentsSerializerMixin,
         :py:meth:`ReviewEntryMixin.is_review_collapsed` for the collapsing
         rules for reviews.
 
+        Stub entries are always collapsed.
+
         Returns:
             bool:
             ``True`` if the entry should be collapsed. ``False`` if it should
             be expanded.
         """
-        return self.is_review_collapsed(self.review)
+        return self.stub or self.is_review_collapsed(self.review)
 
 
 if TYPE_CHECKING:
@@ -2180,6 +2684,7 @@ class ChangeEntry(StatusUpdatesEntryMixin, BaseReviewRequestPageEntry):
     needs_file_attachments = True
     needs_screenshots = True
     template_name = 'reviews/entries/change.html'
+    render_cacheable = True
 
     ######################
     # Instance variables #
@@ -2313,6 +2818,30 @@ class ChangeEntry(StatusUpdatesEntryMixin, BaseReviewRequestPageEntry):
         """
         return '%s%s' % (self.entry_type_id, self.changedesc.pk)
 
+    def get_render_cache_data(self) -> list[object]:
+        """Return data representing the rendered content of the entry.
+
+        Change descriptions don't change once published, but the fields
+        they show may reference state (such as file attachments) updated in
+        later changes, so this includes the latest change description
+        timestamp.
+
+        Version Added:
+            9.0
+
+        Returns:
+            list:
+            The data for the cache key.
+        """
+        changedesc = self.changedesc
+
+        return [
+            *super().get_render_cache_data(),
+            changedesc.pk,
+            changedesc.timestamp,
+            self.data.latest_changedesc_timestamp,
+        ]
+
     def is_entry_new(
         self,
         last_visited: datetime,
@@ -2,18 +2,162 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing
+import os
+import time
+from datetime import datetime, time as dt_time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
 from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.translation import gettext as _
+from haystack import connections as haystack_connections
+from haystack.constants import DEFAULT_ALIAS
+from haystack.utils import get_model_ct
+
+from reviewboard.search import search_backend_registry
+
+if TYPE_CHECKING:
+    import argparse
+
+    from haystack.indexes import SearchIndex
+
+
+#: The version of the checkpoint file format.
+#:
+#: Version Added:
+#:     9.0
+CHECKPOINT_VERSION = 1
+
+
+def _get_index(
+    model_ct: str,
+) -> SearchIndex:
+    """Return the search index for a model.
+
+    Version Added:
+        9.0
+
+    Args:
+        model_ct (str):
+            The ``app_label.model_name`` identifier of the model.
+
+    Returns:
+        haystack.indexes.SearchIndex:
+        The search index.
+
+    Raises:
+        KeyError:
+            There's no search index for the model.
+    """
+    unified_index = haystack_connections[DEFAULT_ALIAS].get_unified_index()
+
+    for model, index in unified_index.get_indexes().items():
+        if get_model_ct(model) == model_ct:
+            return index
+
+    raise KeyError(model_ct)
+
+
+def _index_range(
+    task: tuple[str, int, int, str | None],
+) -> tuple[str, int, int]:
+    """Index all objects of a model in a range of primary keys.
+
+    This is called directly or on a worker process.
+
+    Version Added:
+        9.0
+
+    Args:
+        task (tuple):
+            A 4-tuple of:
+
+            Tuple:
+                0 (str):
+                    The ``app_label.model_name`` identifier of the model.
+
+                1 (int):
+                    The first primary key in the range.
+
+                2 (int):
+                    The primary key following the end of the range.
+
+                3 (str):
+                    The ISO 8601 timestamp that objects must have been
+                    updated since, or ``None``.
+
+    Returns:
+        tuple:
+        A 3-tuple of:
+
+        Tuple:
+            0 (str):
+                The model identifier.
+
+            1 (int):
+                The first primary key in the range.
+
+            2 (int):
+                The number of objects indexed.
+    """
+    model_ct, start_pk, end_pk, since = task
+
+    index = _get_index(model_ct)
+    backend = haystack_connections[DEFAULT_ALIAS].get_backend()
+    objs = list(
+        index.build_queryset(
+            using=DEFAULT_ALIAS,
+            start_date=since and datetime.fromisoformat(since))
+        .filter(pk__gte=start_pk,
+                pk__lt=end_pk)
+        .order_by('pk')
+    )
+
+    if objs:
+        backend.update(index, objs)
+
+    return model_ct, start_pk, len(objs)
+
+
+def _init_worker() -> None:
+    """Initialize a worker process.
+
+    Version Added:
+        9.0
+    """
+    # Make sure the search backend doesn't share any sockets or file handles
+    # with the parent process.
+    haystack_connections[DEFAULT_ALIAS].reset_sessions()
 
 
 class Command(BaseCommand):
-    """Management command to manage the search index."""
+    """Management command to manage the search index.
+
+    Version Changed:
+        9.0:
+        Added the ``--workers``, ``--batch-size``, ``--since``, ``--resume``,
+        and ``--checkpoint-file`` options, and throughput statistics.
+    """
 
     help = _('Creates a search index of review requests.')
     requires_model_validation = True
 
-    def add_arguments(self, parser):
+    #: The number of seconds between progress updates.
+    #:
+    #: Version Added:
+    #:     9.0
+    progress_interval = 5
+
+    def add_arguments(
+        self,
+        parser: argparse.ArgumentParser,
+    ) -> None:
         """Add arguments to the command.
 
         Args:
@@ -26,16 +170,392 @@ class Command(BaseCommand):
             dest='rebuild',
             default=False,
             help='Rebuild the database index')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help=_(
+                'The number of worker processes used to index objects. '
+                'Each worker indexes its own ranges of IDs. This is not '
+                'supported by the Whoosh search backend.'
+            ))
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help=_(
+                'The number of objects written to the search backend at a '
+                'time. This defaults to the backend\'s configured batch '
+                'size.'
+            ))
+        parser.add_argument(
+            '--since',
+            default=None,
+            help=_(
+                'Only index objects updated since the given date or '
+                'date/time (for example, 2025-01-31 or '
+                '2025-01-31T12:00:00).'
+            ))
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            default=False,
+            help=_(
+                'Resume an interrupted run from the checkpoint file, '
+                'skipping any objects already indexed. The other options '
+                'must match the interrupted run.'
+            ))
+        parser.add_argument(
+            '--checkpoint-file',
+            default=os.path.join(settings.SITE_DATA_DIR,
+                                 'search-index-checkpoint.json'),
+            help=_(
+                'The file used to record progress, for use with '
+                '--resume. This is removed once indexing is complete.'
+            ))
 
-    def handle(self, **options):
+    def handle(
+        self,
+        **options,
+    ) -> None:
         """Handle the command.
 
         Args:
             **options (dict):
                 Options parsed on the command line.
+
+        Raises:
+            django.core.management.CommandError:
+                There was an error with the provided options.
         """
-        # Call the appropriate Haystack command to refresh the search index.
-        if options['rebuild']:
-            call_command('rebuild_index', interactive=False)
+        search_backend = search_backend_registry.current_backend
+
+        if search_backend is None:
+            self.stderr.write(_('Search is not enabled. Nothing to index.'))
+            return
+
+        rebuild = options['rebuild']
+        num_workers = options['workers']
+        checkpoint_file = options['checkpoint_file']
+        since = self._parse_since(options['since'])
+
+        if num_workers < 1:
+            raise CommandError(_('--workers must be at least 1.'))
+
+        if num_workers > 1 and not search_backend.supports_parallel_indexing:
+            raise CommandError(
+                _('The %s search backend does not support multiple '
+                  'workers.')
+                % search_backend.name)
+
+        if rebuild and since is not None:
+            raise CommandError(_('--full cannot be used with --since.'))
+
+        backend = haystack_connections[DEFAULT_ALIAS].get_backend()
+        batch_size = options['batch_size'] or backend.batch_size
+
+        if batch_size < 1:
+            raise CommandError(_('--batch-size must be at least 1.'))
+
+        run_info = {
+            'batch_size': batch_size,
+            'rebuild': rebuild,
+            'since': since,
+        }
+
+        if options['resume']:
+            completed = self._load_checkpoint(checkpoint_file, run_info)
         else:
-            call_command('update_index')
+            completed = {}
+
+            if rebuild:
+                # Clear the index the same way the rebuild_index command
+                # would, but only for a new run.
+                call_command('clear_index', interactive=False, verbosity=0)
+
+        tasks: list[tuple[str, int, int, str | None]] = []
+        totals: dict[str, int] = {}
+        unified_index = haystack_connections[DEFAULT_ALIAS].get_unified_index()
+
+        for model, index in unified_index.get_indexes().items():
+            model_ct = get_model_ct(model)
+            queryset = index.build_queryset(
+                using=DEFAULT_ALIAS,
+                start_date=since and datetime.fromisoformat(since))
+            model_completed = set(completed.setdefault(model_ct, []))
+            pk_range = (
+                queryset
+                .order_by()
+                .values_list('pk', flat=True)
+            )
+
+            try:
+                min_pk = pk_range.order_by('pk')[:1].get()
+                max_pk = pk_range.order_by('-pk')[:1].get()
+            except model.DoesNotExist:
+                totals[model_ct] = 0
+                continue
+
+            totals[model_ct] = queryset.count()
+
+            # Partition the primary key space into fixed ranges, so that the
+            # same ranges are used when resuming. Each range holds at most
+            # one batch worth of objects.
+            for start_pk in range(min_pk, max_pk + 1, batch_size):
+                if start_pk not in model_completed:
+                    tasks.append((model_ct, start_pk, start_pk + batch_size,
+                                  since))
+
+        self._save_checkpoint(checkpoint_file, run_info, completed)
+        self._run_tasks(tasks=tasks,
+                        totals=totals,
+                        completed=completed,
+                        num_workers=num_workers,
+                        checkpoint_file=checkpoint_file,
+                        run_info=run_info)
+
+        try:
+            os.unlink(checkpoint_file)
+        except FileNotFoundError:
+            pass
+
+    def _run_tasks(
+        self,
+        *,
+        tasks: list[tuple[str, int, int, str | None]],
+        totals: dict[str, int],
+        completed: dict[str, list[int]],
+        num_workers: int,
+        checkpoint_file: str,
+        run_info: dict,
+    ) -> None:
+        """Index all ranges, recording progress as they complete.
+
+        Args:
+            tasks (list of tuple):
+                The ranges to index. See :py:func:`_index_range`.
+
+            totals (dict):
+                The total number of objects to index for each model.
+
+            completed (dict):
+                The ranges already completed for each model. This will be
+                updated as ranges complete.
+
+            num_workers (int):
+                The number of worker processes to use.
+
+            checkpoint_file (str):
+                The path to the checkpoint file.
+
+            run_info (dict):
+                Information on the options for this run.
+        """
+        counts = dict.fromkeys(totals, 0)
+        start_time = time.monotonic()
+        last_progress_time = start_time
+
+        if num_workers > 1:
+            # Worker processes must open their own database connections.
+            connections.close_all()
+
+            # Workers rely on inheriting the configured Django and Haystack
+            # state, so they must be forked rather than spawned.
+            pool = multiprocessing.get_context('fork').Pool(
+                num_workers,
+                initializer=_init_worker)
+            results = pool.imap_unordered(_index_range, tasks)
+        else:
+            pool = None
+            results = map(_index_range, tasks)
+
+        try:
+            for model_ct, start_pk, num_indexed in results:
+                counts[model_ct] += num_indexed
+                completed[model_ct].append(start_pk)
+                self._save_checkpoint(checkpoint_file, run_info, completed)
+
+                now = time.monotonic()
+
+                if now - last_progress_time >= self.progress_interval:
+                    last_progress_time = now
+                    self._write_stats(counts=counts,
+                                      totals=totals,
+                                      elapsed=now - start_time)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        elapsed = time.monotonic() - start_time
+        num_indexed = sum(counts.values())
+
+        self._write_stats(counts=counts,
+                          totals=totals,
+                          elapsed=elapsed)
+        self.stdout.write(
+            _('Indexed %(count)s object(s) in %(elapsed).1f seconds '
+              '(%(rate).1f objects/second) using %(workers)s worker(s).')
+            % {
+                'count': num_indexed,
+                'elapsed': elapsed,
+                'rate': num_indexed / elapsed if elapsed else 0,
+                'workers': num_workers,
+            })
+
+    def _write_stats(
+        self,
+        *,
+        counts: dict[str, int],
+        totals: dict[str, int],
+        elapsed: float,
+    ) -> None:
+        """Write progress and throughput statistics for each model.
+
+        Args:
+            counts (dict):
+                The number of objects indexed for each model in this run.
+
+            totals (dict):
+                The total number of objects to index for each model.
+
+            elapsed (float):
+                The number of seconds elapsed in this run.
+        """
+        for model_ct, count in counts.items():
+            self.stdout.write(
+                _('%(model)s: %(count)s of %(total)s indexed '
+                  '(%(rate).1f objects/second)')
+                % {
+                    'count': count,
+                    'model': model_ct,
+                    'rate': count / elapsed if elapsed else 0,
+                    'total': totals[model_ct],
+                })
+
+    def _parse_since(
+        self,
+        value: str | None,
+    ) -> str | None:
+        """Parse the value of the --since option.
+
+        Args:
+            value (str):
+                The value to parse.
+
+        Returns:
+            str:
+            The parsed timestamp in ISO 8601 format, or ``None`` if not
+            provided.
+
+        Raises:
+            django.core.management.CommandError:
+                The value could not be parsed.
+        """
+        if not value:
+            return None
+
+        try:
+            since = parse_datetime(value)
+
+            if since is None:
+                date = parse_date(value)
+
+                if date is not None:
+                    since = datetime.combine(date, dt_time.min)
+        except ValueError:
+            since = None
+
+        if since is None:
+            raise CommandError(_('"%s" is not a valid date or date/time.')
+                               % value)
+
+        if settings.USE_TZ and timezone.is_naive(since):
+            since = timezone.make_aware(since)
+
+        return since.isoformat()
+
+    def _load_checkpoint(
+        self,
+        checkpoint_file: str,
+        run_info: dict,
+    ) -> dict[str, list[int]]:
+        """Load the ranges completed by an interrupted run.
+
+        Args:
+            checkpoint_file (str):
+                The path to the checkpoint file.
+
+            run_info (dict):
+                Information on the options for this run.
+
+        Returns:
+            dict:
+            The completed ranges for each model.
+
+        Raises:
+            django.core.management.CommandError:
+                The checkpoint file could not be loaded, or was for a run
+                with different options.
+        """
+        try:
+            with open(checkpoint_file, 'r') as fp:
+                checkpoint = json.load(fp)
+        except FileNotFoundError:
+            raise CommandError(
+                _('There is no interrupted run to resume. The checkpoint '
+                  'file "%s" does not exist.')
+                % checkpoint_file)
+        except (OSError, ValueError) as e:
+            raise CommandError(
+                _('Could not load the checkpoint file "%(path)s": %(error)s')
+                % {
+                    'error': e,
+                    'path': checkpoint_file,
+                })
+
+        if (checkpoint.get('version') != CHECKPOINT_VERSION or
+            checkpoint.get('run_info') != run_info):
+            raise CommandError(
+                _('The checkpoint file "%(path)s" is for a run with '
+                  'different options: %(run_info)s')
+                % {
+                    'path': checkpoint_file,
+                    'run_info': checkpoint.get('run_info'),
+                })
+
+        return checkpoint['completed']
+
+    def _save_checkpoint(
+        self,
+        checkpoint_file: str,
+        run_info: dict,
+        completed: dict[str, list[int]],
+    ) -> None:
+        """Save the ranges completed so far.
+
+        The file is replaced atomically, so an interrupted write won't lose
+        earlier progress.
+
+        Args:
+            checkpoint_file (str):
+                The path to the checkpoint file.
+
+            run_info (dict):
+                Information on the options for this run.
+
+            completed (dict):
+                The completed ranges for each model.
+        """
+        tmp_file = '%s.tmp' % checkpoint_file
+
+        with open(tmp_file, 'w') as fp:
+            json.dump(
+                {
+                    'completed': completed,
+                    'run_info': run_info,
+                    'version': CHECKPOINT_VERSION,
+                },
+                fp)
+
+        os.replace(tmp_file, checkpoint_file)
@@ -0,0 +1,104 @@
+"""Management command to rebuild per-user review request summaries.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.translation import gettext as _
+
+from reviewboard.accounts.models import ReviewRequestUserSummary
+from reviewboard.reviews.models import ReviewRequest
+
+
+class Command(BaseCommand):
+    """Management command to rebuild per-user review request summaries.
+
+    These summaries power the new review counts and "My Comments" states
+    shown on the dashboard. They're normally kept up-to-date automatically,
+    but must be built once for existing data after upgrading, and can be
+    rebuilt if they fall out of sync.
+
+    Version Added:
+        9.0
+    """
+
+    help = _(
+        'Rebuild the per-user review request summaries used for dashboard '
+        'new review counts and review states.'
+    )
+
+    #: The number of review requests to rebuild at a time.
+    BATCH_SIZE = 100
+
+    def add_arguments(
+        self,
+        parser: argparse.ArgumentParser,
+    ) -> None:
+        """Add arguments to the command.
+
+        Args:
+            parser (argparse.ArgumentParser):
+                The argument parser for the command.
+        """
+        parser.add_argument(
+            'review_request_ids',
+            metavar='REVIEW_REQUEST_ID',
+            nargs='*',
+            type=int,
+            help=_('Specific review request IDs to rebuild.'))
+        parser.add_argument(
+            '-a',
+            '--all',
+            action='store_true',
+            default=False,
+            dest='all',
+            help=_('Rebuild summaries for all review requests.'))
+
+    def handle(
+        self,
+        **options,
+    ) -> None:
+        """Handle the command.
+
+        Args:
+            **options (dict):
+                Options parsed on the command line.
+
+        Raises:
+            django.core.management.CommandError:
+                There was an error with the provided options.
+        """
+        review_request_ids: list[int] = options['review_request_ids']
+        rebuild_all: bool = options['all']
+
+        if rebuild_all:
+            if review_request_ids:
+                raise CommandError(
+                    _('Review request IDs cannot be used with --all.'))
+
+            review_request_ids = list(
+                ReviewRequest.objects
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            )
+        elif not review_request_ids:
+            raise CommandError(
+                _('One or more review request IDs must be provided, or '
+                  '--all must be used.'))
+
+        num_summaries = ReviewRequestUserSummary.objects.rebuild(
+            review_request_ids=review_request_ids,
+            batch_size=self.BATCH_SIZE)
+
+        self.stdout.write(
+            _('Rebuilt %(num_summaries)s summaries for '
+              '%(num_review_requests)s review request(s).')
+            % {
+                'num_review_requests': len(review_request_ids),
+                'num_summaries': num_summaries,
+            })
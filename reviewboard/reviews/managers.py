@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import logging
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import connections, router, transaction, IntegrityError
 from django.db.models import Exists, Manager, OuterRef, Q
 from django.db.models.query import QuerySet
 from django.utils.text import slugify
+from djblets.cache.backend import cache_memoize, make_cache_key
 from housekeeping.functions import deprecate_non_keyword_only_args
 
 from reviewboard.deprecation import RemovedInReviewBoard90Warning
@@ -319,6 +322,8 @@ class DefaultReviewerManager(Manager):
 class ReviewGroupManager(Manager):
     """A manager for Group models."""
 
+    _ACL_STATE_CACHE_KEY = 'review-group-acl-state'
+
     @deprecate_non_keyword_only_args(RemovedInReviewBoard90Warning)
     def accessible(self,
                    user,
@@ -434,6 +439,14 @@ class ReviewGroupManager(Manager):
         This wraps :py:meth:`accessible` and takes the same arguments
         (with the exception of ``distinct``, which is ignored).
 
+        Results are cached per user and :term:`Local Site`, and invalidated
+        whenever review group membership, visibility, or invite-only state
+        change.
+
+        Version Changed:
+            9.0:
+            Results are now cached.
+
         Version Changed:
             3.0.24:
             In prior versions, the order was not specified, but was
@@ -453,16 +466,130 @@ class ReviewGroupManager(Manager):
         """
         kwargs['distinct'] = False
 
-        return list(sorted(set(
-            self.accessible(*args, **kwargs)
-            .values_list('pk', flat=True)
-        )))
+        def _gen_ids() -> list[int]:
+            return list(sorted(set(
+                self.accessible(*args, **kwargs)
+                .values_list('pk', flat=True)
+            )))
+
+        return cache_memoize(
+            self._make_accessible_ids_cache_key(*args, **kwargs),
+            _gen_ids)
+
+    def get_acl_state(self) -> str:
+        """Return an identifier for the current state of review group ACLs.
+
+        This will change any time a review group's membership, visibility,
+        invite-only state, or Local Site change. It can be used as a
+        component in cache keys for data that depends on which review groups
+        users can access.
+
+        Version Added:
+            9.0
+
+        Returns:
+            str:
+            The identifier for the current ACL state.
+        """
+        return cache_memoize(self._ACL_STATE_CACHE_KEY,
+                             lambda: str(uuid4()))
+
+    def invalidate_acl_cache(
+        self,
+        *,
+        using: (str | None) = None,
+    ) -> None:
+        """Invalidate all cached review group ACL results.
+
+        This is called automatically when review groups change in a way
+        that may affect access.
+
+        The cache is invalidated immediately, and again once the current
+        transaction (if any) commits. This prevents another request from
+        caching results computed from data that hadn't yet been committed.
+
+        Version Added:
+            9.0
+
+        Args:
+            using (str, optional):
+                The database alias for the transaction making the change.
+        """
+        cache_key = make_cache_key(self._ACL_STATE_CACHE_KEY)
+
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key),
+                              using=using)
 
     def can_create(self, user, local_site=None):
         """Returns whether the user can create groups."""
         return (user.is_superuser or
                 (local_site and local_site.is_mutable_by(user)))
 
+    def _make_accessible_ids_cache_key(
+        self,
+        user: AnonymousUser | User,
+        visible_only: bool = True,
+        local_site: AnyOrAllLocalSites = None,
+        **kwargs,
+    ) -> str:
+        """Return a cache key for accessible review group IDs.
+
+        Superusers all share the same results. Other users are keyed by
+        whether they have permission to view invite-only groups, so that
+        permission changes take effect immediately.
+
+        Version Added:
+            9.0
+
+        Args:
+            user (django.contrib.auth.models.User):
+                The user that must have access to the review groups.
+
+            visible_only (bool, optional):
+                Whether only visible review groups are being returned.
+
+            local_site (reviewboard.site.models.LocalSite or
+                        reviewboard.site.models.LocalSite.ALL, optional):
+                The Local Site that the review groups must be associated
+                with.
+
+            **kwargs (dict, unused):
+                Additional keyword arguments passed to
+                :py:meth:`accessible`.
+
+        Returns:
+            str:
+            The cache key.
+        """
+        if local_site is LocalSite.ALL:
+            local_site_key = 'all'
+        elif local_site is None:
+            local_site_key = 'none'
+        else:
+            local_site_key = str(getattr(local_site, 'pk', local_site))
+
+        if user.is_superuser:
+            user_key = 'superuser'
+        else:
+            if local_site is LocalSite.ALL:
+                perm_local_site = None
+            else:
+                perm_local_site = local_site
+
+            has_perm = user.has_perm('reviews.can_view_invite_only_groups',
+                                     perm_local_site)
+
+            if user.is_authenticated:
+                user_key = f'{user.pk}-{int(has_perm)}'
+            else:
+                user_key = f'anonymous-{int(has_perm)}'
+
+        return (
+            f'review-group-accessible-ids-{self.get_acl_state()}-'
+            f'{user_key}-{local_site_key}-{int(bool(visible_only))}'
+        )
+
 
 class ReviewRequestQuerySet(QuerySet):
     def with_counts(self, user):
@@ -471,18 +598,15 @@ class ReviewRequestQuerySet(QuerySet):
         if user and user.is_authenticated:
             select_dict = {}
 
+            # This is maintained in the user's review request summary, rather
+            # than counting reviews for every row.
             select_dict['new_review_count'] = """
-                SELECT COUNT(*)
-                  FROM reviews_review, accounts_reviewrequestvisit
-                  WHERE reviews_review.public
-                    AND reviews_review.review_request_id =
-                        reviews_reviewrequest.id
-                    AND accounts_reviewrequestvisit.review_request_id =
+                SELECT COALESCE(MAX(new_review_count), 0)
+                  FROM accounts_reviewrequestusersummary
+                  WHERE accounts_reviewrequestusersummary.review_request_id =
                         reviews_reviewrequest.id
-                    AND accounts_reviewrequestvisit.user_id = %(user_id)s
-                    AND reviews_review.timestamp >
-                        accounts_reviewrequestvisit.timestamp
-                    AND reviews_review.user_id != %(user_id)s
+                    AND accounts_reviewrequestusersummary.user_id =
+                        %(user_id)s
             """ % {
                 'user_id': str(user.id)
             }
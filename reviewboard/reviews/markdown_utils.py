@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+from typing import Callable
+
+import bleach
+import pygments
 import pymdownx.emoji
 from bleach.sanitizer import Cleaner
 from django.conf import settings
@@ -7,9 +12,13 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Model
 from django.utils.encoding import force_str
 from django.utils.html import escape
-from djblets import markdown as djblets_markdown
+from djblets import (get_package_version as get_djblets_version,
+                     markdown as djblets_markdown)
+from djblets.cache.backend import cache_memoize
 from djblets.siteconfig.models import SiteConfiguration
-from markdown import markdown
+from markdown import __version__ as markdown_version, markdown
+
+from reviewboard import get_package_version
 
 
 # Keyword arguments used when calling a Markdown renderer function.
@@ -122,6 +131,17 @@ SAFE_MARKDOWN_ATTRS = {
 SAFE_MARKDOWN_URL_PROTOCOLS = ['http', 'https', 'mailto']
 
 
+#: The version of the format stored in the rendered Markdown cache.
+#:
+#: This must be increased whenever the Markdown renderer configuration
+#: changes in a way that affects output and isn't covered by the versions
+#: of Review Board or the rendering libraries.
+#:
+#: Version Added:
+#:     9.0
+MARKDOWN_RENDER_CACHE_VERSION = 1
+
+
 def markdown_escape_field(obj, field_name):
     """Escapes Markdown text in a model or dictionary's field.
 
@@ -251,6 +271,83 @@ def clean_markdown_html(html):
     return cleaner.clean(html)
 
 
+def make_markdown_render_cache_key(
+    text: str,
+    *,
+    renderer_id: str,
+) -> str:
+    """Return the cache key for rendered Markdown text.
+
+    The key is based on a hash of the text, the renderer used, and the
+    versions of Review Board and the libraries used for rendering.
+
+    Version Added:
+        9.0
+
+    Args:
+        text (str):
+            The Markdown text being rendered.
+
+        renderer_id (str):
+            The ID of the renderer. This must identify the renderer and any
+            settings that affect its output.
+
+    Returns:
+        str:
+        The cache key.
+    """
+    text_sha256 = hashlib.sha256(
+        text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    return (
+        f'markdown-html-{MARKDOWN_RENDER_CACHE_VERSION}-'
+        f'{get_package_version()}-{get_djblets_version()}-'
+        f'{markdown_version}-{pymdownx.__version__}-{pygments.__version__}-'
+        f'{bleach.__version__}-{renderer_id}-{text_sha256}'
+    )
+
+
+def get_cached_rendered_markdown(
+    text: str,
+    *,
+    renderer_id: str,
+    render_func: Callable[[str], str],
+) -> str:
+    """Return rendered Markdown text, using the cache if possible.
+
+    The same text is often rendered many times across review request pages,
+    e-mails, and API responses. If the text has already been rendered by the
+    same renderer, the cached result will be returned. Otherwise,
+    ``render_func`` will be called and its result cached.
+
+    Version Added:
+        9.0
+
+    Args:
+        text (str):
+            The Markdown text to render.
+
+        renderer_id (str):
+            The ID of the renderer. This must identify the renderer and any
+            settings that affect its output.
+
+        render_func (callable):
+            The function used to render the text on a cache miss. This
+            takes the text as an argument.
+
+    Returns:
+        str:
+        The rendered HTML.
+    """
+    if not text:
+        return render_func(text)
+
+    return cache_memoize(
+        make_markdown_render_cache_key(text, renderer_id=renderer_id),
+        lambda: render_func(text),
+        large_data=True)
+
+
 def render_markdown(text):
     """Render Markdown text to XHTML.
 
@@ -261,6 +358,13 @@ def render_markdown(text):
     It's rendered to XHTML in order to allow the element tree to be easily
     parsed for code review and change description diffing.
 
+    Rendered results are cached, keyed off of the text and the renderer
+    settings.
+
+    Version Changed:
+        9.0:
+        Rendered results are now cached.
+
     Args:
         text (bytes or unicode):
             The Markdown text to render.
@@ -271,7 +375,16 @@ def render_markdown(text):
         unicode:
         The Markdown-rendered XHTML.
     """
-    return clean_markdown_html(markdown(force_str(text), **MARKDOWN_KWARGS))
+    # The allowed URL protocols affect the sanitized output, so they must
+    # be part of the renderer ID.
+    url_protocols = ','.join(sorted(
+        settings.ALLOWED_MARKDOWN_URL_PROTOCOLS or []))
+
+    return get_cached_rendered_markdown(
+        force_str(text),
+        renderer_id=f'xhtml-{url_protocols}',
+        render_func=lambda text: clean_markdown_html(
+            markdown(text, **MARKDOWN_KWARGS)))
 
 
 def render_markdown_from_file(f):
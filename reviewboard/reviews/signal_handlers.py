@@ -6,11 +6,28 @@ Version Added:
 
 from __future__ import annotations
 
-from django.db.models.signals import pre_delete
+from typing import TYPE_CHECKING
 
-from reviewboard.reviews.models import (ReviewRequest,
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+
+from reviewboard.diffviewer.models import DiffSet
+from reviewboard.diffviewer.prerender import diff_prerenderer
+from reviewboard.reviews.models import (Group,
+                                        Review,
+                                        ReviewRequest,
                                         ReviewRequestDraft)
 from reviewboard.reviews.models.review_request import FileAttachmentState
+from reviewboard.reviews.signals import (reply_published,
+                                         review_published,
+                                         review_request_closed,
+                                         review_request_published,
+                                         review_request_reopened)
+from reviewboard.reviews.updates import publish_review_request_update
+from reviewboard.scmtools.models import Repository
+
+if TYPE_CHECKING:
+    from reviewboard.changedescs.models import ChangeDescription
 
 
 def _on_review_request_draft_deleted(
@@ -117,6 +134,173 @@ def _on_review_request_deleted(
     instance.diffset_history.delete()
 
 
+def _on_review_request_published(
+    sender: type[ReviewRequest],
+    review_request: ReviewRequest,
+    changedesc: (ChangeDescription | None) = None,
+    **kwargs,
+) -> None:
+    """Queue pre-rendering of diffs for a published review request.
+
+    If the publish introduced a new diff, the new diff and the interdiff
+    against the previous diff will be queued for pre-rendering, if enabled.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The sender of the signal.
+
+        review_request (reviewboard.reviews.models.ReviewRequest):
+            The review request that was published.
+
+        changedesc (reviewboard.changedescs.models.ChangeDescription,
+                    optional):
+            The change description for the publish, if any.
+
+        **kwargs (dict, unused):
+            Unused additional keyword arguments.
+    """
+    if (not review_request.diffset_history_id or
+        (changedesc is not None and
+         'diff' not in changedesc.fields_changed)):
+        return
+
+    diffsets = list(
+        DiffSet.objects
+        .filter(history=review_request.diffset_history_id)
+        .select_related('repository')
+        .order_by('-revision')[:2]
+    )
+
+    if diffsets:
+        diff_prerenderer.queue_diffset(diffsets[0])
+
+        if len(diffsets) > 1:
+            diff_prerenderer.queue_diffset(diffsets[1],
+                                           interdiffset=diffsets[0])
+
+
+def _on_review_request_updated(
+    sender: type[ReviewRequest],
+    review_request: ReviewRequest,
+    **kwargs,
+) -> None:
+    """Notify listening clients of a public update to a review request.
+
+    This handles publishing, closing, and reopening review requests.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The sender of the signal.
+
+        review_request (reviewboard.reviews.models.ReviewRequest):
+            The review request that was updated.
+
+        **kwargs (dict, unused):
+            Unused additional keyword arguments.
+    """
+    publish_review_request_update(review_request)
+
+
+def _on_review_published(
+    sender: type[Review],
+    review: (Review | None) = None,
+    reply: (Review | None) = None,
+    **kwargs,
+) -> None:
+    """Notify listening clients of a new review or reply.
+
+    Version Added:
+        9.0
+
+    Args:
+        sender (type, unused):
+            The sender of the signal.
+
+        review (reviewboard.reviews.models.Review, optional):
+            The review that was published, for reviews.
+
+        reply (reviewboard.reviews.models.Review, optional):
+            The reply that was published, for replies.
+
+        **kwargs (dict, unused):
+            Unused additional keyword arguments.
+    """
+    review = review or reply
+    assert review is not None
+
+    publish_review_request_update(review.review_request)
+
+
+def _on_group_saved(
+    instance: Group,
+    created: bool,
+    update_fields: (frozenset[str] | None),
+    using: str,
+    **kwargs,
+) -> None:
+    """Invalidate cached review group ACLs when access may have changed.
+
+    Version Added:
+        9.0
+
+    Args:
+        instance (reviewboard.reviews.models.Group):
+            The review group that was saved.
+
+        created (bool):
+            Whether the review group was created.
+
+        update_fields (frozenset of str):
+            The fields that were specifically updated, if any.
+
+        using (str):
+            The database alias being used.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    if (created or
+        not update_fields or
+        not update_fields.isdisjoint(('invite_only', 'local_site',
+                                      'visible'))):
+        Group.objects.invalidate_acl_cache(using=using)
+
+
+def _on_group_acl_changed(
+    using: str,
+    action: (str | None) = None,
+    **kwargs,
+) -> None:
+    """Invalidate cached ACLs when review group membership changes.
+
+    This handles deleting review groups and changing their members. Both
+    affect access to review groups and to repositories that grant access
+    through review groups.
+
+    Version Added:
+        9.0
+
+    Args:
+        using (str):
+            The database alias being used.
+
+        action (str, optional):
+            The M2M action being performed, for M2M changes.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    if action in (None, 'post_add', 'post_remove', 'post_clear'):
+        Group.objects.invalidate_acl_cache(using=using)
+        Repository.objects.invalidate_acl_cache(using=using)
+
+
 def connect_signal_handlers() -> None:
     """Connect review and review request related signal handlers.
 
@@ -127,3 +311,19 @@ def connect_signal_handlers() -> None:
                        sender=ReviewRequestDraft)
     pre_delete.connect(_on_review_request_deleted,
                        sender=ReviewRequest)
+    review_request_published.connect(_on_review_request_published,
+                                     sender=ReviewRequest)
+
+    for signal in (review_request_published,
+                   review_request_closed,
+                   review_request_reopened):
+        signal.connect(_on_review_request_updated,
+                       sender=ReviewRequest)
+
+    review_published.connect(_on_review_published, sender=Review)
+    reply_published.connect(_on_review_published, sender=Review)
+
+    # Invalidate cached review group ACLs any time access may have changed.
+    post_save.connect(_on_group_saved, sender=Group)
+    post_delete.connect(_on_group_acl_changed, sender=Group)
+    m2m_changed.connect(_on_group_acl_changed, sender=Group.users.through)
@@ -37,6 +37,7 @@ from reviewboard.reviews.models import (BaseComment, Group,
                                         FileAttachmentComment,
                                         GeneralComment)
 from reviewboard.reviews.ui.base import FileAttachmentReviewUI
+from reviewboard.reviews.updates import is_updates_push_enabled
 from reviewboard.site.urlresolvers import local_site_reverse
 
 if TYPE_CHECKING:
@@ -1074,15 +1075,25 @@ def reviewable_page_model_data(
     if file_attachment_comments_data:
         editor_data['fileAttachmentComments'] = file_attachment_comments_data
 
-    # And we're done! Assemble it together and chop off the outer dictionary
-    # so it can be injected correctly.
-    json_items = json_dumps_items({
+    page_data = {
         'checkForUpdates': True,
         'reviewRequestData': review_request_data,
         'extraReviewRequestDraftData': extra_review_request_draft_data,
         'editorData': editor_data,
         'lastActivityTimestamp': context['last_activity_time'],
-    })
+    }
+
+    # If updates are pushed to the page, let it listen for them instead of
+    # polling.
+    if is_updates_push_enabled():
+        page_data['updatesStreamURL'] = local_site_reverse(
+            'review-request-updates-stream',
+            args=[review_request.display_id],
+            request=request)
+
+    # And we're done! Assemble it together and chop off the outer dictionary
+    # so it can be injected correctly.
+    json_items = json_dumps_items(page_data)
     assert isinstance(json_items, SafeString)
 
     return json_items
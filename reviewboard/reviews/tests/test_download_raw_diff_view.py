@@ -110,3 +110,32 @@ class DownloadRawDiffViewTests(TestCase):
 
         response = self.client.get('/r/%d/diff/raw/' % review_request.pk)
         self.assertEqual(response.content, cumulative_diff)
+
+    def test_streaming(self):
+        """Testing DownloadRawDiffView streams the diff one file at a
+        time
+        """
+        review_request = self.create_review_request(create_repository=True,
+                                                    publish=True)
+        diffset = self.create_diffset(review_request=review_request)
+        filediff1 = self.create_filediff(diffset,
+                                         source_file='/test-file-1',
+                                         dest_file='/test-file-1')
+        filediff2 = self.create_filediff(
+            diffset,
+            source_file='/test-file-2',
+            dest_file='/test-file-2',
+            diff=(
+                b'--- test-file-2\n'
+                b'+++ test-file-2\n'
+                b'@@ -1 +1 @@\n'
+                b'-Hello, world!\n'
+                b'+Goodbye, world!\n'
+            ))
+
+        response = self.client.get('/r/%d/diff/raw/' % review_request.pk)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/x-patch')
+        self.assertEqual(list(response.streaming_content),
+                         [filediff1.diff, filediff2.diff])
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 
 from django.contrib.auth.models import AnonymousUser, User
 from django.template import RequestContext
+from django.template.loader import render_to_string
 from django.test.client import RequestFactory
 from django.utils.timezone import now
 from djblets.testing.decorators import add_fixtures
@@ -208,6 +209,29 @@ class BaseReviewRequestPageEntryTests(SpyAgency, TestCase):
         self.assertEqual(logger.exception.spy.calls[0].args[0],
                          'Error rendering template for %s (ID=%s): %s')
 
+    def test_render_to_string_not_cacheable(self):
+        """Testing BaseReviewRequestPageEntry.render_to_string does not
+        cache when render_cacheable is False
+        """
+        entry = BaseReviewRequestPageEntry(data=self.data,
+                                           entry_id='test',
+                                           added_timestamp=None)
+        entry.template_name = 'reviews/entries/base.html'
+
+        self.spy_on(render_to_string)
+
+        self.assertIsNone(entry.get_render_cache_key(request=self.request,
+                                                     entry_is_new=False))
+
+        for i in range(2):
+            entry.render_to_string(
+                self.request,
+                RequestContext(self.request, {
+                    'last_visited': now(),
+                }))
+
+        self.assertSpyCallCount(render_to_string, 2)
+
     def test_is_entry_new_with_timestamp(self):
         """Testing BaseReviewRequestPageEntry.is_entry_new with timestamp"""
         entry = BaseReviewRequestPageEntry(
@@ -1172,7 +1196,7 @@ class InitialStatusUpdatesEntryTests(TestCase):
         self.assertFalse(entry.collapsed)
 
 
-class ReviewEntryTests(TestCase):
+class ReviewEntryTests(SpyAgency, TestCase):
     """Unit tests for ReviewEntry."""
 
     fixtures = ['test_users']
@@ -1558,6 +1582,119 @@ class ReviewEntryTests(TestCase):
             })
 
 
+    def test_render_to_string_with_cache(self):
+        """Testing ReviewEntry.render_to_string caches rendered HTML"""
+        self.spy_on(render_to_string)
+
+        html1 = self._render_entry()
+        html2 = self._render_entry()
+
+        self.assertNotEqual(html1, '')
+        self.assertEqual(html1, html2)
+        self.assertSpyCallCount(render_to_string, 1)
+
+    def test_render_to_string_with_cache_and_new_reply(self):
+        """Testing ReviewEntry.render_to_string re-renders after a new
+        reply
+        """
+        comment = self.create_general_comment(self.review)
+
+        self.spy_on(render_to_string)
+
+        self._render_entry()
+
+        reply = self.create_reply(self.review)
+        self.create_general_comment(reply, reply_to=comment)
+        reply.publish()
+
+        self._render_entry()
+
+        self.assertSpyCallCount(render_to_string, 2)
+
+    def test_render_to_string_with_cache_and_issue_status(self):
+        """Testing ReviewEntry.render_to_string re-renders after an issue
+        status change
+        """
+        comment = self.create_general_comment(self.review,
+                                              issue_opened=True)
+
+        self.spy_on(render_to_string)
+
+        self._render_entry()
+
+        comment.issue_status = BaseComment.RESOLVED
+        comment.save()
+
+        self._render_entry()
+
+        self.assertSpyCallCount(render_to_string, 2)
+
+    def test_get_render_cache_key(self):
+        """Testing ReviewEntry.get_render_cache_key varies by user and
+        new state
+        """
+        self.data.query_data_pre_etag()
+        self.data.query_data_post_etag()
+
+        entry = ReviewEntry(data=self.data,
+                            review=self.review)
+        key = entry.get_render_cache_key(request=self.request,
+                                         entry_is_new=False)
+
+        self.assertIsNotNone(key)
+        self.assertTrue(key.startswith(
+            f'review-request-page-entry-{self.review_request.pk}-review-'
+            f'{self.review.pk}-'))
+        self.assertEqual(
+            key,
+            entry.get_render_cache_key(request=self.request,
+                                       entry_is_new=False))
+        self.assertNotEqual(
+            key,
+            entry.get_render_cache_key(request=self.request,
+                                       entry_is_new=True))
+
+        request = RequestFactory().get('/r/1/')
+        request.user = User.objects.get(username='doc')
+
+        self.assertNotEqual(
+            key,
+            entry.get_render_cache_key(request=request,
+                                       entry_is_new=False))
+
+    def test_get_render_cache_key_with_stub(self):
+        """Testing ReviewEntry.get_render_cache_key with stub entry"""
+        entry = ReviewEntry(data=self.data,
+                            review=self.review,
+                            stub=True)
+
+        self.assertIsNone(entry.get_render_cache_key(request=self.request,
+                                                     entry_is_new=False))
+
+    def _render_entry(self) -> str:
+        """Render the entry for the review using freshly-queried data.
+
+        Returns:
+            str:
+            The rendered HTML.
+        """
+        data = ReviewRequestPageData(review_request=self.review_request,
+                                     request=self.request)
+        data.query_data_pre_etag()
+        data.query_data_post_etag()
+
+        entry = ReviewEntry(data=data,
+                            review=self.review)
+
+        for comment in data.review_comments.get(self.review.pk, []):
+            entry.add_comment(comment._type, comment)
+
+        return entry.render_to_string(
+            self.request,
+            RequestContext(self.request, {
+                'last_visited': now(),
+            }))
+
 class ChangeEntryTests(TestCase):
     """Unit tests for ChangeEntry."""
 
@@ -0,0 +1,162 @@
+"""Unit tests for the index management command."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from haystack import connections as haystack_connections
+from haystack.constants import DEFAULT_ALIAS
+from haystack.query import SearchQuerySet
+
+from reviewboard.reviews.models import ReviewRequest
+from reviewboard.search.testing import search_enabled
+from reviewboard.testing import TestCase
+
+
+class IndexCommandTests(TestCase):
+    """Unit tests for the index management command."""
+
+    fixtures = ['test_users']
+
+    def setUp(self) -> None:
+        """Set up a test case."""
+        super().setUp()
+
+        self.checkpoint_file = os.path.join(tempfile.mkdtemp(),
+                                            'checkpoint.json')
+
+    def test_full(self) -> None:
+        """Testing index --full"""
+        for i in range(3):
+            self.create_review_request(summary='Test %s' % i,
+                                       publish=True)
+
+        with search_enabled():
+            stdout = self._run_command('--full', '--batch-size=2')
+
+            self.assertEqual(
+                SearchQuerySet().models(ReviewRequest).count(),
+                3)
+
+        self.assertIn('reviews.reviewrequest: 3 of 3 indexed', stdout)
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+
+    def test_resume(self) -> None:
+        """Testing index --resume skips completed ranges"""
+        review_requests = [
+            self.create_review_request(summary='Test %s' % i,
+                                       publish=True)
+            for i in range(4)
+        ]
+
+        with search_enabled():
+            backend = haystack_connections[DEFAULT_ALIAS].get_backend()
+            backend.clear()
+
+            with open(self.checkpoint_file, 'w') as fp:
+                json.dump(
+                    {
+                        'completed': {
+                            'reviews.reviewrequest': [review_requests[0].pk],
+                        },
+                        'run_info': {
+                            'batch_size': 2,
+                            'rebuild': True,
+                            'since': None,
+                        },
+                        'version': 1,
+                    },
+                    fp)
+
+            stdout = self._run_command('--full', '--batch-size=2',
+                                       '--resume')
+
+            self.assertEqual(
+                sorted(
+                    int(result.pk)
+                    for result in SearchQuerySet().models(ReviewRequest)
+                ),
+                [review_request.pk for review_request in review_requests[2:]])
+
+        self.assertIn('reviews.reviewrequest: 2 of 4 indexed', stdout)
+
+    def test_resume_with_different_options(self) -> None:
+        """Testing index --resume with options that don't match the
+        checkpoint
+        """
+        with open(self.checkpoint_file, 'w') as fp:
+            json.dump(
+                {
+                    'completed': {},
+                    'run_info': {
+                        'batch_size': 100,
+                        'rebuild': True,
+                        'since': None,
+                    },
+                    'version': 1,
+                },
+                fp)
+
+        with search_enabled():
+            with self.assertRaisesMessage(CommandError, 'different options'):
+                self._run_command('--full', '--batch-size=2', '--resume')
+
+    def test_since(self) -> None:
+        """Testing index --since"""
+        old_review_request = self.create_review_request(summary='Old',
+                                                        publish=True)
+        self.create_review_request(summary='New',
+                                   publish=True)
+
+        ReviewRequest.objects.filter(pk=old_review_request.pk).update(
+            last_updated=datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+        with search_enabled():
+            backend = haystack_connections[DEFAULT_ALIAS].get_backend()
+            backend.clear()
+
+            stdout = self._run_command('--since=2024-01-01')
+
+            self.assertEqual(
+                [
+                    result.summary
+                    for result in SearchQuerySet().models(ReviewRequest)
+                ],
+                ['New'])
+
+        self.assertIn('reviews.reviewrequest: 1 of 1 indexed', stdout)
+
+    def test_workers_with_whoosh(self) -> None:
+        """Testing index --workers with the Whoosh backend"""
+        with search_enabled():
+            with self.assertRaisesMessage(CommandError,
+                                          'does not support multiple'):
+                self._run_command('--workers=2')
+
+    def _run_command(
+        self,
+        *args,
+    ) -> str:
+        """Run the index command.
+
+        Args:
+            *args (tuple):
+                Arguments to pass to the command.
+
+        Returns:
+            str:
+            The output of the command.
+        """
+        stdout = StringIO()
+        call_command('index',
+                     '--checkpoint-file=%s' % self.checkpoint_file,
+                     *args,
+                     stdout=stdout)
+
+        return stdout.getvalue()
@@ -3,17 +3,24 @@ from __future__ import annotations
 import io
 
 import kgb
+import pymdownx
 from django.contrib.auth.models import User
 from django.test.utils import override_settings
 from django.utils.safestring import SafeString
-from markdown import __version_info__ as markdown_version_info
+from djblets import get_package_version as get_djblets_version
+from markdown import (__version__ as markdown_version,
+                      __version_info__ as markdown_version_info)
 
 from reviewboard.accounts.models import Profile
-from reviewboard.reviews.markdown_utils import (clean_markdown_html,
-                                                markdown_render_conditional,
-                                                normalize_text_for_edit,
-                                                render_markdown,
-                                                render_markdown_from_file)
+from reviewboard.reviews.markdown_utils import (
+    clean_markdown_html,
+    get_cached_rendered_markdown,
+    make_markdown_render_cache_key,
+    markdown_render_conditional,
+    normalize_text_for_edit,
+    render_markdown,
+    render_markdown_from_file,
+)
 from reviewboard.testing import TestCase
 
 
@@ -353,6 +360,80 @@ class MarkdownUtilsTests(kgb.SpyAgency, TestCase):
             render_markdown('~~strike~~'),
             '<p><del>strike</del></p>')
 
+    def test_render_markdown_with_cache(self):
+        """Testing render_markdown caches rendered results"""
+        self.spy_on(clean_markdown_html)
+
+        for i in range(2):
+            self.assertEqual(render_markdown('**foo**'),
+                             '<p><strong>foo</strong></p>')
+
+        self.assertSpyCallCount(clean_markdown_html, 1)
+
+        self.assertEqual(render_markdown(b'**foo**'),
+                         '<p><strong>foo</strong></p>')
+        self.assertEqual(render_markdown('**bar**'),
+                         '<p><strong>bar</strong></p>')
+        self.assertSpyCallCount(clean_markdown_html, 2)
+
+    def test_render_markdown_with_cache_and_setting(self):
+        """Testing render_markdown cache with changes to
+        settings.ALLOWED_MARKDOWN_URL_PROTOCOLS
+        """
+        text = '[my link](custom://example.com)'
+
+        self.assertEqual(render_markdown(text),
+                         '<p><a>my link</a></p>')
+
+        with override_settings(ALLOWED_MARKDOWN_URL_PROTOCOLS=['custom']):
+            self.assertEqual(
+                render_markdown(text),
+                '<p><a href="custom://example.com">my link</a></p>')
+
+    def test_get_cached_rendered_markdown_with_exception(self):
+        """Testing get_cached_rendered_markdown does not cache exceptions
+        """
+        def _render(text: str) -> str:
+            raise ValueError('Oh no')
+
+        with self.assertRaises(ValueError):
+            get_cached_rendered_markdown('**foo**',
+                                         renderer_id='test',
+                                         render_func=_render)
+
+        self.assertEqual(
+            get_cached_rendered_markdown('**foo**',
+                                         renderer_id='test',
+                                         render_func=lambda text: 'foo'),
+            'foo')
+
+    def test_make_markdown_render_cache_key(self):
+        """Testing make_markdown_render_cache_key varies by text and
+        renderer
+        """
+        key = make_markdown_render_cache_key('**foo**',
+                                             renderer_id='test')
+
+        self.assertNotEqual(
+            key,
+            make_markdown_render_cache_key('**bar**',
+                                           renderer_id='test'))
+        self.assertNotEqual(
+            key,
+            make_markdown_render_cache_key('**foo**',
+                                           renderer_id='test2'))
+
+    def test_make_markdown_render_cache_key_with_versions(self):
+        """Testing make_markdown_render_cache_key includes the versions of
+        the rendering libraries
+        """
+        key = make_markdown_render_cache_key('**foo**',
+                                             renderer_id='test')
+
+        self.assertIn('-%s-' % get_djblets_version(), key)
+        self.assertIn('-%s-' % markdown_version, key)
+        self.assertIn('-%s-' % pymdownx.__version__, key)
+
     def test_normalize_text_for_edit_rich_text_default_rich_text(self):
         """Testing normalize_text_for_edit with rich text and
         user defaults to rich text
@@ -0,0 +1,42 @@
+"""Unit tests for the rebuild-review-request-summaries management command."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from reviewboard.accounts.models import (ReviewRequestUserSummary,
+                                         ReviewRequestVisit)
+from reviewboard.testing import TestCase
+
+
+class RebuildReviewRequestSummariesCommandTests(TestCase):
+    """Unit tests for the rebuild-review-request-summaries command."""
+
+    fixtures = ['test_users']
+
+    def test_all(self) -> None:
+        """Testing rebuild-review-request-summaries --all"""
+        review_request1 = self.create_review_request(publish=True)
+        review_request2 = self.create_review_request(publish=True)
+        self.create_visit(review_request1, ReviewRequestVisit.VISIBLE)
+        self.create_review(review_request2, publish=True)
+
+        ReviewRequestUserSummary.objects.all().delete()
+
+        stdout = StringIO()
+        call_command('rebuild-review-request-summaries', '--all',
+                     stdout=stdout)
+
+        self.assertIn('Rebuilt 2 summaries for 2 review request(s).',
+                      stdout.getvalue())
+        self.assertEqual(ReviewRequestUserSummary.objects.count(), 2)
+
+    def test_without_review_requests(self) -> None:
+        """Testing rebuild-review-request-summaries without review request
+        IDs or --all
+        """
+        with self.assertRaises(CommandError):
+            call_command('rebuild-review-request-summaries')
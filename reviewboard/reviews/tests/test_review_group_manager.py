@@ -914,6 +914,47 @@ class AccessibleIDsTests(AccessibleTestsMixin, TestCase):
             group.pk,
             Group.objects.accessible_ids(user, local_site=LocalSite.ALL))
 
+    def test_caching(self) -> None:
+        """Testing Group.objects.accessible_ids caches results"""
+        user = self.create_user()
+        group = self.create_review_group(invite_only=True)
+        group.users.add(user)
+
+        accessible_ids = Group.objects.accessible_ids(user)
+        self.assertEqual(accessible_ids, [group.pk])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(Group.objects.accessible_ids(user),
+                             accessible_ids)
+
+    def test_caching_with_membership_changed(self) -> None:
+        """Testing Group.objects.accessible_ids invalidates cache when
+        membership changes
+        """
+        user = self.create_user()
+        group = self.create_review_group(invite_only=True)
+
+        self.assertEqual(Group.objects.accessible_ids(user), [])
+
+        group.users.add(user)
+        self.assertEqual(Group.objects.accessible_ids(user), [group.pk])
+
+        user.review_groups.clear()
+        self.assertEqual(Group.objects.accessible_ids(user), [])
+
+    def test_caching_with_invite_only_changed(self) -> None:
+        """Testing Group.objects.accessible_ids invalidates cache when
+        invite-only state changes
+        """
+        user = self.create_user()
+        group = self.create_review_group(invite_only=False)
+
+        self.assertEqual(Group.objects.accessible_ids(user), [group.pk])
+
+        group.invite_only = True
+        group.save(update_fields=('invite_only',))
+        self.assertEqual(Group.objects.accessible_ids(user), [])
+
     def _test_accessible_ids(
         self,
         *,
@@ -1703,21 +1703,162 @@ class ReviewRequestPageDataTests(TestCase):
                     entry.render_to_string(request=request,
                                            context=context)
 
+    def test_with_max_loaded_reviews(self) -> None:
+        """Testing ReviewRequestPageData with max_loaded_reviews loads
+        recent reviews and reviews with open issues
+        """
+        reviews = self._create_windowed_reviews()
+
+        data = self._build_data(max_loaded_reviews=2)
+        data.query_data_pre_etag()
+
+        # The oldest review has an open issue, and the second-oldest review
+        # has the latest reply.
+        self.assertEqual(
+            {
+                review.pk
+                for review in data.reviews
+                if not review.is_reply()
+            },
+            {reviews[0].pk, reviews[1].pk, reviews[3].pk})
+        self.assertEqual(data.review_count, 5)
+        self.assertEqual(data.latest_review_timestamp,
+                         reviews[1].timestamp + timedelta(days=10))
+
+        data.query_data_post_etag()
+
+        self.assertEqual(data.stub_reviews, [reviews[2]])
+        self.assertEqual(data.issue_counts['total'], 2)
+        self.assertEqual(data.issue_counts['open'], 1)
+        self.assertEqual(data.issue_counts['resolved'], 1)
+
+        entries = data.get_entries()['main']
+        self.assertEqual(len(entries), 4)
+
+        for entry, review in zip(entries, reviews):
+            assert isinstance(entry, ReviewEntry)
+            self.assertEqual(entry.review, review)
+            self.assertEqual(entry.stub, review == reviews[2])
+            self.assertEqual(entry.collapsed, review == reviews[2])
+
+    def test_with_max_loaded_reviews_not_exceeded(self) -> None:
+        """Testing ReviewRequestPageData with max_loaded_reviews and fewer
+        reviews than the maximum
+        """
+        reviews = self._create_windowed_reviews()
+
+        data = self._build_data(max_loaded_reviews=4)
+        data.query_data_pre_etag()
+        data.query_data_post_etag()
+
+        self.assertEqual(
+            {
+                review.pk
+                for review in data.reviews
+                if not review.is_reply()
+            },
+            {review.pk for review in reviews})
+        self.assertEqual(data.stub_reviews, [])
+        self.assertEqual(data.review_count, 5)
+
+    def test_with_review_ids(self) -> None:
+        """Testing ReviewRequestPageData with review_ids loads only those
+        reviews
+        """
+        reviews = self._create_windowed_reviews()
+
+        data = self._build_data(entry_classes=[ReviewEntry],
+                                review_ids=[reviews[2].pk])
+        data.query_data_pre_etag()
+        data.query_data_post_etag()
+
+        self.assertEqual(data.reviews, [reviews[2]])
+        self.assertEqual(data.stub_reviews, [])
+
+        # Issues are still loaded from all reviews.
+        self.assertEqual(data.issue_counts['total'], 2)
+
+        entries = data.get_entries()['main']
+        self.assertEqual(len(entries), 1)
+
+        entry = entries[0]
+        assert isinstance(entry, ReviewEntry)
+        self.assertEqual(entry.review, reviews[2])
+        self.assertFalse(entry.stub)
+
+    def _create_windowed_reviews(self) -> list[Review]:
+        """Create reviews for testing windowed loading.
+
+        This will create 4 published reviews, a day apart, with:
+
+        1. An open issue.
+        2. A reply 10 days later.
+        3. A resolved issue.
+        4. No comments.
+
+        Version Added:
+            9.0
+
+        Returns:
+            list of reviewboard.reviews.models.Review:
+            The created reviews, in order.
+        """
+        review_request = self.create_review_request(publish=True)
+        timestamp = datetime(2025, 1, 1, tzinfo=tz.utc)
+        reviews: list[Review] = []
+
+        for i in range(4):
+            review = self.create_review(review_request)
+
+            if i == 0:
+                self.create_general_comment(review,
+                                            issue_opened=True)
+            elif i == 2:
+                self.create_general_comment(
+                    review,
+                    issue_opened=True,
+                    issue_status=BaseComment.RESOLVED)
+
+            review.publish()
+
+            review.timestamp = timestamp + timedelta(days=i)
+            Review.objects.filter(pk=review.pk).update(
+                timestamp=review.timestamp)
+
+            reviews.append(review)
+
+        self.create_reply(reviews[1],
+                          timestamp=timestamp + timedelta(days=11),
+                          publish=True)
+
+        # Reload the review request to pick up the new issue counts.
+        self.review_request = ReviewRequest.objects.get(pk=review_request.pk)
+
+        return reviews
+
     def _build_data(
         self,
         entry_classes: (
             Sequence[type[BaseReviewRequestPageEntry]] | None
         ) = None,
+        **kwargs,
     ) -> ReviewRequestPageData:
         """Build the data to test against.
 
         This will build the page data to test against. It must be run
         after populating review request data.
 
+        Version Changed:
+            9.0:
+            Added ``**kwargs``.
+
         Args:
             entry_classes (list of type, optional):
                 The list of entry classes available for the page data.
 
+            **kwargs (dict):
+                Additional keyword arguments for the page data.
+
         Returns:
             reviewboard.reviews.detail.ReviewRequestPageData:
             The resulting page data.
@@ -1727,7 +1868,8 @@ class ReviewRequestPageDataTests(TestCase):
 
         return ReviewRequestPageData(review_request=self.review_request,
                                      request=request,
-                                     entry_classes=entry_classes)
+                                     entry_classes=entry_classes,
+                                     **kwargs)
 
     def _test_query_data_pre_etag_with(
         self,
@@ -0,0 +1,187 @@
+"""Unit tests for ReviewRequestUpdatesStreamView."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from reviewboard.notifications.pubsub import (get_pubsub_broker,
+                                              reset_pubsub_broker)
+from reviewboard.reviews.updates import get_updates_channel
+from reviewboard.testing import TestCase
+
+
+@override_settings(PUBSUB_BROKER={
+    'BACKEND': 'reviewboard.notifications.pubsub.LocalPubSubBroker',
+    'OPTIONS': {
+        'single_process': True,
+    },
+})
+class ReviewRequestUpdatesStreamViewTests(TestCase):
+    """Unit tests for ReviewRequestUpdatesStreamView."""
+
+    fixtures = ['test_users']
+
+    def setUp(self) -> None:
+        """Set up a test case."""
+        super().setUp()
+
+        reset_pubsub_broker()
+        self.addCleanup(reset_pubsub_broker)
+
+        self.review_request = self.create_review_request(
+            publish=True,
+            last_updated=datetime(2024, 5, 1, 10, 0, 0, tzinfo=timezone.utc))
+        self.url = reverse('review-request-updates-stream',
+                           args=[self.review_request.display_id])
+
+    def test_get_with_push_disabled(self) -> None:
+        """Testing ReviewRequestUpdatesStreamView GET with
+        updates_push_enabled=False
+        """
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_with_process_local_broker(self) -> None:
+        """Testing ReviewRequestUpdatesStreamView GET with a broker that
+        doesn't deliver to all processes
+        """
+        reset_pubsub_broker()
+
+        local_broker = {
+            'BACKEND': 'reviewboard.notifications.pubsub.LocalPubSubBroker',
+        }
+
+        with self.settings(PUBSUB_BROKER=local_broker):
+            with self.siteconfig_settings({'updates_push_enabled': True}):
+                response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_get(self) -> None:
+        """Testing ReviewRequestUpdatesStreamView GET"""
+        channel = get_updates_channel(self.review_request.pk)
+
+        with self.siteconfig_settings({'updates_push_enabled': True}):
+            response = self.client.get(self.url)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            self.assertEqual(response['Cache-Control'], 'no-cache')
+
+            stream = iter(response.streaming_content)
+
+            try:
+                self.assertEqual(next(stream), b'retry: 5000\n\n')
+                self.assertEqual(
+                    self._parse_event(next(stream)),
+                    {
+                        'summary': 'Review request updated',
+                        'timestamp': '2024-05-01T10:00:00Z',
+                        'type': 'review-request',
+                        'user': {
+                            'username': 'doc',
+                        },
+                    })
+
+                review = self.create_review(self.review_request)
+
+                with self.captureOnCommitCallbacks(execute=True):
+                    review.publish()
+
+                event = self._parse_event(next(stream))
+                self.assertEqual(event['summary'], 'New review')
+                self.assertEqual(event['type'], 'review')
+                self.assertEqual(event['user']['username'], 'dopey')
+            finally:
+                response.close()
+
+        # Closing the response must remove the subscription.
+        self.assertNotIn(channel, get_pubsub_broker()._subscriptions)
+
+    def test_get_with_heartbeat(self) -> None:
+        """Testing ReviewRequestUpdatesStreamView GET sends keep-alives and
+        ends after the maximum duration
+        """
+        with self.siteconfig_settings({
+            'updates_push_enabled': True,
+            'updates_push_heartbeat_interval': 1,
+            'updates_push_max_duration': 1,
+        }):
+            response = self.client.get(self.url)
+
+            chunks = list(response.streaming_content)
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[2], b': keep-alive\n\n')
+
+    def test_get_with_max_streams(self) -> None:
+        """Testing ReviewRequestUpdatesStreamView GET with the maximum
+        number of streams already open
+        """
+        with self.siteconfig_settings({
+            'updates_push_enabled': True,
+            'updates_push_max_streams': 1,
+        }):
+            response1 = self.client.get(self.url)
+            self.assertEqual(response1.status_code, 200)
+
+            stream = iter(response1.streaming_content)
+            self.assertEqual(next(stream), b'retry: 5000\n\n')
+
+            try:
+                response2 = self.client.get(self.url)
+
+                self.assertEqual(response2.status_code, 204)
+                self.assertEqual(response2.content, b'')
+            finally:
+                response1.close()
+
+            # Closing the first stream frees its slot.
+            response3 = self.client.get(self.url)
+
+            try:
+                self.assertEqual(response3.status_code, 200)
+            finally:
+                response3.close()
+
+    def test_get_with_no_access(self) -> None:
+        """Testing ReviewRequestUpdatesStreamView GET without access to the
+        review request
+        """
+        self.review_request.target_people.clear()
+        self.review_request.repository = self.create_repository(public=False)
+        self.review_request.save()
+
+        self.client.login(username='grumpy', password='grumpy')
+
+        with self.siteconfig_settings({'updates_push_enabled': True}):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def _parse_event(
+        self,
+        chunk: bytes,
+    ) -> dict:
+        """Return the data from an update event in the stream.
+
+        Args:
+            chunk (bytes):
+                The chunk containing the event.
+
+        Returns:
+            dict:
+            The deserialized event data.
+        """
+        event_line, data_line, *rest = chunk.decode('utf-8').split('\n')
+
+        self.assertEqual(event_line, 'event: update')
+        self.assertTrue(data_line.startswith('data: '))
+        self.assertEqual(rest, ['', ''])
+
+        return json.loads(data_line[len('data: '):])
@@ -19,6 +19,10 @@ from reviewboard.attachments.models import FileAttachment
 from reviewboard.diffviewer.chunk_generator import (NoWrapperHtmlFormatter,
                                                     RawDiffChunkGenerator)
 from reviewboard.diffviewer.diffutils import get_chunks_in_range
+from reviewboard.diffviewer.highlight_cache import (
+    get_highlighted_lines,
+    get_pygments_highlighter_id,
+)
 from reviewboard.diffviewer.settings import DiffSettings
 from reviewboard.reviews.models import FileAttachmentComment
 from reviewboard.reviews.ui.base import (ReviewUI,
@@ -237,6 +241,11 @@ class TextBasedReviewUI(ReviewUI[
         highlighting that's appropriate. The contents will be split into
         reviewable lines and will be cached for future renders.
 
+        Version Changed:
+            9.0:
+            Highlighted lines are now cached by content, and shared across
+            attachments with the same content.
+
         Returns:
             list of str:
             The syntax-highlighted text, split into lines.
@@ -246,7 +255,12 @@ class TextBasedReviewUI(ReviewUI[
         data = self.get_text()
 
         lexer = self.get_source_lexer(self.obj.filename, data)
-        lines = highlight(data, lexer, NoWrapperHtmlFormatter()).splitlines()
+        lines = get_highlighted_lines(
+            content=data,
+            highlighter_id=get_pygments_highlighter_id(lexer, 'textui'),
+            highlight_func=lambda: highlight(
+                data, lexer, NoWrapperHtmlFormatter()).splitlines())
+        assert lines is not None
 
         return [
             '<pre>%s</pre>' % line
@@ -0,0 +1,289 @@
+"""Real-time notifications of updates to review requests.
+
+When enabled through the ``updates_push_enabled`` site configuration
+setting, public activity on a review request (publishing, closing,
+reopening, reviews, and replies) is published to the configured
+:py:mod:`pub/sub broker <reviewboard.notifications.pubsub>`. Review request
+pages listening on
+:py:class:`~reviewboard.reviews.views.ReviewRequestUpdatesStreamView`
+are notified right away, rather than having to poll the
+``last_update`` API for changes.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.utils.translation import gettext as _
+from djblets.siteconfig.models import SiteConfiguration
+from djblets.util.serializers import DjbletsJSONEncoder
+from typing_extensions import TypedDict
+
+from reviewboard.diffviewer.models import DiffSet
+from reviewboard.notifications.pubsub import get_pubsub_broker
+from reviewboard.reviews.models import Review, ReviewRequest
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django.contrib.auth.models import User
+
+    from reviewboard.reviews.models.review_request import LastActivityInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+#: Whether a warning about an unsupported broker has been logged.
+_warned_broker_unsupported = False
+
+
+class LastUpdateInfo(TypedDict):
+    """Information on the last update made to a review request.
+
+    Version Added:
+        9.0
+    """
+
+    #: A short, localized summary of the update.
+    #:
+    #: Type:
+    #:     str
+    summary: str
+
+    #: The timestamp of the update.
+    #:
+    #: Type:
+    #:     datetime.datetime
+    timestamp: datetime
+
+    #: The type of the update.
+    #:
+    #: This is one of ``review-request``, ``diff``, ``reply``, or ``review``.
+    #:
+    #: Type:
+    #:     str
+    type: str
+
+    #: The user who made the update.
+    #:
+    #: Type:
+    #:     django.contrib.auth.models.User
+    user: User
+
+
+def get_last_update_info(
+    review_request: ReviewRequest,
+    activity_info: (LastActivityInfo | None) = None,
+) -> LastUpdateInfo:
+    """Return information on the last update made to a review request.
+
+    Only public updates are taken into account.
+
+    Version Added:
+        9.0
+
+    Args:
+        review_request (reviewboard.reviews.models.ReviewRequest):
+            The review request.
+
+        activity_info (dict, optional):
+            The result of
+            :py:meth:`ReviewRequest.get_last_activity_info()
+            <reviewboard.reviews.models.ReviewRequest.get_last_activity_info>`,
+            if already computed.
+
+    Returns:
+        LastUpdateInfo:
+        Information on the last update.
+    """
+    if activity_info is None:
+        activity_info = review_request.get_last_activity_info()
+
+    updated_object = activity_info['updated_object']
+    changedesc = activity_info['changedesc']
+    user = None
+
+    if isinstance(updated_object, ReviewRequest):
+        if updated_object.status == ReviewRequest.SUBMITTED:
+            summary = _('Review request completed')
+        elif updated_object.status == ReviewRequest.DISCARDED:
+            summary = _('Review request discarded')
+        else:
+            summary = _('Review request updated')
+
+        update_type = 'review-request'
+    elif isinstance(updated_object, DiffSet):
+        summary = _('Diff updated')
+        update_type = 'diff'
+    elif isinstance(updated_object, Review):
+        if updated_object.is_reply():
+            summary = _('New reply')
+            update_type = 'reply'
+        else:
+            summary = _('New review')
+            update_type = 'review'
+
+        user = updated_object.user
+    else:
+        # Should never be able to happen. The object will always at least
+        # be a ReviewRequest.
+        assert False
+
+    if changedesc:
+        user = changedesc.get_user(review_request)
+    elif user is None:
+        # There is no changedesc which means this review request hasn't
+        # been changed since it was first published, so this change must
+        # be due to the original submitter.
+        user = review_request.submitter
+
+    return {
+        'summary': summary,
+        'timestamp': activity_info['timestamp'],
+        'type': update_type,
+        'user': user,
+    }
+
+
+def serialize_last_update_info(
+    info: LastUpdateInfo,
+) -> str:
+    """Serialize last update information for sending to clients.
+
+    The result matches the format of the ``last_update`` API resource, so
+    clients can handle both the same way.
+
+    The same payload is sent to every subscriber, including anonymous users,
+    so only the username is included for the user. Full names may be
+    private, and are only shown through the API to users allowed to see
+    them.
+
+    Version Added:
+        9.0
+
+    Args:
+        info (LastUpdateInfo):
+            The information to serialize.
+
+    Returns:
+        str:
+        The JSON-serialized information.
+    """
+    user = info['user']
+
+    return json.dumps(
+        {
+            'summary': info['summary'],
+            'timestamp': info['timestamp'],
+            'type': info['type'],
+            'user': {
+                'username': user.username,
+            },
+        },
+        cls=DjbletsJSONEncoder)
+
+
+def get_updates_channel(
+    review_request_id: int,
+) -> str:
+    """Return the pub/sub channel for updates to a review request.
+
+    Version Added:
+        9.0
+
+    Args:
+        review_request_id (int):
+            The database ID of the review request.
+
+    Returns:
+        str:
+        The name of the channel.
+    """
+    return 'review-request-updates:%s' % review_request_id
+
+
+def is_updates_push_enabled() -> bool:
+    """Return whether review request updates are pushed to clients.
+
+    This requires the ``updates_push_enabled`` site configuration setting,
+    and a pub/sub broker that delivers to every web server process.
+    Otherwise, clients connected to another process would silently miss
+    updates, so they're left to poll instead.
+
+    Version Added:
+        9.0
+
+    Returns:
+        bool:
+        ``True`` if updates are pushed.
+    """
+    global _warned_broker_unsupported
+
+    siteconfig = SiteConfiguration.objects.get_current()
+
+    if not siteconfig.get('updates_push_enabled'):
+        return False
+
+    broker = get_pubsub_broker()
+
+    if not broker.delivers_to_all_processes:
+        if not _warned_broker_unsupported:
+            logger.warning(
+                'Review request updates will not be pushed to clients, '
+                'because the %s pub/sub broker does not deliver messages '
+                'to all web server processes. Configure a shared broker '
+                'in the PUBSUB_BROKER setting.',
+                type(broker).__name__)
+            _warned_broker_unsupported = True
+
+        return False
+
+    return True
+
+
+def publish_review_request_update(
+    review_request: ReviewRequest,
+) -> None:
+    """Notify listening clients of an update to a review request.
+
+    The notification will be published once the current transaction (if
+    any) commits, so that clients fetching the update will see it.
+
+    Version Added:
+        9.0
+
+    Args:
+        review_request (reviewboard.reviews.models.ReviewRequest):
+            The review request that was updated.
+    """
+    if not is_updates_push_enabled():
+        return
+
+    review_request_id = review_request.pk
+
+    def _publish() -> None:
+        try:
+            # Fetch a fresh copy, so that the latest state is reported no
+            # matter which instance triggered the update.
+            review_request = (
+                ReviewRequest.objects
+                .select_related('submitter')
+                .get(pk=review_request_id)
+            )
+            get_pubsub_broker().publish(
+                get_updates_channel(review_request_id),
+                serialize_last_update_info(
+                    get_last_update_info(review_request)))
+        except Exception as e:
+            logger.exception('Unable to publish updates for review request '
+                             '%s: %s',
+                             review_request_id, e)
+
+    transaction.on_commit(_publish)
@@ -103,6 +103,10 @@ review_request_urls = [
          views.ReviewRequestUpdatesView.as_view(),
          name='review-request-updates'),
 
+    path('_updates/stream/',
+         views.ReviewRequestUpdatesStreamView.as_view(),
+         name='review-request-updates-stream'),
+
     # Review request diffs
     path('diff/', include(diffviewer_urls)),
 
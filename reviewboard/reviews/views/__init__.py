@@ -30,6 +30,8 @@ from reviewboard.reviews.views.review_request_infobox import \
     ReviewRequestInfoboxView
 from reviewboard.reviews.views.review_request_updates import \
     ReviewRequestUpdatesView
+from reviewboard.reviews.views.review_request_updates_stream import \
+    ReviewRequestUpdatesStreamView
 from reviewboard.reviews.views.root import RootView
 
 
@@ -49,6 +51,7 @@ __all__ = [
     'ReviewFileAttachmentView',
     'ReviewRequestDetailView',
     'ReviewRequestInfoboxView',
+    'ReviewRequestUpdatesStreamView',
     'ReviewRequestUpdatesView',
     'ReviewRequestViewMixin',
     'ReviewScreenshotView',
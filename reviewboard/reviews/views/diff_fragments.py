@@ -1022,20 +1022,21 @@ class ReviewsDiffFragmentView(ReviewRequestViewMixin, DiffFragmentView):
                 path=filediff.source_file,
                 revision=filediff.source_revision,
                 context=context)
-            attachment_extra_data = {
-                'sha256_checksum': get_sha256(file_contents),
-            }
+            checksum = get_sha256(file_contents)
 
             with ContentFile(file_contents) as file_obj:
                 attachment = FileAttachment.objects.create_from_filediff(
-                    extra_data=attachment_extra_data,
+                    extra_data={
+                        'sha256_checksum': checksum,
+                    },
                     filediff=filediff,
                     from_modified=False,
                     mimetype=guess_mimetype(file_obj))
 
-                attachment.file.save(
-                    os.path.basename(filediff.source_file),
-                    file_obj)
+                attachment.save_file(
+                    filename=os.path.basename(filediff.source_file),
+                    content=file_obj,
+                    checksum=checksum)
 
             logger.debug('Creating new file attachment for binary file %s '
                          '(%s) in repository %s',
@@ -14,6 +14,7 @@ from reviewboard.diffviewer.diffutils import (convert_to_unicode,
                                               get_original_file,
                                               get_patched_file)
 from reviewboard.diffviewer.errors import PatchError
+from reviewboard.diffviewer.responses import RawDiffResponse
 from reviewboard.diffviewer.views import DownloadPatchErrorBundleView
 from reviewboard.reviews.views.diff_fragments import ReviewsDiffFragmentView
 from reviewboard.reviews.views.mixins import ReviewRequestViewMixin
@@ -114,10 +115,10 @@ class DownloadRawDiffView(ReviewRequestViewMixin, View):
         revision: (int | None) = None,
         *args,
         **kwargs,
-    ) -> HttpResponse:
+    ) -> RawDiffResponse:
         """Handle HTTP GET requests for this view.
 
-        This will generate the raw diff file and send it to the client.
+        This will generate the raw diff file and stream it to the client.
 
         Args:
             request (django.http.HttpRequest):
@@ -134,7 +135,7 @@ class DownloadRawDiffView(ReviewRequestViewMixin, View):
                 Keyword arguments passed to the handler.
 
         Returns:
-            django.http.HttpResponse:
+            reviewboard.diffviewer.responses.RawDiffResponse:
             The HTTP response to send to the client.
         """
         review_request = self.review_request
@@ -143,9 +144,8 @@ class DownloadRawDiffView(ReviewRequestViewMixin, View):
         diffset = self.get_diff(revision, draft)
 
         tool = review_request.repository.get_scmtool()
-        data = tool.get_parser(b'').raw_diff(diffset)
-
-        resp = HttpResponse(data, content_type='text/x-patch')
+        resp = RawDiffResponse(parser=tool.get_parser(b''),
+                               diffset_or_commit=diffset)
 
         if diffset.name == 'diff':
             filename = 'rb%d.patch' % review_request.display_id
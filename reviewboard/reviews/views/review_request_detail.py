@@ -10,6 +10,7 @@ from django.conf import settings
 from django.http import HttpRequest
 from django.utils import timezone as django_timezone
 from django.views.generic.base import TemplateView
+from djblets.siteconfig.models import SiteConfiguration
 from djblets.views.generic.etag import ETagViewMixin
 
 from reviewboard.accounts.mixins import UserProfileRequiredViewMixin
@@ -98,9 +99,17 @@ class ReviewRequestDetailView(ReviewRequestViewMixin,
         # Begin building data for the contents of the page. This will include
         # the reviews, change descriptions, and other content shown on the
         # page.
-        data = ReviewRequestPageData(review_request=review_request,
-                                     request=request,
-                                     last_visited=self.last_visited)
+        #
+        # On review requests with a lot of reviews, only a window of them
+        # will be loaded. The rest will be shown as stubs that load their
+        # content when expanded.
+        siteconfig = SiteConfiguration.objects.get_current()
+        data = ReviewRequestPageData(
+            review_request=review_request,
+            request=request,
+            last_visited=self.last_visited,
+            max_loaded_reviews=(
+                siteconfig.get('reviews_page_max_loaded_reviews') or 0))
         self.data = data
 
         data.query_data_pre_etag()
@@ -136,6 +145,7 @@ class ReviewRequestDetailView(ReviewRequestViewMixin,
             data.latest_changedesc_timestamp,
             entry_etags,
             data.latest_review_timestamp,
+            data.review_count,
             review_request.last_review_activity_timestamp,
             is_rich_text_default_for_user(user),
             is_site_read_only_for(user),
@@ -107,11 +107,22 @@ class ReviewRequestUpdatesView(ReviewRequestViewMixin, ETagViewMixin,
         # interested in.
         entries_str = request.GET.get('entries')
 
+        review_ids: (set[int] | None) = None
+
         if entries_str:
             try:
                 for entry_part in entries_str.split(';'):
                     entry_type, entry_ids = entry_part.split(':')
                     self.entry_ids[entry_type] = set(entry_ids.split(','))
+
+                # If specific reviews were requested, only those need to
+                # be loaded. This keeps requests for single reviews cheap on
+                # review requests with a lot of reviews.
+                if 'review' in self.entry_ids:
+                    review_ids = {
+                        int(review_id)
+                        for review_id in self.entry_ids['review']
+                    }
             except ValueError as e:
                 return HttpResponseBadRequest('Invalid ?entries= value: %s'
                                               % e)
@@ -133,7 +144,8 @@ class ReviewRequestUpdatesView(ReviewRequestViewMixin, ETagViewMixin,
         self.since = request.GET.get('since')
 
         self.data = ReviewRequestPageData(self.review_request, request,
-                                          entry_classes=entry_classes)
+                                          entry_classes=entry_classes,
+                                          review_ids=review_ids)
 
     def get_etag_data(
         self,
@@ -180,6 +192,7 @@ class ReviewRequestUpdatesView(ReviewRequestViewMixin, ETagViewMixin,
             request.user,
             last_activity_time,
             data.latest_review_timestamp,
+            data.review_count,
             review_request.last_review_activity_timestamp,
             entry_etags,
             is_rich_text_default_for_user(request.user),
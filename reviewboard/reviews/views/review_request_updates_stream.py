@@ -0,0 +1,271 @@
+"""View for streaming update notifications for a review request."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+from django.db import connections
+from django.http import (Http404,
+                         HttpRequest,
+                         HttpResponse,
+                         StreamingHttpResponse)
+from django.views.generic.base import View
+from djblets.siteconfig.models import SiteConfiguration
+
+from reviewboard.notifications.pubsub import get_pubsub_broker
+from reviewboard.reviews.updates import (get_last_update_info,
+                                         get_updates_channel,
+                                         is_updates_push_enabled,
+                                         serialize_last_update_info)
+from reviewboard.reviews.views.mixins import ReviewRequestViewMixin
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from reviewboard.notifications.pubsub import PubSubSubscription
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewRequestUpdatesStreamView(ReviewRequestViewMixin, View):
+    """Internal view for streaming update notifications to the page.
+
+    This holds a connection open and sends a `Server-Sent Events
+    <https://html.spec.whatwg.org/multipage/server-sent-events.html>`_
+    stream to the client. Each ``update`` event contains the same
+    information as the ``last_update`` API resource, and is sent as soon as
+    the review request is publicly updated.
+
+    The current state is sent as the first event, so that any updates made
+    while the client was disconnected aren't missed. Comment lines are sent
+    periodically to keep the connection alive through proxies, and the
+    stream is ended after a maximum duration, after which the client will
+    reconnect.
+
+    This is only available when the ``updates_push_enabled`` site
+    configuration setting is enabled and the configured pub/sub broker
+    delivers to all web server processes. Otherwise, clients should poll the
+    ``last_update`` API resource.
+
+    The stream holds a web server thread for its duration, but releases its
+    database connections once the initial state has been sent. To keep
+    streams from using up the server's threads, each process serves at most
+    ``updates_push_max_streams`` streams at once. Further clients get an
+    empty :http:`204` response, which tells the browser not to reconnect, so
+    the page polls instead.
+
+    Version Added:
+        9.0
+    """
+
+    #: The number of milliseconds clients should wait before reconnecting.
+    reconnect_delay_ms = 5000
+
+    _num_streams: int = 0
+    _num_streams_lock = threading.Lock()
+
+    #: Whether this request holds one of the process's stream slots.
+    _holds_stream_slot: bool = False
+
+    def get(
+        self,
+        request: HttpRequest,
+        *args,
+        **kwargs,
+    ) -> HttpResponse | StreamingHttpResponse:
+        """Handle a HTTP GET request for the stream.
+
+        Args:
+            request (django.http.HttpRequest):
+                The HTTP request from the client.
+
+            *args (tuple, unused):
+                Positional arguments passed to the handler.
+
+            **kwargs (dict, unused):
+                Keyword arguments passed to the handler.
+
+        Returns:
+            django.http.HttpResponse or django.http.StreamingHttpResponse:
+            The resulting HTTP response. This will be an empty :http:`204`
+            response if this process is already serving the maximum number
+            of streams.
+
+        Raises:
+            django.http.Http404:
+                Pushing updates is disabled.
+        """
+        if not is_updates_push_enabled():
+            raise Http404
+
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        if not self._acquire_stream_slot(
+            siteconfig.get('updates_push_max_streams')):
+            return HttpResponse(status=204)
+
+        try:
+            review_request = self.review_request
+
+            # Subscribe before fetching the current state, so that no
+            # updates can slip in between the two.
+            subscription = get_pubsub_broker().subscribe([
+                get_updates_channel(review_request.pk),
+            ])
+
+            try:
+                initial_data = serialize_last_update_info(
+                    get_last_update_info(review_request))
+            except Exception:
+                subscription.close()
+                raise
+        except BaseException:
+            self._release_stream_slot()
+            raise
+
+        stream = self._stream_events(
+            subscription=subscription,
+            initial_data=initial_data,
+            max_duration=siteconfig.get('updates_push_max_duration'),
+            heartbeat_interval=siteconfig.get(
+                'updates_push_heartbeat_interval'))
+
+        # The stream releases its slot when it finishes. If it's discarded
+        # without ever being started, its cleanup code never runs, so
+        # release the slot when it's garbage-collected as well.
+        weakref.finalize(stream, self._release_stream_slot)
+
+        response = StreamingHttpResponse(stream,
+                                         content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+
+        # Prevent nginx from buffering the stream.
+        response['X-Accel-Buffering'] = 'no'
+
+        return response
+
+    def _stream_events(
+        self,
+        *,
+        subscription: PubSubSubscription,
+        initial_data: str,
+        max_duration: float,
+        heartbeat_interval: float,
+    ) -> Iterator[str]:
+        """Generate the events for the stream.
+
+        Args:
+            subscription (reviewboard.notifications.pubsub.
+                          PubSubSubscription):
+                The subscription for the review request's updates. This will
+                be closed when the stream ends.
+
+            initial_data (str):
+                The serialized current state of the review request.
+
+            max_duration (float):
+                The maximum number of seconds to keep the stream open.
+
+            heartbeat_interval (float):
+                The number of seconds between keep-alive comments.
+
+        Yields:
+            str:
+            Each chunk of the stream.
+        """
+        deadline = time.monotonic() + max_duration
+        heartbeat_interval = max(heartbeat_interval, 1)
+
+        # Nothing below needs the database, so don't hold connections open
+        # for the life of the stream.
+        self._release_db_connections()
+
+        try:
+            yield 'retry: %d\n\n' % self.reconnect_delay_ms
+            yield self._format_event(initial_data)
+
+            while (remaining := deadline - time.monotonic()) > 0:
+                data = subscription.get(
+                    timeout=min(heartbeat_interval, remaining))
+
+                if data is None:
+                    yield ': keep-alive\n\n'
+                else:
+                    yield self._format_event(data)
+        except Exception as e:
+            logger.exception('Unexpected error streaming updates for '
+                             'review request %s: %s',
+                             self.review_request.pk, e)
+        finally:
+            subscription.close()
+            self._release_stream_slot()
+
+    def _acquire_stream_slot(
+        self,
+        max_streams: int,
+    ) -> bool:
+        """Reserve one of this process's stream slots for this request.
+
+        Args:
+            max_streams (int):
+                The maximum number of streams served at once by this process.
+
+        Returns:
+            bool:
+            ``True`` if a slot was reserved. ``False`` if all slots are in
+            use.
+        """
+        cls = type(self)
+
+        with cls._num_streams_lock:
+            if cls._num_streams >= max_streams:
+                return False
+
+            cls._num_streams += 1
+
+        self._holds_stream_slot = True
+
+        return True
+
+    def _release_stream_slot(self) -> None:
+        """Release this request's stream slot, if it holds one.
+
+        This is safe to call more than once.
+        """
+        cls = type(self)
+
+        with cls._num_streams_lock:
+            if self._holds_stream_slot:
+                self._holds_stream_slot = False
+                cls._num_streams -= 1
+
+    def _release_db_connections(self) -> None:
+        """Close any open database connections for this thread.
+
+        Connections in a transaction are left alone, as closing them would
+        break the transaction. They'll be re-opened if needed again.
+        """
+        for connection in connections.all(initialized_only=True):
+            if not connection.in_atomic_block:
+                connection.close()
+
+    def _format_event(
+        self,
+        data: str,
+    ) -> str:
+        """Return an update event for the stream.
+
+        Args:
+            data (str):
+                The single-line data for the event.
+
+        Returns:
+            str:
+            The formatted event.
+        """
+        return 'event: update\ndata: %s\n\n' % data
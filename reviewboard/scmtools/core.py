@@ -813,6 +813,18 @@ class SCMTool:
     #: the repository. It's up to the SCMTool to make use of it.
     supports_ticket_auth: bool = False
 
+    #: Whether files can be fetched from multiple threads at once.
+    #:
+    #: If ``True``, :py:meth:`get_file` must be safe to call from multiple
+    #: threads at once for the same repository. This
+    #: allows :py:meth:`Repository.get_files()
+    #: <reviewboard.scmtools.models.Repository.get_files>` to fetch several
+    #: files in parallel.
+    #:
+    #: Version Added:
+    #:     9.0
+    supports_concurrent_file_fetches: bool = False
+
     #: Whether filenames in diffs are stored using absolute paths.
     #:
     #: This is used when uploading and validating diffs to determine if the
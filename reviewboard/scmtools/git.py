@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import io
 import logging
 import os
 import platform
 import re
 import stat
+import subprocess
+import threading
+import time
 from typing import Any, TYPE_CHECKING
 from urllib.parse import (quote as urlquote,
                           urlparse,
@@ -110,6 +114,7 @@ class GitTool(SCMTool):
     supports_history = True
     commits_have_committer = True
     supports_raw_file_urls = True
+    supports_concurrent_file_fetches = True
     field_help_text = {
         'path': _('For local Git repositories, this should be the path to a '
                   '.git directory that Review Board can read from. For remote '
@@ -779,9 +784,508 @@ class GitDiffParser(DiffParser):
                 setattr(file_info, attr, b'')
 
 
+class GitCatFileProcess:
+    """A long-lived :command:`git cat-file --batch` worker process.
+
+    This wraps a single :command:`git cat-file --batch` or
+    :command:`git cat-file --batch-check` process. Object names are written
+    to the process's stdin one per line, and responses are read back using
+    the object header (``<oid> <type> <size>``) to frame the content.
+
+    Instances are not thread-safe. They're handed out to one caller at a
+    time by :py:class:`GitCatFilePool`.
+
+    Version Added:
+        9.0
+    """
+
+    #: The maximum number of seconds to wait for a response.
+    #:
+    #: If the process doesn't respond in time, it will be killed and the
+    #: request will fail.
+    timeout: float = 30
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: Whether this process only returns object information.
+    #:
+    #: If ``True``, this runs :command:`git cat-file --batch-check`, and
+    #: responses will not contain object content.
+    batch_check: bool
+
+    #: The time the process was started, in :py:func:`time.monotonic` units.
+    created: float
+
+    #: The time the process was last returned to the pool.
+    last_used: float
+
+    #: Whether the process was killed for not responding in time.
+    timed_out: bool
+
+    def __init__(
+        self,
+        git_dir: str,
+        *,
+        batch_check: bool = False,
+        local_site_name: (str | None) = None,
+    ) -> None:
+        """Initialize the worker process.
+
+        Args:
+            git_dir (str):
+                The path to the Git directory.
+
+            batch_check (bool, optional):
+                Whether to run in ``--batch-check`` mode.
+
+            local_site_name (str, optional):
+                The name of the Local Site owning the repository, if any.
+
+        Raises:
+            OSError:
+                The process could not be started.
+        """
+        self.batch_check = batch_check
+
+        if batch_check:
+            batch_arg = '--batch-check'
+        else:
+            batch_arg = '--batch'
+
+        self._process = SCMTool.popen(
+            ['git', f'--git-dir={git_dir}', 'cat-file', batch_arg],
+            local_site_name=local_site_name,
+            stdin=subprocess.PIPE,
+            stderr=subprocess.DEVNULL)
+
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.timed_out = False
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running.
+
+        Type:
+            bool
+        """
+        return not self.timed_out and self._process.poll() is None
+
+    def request(
+        self,
+        object_name: str,
+    ) -> tuple[bytes, bytes | None] | None:
+        """Request an object from the process.
+
+        Args:
+            object_name (str):
+                The object name to look up. This can be anything accepted by
+                :command:`git rev-parse`, such as a SHA or ``HEAD:<path>``.
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            Tuple:
+                0 (bytes):
+                    The type of the object.
+
+                1 (bytes):
+                    The object's content, or ``None`` when running in
+                    ``--batch-check`` mode.
+
+            If the object could not be found, or the name was ambiguous,
+            this will return ``None`` instead.
+
+        Raises:
+            OSError:
+                The process exited, its pipes were closed, or it didn't
+                respond within :py:attr:`timeout` seconds. The process must
+                not be used again.
+
+            ValueError:
+                The process returned a response that couldn't be parsed.
+                The process must not be used again.
+        """
+        # Reads from the process block, so a watchdog kills the process if
+        # it wedges. This closes its pipes and unblocks the reads below.
+        timer = threading.Timer(self.timeout, self._on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        try:
+            return self._request(object_name)
+        except OSError as e:
+            if self.timed_out:
+                raise OSError(
+                    f'git cat-file did not respond within {self.timeout} '
+                    f'seconds'
+                ) from e
+
+            raise
+        finally:
+            timer.cancel()
+
+    def close(self) -> None:
+        """Shut down the process.
+
+        Closing stdin causes :command:`git cat-file` to exit cleanly. If it
+        doesn't exit in a timely manner, it will be killed.
+        """
+        process = self._process
+
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+    def _on_timeout(self) -> None:
+        """Kill the process after a request has timed out."""
+        self.timed_out = True
+
+        try:
+            self._process.kill()
+        except OSError:
+            # The process has already exited.
+            pass
+
+    def _request(
+        self,
+        object_name: str,
+    ) -> tuple[bytes, bytes | None] | None:
+        """Send a request to the process and read the response.
+
+        Args:
+            object_name (str):
+                The object name to look up.
+
+        Returns:
+            tuple:
+            The result, as documented in :py:meth:`request`.
+
+        Raises:
+            OSError:
+                The process exited or its pipes were closed while
+                communicating with it.
+
+            ValueError:
+                The process returned a response that couldn't be parsed.
+        """
+        process = self._process
+        stdin = process.stdin
+        stdout = process.stdout
+        assert stdin is not None
+        assert stdout is not None
+
+        stdin.write(b'%s\n' % object_name.encode('utf-8'))
+        stdin.flush()
+
+        header = stdout.readline()
+
+        if not header.endswith(b'\n'):
+            raise OSError('git cat-file exited while reading a response')
+
+        # Object names can contain spaces (such as "<rev>:<path>"), so
+        # check for the "<name> missing" and "<name> ambiguous" forms
+        # before splitting apart the "<oid> <type> <size>" form.
+        if header.endswith((b' missing\n', b' ambiguous\n')):
+            return None
+
+        parts = header.split()
+
+        if len(parts) != 3:
+            raise ValueError(
+                f'Unexpected response from git cat-file: {header!r}')
+
+        obj_type = parts[1]
+
+        if self.batch_check:
+            return obj_type, None
+
+        size = int(parts[2])
+        content = stdout.read(size + 1)
+
+        if len(content) != size + 1:
+            raise OSError('git cat-file exited while reading object content')
+
+        # Strip the trailing newline terminating the object.
+        return obj_type, content[:-1]
+
+
+class GitCatFilePool:
+    """A pool of long-lived :command:`git cat-file` worker processes.
+
+    Fetching a file through :command:`git cat-file <type> <object>` costs a
+    full fork/exec for every file. This pool keeps :command:`git cat-file
+    --batch` processes alive between requests, pipelining lookups over
+    stdin instead.
+
+    Pools are per-process and per-repository, and are retrieved through
+    :py:meth:`get_for_git_dir`.
+
+    Idle processes are reaped after :py:attr:`idle_timeout` seconds, and
+    processes are recycled after :py:attr:`max_age` seconds so that they'll
+    pick up any repository changes (such as repacks). Processes that crash
+    or stop responding are discarded and the request is retried on a new
+    process.
+
+    Version Added:
+        9.0
+    """
+
+    #: The number of seconds an idle process is kept before being closed.
+    idle_timeout: float = 60
+
+    #: The maximum number of seconds a process is kept alive.
+    max_age: float = 600
+
+    #: The maximum number of idle processes kept around per pool.
+    max_idle: int = 4
+
+    _pools: dict[tuple[str, str | None, bool], GitCatFilePool] = {}
+    _pools_lock = threading.Lock()
+    _pools_pid: (int | None) = None
+
+    @classmethod
+    def get_for_git_dir(
+        cls,
+        git_dir: str,
+        *,
+        batch_check: bool = False,
+        local_site_name: (str | None) = None,
+    ) -> GitCatFilePool:
+        """Return the pool for a Git directory.
+
+        If the process has forked since the pools were created, the pools
+        will be discarded, since the worker processes can't be shared with
+        the child process.
+
+        Args:
+            git_dir (str):
+                The path to the Git directory.
+
+            batch_check (bool, optional):
+                Whether to return a pool of ``--batch-check`` processes.
+
+            local_site_name (str, optional):
+                The name of the Local Site owning the repository, if any.
+
+        Returns:
+            GitCatFilePool:
+            The pool for the repository.
+        """
+        key = (git_dir, local_site_name, batch_check)
+        pid = os.getpid()
+
+        with cls._pools_lock:
+            if cls._pools_pid != pid:
+                cls._pools = {}
+                cls._pools_pid = pid
+
+            try:
+                pool = cls._pools[key]
+            except KeyError:
+                pool = cls(git_dir=git_dir,
+                           batch_check=batch_check,
+                           local_site_name=local_site_name)
+                cls._pools[key] = pool
+
+        return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all pools owned by this process.
+
+        This is registered to run when the process exits, and can also be
+        used by unit tests to reset state.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+
+            if cls._pools_pid != os.getpid():
+                pools = []
+
+            cls._pools = {}
+
+        for pool in pools:
+            pool.close()
+
+    def __init__(
+        self,
+        git_dir: str,
+        *,
+        batch_check: bool = False,
+        local_site_name: (str | None) = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            git_dir (str):
+                The path to the Git directory.
+
+            batch_check (bool, optional):
+                Whether this pool manages ``--batch-check`` processes.
+
+            local_site_name (str, optional):
+                The name of the Local Site owning the repository, if any.
+        """
+        self.git_dir = git_dir
+        self.batch_check = batch_check
+        self.local_site_name = local_site_name
+
+        self._idle: list[GitCatFileProcess] = []
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        object_name: str,
+    ) -> tuple[bytes, bytes | None] | None:
+        """Request an object from a worker process in the pool.
+
+        If the worker process crashes during the request, it will be
+        discarded and the request retried once on a new process.
+
+        Args:
+            object_name (str):
+                The object name to look up.
+
+        Returns:
+            tuple:
+            The result from :py:meth:`GitCatFileProcess.request`.
+
+        Raises:
+            OSError:
+                The request failed on a fresh process as well.
+        """
+        for attempt in range(2):
+            process = self._acquire(fresh=(attempt > 0))
+
+            try:
+                result = process.request(object_name)
+            except (OSError, ValueError) as e:
+                logger.warning('git cat-file process for %s failed '
+                               '(attempt %d): %s',
+                               self.git_dir, attempt + 1, e)
+                process.close()
+
+                if attempt > 0:
+                    raise OSError(str(e)) from e
+            else:
+                self._release(process)
+
+                return result
+
+        # This is unreachable, but keeps type checkers happy.
+        raise OSError('Unable to communicate with git cat-file')
+
+    def close(self) -> None:
+        """Close all idle processes in the pool."""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+
+        for process in idle:
+            process.close()
+
+    def _acquire(
+        self,
+        *,
+        fresh: bool = False,
+    ) -> GitCatFileProcess:
+        """Acquire a worker process from the pool.
+
+        Any idle processes that have expired or exited will be reaped.
+
+        Args:
+            fresh (bool, optional):
+                Whether to skip any idle processes and start a new one.
+
+        Returns:
+            GitCatFileProcess:
+            The worker process.
+        """
+        now = time.monotonic()
+        expired: list[GitCatFileProcess] = []
+        process: (GitCatFileProcess | None) = None
+
+        with self._lock:
+            idle: list[GitCatFileProcess] = []
+
+            for candidate in self._idle:
+                if (now - candidate.last_used > self.idle_timeout or
+                    now - candidate.created > self.max_age or
+                    not candidate.alive):
+                    expired.append(candidate)
+                else:
+                    idle.append(candidate)
+
+            if idle and not fresh:
+                process = idle.pop()
+
+            self._idle = idle
+
+        for candidate in expired:
+            candidate.close()
+
+        if process is None:
+            process = GitCatFileProcess(
+                self.git_dir,
+                batch_check=self.batch_check,
+                local_site_name=self.local_site_name)
+
+        return process
+
+    def _release(
+        self,
+        process: GitCatFileProcess,
+    ) -> None:
+        """Return a worker process to the pool.
+
+        If the pool already has enough idle processes, or the process has
+        exceeded its maximum age, it will be closed instead.
+
+        Args:
+            process (GitCatFileProcess):
+                The process to return.
+        """
+        now = time.monotonic()
+        process.last_used = now
+
+        if now - process.created <= self.max_age:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(process)
+                    return
+
+        process.close()
+
+
+atexit.register(GitCatFilePool.close_all)
+
+
 class GitClient(SCMClient):
     FULL_SHA1_LENGTH = 40
 
+    #: Whether to fetch objects from local repositories using a pool.
+    #:
+    #: If enabled, local file lookups will be sent to long-lived
+    #: :command:`git cat-file --batch` processes managed by
+    #: :py:class:`GitCatFilePool`, rather than starting a new process for
+    #: every lookup.
+    #:
+    #: Version Added:
+    #:     9.0
+    use_cat_file_pool: bool = True
+
     schemeless_url_re = re.compile(
         r'^(?P<username>[A-Za-z0-9_\.-]+@)?(?P<hostname>[A-Za-z0-9_\.-]+):'
         r'(?P<path>.*)')
@@ -958,6 +1462,15 @@ class GitClient(SCMClient):
         """
         commit = self._resolve_head(revision, path)
 
+        if (self.use_cat_file_pool and
+            self.git_dir and
+            option in ('blob', '-t') and
+            '\n' not in commit):
+            contents = self._cat_file_batch(path, commit, option)
+
+            if contents is not None:
+                return contents
+
         with self._run_git(
             [f'--git-dir={self.git_dir}', 'cat-file', option, commit],
         ) as p:
@@ -973,6 +1486,74 @@ class GitClient(SCMClient):
 
         return contents
 
+    def _cat_file_batch(
+        self,
+        path: str,
+        commit: str,
+        option: str,
+    ) -> bytes | None:
+        """Look up an object using a pooled git-cat-file(1) process.
+
+        Version Added:
+            9.0
+
+        Args:
+            path (str):
+                The path of the file being looked up.
+
+            commit (str):
+                The object name to look up.
+
+            option (str):
+                The :command:`git cat-file` option the caller would have
+                used. This must be ``blob`` or ``-t``.
+
+        Returns:
+            bytes:
+            The content of the blob (for ``blob``) or the type of the object
+            (for ``-t``), in the same form as the standalone command would
+            have returned.
+
+            If the result must instead come from the standalone command
+            (due to a non-blob object type or a process error), this will
+            return ``None``.
+
+        Raises:
+            reviewboard.scmtools.errors.FileNotFoundError:
+                The object could not be found.
+        """
+        assert self.git_dir
+
+        pool = GitCatFilePool.get_for_git_dir(
+            self.git_dir,
+            batch_check=(option == '-t'),
+            local_site_name=self.local_site_name)
+
+        try:
+            result = pool.request(commit)
+        except OSError as e:
+            logger.error('Git: Unable to look up "%s" in %s using '
+                         'git cat-file --batch. Falling back to '
+                         'git cat-file: %s',
+                         commit, self.git_dir, e)
+            return None
+
+        if result is None:
+            raise FileNotFoundError(path, revision=commit)
+
+        obj_type, content = result
+
+        if option == '-t':
+            return obj_type + b'\n'
+        elif obj_type == b'blob':
+            assert content is not None
+
+            return content
+        else:
+            # Let git-cat-file(1) handle peeling tags or reporting the
+            # error for other object types.
+            return None
+
     def _resolve_head(self, revision, path):
         if revision == HEAD:
             if path == '':
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
+import select
+import struct
+import subprocess
+import threading
+import time
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
 from urllib.parse import quote as urllib_quote, urlparse
@@ -25,8 +32,6 @@ from reviewboard.scmtools.errors import FileNotFoundError, SCMError
 from reviewboard.scmtools.git import GitDiffParser, strip_git_symlink_mode
 
 if TYPE_CHECKING:
-    import subprocess
-
     from reviewboard.diffviewer.parser import ParsedDiffFile
     from reviewboard.scmtools.core import (
         FileLookupContext,
@@ -935,11 +940,584 @@ class HgWebClient(SCMClient):
         return json.loads(contents.decode('utf-8'))
 
 
+class HgCommandServer:
+    """A long-lived :command:`hg serve --cmdserver pipe` process.
+
+    This wraps a single Mercurial command server, speaking its pipe
+    protocol. Commands are sent as ``runcommand`` requests, and the output,
+    error and result channels are collected into a result.
+
+    Instances are not thread-safe. They're handed out to one caller at a
+    time by :py:class:`HgCommandServerPool`.
+
+    Version Added:
+        9.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The time the process was started, in :py:func:`time.monotonic` units.
+    created: float
+
+    #: The time the process was last returned to the pool.
+    last_used: float
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        local_site_name: (str | None) = None,
+        timeout: float = 120,
+    ) -> None:
+        """Initialize the command server.
+
+        This will start the process and read the server's hello message.
+
+        Args:
+            path (str):
+                The path to the repository.
+
+            local_site_name (str, optional):
+                The name of the Local Site owning the repository, if any.
+
+            timeout (float, optional):
+                The number of seconds to wait for the hello message.
+
+        Raises:
+            OSError:
+                The process could not be started, or did not identify itself
+                as a command server.
+        """
+        self._process = SCMTool.popen(
+            ['hg', '--noninteractive', '--repository', path,
+             'serve', '--cmdserver', 'pipe'],
+            local_site_name=local_site_name,
+            cwd=path,
+            stdin=subprocess.PIPE,
+            stderr=subprocess.DEVNULL)
+
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+        try:
+            channel, data = self._read_message(time.monotonic() + timeout)
+
+            if channel != b'o':
+                raise OSError('Unexpected hello channel %r from hg command '
+                              'server' % channel)
+
+            capabilities: list[bytes] = []
+
+            for line in data.splitlines():
+                if line.startswith(b'capabilities:'):
+                    capabilities = line.split()[1:]
+
+            if b'runcommand' not in capabilities:
+                raise OSError('hg command server does not support '
+                              'runcommand')
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running.
+
+        Type:
+            bool
+        """
+        return self._process.poll() is None
+
+    def run_command(
+        self,
+        args: list[str],
+        *,
+        timeout: float = 120,
+    ) -> tuple[int, bytes, bytes]:
+        """Run a Mercurial command on the server.
+
+        Args:
+            args (list of str):
+                The arguments for the command, as would be passed to
+                :command:`hg`.
+
+            timeout (float, optional):
+                The number of seconds to wait for the command to finish.
+
+        Returns:
+            tuple:
+            A 3-tuple containing:
+
+            Tuple:
+                0 (int):
+                    The exit code of the command.
+
+                1 (bytes):
+                    The output of the command.
+
+                2 (bytes):
+                    The error output of the command.
+
+        Raises:
+            TimeoutError:
+                The command did not finish in time. The process must not be
+                used again.
+
+            OSError:
+                The process exited or its pipes were closed while
+                communicating with it. The process must not be used again.
+        """
+        stdin = self._process.stdin
+        assert stdin is not None
+
+        payload = b'\0'.join(
+            arg.encode('utf-8')
+            for arg in args
+        )
+
+        stdin.write(b'runcommand\n%s%s' % (struct.pack('>I', len(payload)),
+                                           payload))
+        stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        out: list[bytes] = []
+        err: list[bytes] = []
+
+        while True:
+            channel, data = self._read_message(deadline)
+
+            if channel == b'o':
+                out.append(data)
+            elif channel == b'e':
+                err.append(data)
+            elif channel == b'r':
+                return (struct.unpack('>i', data)[0],
+                        b''.join(out),
+                        b''.join(err))
+            elif channel in (b'I', b'L'):
+                # Commands are run non-interactively, so there's never any
+                # input to provide. An empty response signals EOF.
+                stdin.write(struct.pack('>I', 0))
+                stdin.flush()
+            elif channel.isupper():
+                raise OSError('Unsupported required channel %r from hg '
+                              'command server' % channel)
+
+            # Any other lowercase channels are optional, and are ignored.
+
+    def close(self) -> None:
+        """Shut down the process.
+
+        Closing stdin causes the command server to exit cleanly. If it
+        doesn't exit in a timely manner, it will be killed.
+        """
+        process = self._process
+
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+    def _read_message(
+        self,
+        deadline: float,
+    ) -> tuple[bytes, bytes]:
+        """Read a message from the server.
+
+        Input channels (``I`` and ``L``) carry no data. For these, the
+        returned data is empty.
+
+        Args:
+            deadline (float):
+                The :py:func:`time.monotonic` time to give up at.
+
+        Returns:
+            tuple:
+            A 2-tuple of the channel identifier and the message data.
+
+        Raises:
+            OSError:
+                The message could not be read.
+        """
+        channel, length = struct.unpack('>cI', self._read(5, deadline))
+
+        if channel in (b'I', b'L'):
+            return channel, b''
+
+        return channel, self._read(length, deadline)
+
+    def _read(
+        self,
+        size: int,
+        deadline: float,
+    ) -> bytes:
+        """Read an exact number of bytes from the server.
+
+        Args:
+            size (int):
+                The number of bytes to read.
+
+            deadline (float):
+                The :py:func:`time.monotonic` time to give up at.
+
+        Returns:
+            bytes:
+            The data that was read.
+
+        Raises:
+            TimeoutError:
+                The data was not available before the deadline.
+
+            OSError:
+                The process exited before all data was read.
+        """
+        stdout = self._process.stdout
+        assert stdout is not None
+
+        fd = stdout.fileno()
+        buf = bytearray()
+
+        while len(buf) < size:
+            timeout = deadline - time.monotonic()
+
+            if (timeout <= 0 or
+                not select.select([fd], [], [], timeout)[0]):
+                raise TimeoutError('Timed out waiting for hg command server')
+
+            chunk = os.read(fd, min(size - len(buf), 65536))
+
+            if not chunk:
+                raise OSError('hg command server exited while reading a '
+                              'response')
+
+            buf += chunk
+
+        return bytes(buf)
+
+
+class HgCommandServerPool:
+    """A pool of long-lived Mercurial command server processes.
+
+    Running a :command:`hg` command costs the startup of a Python
+    interpreter and Mercurial itself for every call. This pool keeps
+    :command:`hg serve --cmdserver pipe` processes alive between requests,
+    sending commands to them over the command server protocol instead.
+
+    Pools are per-process and per-repository, and are retrieved through
+    :py:meth:`get_for_path`.
+
+    Idle processes are reaped after :py:attr:`idle_timeout` seconds, and
+    processes are recycled after :py:attr:`max_age` seconds so that they'll
+    pick up any repository or configuration changes. Processes that crash
+    are discarded and the command is retried on a new process. Commands
+    that take longer than :py:attr:`command_timeout` seconds are aborted.
+
+    At most :py:attr:`max_active` commands run at once per pool, so a burst
+    of requests can't spawn an unbounded number of processes. Any further
+    commands wait for a running one to finish.
+
+    Version Added:
+        9.0
+    """
+
+    #: The number of seconds an idle process is kept before being closed.
+    idle_timeout: float = 60
+
+    #: The maximum number of seconds a process is kept alive.
+    max_age: float = 600
+
+    #: The maximum number of idle processes kept around per pool.
+    max_idle: int = 4
+
+    #: The maximum number of commands run at once per pool.
+    #:
+    #: Each running command holds its own process, so this also caps the
+    #: number of busy processes.
+    max_active: int = 8
+
+    #: The maximum number of seconds to wait for a command to finish.
+    command_timeout: float = 120
+
+    _pools: dict[tuple[str, str | None], HgCommandServerPool] = {}
+    _pools_lock = threading.Lock()
+    _pools_pid: (int | None) = None
+
+    @classmethod
+    def get_for_path(
+        cls,
+        path: str,
+        *,
+        local_site_name: (str | None) = None,
+    ) -> HgCommandServerPool:
+        """Return the pool for a repository.
+
+        If the process has forked since the pools were created, the pools
+        will be discarded, since the server processes can't be shared with
+        the child process.
+
+        Args:
+            path (str):
+                The path to the repository.
+
+            local_site_name (str, optional):
+                The name of the Local Site owning the repository, if any.
+
+        Returns:
+            HgCommandServerPool:
+            The pool for the repository.
+        """
+        key = (path, local_site_name)
+        pid = os.getpid()
+
+        with cls._pools_lock:
+            if cls._pools_pid != pid:
+                cls._pools = {}
+                cls._pools_pid = pid
+
+            try:
+                pool = cls._pools[key]
+            except KeyError:
+                pool = cls(path=path,
+                           local_site_name=local_site_name)
+                cls._pools[key] = pool
+
+        return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all pools owned by this process.
+
+        This is registered to run when the process exits, and can also be
+        used by unit tests to reset state.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+
+            if cls._pools_pid != os.getpid():
+                pools = []
+
+            cls._pools = {}
+
+        for pool in pools:
+            pool.close()
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        local_site_name: (str | None) = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            path (str):
+                The path to the repository.
+
+            local_site_name (str, optional):
+                The name of the Local Site owning the repository, if any.
+        """
+        self.path = path
+        self.local_site_name = local_site_name
+
+        self._active = 0
+        self._idle: list[HgCommandServer] = []
+        self._lock = threading.Lock()
+        self._slot_available = threading.Condition(self._lock)
+
+    def run_command(
+        self,
+        args: list[str],
+    ) -> tuple[int, bytes, bytes]:
+        """Run a Mercurial command on a server in the pool.
+
+        If :py:attr:`max_active` commands are already running, this will
+        wait for one of them to finish first.
+
+        If the server crashes during the command, it will be discarded and
+        the command retried once on a new server.
+
+        Args:
+            args (list of str):
+                The arguments for the command.
+
+        Returns:
+            tuple:
+            The result from :py:meth:`HgCommandServer.run_command`.
+
+        Raises:
+            TimeoutError:
+                The command did not finish in time, or no server became
+                available in time.
+
+            OSError:
+                The command failed on a new server as well.
+        """
+        self._reserve_slot()
+
+        try:
+            for attempt in range(2):
+                server = self._acquire(fresh=(attempt > 0))
+
+                try:
+                    result = server.run_command(args,
+                                                timeout=self.command_timeout)
+                except OSError as e:
+                    logger.warning('hg command server for %s failed '
+                                   '(attempt %d): %s',
+                                   self.path, attempt + 1, e)
+                    server.close()
+
+                    if attempt > 0 or isinstance(e, TimeoutError):
+                        raise
+                else:
+                    self._release(server)
+
+                    return result
+        finally:
+            self._free_slot()
+
+        # This is unreachable, but keeps type checkers happy.
+        raise OSError('Unable to communicate with the hg command server')
+
+    def close(self) -> None:
+        """Close all idle processes in the pool."""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+
+        for server in idle:
+            server.close()
+
+    def _reserve_slot(self) -> None:
+        """Reserve a slot for running a command.
+
+        This will wait until fewer than :py:attr:`max_active` commands are
+        running.
+
+        Raises:
+            TimeoutError:
+                A slot did not become available within
+                :py:attr:`command_timeout` seconds.
+        """
+        with self._slot_available:
+            if not self._slot_available.wait_for(
+                lambda: self._active < self.max_active,
+                timeout=self.command_timeout):
+                raise TimeoutError('Timed out waiting for an available hg '
+                                   'command server')
+
+            self._active += 1
+
+    def _free_slot(self) -> None:
+        """Free a slot reserved by :py:meth:`_reserve_slot`."""
+        with self._slot_available:
+            self._active -= 1
+            self._slot_available.notify()
+
+    def _acquire(
+        self,
+        *,
+        fresh: bool = False,
+    ) -> HgCommandServer:
+        """Acquire a server process from the pool.
+
+        Any idle processes that have expired or exited will be reaped.
+
+        Args:
+            fresh (bool, optional):
+                Whether to skip any idle processes and start a new one.
+
+        Returns:
+            HgCommandServer:
+            The server process.
+
+        Raises:
+            OSError:
+                A new server process could not be started.
+        """
+        now = time.monotonic()
+        expired: list[HgCommandServer] = []
+        server: (HgCommandServer | None) = None
+
+        with self._lock:
+            idle: list[HgCommandServer] = []
+
+            for candidate in self._idle:
+                if (now - candidate.last_used > self.idle_timeout or
+                    now - candidate.created > self.max_age or
+                    not candidate.alive):
+                    expired.append(candidate)
+                else:
+                    idle.append(candidate)
+
+            if idle and not fresh:
+                server = idle.pop()
+
+            self._idle = idle
+
+        for candidate in expired:
+            candidate.close()
+
+        if server is None:
+            server = HgCommandServer(self.path,
+                                     local_site_name=self.local_site_name,
+                                     timeout=self.command_timeout)
+
+        return server
+
+    def _release(
+        self,
+        server: HgCommandServer,
+    ) -> None:
+        """Return a server process to the pool.
+
+        If the pool already has enough idle processes, or the process has
+        exceeded its maximum age, it will be closed instead.
+
+        Args:
+            server (HgCommandServer):
+                The server process to return.
+        """
+        now = time.monotonic()
+        server.last_used = now
+
+        if now - server.created <= self.max_age:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(server)
+                    return
+
+        server.close()
+
+
+atexit.register(HgCommandServerPool.close_all)
+
+
 class HgClient(SCMClient):
     """Client implementation for using the hg tool."""
 
     COMMITS_PAGE_LIMIT = '31'
 
+    #: Whether to run commands on local repositories using command servers.
+    #:
+    #: If enabled, commands for local repositories will be sent to
+    #: long-lived :command:`hg serve --cmdserver pipe` processes managed by
+    #: :py:class:`HgCommandServerPool`, rather than starting a new
+    #: :command:`hg` process for every command.
+    #:
+    #: Version Added:
+    #:     9.0
+    use_command_server: bool = (os.name != 'nt')
+
     def __init__(
         self,
         path: str,
@@ -1007,10 +1585,8 @@ class HgClient(SCMClient):
             rev = ''
 
         if path:
-            with self._run_hg(['cat', '--rev', str(rev), path]) as p:
-                assert p.stdout is not None
-                contents = p.stdout.read()
-                failure = p.wait()
+            failure, contents, errors = self._run_hg_command(
+                ['cat', '--rev', str(rev), path])
 
             if not failure:
                 return contents
@@ -1024,21 +1600,20 @@ class HgClient(SCMClient):
             list of reviewboard.scmtools.core.Branch:
             The list of the branches.
         """
-        with self._run_hg(['branches', '--template', 'json']) as p:
-            if p.wait() != 0:
-                assert p.stderr is not None
-                raise SCMError('Cannot load branches: %s' % p.stderr.read())
-
-            assert p.stdout is not None
+        failure, contents, errors = self._run_hg_command(
+            ['branches', '--template', 'json'])
 
-            return [
-                Branch(
-                    id=data['branch'],
-                    commit=data['node'],
-                    default=(data['branch'] == 'default'))
-                for data in json.loads(force_str(p.stdout.read()))
-                if not data['closed']
-            ]
+        if failure:
+            raise SCMError('Cannot load branches: %s' % errors)
+
+        return [
+            Branch(
+                id=data['branch'],
+                commit=data['node'],
+                default=(data['branch'] == 'default'))
+            for data in json.loads(force_str(contents))
+            if not data['closed']
+        ]
 
     def _get_commits(
         self,
@@ -1060,30 +1635,28 @@ class HgClient(SCMClient):
         """
         cmd = ['log'] + revset + ['--template', 'json']
 
-        with self._run_hg(cmd) as p:
-            if p.wait() != 0:
-                assert p.stderr is not None
-                raise SCMError('Cannot load commits: %s' % p.stderr.read())
+        failure, contents, errors = self._run_hg_command(cmd)
 
-            results = []
+        if failure:
+            raise SCMError('Cannot load commits: %s' % errors)
 
-            assert p.stdout is not None
+        results = []
 
-            for data in json.loads(force_str(p.stdout.read())):
-                try:
-                    parent: (str | None) = force_str(data['parents'][0])
+        for data in json.loads(force_str(contents)):
+            try:
+                parent: (str | None) = force_str(data['parents'][0])
 
-                    if parent == INITIAL_COMMIT_ID:
-                        parent = ''
-                except IndexError:
-                    parent = None
+                if parent == INITIAL_COMMIT_ID:
+                    parent = ''
+            except IndexError:
+                parent = None
 
-                results.append(Commit(
-                    id=data['node'],
-                    message=data['desc'],
-                    author_name=data['user'],
-                    date=HgTool.date_tuple_to_iso8601(data['date']),
-                    parent=parent))
+            results.append(Commit(
+                id=data['node'],
+                message=data['desc'],
+                author_name=data['user'],
+                date=HgTool.date_tuple_to_iso8601(data['date']),
+                parent=parent))
 
         return results
 
@@ -1138,19 +1711,13 @@ class HgClient(SCMClient):
 
         if changesets:
             commit = changesets[0]
-            cmd = ['diff', '-c', revision]
+            failure, contents, errors = self._run_hg_command(
+                ['diff', '-c', revision])
 
-            with self._run_hg(cmd) as p:
+            if failure:
+                raise SCMError(f'Cannot load patch {revision}: {errors}')
 
-                if p.wait() != 0:
-                    assert p.stderr is not None
-
-                    e = p.stderr.read()
-                    raise SCMError(f'Cannot load patch {revision}: {e}')
-
-                assert p.stdout is not None
-
-                commit.diff = p.stdout.read()
+            commit.diff = contents
 
             return commit
 
@@ -1164,10 +1731,10 @@ class HgClient(SCMClient):
         ]
 
         # We need to query hg for the current SSH configuration. Note
-        # that _run_hg is calling this function, and this function is then
-        # (through _get_hg_config) calling _run_hg, but it's okay. Due to
-        # having set a good default for self.default_args above, there's no
-        # issue of an infinite loop.
+        # that _run_hg_command is calling this function, and this function
+        # is then (through _get_hg_config) calling _run_hg_command, but it's
+        # okay. Due to having set a good default for self.default_args
+        # above, there's no issue of an infinite loop.
         hg_ssh = self._get_hg_config('ui.ssh')
 
         if not hg_ssh:
@@ -1188,11 +1755,8 @@ class HgClient(SCMClient):
         self,
         config_name: str,
     ) -> str | None:
-        with self._run_hg(['showconfig', config_name]) as p:
-            assert p.stdout is not None
-
-            contents = p.stdout.read()
-            failure = p.wait()
+        failure, contents, errors = self._run_hg_command(
+            ['showconfig', config_name])
 
         if failure:
             # Just assume it's empty.
@@ -1200,6 +1764,67 @@ class HgClient(SCMClient):
 
         return contents.strip()
 
+    def _run_hg_command(
+        self,
+        args: list[str],
+    ) -> tuple[int, bytes, bytes]:
+        """Run a Mercurial command and return its results.
+
+        For local repositories, this will run the command on a pooled
+        Mercurial command server if :py:attr:`use_command_server` is
+        enabled. If the command server can't be used, this will fall back to
+        running :command:`hg` through :py:meth:`_run_hg`.
+
+        Version Added:
+            9.0
+
+        Args:
+            args (list of str):
+                The arguments to add to the :command:`hg` command.
+
+        Returns:
+            tuple:
+            A 3-tuple containing:
+
+            Tuple:
+                0 (int):
+                    The exit code of the command.
+
+                1 (bytes):
+                    The output of the command.
+
+                2 (bytes):
+                    The error output of the command.
+
+        Raises:
+            reviewboard.scmtools.errors.SCMError:
+                The command timed out on the command server.
+        """
+        if not self.default_args:
+            self._calculate_default_args()
+
+        assert self.default_args is not None
+
+        if self.use_command_server and os.path.isdir(self.path):
+            pool = HgCommandServerPool.get_for_path(
+                self.path,
+                local_site_name=self.local_site_name)
+
+            try:
+                return pool.run_command(self.default_args + args)
+            except TimeoutError as e:
+                raise SCMError('Timed out running hg %s: %s'
+                               % (args[0], e)) from e
+            except OSError as e:
+                logger.error('Mercurial: Unable to run "hg %s" in %s using '
+                             'the command server. Falling back to hg: %s',
+                             args[0], self.path, e)
+
+        with self._run_hg(args) as p:
+            contents, errors = p.communicate()
+
+        return p.returncode, contents, errors
+
     def _run_hg(
         self,
         args: list[str],
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import logging
 from typing import Any, TYPE_CHECKING
+from uuid import uuid4
 
 import importlib_metadata
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Manager, Q
 from django.db.models.query import QuerySet
+from djblets.cache.backend import cache_memoize, make_cache_key
 from housekeeping.functions import deprecate_non_keyword_only_args
 
 from reviewboard.deprecation import RemovedInReviewBoard90Warning
@@ -179,6 +183,8 @@ class ToolManager(Manager['Tool']):
 class RepositoryManager(Manager['Repository']):
     """A manager for Repository models."""
 
+    _ACL_STATE_CACHE_KEY = 'repository-acl-state'
+
     @deprecate_non_keyword_only_args(RemovedInReviewBoard90Warning)
     def accessible(
         self,
@@ -281,6 +287,14 @@ class RepositoryManager(Manager['Repository']):
 
         Callers should not assume order.
 
+        Results are cached per user and :term:`Local Site`, and invalidated
+        whenever repository access lists, review group membership, or
+        repository visibility change.
+
+        Version Changed:
+            9.0:
+            Results are now cached.
+
         Version Changed:
             3.0.24:
             In prior versions, the order was not specified, but was
@@ -300,10 +314,60 @@ class RepositoryManager(Manager['Repository']):
         """
         kwargs['distinct'] = False
 
-        return list(sorted(set(
-            self.accessible(*args, **kwargs)
-            .values_list('pk', flat=True)
-        )))
+        def _gen_ids() -> list[int]:
+            return list(sorted(set(
+                self.accessible(*args, **kwargs)
+                .values_list('pk', flat=True)
+            )))
+
+        return cache_memoize(
+            self._make_accessible_ids_cache_key(*args, **kwargs),
+            _gen_ids)
+
+    def get_acl_state(self) -> str:
+        """Return an identifier for the current state of repository ACLs.
+
+        This will change any time a repository's access lists, visibility,
+        or Local Site change, or the membership of a review group changes.
+        It can be used as a component in cache keys for data that depends
+        on which repositories users can access.
+
+        Version Added:
+            9.0
+
+        Returns:
+            str:
+            The identifier for the current ACL state.
+        """
+        return cache_memoize(self._ACL_STATE_CACHE_KEY,
+                             lambda: str(uuid4()))
+
+    def invalidate_acl_cache(
+        self,
+        *,
+        using: (str | None) = None,
+    ) -> None:
+        """Invalidate all cached repository ACL results.
+
+        This is called automatically when repositories or review groups
+        change in a way that may affect access.
+
+        The cache is invalidated immediately, and again once the current
+        transaction (if any) commits. This prevents another request from
+        caching results computed from data that hadn't yet been committed.
+
+        Version Added:
+            9.0
+
+        Args:
+            using (str, optional):
+                The database alias for the transaction making the change.
+        """
+        cache_key = make_cache_key(self._ACL_STATE_CACHE_KEY)
+
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key),
+                              using=using)
 
     def get_best_match(
         self,
@@ -454,3 +518,55 @@ class RepositoryManager(Manager['Repository']):
         for repository in qs:
             # This will trigger a migration of the password.
             repository.password
+
+    def _make_accessible_ids_cache_key(
+        self,
+        user: AnonymousUser | User,
+        visible_only: bool = True,
+        local_site: AnyOrAllLocalSites = None,
+        **kwargs,
+    ) -> str:
+        """Return a cache key for accessible repository IDs.
+
+        Superusers all share the same results, as do anonymous users.
+
+        Version Added:
+            9.0
+
+        Args:
+            user (django.contrib.auth.models.User):
+                The user that must have access to the repositories.
+
+            visible_only (bool, optional):
+                Whether only visible repositories are being returned.
+
+            local_site (reviewboard.site.models.LocalSite or
+                        reviewboard.site.models.LocalSite.ALL, optional):
+                The Local Site that the repositories must be associated with.
+
+            **kwargs (dict, unused):
+                Additional keyword arguments passed to
+                :py:meth:`accessible`.
+
+        Returns:
+            str:
+            The cache key.
+        """
+        if user.is_superuser:
+            user_key = 'superuser'
+        elif user.is_authenticated:
+            user_key = str(user.pk)
+        else:
+            user_key = 'anonymous'
+
+        if local_site is LocalSite.ALL:
+            local_site_key = 'all'
+        elif local_site is None:
+            local_site_key = 'none'
+        else:
+            local_site_key = str(getattr(local_site, 'pk', local_site))
+
+        return (
+            f'repository-accessible-ids-{self.get_acl_state()}-{user_key}-'
+            f'{local_site_key}-{int(bool(visible_only))}'
+        )
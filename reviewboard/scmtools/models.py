@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from time import time
 from typing import Any, ClassVar, Final, TYPE_CHECKING, cast
@@ -12,13 +13,14 @@ from urllib.parse import quote
 from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured, ValidationError
-from django.db import IntegrityError, models
+from django.db import IntegrityError, connections, models
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext, gettext_lazy as _
 from djblets.cache.backend import cache_memoize, make_cache_key
 from djblets.db.fields import JSONField
 from djblets.log import log_timed
+from djblets.siteconfig.models import SiteConfiguration
 from djblets.util.decorators import cached_property
 from housekeeping import deprecate_non_keyword_only_args
 
@@ -732,6 +734,159 @@ class Repository(models.Model):
             ],
             large_data=True)[0]
 
+    @property
+    def supports_concurrent_file_fetches(self) -> bool:
+        """Whether files can be fetched from this repository concurrently.
+
+        This is determined by the hosting service, if one is used, or by the
+        SCMTool.
+
+        Version Added:
+            9.0
+
+        Type:
+            bool
+        """
+        hosting_service = self.hosting_service
+
+        if hosting_service:
+            return hosting_service.supports_concurrent_file_fetches
+
+        scmtool_class = self.scmtool_class
+
+        return bool(scmtool_class and
+                    scmtool_class.supports_concurrent_file_fetches)
+
+    def get_files(
+        self,
+        *,
+        files: Sequence[tuple[str, str, FileLookupContext]],
+        max_workers: (int | None) = None,
+    ) -> list[bytes]:
+        """Return several files from the repository.
+
+        This is equivalent to calling :py:meth:`get_file` for each file, and
+        uses the same cache. If the hosting service or SCMTool supports
+        concurrent file fetches, uncached files will be fetched in parallel
+        on a bounded pool of threads. Otherwise, they'll be fetched one at a
+        time.
+
+        Version Added:
+            9.0
+
+        Args:
+            files (list of tuple):
+                The files to fetch. Each is a tuple of the path, the
+                revision, and the
+                :py:class:`~reviewboard.scmtools.core.FileLookupContext`
+                for the file.
+
+            max_workers (int, optional):
+                The maximum number of files to fetch at once. This defaults
+                to the ``diffviewer_file_fetch_max_workers`` site
+                configuration setting.
+
+        Returns:
+            list of bytes:
+            The contents of each file, in the same order as ``files``.
+
+        Raises:
+            Exception:
+                An error fetching one of the files. Files fetched
+                successfully will still be cached.
+        """
+        if max_workers is None:
+            siteconfig = SiteConfiguration.objects.get_current()
+            max_workers = siteconfig.get('diffviewer_file_fetch_max_workers')
+
+        def _get_file(
+            path: str,
+            revision: str,
+            context: FileLookupContext,
+        ) -> bytes:
+            return self.get_file(path=path,
+                                 revision=revision,
+                                 context=context)
+
+        if (len(files) < 2 or
+            not max_workers or
+            max_workers < 2 or
+            not self.supports_concurrent_file_fetches):
+            return [
+                _get_file(*file_info)
+                for file_info in files
+            ]
+
+        def _get_file_in_thread(
+            path: str,
+            revision: str,
+            context: FileLookupContext,
+        ) -> bytes:
+            try:
+                return _get_file(path, revision, context)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(files)),
+            thread_name_prefix='rb-file-fetch') as executor:
+            futures = [
+                executor.submit(_get_file_in_thread, *file_info)
+                for file_info in files
+            ]
+
+        return [
+            future.result()
+            for future in futures
+        ]
+
+    def prefetch_files(
+        self,
+        *,
+        files: Sequence[tuple[str, str, FileLookupContext]],
+    ) -> None:
+        """Fetch several files into the cache at once.
+
+        This is used to fetch the files needed for a page up-front, rather
+        than one at a time as each is needed. Files already in the cache
+        will be skipped.
+
+        This only fetches files if the repository supports concurrent file
+        fetches, since there's otherwise nothing to gain by fetching files
+        early. Errors are logged and ignored, and will be raised again when
+        the file is later fetched through :py:meth:`get_file`.
+
+        Version Added:
+            9.0
+
+        Args:
+            files (list of tuple):
+                The files to fetch. Each is a tuple of the path, the
+                revision, and the
+                :py:class:`~reviewboard.scmtools.core.FileLookupContext`
+                for the file.
+        """
+        try:
+            if not self.supports_concurrent_file_fetches:
+                return
+
+            uncached_files = [
+                (path, revision, context)
+                for path, revision, context in files
+                if not cache.has_key(make_cache_key(
+                    self._make_file_cache_key(
+                        path=path,
+                        revision=revision,
+                        base_commit_id=context.base_commit_id)))
+            ]
+
+            if len(uncached_files) > 1:
+                self.get_files(files=uncached_files)
+        except Exception as e:
+            logger.warning('Unable to prefetch %d files from repository '
+                           '%s: %s',
+                           len(files), self.pk, e)
+
     @deprecate_non_keyword_only_args(RemovedInReviewBoard10_0Warning)
     def get_file_exists(
         self,
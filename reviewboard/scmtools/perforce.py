@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
 import random
@@ -12,6 +13,7 @@ import socket
 import stat
 import subprocess
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
@@ -203,6 +205,26 @@ class STunnelProxy(object):
 
         shutil.rmtree(tempdir)
 
+    @property
+    def running(self) -> bool:
+        """Whether the stunnel process is running.
+
+        Version Added:
+            9.0
+
+        Type:
+            bool
+        """
+        if not self.pid:
+            return False
+
+        try:
+            os.kill(self.pid, 0)
+        except OSError:
+            return False
+
+        return True
+
     def shutdown(self):
         """Shut down the tunnel."""
         if self.pid:
@@ -241,6 +263,362 @@ class STunnelProxy(object):
                     pass
 
 
+class PerforceConnection:
+    """A pooled, authenticated connection to a Perforce server.
+
+    This wraps a connected :py:class:`P4.P4` instance, along with the
+    bookkeeping needed by :py:class:`PerforceConnectionPool`.
+
+    Instances are not thread-safe. They're handed out to one caller at a
+    time by :py:class:`PerforceConnectionPool`.
+
+    Version Added:
+        9.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The time the connection was opened, in :py:func:`time.monotonic` units.
+    created: float
+
+    #: The time the connection was last returned to the pool.
+    last_used: float
+
+    #: The time the login ticket was last checked.
+    last_ticket_check: float
+
+    def __init__(
+        self,
+        p4,
+    ) -> None:
+        """Initialize the connection.
+
+        Args:
+            p4 (P4.P4):
+                The connected Perforce client instance.
+        """
+        self.p4 = p4
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.last_ticket_check = self.created
+
+    @property
+    def alive(self) -> bool:
+        """Whether the connection is still open.
+
+        This will be ``False`` if the connection was closed or dropped by
+        the server.
+
+        Type:
+            bool
+        """
+        try:
+            return bool(self.p4.connected())
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """Close the connection."""
+        from P4 import P4Exception
+
+        try:
+            if self.p4.connected():
+                self.p4.disconnect()
+        except P4Exception as e:
+            logger.debug('Error disconnecting from Perforce host "%s": %s',
+                         self.p4.port, e)
+
+
+class PerforceConnectionPool:
+    """A pool of long-lived, authenticated Perforce connections.
+
+    Setting up a Perforce connection costs a TCP handshake, authentication,
+    and possibly a ticket check, all before the real command is run. This
+    pool keeps connections open between operations, so that fetching
+    several files for a diff only pays that cost once.
+
+    Pools are per-process, and are keyed off of the connection settings
+    for a repository. They're retrieved through :py:meth:`get_for_client`.
+
+    Idle connections are closed after :py:attr:`idle_timeout` seconds, and
+    connections are recycled after :py:attr:`max_age` seconds. At most
+    :py:attr:`max_connections` connections will be open at once. Reused
+    connections using ticket-based authentication will have their ticket
+    checked and refreshed every :py:attr:`ticket_check_interval` seconds.
+
+    If the repository uses stunnel, a single stunnel client is shared by
+    all connections in the pool.
+
+    Version Added:
+        9.0
+    """
+
+    #: The number of seconds an idle connection is kept before being closed.
+    idle_timeout: float = 60
+
+    #: The maximum number of seconds a connection is kept open.
+    max_age: float = 600
+
+    #: The maximum number of connections open at once per pool.
+    max_connections: int = 4
+
+    #: The number of seconds to wait for a connection to become available.
+    acquire_timeout: float = 30
+
+    #: The number of seconds between ticket checks on a reused connection.
+    ticket_check_interval: float = 5 * 60
+
+    _pools: dict[tuple, PerforceConnectionPool] = {}
+    _pools_lock = threading.Lock()
+    _pools_pid: (int | None) = None
+
+    @classmethod
+    def get_for_client(
+        cls,
+        client: PerforceClient,
+    ) -> PerforceConnectionPool:
+        """Return the pool for a client's connection settings.
+
+        If the process has forked since the pools were created, the pools
+        will be discarded, since the connections can't be shared with the
+        child process.
+
+        Args:
+            client (PerforceClient):
+                The client that will use the pool.
+
+        Returns:
+            PerforceConnectionPool:
+            The pool for the connection settings.
+        """
+        key = (
+            client.p4port,
+            client.use_stunnel,
+            client.username,
+            client.password,
+            client.encoding,
+            client.p4host,
+            client.client_name,
+            client.local_site_name,
+            client.use_ticket_auth,
+        )
+        pid = os.getpid()
+
+        with cls._pools_lock:
+            if cls._pools_pid != pid:
+                cls._pools = {}
+                cls._pools_pid = pid
+
+            try:
+                pool = cls._pools[key]
+            except KeyError:
+                pool = cls(p4port=client.p4port,
+                           use_stunnel=client.use_stunnel)
+                cls._pools[key] = pool
+
+        return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all pools owned by this process.
+
+        This is registered to run when the process exits, and can also be
+        used by unit tests to reset state.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+
+            if cls._pools_pid != os.getpid():
+                pools = []
+
+            cls._pools = {}
+
+        for pool in pools:
+            pool.close()
+
+    def __init__(
+        self,
+        p4port: str,
+        *,
+        use_stunnel: bool = False,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            p4port (str):
+                The Perforce port the pool connects to.
+
+            use_stunnel (bool, optional):
+                Whether connections go through a shared stunnel client.
+        """
+        self.p4port = p4port
+        self.use_stunnel = use_stunnel
+
+        self._idle: list[PerforceConnection] = []
+        self._num_open = 0
+        self._proxy: (STunnelProxy | None) = None
+        self._cond = threading.Condition()
+
+    def get_p4_port(self) -> str:
+        """Return the port that connections should be opened on.
+
+        If the pool uses stunnel, this will start the shared stunnel client
+        if it's not already running.
+
+        Returns:
+            str:
+            The port to connect to.
+        """
+        if not self.use_stunnel:
+            return self.p4port
+
+        with self._cond:
+            proxy = self._proxy
+
+            if proxy is None or not proxy.running:
+                proxy = STunnelProxy(self.p4port)
+                proxy.start_client()
+                self._proxy = proxy
+
+            return '127.0.0.1:%d' % proxy.port
+
+    def acquire(
+        self,
+        client: PerforceClient,
+    ) -> tuple[PerforceConnection, bool]:
+        """Acquire a connection from the pool.
+
+        Any idle connections that have expired or been dropped will be
+        closed. If there are no usable idle connections, a new one will be
+        opened through :py:meth:`PerforceClient.open_pooled_connection`.
+
+        Args:
+            client (PerforceClient):
+                The client acquiring the connection.
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            Tuple:
+                0 (PerforceConnection):
+                    The connection.
+
+                1 (bool):
+                    Whether the connection was newly opened.
+
+        Raises:
+            P4.P4Exception:
+                There was an error connecting or authenticating.
+
+            reviewboard.scmtools.errors.SCMError:
+                No connection became available in time.
+        """
+        now = time.monotonic()
+        expired: list[PerforceConnection] = []
+        conn: (PerforceConnection | None) = None
+
+        with self._cond:
+            while True:
+                idle: list[PerforceConnection] = []
+
+                for candidate in self._idle:
+                    if (now - candidate.last_used > self.idle_timeout or
+                        now - candidate.created > self.max_age or
+                        not candidate.alive):
+                        expired.append(candidate)
+                        self._num_open -= 1
+                    else:
+                        idle.append(candidate)
+
+                self._idle = idle
+
+                if idle:
+                    conn = idle.pop()
+                    break
+                elif self._num_open < self.max_connections:
+                    # Reserve a slot for the new connection.
+                    self._num_open += 1
+                    break
+                elif not self._cond.wait(timeout=self.acquire_timeout):
+                    raise SCMError(_(
+                        'Timed out waiting for a connection to the Perforce '
+                        'server.'
+                    ))
+
+                now = time.monotonic()
+
+        for candidate in expired:
+            candidate.close()
+
+        if conn is not None:
+            return conn, False
+
+        try:
+            conn = client.open_pooled_connection(self.get_p4_port())
+        except BaseException:
+            self._discard_slot()
+            raise
+
+        return conn, True
+
+    def release(
+        self,
+        conn: PerforceConnection,
+    ) -> None:
+        """Return a connection to the pool.
+
+        If the connection was dropped or has exceeded its maximum age, it
+        will be closed instead.
+
+        Args:
+            conn (PerforceConnection):
+                The connection to return.
+        """
+        now = time.monotonic()
+        conn.last_used = now
+
+        if now - conn.created <= self.max_age and conn.alive:
+            with self._cond:
+                self._idle.append(conn)
+                self._cond.notify()
+
+            return
+
+        conn.close()
+        self._discard_slot()
+
+    def close(self) -> None:
+        """Close all idle connections and the shared stunnel client."""
+        with self._cond:
+            idle = self._idle
+            self._idle = []
+            self._num_open -= len(idle)
+
+            proxy = self._proxy
+            self._proxy = None
+
+        for conn in idle:
+            conn.close()
+
+        if proxy is not None:
+            try:
+                proxy.shutdown()
+            except Exception:
+                pass
+
+    def _discard_slot(self) -> None:
+        """Release a connection slot without returning a connection."""
+        with self._cond:
+            self._num_open -= 1
+            self._cond.notify()
+
+
+atexit.register(PerforceConnectionPool.close_all)
+
+
 class PerforceClient(SCMClient):
     """Client for talking to a Perforce server.
 
@@ -256,6 +634,16 @@ class PerforceClient(SCMClient):
     #: We default this to 1 hour.
     TICKET_RENEWAL_SECS = 1 * 60 * 60
 
+    #: Whether to run operations on pooled connections.
+    #:
+    #: If enabled, :py:meth:`run_worker` will reuse authenticated connections
+    #: managed by :py:class:`PerforceConnectionPool`, rather than opening and
+    #: authenticating a new connection for every operation.
+    #:
+    #: Version Added:
+    #:     9.0
+    use_connection_pool: bool = True
+
     def __init__(
         self,
         path: str,
@@ -333,9 +721,18 @@ class PerforceClient(SCMClient):
         self.local_site_name = local_site_name
         self.use_ticket_auth = use_ticket_auth
 
-    def get_ticket_status(self):
+    def get_ticket_status(self, p4=None):
         """Return the status of the current login ticket.
 
+        Version Changed:
+            9.0:
+            Added the ``p4`` argument.
+
+        Args:
+            p4 (P4.P4, optional):
+                The connected Perforce client instance to check. This
+                defaults to :py:attr:`p4`.
+
         Returns:
             dict:
             A dictionary containing the following keys:
@@ -348,8 +745,11 @@ class PerforceClient(SCMClient):
         """
         from P4 import P4Exception
 
+        if p4 is None:
+            p4 = self.p4
+
         try:
-            status = self.p4.run_login('-s')[0]
+            status = p4.run_login('-s')[0]
         except (IndexError, P4Exception):
             return None
 
@@ -358,13 +758,25 @@ class PerforceClient(SCMClient):
             'expiration_secs': int(status['TicketExpiration']),
         }
 
-    def check_refresh_ticket(self):
+    def check_refresh_ticket(self, p4=None):
         """Refreshes a ticket or re-authenticates if needed.
 
         If the ticket has expired, is close to expiring, or the username has
         changed, a login will be performed.
+
+        Version Changed:
+            9.0:
+            Added the ``p4`` argument.
+
+        Args:
+            p4 (P4.P4, optional):
+                The connected Perforce client instance to check. This
+                defaults to :py:attr:`p4`.
         """
-        ticket_status = self.get_ticket_status()
+        if p4 is None:
+            p4 = self.p4
+
+        ticket_status = self.get_ticket_status(p4)
 
         if not ticket_status or ticket_status['user'] != self.username:
             logger.info('Perforce ticket for host "%s" (user "%s") does not '
@@ -378,19 +790,31 @@ class PerforceClient(SCMClient):
             # The ticket is fine. We don't need to log in again.
             return
 
-        self.login()
+        self.login(p4)
 
-    def login(self):
+    def login(self, p4=None):
         """Log into Perforce.
 
         If there's an existing ticket, this will extend the ticket instead
         of creating a new one.
+
+        Version Changed:
+            9.0:
+            Added the ``p4`` argument.
+
+        Args:
+            p4 (P4.P4, optional):
+                The connected Perforce client instance to log in with. This
+                defaults to :py:attr:`p4`.
         """
+        if p4 is None:
+            p4 = self.p4
+
         logger.info('Logging into Perforce host "%s" (user "%s")',
                     self.p4port, self.username)
 
-        self.p4.password = force_str(self.password)
-        self.p4.run_login()
+        p4.password = force_str(self.password)
+        p4.run_login()
 
     @contextmanager
     def connect(self):
@@ -401,28 +825,26 @@ class PerforceClient(SCMClient):
         should be used instead, as this will convert certain P4 exceptions to
         Review Board exceptions.
 
-        Context:
-            The context for the connection. Once the context ends, the
-            connection will close.
+        This uses the client's own :py:attr:`p4` instance, so it must not be
+        used by more than one thread at a time.
 
-            No variables are passed to the context.
+        Version Changed:
+            9.0:
+            The Perforce client instance is now passed to the context.
+
+        Context:
+            P4.P4:
+            The connected Perforce client instance. Once the context ends,
+            the connection will close.
 
         Example:
             .. code-block:: python
 
-                with client.connect():
+                with client.connect() as p4:
                     ...
         """
         p4 = self.p4
 
-        p4.user = force_str(self.username)
-
-        if encoding := self.encoding:
-            p4.charset = force_str(encoding)
-
-        # Exceptions will only be raised for errors, not warnings.
-        p4.exception_level = 1
-
         if self.use_stunnel:
             # Spin up an stunnel client and then redirect through that
             proxy = STunnelProxy(self.p4port)
@@ -432,6 +854,89 @@ class PerforceClient(SCMClient):
             proxy = None
             p4_port = self.p4port
 
+        self._setup_p4(p4, p4_port)
+
+        try:
+            with p4.connect():
+                if p4.connected():
+                    self._authenticate(p4)
+
+                yield p4
+        finally:
+            if proxy:
+                try:
+                    proxy.shutdown()
+                except Exception:
+                    pass
+
+    def open_pooled_connection(
+        self,
+        p4_port: str,
+    ) -> PerforceConnection:
+        """Open and authenticate a new connection for a connection pool.
+
+        This is called by :py:class:`PerforceConnectionPool` when it needs a
+        new connection. The connection is set up the same way as in
+        :py:meth:`connect`, but is left open when this returns.
+
+        Version Added:
+            9.0
+
+        Args:
+            p4_port (str):
+                The port to connect to. This may be a shared stunnel client.
+
+        Returns:
+            PerforceConnection:
+            The new connection.
+
+        Raises:
+            P4.P4Exception:
+                There was an error connecting or authenticating.
+        """
+        import P4
+
+        p4 = P4.P4()
+        self._setup_p4(p4, p4_port)
+
+        try:
+            p4.connect()
+
+            if p4.connected():
+                self._authenticate(p4)
+        except BaseException:
+            if p4.connected():
+                p4.disconnect()
+
+            raise
+
+        return PerforceConnection(p4)
+
+    def _setup_p4(
+        self,
+        p4,
+        p4_port: str,
+    ) -> None:
+        """Configure a Perforce client instance before connecting.
+
+        Version Added:
+            9.0
+
+        Args:
+            p4 (P4.P4):
+                The Perforce client instance to configure.
+
+            p4_port (str):
+                The port to connect to.
+        """
+        p4.user = force_str(self.username)
+
+        if encoding := self.encoding:
+            p4.charset = force_str(encoding)
+
+        # Exceptions will only be raised for errors, not warnings.
+        p4.exception_level = 1
+
         p4.port = force_str(p4_port)
 
         if p4host := self.p4host:
@@ -470,38 +975,89 @@ class PerforceClient(SCMClient):
             # need to set the password that's provided.
             p4.password = force_str(self.password)
 
+    def _authenticate(
+        self,
+        p4,
+    ) -> None:
+        """Authenticate a connection.
+
+        This must be called after connecting.
+
+        Version Added:
+            9.0
+
+        Args:
+            p4 (P4.P4):
+                The connected Perforce client instance to authenticate.
+        """
+        if self.use_ticket_auth:
+            # The ticket may not exist, may have expired, or may be close to
+            # expiring. Check for those conditions and possibly
+            # request/extend a ticket.
+            self.check_refresh_ticket(p4)
+        elif p4.password:
+            p4.run_login()
+
+    @contextmanager
+    def _connect_pooled(self):
+        """Run an operation on a pooled connection.
+
+        The pooled connection's Perforce client instance is passed to the
+        context, rather than being set in :py:attr:`p4`, so that a client can
+        be used by multiple threads at once. Afterward, the connection is
+        returned to the pool, unless it was dropped.
+
+        Version Added:
+            9.0
+
+        Context:
+            P4.P4:
+            The pooled connection's Perforce client instance.
+
+        Raises:
+            P4.P4Exception:
+                There was an error connecting or authenticating.
+        """
+        pool = PerforceConnectionPool.get_for_client(self)
+        conn, is_new = pool.acquire(self)
+        p4 = conn.p4
+
         try:
-            with p4.connect():
-                if p4.connected():
-                    if self.use_ticket_auth:
-                        # The ticket may not exist, may have expired, or may be
-                        # close to expiring. Check for those conditions and
-                        # possibly request/extend a ticket.
-                        self.check_refresh_ticket()
-                    elif p4.password:
-                        p4.run_login()
-
-                yield
+            if not is_new and self.use_ticket_auth:
+                now = time.monotonic()
+
+                if (now - conn.last_ticket_check >
+                    pool.ticket_check_interval):
+                    conn.last_ticket_check = now
+                    self.check_refresh_ticket(p4)
+
+            yield p4
         finally:
-            if proxy:
-                try:
-                    proxy.shutdown()
-                except Exception:
-                    pass
+            pool.release(conn)
 
     @contextmanager
     def run_worker(self):
         """Run a Perforce command from within a Perforce connection context.
 
-        This will set up a Perforce connection for an operation, disconnecting
-        when the context is finished, and raising a suitable exception if
-        anything goes wrong.
+        This will set up a Perforce connection for an operation, and raise a
+        suitable exception if anything goes wrong.
 
-        Context:
-            The context for the connection. Once the context ends, the
-            connection will close.
+        If :py:attr:`use_connection_pool` is enabled, the connection will
+        come from a :py:class:`PerforceConnectionPool` and be returned to it
+        when the context is finished. Otherwise, a new connection will be
+        opened and then closed when the context is finished.
 
-            No variables are passed to the context.
+        Operations must be run on the Perforce client instance passed to the
+        context, rather than on :py:attr:`p4`.
+
+        Version Changed:
+            9.0:
+            * Added support for pooled connections.
+            * The Perforce client instance is now passed to the context.
+
+        Context:
+            P4.P4:
+            The connected Perforce client instance.
 
         Raises:
             reviewboard.scmtools.errors.AuthenticationError:
@@ -524,14 +1080,19 @@ class PerforceClient(SCMClient):
         Example:
             .. code-block:: python
 
-                with client.run_worker():
+                with client.run_worker() as p4:
                     ...
         """
         from P4 import P4Exception
 
+        if self.use_connection_pool:
+            connect = self._connect_pooled
+        else:
+            connect = self.connect
+
         try:
-            with self.connect():
-                yield
+            with connect() as p4:
+                yield p4
         except P4Exception as e:
             try:
                 error = str(e)
@@ -585,16 +1146,16 @@ class PerforceClient(SCMClient):
         """
         changeset_id = str(changeset_id)
 
-        with self.run_worker():
+        with self.run_worker() as p4:
             try:
-                change = self.p4.run_change('-o', '-O', changeset_id)
+                change = p4.run_change('-o', '-O', changeset_id)
                 changeset_id = change[0]['Change']
             except Exception as e:
                 logger.warning('Failed to get updated changeset information '
                                'for CLN %s (%s): %s',
                                changeset_id, self.p4port, e, exc_info=True)
 
-            return self.p4.run_describe('-s', changeset_id)
+            return p4.run_describe('-s', changeset_id)
 
     def get_info(self):
         """Return information on a Perforce server connection.
@@ -603,8 +1164,8 @@ class PerforceClient(SCMClient):
             list of dict:
             A list of connection detail dictionaries.
         """
-        with self.run_worker():
-            return self.p4.run_info()
+        with self.run_worker() as p4:
+            return p4.run_info()
 
     def get_file(self, path, revision):
         """Return the contents of a file at a specified revision.
@@ -628,12 +1189,12 @@ class PerforceClient(SCMClient):
         else:
             depot_path = '%s#%s' % (path, revision)
 
-        with self.run_worker():
+        with self.run_worker() as p4:
             fd, filename = tempfile.mkstemp(prefix='reviewboard.')
 
             try:
                 os.close(fd)
-                self.p4.run_print('-q', '-o', filename, depot_path)
+                p4.run_print('-q', '-o', filename, depot_path)
 
                 if os.path.islink(filename):
                     return b''
@@ -673,8 +1234,8 @@ class PerforceClient(SCMClient):
         else:
             depot_path = '%s#%s' % (path, revision)
 
-        with self.run_worker():
-            res = self.p4.run_fstat(depot_path)
+        with self.run_worker() as p4:
+            res = p4.run_fstat(depot_path)
 
         if res:
             return res[-1]
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 
-from django.db.models.signals import post_init
+from django.db.models.signals import (m2m_changed, post_delete, post_init,
+                                      post_save)
 
 from reviewboard.scmtools.models import Repository
 
@@ -68,6 +69,58 @@ def _migrate_scmtool_ids(instance, **kwargs):
                                  scmtool_id, instance.pk, e)
 
 
+def _on_repository_saved(instance, created, update_fields, using,
+                         **kwargs):
+    """Invalidate cached repository ACLs when access may have changed.
+
+    Version Added:
+        9.0
+
+    Args:
+        instance (reviewboard.scmtools.models.Repository):
+            The repository that was saved.
+
+        created (bool):
+            Whether the repository was created.
+
+        update_fields (set of str):
+            The fields that were specifically updated, if any.
+
+        using (str):
+            The database alias being used.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    if (created or
+        not update_fields or
+        not update_fields.isdisjoint(('local_site', 'public', 'visible'))):
+        Repository.objects.invalidate_acl_cache(using=using)
+
+
+def _on_repository_acl_changed(using, action=None, **kwargs):
+    """Invalidate cached repository ACLs when access lists change.
+
+    This handles deleting repositories and changing their user or review
+    group access lists.
+
+    Version Added:
+        9.0
+
+    Args:
+        using (str):
+            The database alias being used.
+
+        action (str, optional):
+            The M2M action being performed, for M2M changes.
+
+        **kwargs (dict, unused):
+            Additional keyword arguments passed to the signal.
+    """
+    if action in (None, 'post_add', 'post_remove', 'post_clear'):
+        Repository.objects.invalidate_acl_cache(using=using)
+
+
 def connect_signal_handlers():
     """Connect SCMTool-related signal handlers.
 
@@ -75,3 +128,11 @@ def connect_signal_handlers():
         5.0
     """
     post_init.connect(_migrate_scmtool_ids, sender=Repository)
+
+    # Invalidate cached repository ACLs any time access may have changed.
+    post_save.connect(_on_repository_saved, sender=Repository)
+    post_delete.connect(_on_repository_acl_changed, sender=Repository)
+    m2m_changed.connect(_on_repository_acl_changed,
+                        sender=Repository.users.through)
+    m2m_changed.connect(_on_repository_acl_changed,
+                        sender=Repository.review_groups.through)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import signal
 import unittest
 
 import kgb
@@ -13,7 +14,11 @@ from reviewboard.diffviewer.parser import DiffParserError
 from reviewboard.diffviewer.testing.mixins import DiffParserTestingMixin
 from reviewboard.scmtools.core import PRE_CREATION
 from reviewboard.scmtools.errors import SCMError, FileNotFoundError
-from reviewboard.scmtools.git import ShortSHA1Error, GitClient, GitTool
+from reviewboard.scmtools.git import (GitCatFilePool,
+                                      GitCatFileProcess,
+                                      GitClient,
+                                      GitTool,
+                                      ShortSHA1Error)
 from reviewboard.scmtools.tests.testcases import SCMTestCase
 from reviewboard.testing.testcase import TestCase
 
@@ -52,6 +57,11 @@ class GitTests(DiffParserTestingMixin, kgb.SpyAgency, SCMTestCase):
         except ImportError:
             raise unittest.SkipTest('git binary not found')
 
+    def tearDown(self):
+        GitCatFilePool.close_all()
+
+        super().tearDown()
+
     def _read_diff_fixture(self, filename, expected_num_diffs):
         """Read a diff fixture from the test data.
 
@@ -1206,6 +1216,123 @@ class GitTests(DiffParserTestingMixin, kgb.SpyAgency, SCMTestCase):
         with self.assertRaises(FileNotFoundError):
             tool.get_file('readme', '0000000')
 
+    def test_get_file_with_cat_file_pool(self):
+        """Testing GitTool.get_file reuses pooled git cat-file processes"""
+        tool = self.tool
+
+        self.spy_on(GitCatFileProcess.request, owner=GitCatFileProcess)
+
+        self.assertEqual(tool.get_file('readme', 'e965047'), b'Hello\n')
+        self.assertEqual(tool.get_file('readme', 'd6613f5'),
+                         b'Hello there\n')
+        self.assertTrue(tool.file_exists('readme', 'e965047'))
+        self.assertFalse(tool.file_exists('readme', 'fffffff'))
+
+        self.assertSpyCallCount(GitCatFileProcess.request, 4)
+
+        pool = GitCatFilePool.get_for_git_dir(tool.client.git_dir)
+        self.assertEqual(len(pool._idle), 1)
+
+    def test_get_file_with_cat_file_pool_crashed_process(self):
+        """Testing GitTool.get_file recovers from a crashed pooled git
+        cat-file process
+        """
+        tool = self.tool
+
+        self.assertEqual(tool.get_file('readme', 'e965047'), b'Hello\n')
+
+        pool = GitCatFilePool.get_for_git_dir(tool.client.git_dir)
+        self.assertEqual(len(pool._idle), 1)
+
+        process = pool._idle[0]
+        process._process.stdin.close()
+
+        self.assertEqual(tool.get_file('readme', 'd6613f5'),
+                         b'Hello there\n')
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIsNot(pool._idle[0], process)
+
+    def test_get_file_with_cat_file_pool_expired_process(self):
+        """Testing GitTool.get_file replaces expired pooled git cat-file
+        processes
+        """
+        tool = self.tool
+
+        self.assertEqual(tool.get_file('readme', 'e965047'), b'Hello\n')
+
+        pool = GitCatFilePool.get_for_git_dir(tool.client.git_dir)
+        process = pool._idle[0]
+        process.last_used -= pool.idle_timeout + 1
+
+        self.assertEqual(tool.get_file('readme', 'e965047'), b'Hello\n')
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIsNot(pool._idle[0], process)
+        self.assertFalse(process.alive)
+
+    def test_get_file_with_cat_file_pool_unresponsive_process(self):
+        """Testing GitTool.get_file replaces pooled git cat-file processes
+        that stop responding
+        """
+        tool = self.tool
+
+        self.assertEqual(tool.get_file('readme', 'e965047'), b'Hello\n')
+
+        pool = GitCatFilePool.get_for_git_dir(tool.client.git_dir)
+        process = pool._idle[0]
+        process.timeout = 0.1
+        os.kill(process._process.pid, signal.SIGSTOP)
+
+        self.assertEqual(tool.get_file('readme', 'd6613f5'),
+                         b'Hello there\n')
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIsNot(pool._idle[0], process)
+        self.assertTrue(process.timed_out)
+        self.assertFalse(process.alive)
+
+    def test_cat_file_process_request_with_missing_name_with_spaces(self):
+        """Testing GitCatFileProcess.request with a missing object name
+        containing spaces
+        """
+        process = GitCatFileProcess(self.tool.client.git_dir)
+        self.addCleanup(process.close)
+
+        self.assertIsNone(process.request('e965047:no such'))
+        self.assertIsNone(process.request('e965047:no such file'))
+        self.assertEqual(process.request('e965047'),
+                         (b'blob', b'Hello\n'))
+
+    def test_cat_file_process_request_with_timeout(self):
+        """Testing GitCatFileProcess.request with a process that stops
+        responding
+        """
+        process = GitCatFileProcess(self.tool.client.git_dir)
+        process.timeout = 0.1
+        self.addCleanup(process.close)
+
+        os.kill(process._process.pid, signal.SIGSTOP)
+
+        message = 'git cat-file did not respond within 0.1 seconds'
+
+        with self.assertRaisesMessage(OSError, message):
+            process.request('e965047')
+
+        self.assertTrue(process.timed_out)
+        self.assertFalse(process.alive)
+
+    def test_get_file_without_cat_file_pool(self):
+        """Testing GitTool.get_file with GitClient.use_cat_file_pool=False"""
+        tool = self.tool
+        tool.client.use_cat_file_pool = False
+
+        self.spy_on(GitCatFilePool.request, owner=GitCatFilePool)
+
+        self.assertEqual(tool.get_file('readme', 'e965047'), b'Hello\n')
+
+        with self.assertRaises(FileNotFoundError):
+            tool.get_file('readme', '0000000')
+
+        self.assertSpyNotCalled(GitCatFilePool.request)
+
     def test_parse_diff_revision_with_remote_and_short_SHA1_error(self):
         """Testing GitTool.parse_diff_revision with remote files and short
         SHA1 error
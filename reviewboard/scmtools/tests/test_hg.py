@@ -18,7 +18,9 @@ from reviewboard.scmtools.core import (
     Revision,
 )
 from reviewboard.scmtools.errors import SCMError, FileNotFoundError
-from reviewboard.scmtools.hg import (HgDiffParser,
+from reviewboard.scmtools.hg import (HgCommandServer,
+                                     HgCommandServerPool,
+                                     HgDiffParser,
                                      HgGitDiffParser,
                                      HgTool,
                                      HgWebClient)
@@ -32,7 +34,7 @@ if TYPE_CHECKING:
     from reviewboard.scmtools.core import RevisionID, SCMClient
 
 
-class MercurialTests(DiffParserTestingMixin, SCMTestCase):
+class MercurialTests(kgb.SpyAgency, DiffParserTestingMixin, SCMTestCase):
     """Unit tests for mercurial."""
 
     fixtures = ['test_scmtools']
@@ -53,6 +55,12 @@ class MercurialTests(DiffParserTestingMixin, SCMTestCase):
         except ImportError:
             raise unittest.SkipTest('Hg is not installed')
 
+    def tearDown(self) -> None:
+        """Tear down the test."""
+        super().tearDown()
+
+        HgCommandServerPool.close_all()
+
     def test_ssh_disallowed(self) -> None:
         """Testing HgTool does not allow SSH URLs"""
         with self.assertRaises(SCMError):
@@ -427,6 +435,130 @@ class MercurialTests(DiffParserTestingMixin, SCMTestCase):
         self.assertTrue(isinstance(value, list))
         self.assertEqual(len(value), 1)
 
+    def test_get_file_with_command_server(self) -> None:
+        """Testing HgTool.get_file reuses a command server"""
+        self.spy_on(HgCommandServerPool.run_command,
+                    owner=HgCommandServerPool)
+
+        content = self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+        self.assertEqual(content, b'Hello\n\ngoodbye\n')
+
+        pool = HgCommandServerPool.get_for_path(self.tool.client.path)
+        self.assertEqual(len(pool._idle), 1)
+        server = pool._idle[0]
+
+        self.spy_on(HgCommandServer.__init__, owner=HgCommandServer)
+
+        content = self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+        self.assertEqual(content, b'Hello\n\ngoodbye\n')
+
+        self.assertSpyCalled(HgCommandServerPool.run_command)
+        self.assertSpyNotCalled(HgCommandServer.__init__)
+
+        self.assertEqual(pool._idle, [server])
+        self.assertTrue(server.alive)
+
+    def test_get_file_with_command_server_expired(self) -> None:
+        """Testing HgTool.get_file replaces an exited idle command server"""
+        self.tool.get_file('doc/readme', Revision('f814b6e226d2'))
+
+        pool = HgCommandServerPool.get_for_path(self.tool.client.path)
+        server = pool._idle[0]
+        server._process.kill()
+        server._process.wait()
+
+        # The dead server will be reaped when acquiring a new one.
+        content = self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+        self.assertEqual(content, b'Hello\n\ngoodbye\n')
+
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIsNot(pool._idle[0], server)
+
+    def test_get_file_with_command_server_crash(self) -> None:
+        """Testing HgTool.get_file retries a command on a new command server
+        when the server crashes mid-command
+        """
+        self.tool.get_file('doc/readme', Revision('f814b6e226d2'))
+
+        pool = HgCommandServerPool.get_for_path(self.tool.client.path)
+        server = pool._idle[0]
+
+        def _crash(_self, *args, **kwargs):
+            # Kill the server once the command is underway, so that sending
+            # or reading the response fails.
+            _self._process.kill()
+            _self._process.wait()
+
+            return HgCommandServer.run_command.call_original(
+                _self, *args, **kwargs)
+
+        self.spy_on(HgCommandServer.run_command,
+                    owner=HgCommandServer,
+                    op=kgb.SpyOpMatchInOrder([
+                        {
+                            'call_fake': _crash,
+                        },
+                        {
+                            'call_original': True,
+                        },
+                    ]))
+
+        content = self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+        self.assertEqual(content, b'Hello\n\ngoodbye\n')
+
+        self.assertSpyCallCount(HgCommandServer.run_command, 2)
+        self.assertFalse(server.alive)
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIsNot(pool._idle[0], server)
+
+    def test_get_file_with_command_server_max_active(self) -> None:
+        """Testing HgTool.get_file with all command server slots in use"""
+        pool = HgCommandServerPool.get_for_path(self.tool.client.path)
+        pool.max_active = 1
+        pool.command_timeout = 0.1
+
+        # Hold the only slot, as a command running in another thread would.
+        pool._reserve_slot()
+        self.addCleanup(pool._free_slot)
+
+        self.spy_on(HgCommandServer.__init__, owner=HgCommandServer)
+
+        message = (
+            'Timed out running hg cat: Timed out waiting for an available '
+            'hg command server'
+        )
+
+        with self.assertRaisesMessage(SCMError, message):
+            self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+
+        self.assertSpyNotCalled(HgCommandServer.__init__)
+        self.assertEqual(pool._idle, [])
+
+    def test_get_file_with_command_server_fallback(self) -> None:
+        """Testing HgTool.get_file falls back to hg when the command server
+        fails
+        """
+        self.spy_on(HgCommandServerPool.run_command,
+                    owner=HgCommandServerPool,
+                    op=kgb.SpyOpRaise(OSError('Oh no')))
+
+        content = self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+        self.assertEqual(content, b'Hello\n\ngoodbye\n')
+
+        self.assertSpyCalled(HgCommandServerPool.run_command)
+
+    def test_get_file_without_command_server(self) -> None:
+        """Testing HgTool.get_file with use_command_server=False"""
+        self.tool.client.use_command_server = False
+
+        self.spy_on(HgCommandServerPool.run_command,
+                    owner=HgCommandServerPool)
+
+        content = self.tool.get_file('doc/readme', Revision('661e5dd3c493'))
+        self.assertEqual(content, b'Hello\n\ngoodbye\n')
+
+        self.assertSpyNotCalled(HgCommandServerPool.run_command)
+
     def test_get_file(self) -> None:
         """Testing HgTool.get_file"""
         tool = self.tool
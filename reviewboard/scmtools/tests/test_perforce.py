@@ -29,7 +29,9 @@ from reviewboard.scmtools.errors import (AuthenticationError,
                                          RepositoryNotFoundError,
                                          SCMError,
                                          UnverifiedCertificateError)
-from reviewboard.scmtools.perforce import PerforceTool, STunnelProxy
+from reviewboard.scmtools.perforce import (PerforceConnectionPool,
+                                           PerforceTool,
+                                           STunnelProxy)
 from reviewboard.scmtools.tests.testcases import SCMTestCase
 from reviewboard.site.models import LocalSite
 from reviewboard.testing.testcase import TestCase
@@ -126,6 +128,8 @@ class BasePerforceTestCase(SpyAgency, SCMTestCase):
         """Tear down the test case class."""
         super().tearDownClass()
 
+        PerforceConnectionPool.close_all()
+
         if has_p4d:
             try:
                 cls.p4d_process.terminate()
@@ -157,6 +161,7 @@ class PerforceTests(DiffParserTestingMixin, BasePerforceTestCase):
         """Tear down the test case."""
         super().tearDown()
 
+        PerforceConnectionPool.close_all()
         shutil.rmtree(os.path.join(settings.SITE_DATA_DIR, 'p4'),
                       ignore_errors=True)
 
@@ -281,6 +286,7 @@ class PerforceTests(DiffParserTestingMixin, BasePerforceTestCase):
         p4 = DummyP4()
         client = tool.client
         client.p4 = p4
+        client.use_connection_pool = False
 
         fingerprint = \
             'A0:B1:C2:D3:E4:F5:6A:7B:8C:9D:E0:F1:2A:3B:4C:5D:6E:7F:A1:B2'
@@ -313,6 +319,7 @@ class PerforceTests(DiffParserTestingMixin, BasePerforceTestCase):
         p4 = DummyP4()
         client = tool.client
         client.p4 = p4
+        client.use_connection_pool = False
 
         fingerprint = \
             'A0:B1:C2:D3:E4:F5:6A:7B:8C:9D:E0:F1:2A:3B:4C:5D:6E:7F:A1:B2'
@@ -347,6 +354,7 @@ class PerforceTests(DiffParserTestingMixin, BasePerforceTestCase):
         p4 = DummyP4()
         client = tool.client
         client.p4 = p4
+        client.use_connection_pool = False
 
         fingerprint = \
             'A0:B1:C2:D3:E4:F5:6A:7B:8C:9D:E0:F1:2A:3B:4C:5D:6E:7F:A1:B2'
@@ -512,6 +520,96 @@ class PerforceTests(DiffParserTestingMixin, BasePerforceTestCase):
         self.assertFalse(self.tool.file_exists('//depot/xxx-new-file',
                                                PRE_CREATION))
 
+    @unittest.skipIf(not has_p4d,
+                     'The p4d command line tool is not installed')
+    def test_run_worker_reuses_pooled_connection(self) -> None:
+        """Testing PerforceTool.run_worker reuses pooled connections"""
+        client = self.tool.client
+
+        self.spy_on(client.open_pooled_connection)
+
+        self.assertTrue(self.tool.file_exists('//depot/model.py', '2'))
+        self.assertEqual(self.tool.get_file('//depot/model.py', '4'), b'')
+
+        self.assertSpyCallCount(client.open_pooled_connection, 1)
+
+        pool = PerforceConnectionPool.get_for_client(client)
+        self.assertEqual(len(pool._idle), 1)
+        self.assertTrue(pool._idle[0].alive)
+
+    @unittest.skipIf(not has_p4d,
+                     'The p4d command line tool is not installed')
+    def test_run_worker_discards_dropped_connection(self) -> None:
+        """Testing PerforceTool.run_worker discards dropped pooled
+        connections
+        """
+        client = self.tool.client
+
+        self.spy_on(client.open_pooled_connection)
+
+        self.assertTrue(self.tool.file_exists('//depot/model.py', '2'))
+
+        pool = PerforceConnectionPool.get_for_client(client)
+        pool._idle[0].p4.disconnect()
+
+        self.assertTrue(self.tool.file_exists('//depot/model.py', '2'))
+
+        self.assertSpyCallCount(client.open_pooled_connection, 2)
+        self.assertEqual(len(pool._idle), 1)
+
+    @unittest.skipIf(not has_p4d,
+                     'The p4d command line tool is not installed')
+    def test_run_worker_with_pooled_connection_keeps_client_p4(self) -> None:
+        """Testing PerforceTool.run_worker with a pooled connection passes
+        the connection to the context without replacing PerforceClient.p4
+        """
+        client = self.tool.client
+        client_p4 = client.p4
+
+        with client.run_worker() as p4:
+            self.assertIsNot(p4, client_p4)
+            self.assertIs(client.p4, client_p4)
+            self.assertTrue(p4.connected())
+
+        pool = PerforceConnectionPool.get_for_client(client)
+        self.assertEqual(len(pool._idle), 1)
+        self.assertIs(pool._idle[0].p4, p4)
+
+    @unittest.skipIf(not has_p4d,
+                     'The p4d command line tool is not installed')
+    def test_run_worker_with_auth_error_releases_slot(self) -> None:
+        """Testing PerforceTool.run_worker with an authentication error
+        releases the pooled connection slot
+        """
+        repo = self.create_repository(
+            path='localhost:61666',
+            tool_name='Perforce',
+            username='samwise',
+            password='bogus',
+            encoding='none')
+        tool = repo.get_scmtool()
+
+        for i in range(PerforceConnectionPool.max_connections + 1):
+            with self.assertRaises(AuthenticationError):
+                tool.get_changeset('4')
+
+        pool = PerforceConnectionPool.get_for_client(tool.client)
+        self.assertEqual(pool._num_open, 0)
+
+    @unittest.skipIf(not has_p4d,
+                     'The p4d command line tool is not installed')
+    def test_run_worker_without_connection_pool(self) -> None:
+        """Testing PerforceTool.run_worker with use_connection_pool=False"""
+        client = self.tool.client
+        client.use_connection_pool = False
+
+        self.spy_on(client.open_pooled_connection)
+
+        self.assertTrue(self.tool.file_exists('//depot/model.py', '2'))
+
+        self.assertSpyNotCalled(client.open_pooled_connection)
+        self.assertFalse(client.p4.connected())
+
     @unittest.skipIf(not has_p4d,
                      'The p4d command line tool is not installed')
     def test_custom_host(self) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import threading
 
 import kgb
 from django_assert_queries.testing import assert_queries
@@ -467,6 +468,143 @@ class RepositoryTests(kgb.SpyAgency, TestCase):
             request=request,
             context=context)
 
+    def test_get_files(self):
+        """Testing Repository.get_files fetches concurrently and caches
+        results
+        """
+        repository = self.repository
+        scmtool_cls = repository.scmtool_class
+        thread_names = set()
+
+        def _get_file(_self, path, revision, **kwargs):
+            thread_names.add(threading.current_thread().name)
+
+            return f'{path}@{revision}'.encode()
+
+        self.spy_on(scmtool_cls.get_file,
+                    owner=scmtool_cls,
+                    call_fake=_get_file)
+
+        context = FileLookupContext()
+        files = [
+            ('README', 'abc123', context),
+            ('main.c', 'def456', context),
+            ('main.h', '789abc', context),
+        ]
+
+        self.assertTrue(repository.supports_concurrent_file_fetches)
+        self.assertEqual(
+            repository.get_files(files=files,
+                                 max_workers=2),
+            [
+                b'README@abc123',
+                b'main.c@def456',
+                b'main.h@789abc',
+            ])
+        self.assertSpyCallCount(scmtool_cls.get_file, 3)
+        self.assertTrue(all(
+            name.startswith('rb-file-fetch')
+            for name in thread_names
+        ))
+
+        # The results should now be cached.
+        self.assertEqual(repository.get_file(path='main.c',
+                                             revision='def456'),
+                         b'main.c@def456')
+        self.assertSpyCallCount(scmtool_cls.get_file, 3)
+
+    def test_get_files_without_concurrency(self):
+        """Testing Repository.get_files fetches serially when the SCMTool
+        does not support concurrent fetches
+        """
+        repository = self.create_repository(name='Test repo',
+                                            tool_name='Test')
+        scmtool_cls = repository.scmtool_class
+        thread_names = set()
+
+        def _get_file(_self, path, revision, **kwargs):
+            thread_names.add(threading.current_thread().name)
+
+            return path.encode()
+
+        self.spy_on(scmtool_cls.get_file,
+                    owner=scmtool_cls,
+                    call_fake=_get_file)
+
+        context = FileLookupContext()
+
+        self.assertFalse(repository.supports_concurrent_file_fetches)
+        self.assertEqual(
+            repository.get_files(files=[
+                ('README', 'abc123', context),
+                ('main.c', 'def456', context),
+            ]),
+            [b'README', b'main.c'])
+        self.assertEqual(thread_names,
+                         {threading.current_thread().name})
+
+    def test_prefetch_files_skips_cached(self):
+        """Testing Repository.prefetch_files skips cached files"""
+        repository = self.repository
+        scmtool_cls = repository.scmtool_class
+
+        self.spy_on(scmtool_cls.get_file,
+                    owner=scmtool_cls,
+                    op=kgb.SpyOpReturn(b'data'))
+        self.spy_on(repository.get_files)
+
+        context = FileLookupContext()
+        repository.get_file(path='README',
+                            revision='abc123',
+                            context=context)
+
+        repository.prefetch_files(files=[
+            ('README', 'abc123', context),
+            ('main.c', 'def456', context),
+            ('main.h', '789abc', context),
+        ])
+
+        self.assertSpyCalledWith(
+            repository.get_files,
+            files=[
+                ('main.c', 'def456', context),
+                ('main.h', '789abc', context),
+            ])
+        self.assertSpyCallCount(scmtool_cls.get_file, 3)
+
+    def test_prefetch_files_without_concurrency(self):
+        """Testing Repository.prefetch_files does nothing when the SCMTool
+        does not support concurrent fetches
+        """
+        repository = self.create_repository(name='Test repo',
+                                            tool_name='Test')
+        self.spy_on(repository.get_files)
+
+        context = FileLookupContext()
+        repository.prefetch_files(files=[
+            ('README', 'abc123', context),
+            ('main.c', 'def456', context),
+        ])
+
+        self.assertSpyNotCalled(repository.get_files)
+
+    def test_prefetch_files_with_error(self):
+        """Testing Repository.prefetch_files ignores errors"""
+        repository = self.repository
+        scmtool_cls = repository.scmtool_class
+
+        self.spy_on(scmtool_cls.get_file,
+                    owner=scmtool_cls,
+                    op=kgb.SpyOpRaise(Exception('Oh no')))
+
+        context = FileLookupContext()
+        repository.prefetch_files(files=[
+            ('README', 'abc123', context),
+            ('main.c', 'def456', context),
+        ])
+
+        self.assertSpyCallCount(scmtool_cls.get_file, 2)
+
     def test_hosting_service(self):
         """Testing Repository.hosting_service with a valid hosting service"""
         account = HostingServiceAccount.objects.create(
@@ -1431,6 +1431,88 @@ class AccessibleIDsTests(AccessibleTestsMixin, TestCase):
                 user,
                 local_site=LocalSite.ALL))
 
+    def test_caching(self) -> None:
+        """Testing Repository.objects.accessible_ids caches results"""
+        user = User.objects.get(username='doc')
+        repository = self.create_repository(public=False)
+        repository.users.add(user)
+
+        accessible_ids = Repository.objects.accessible_ids(user)
+        self.assertEqual(accessible_ids, [repository.pk])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(Repository.objects.accessible_ids(user),
+                             accessible_ids)
+
+    def test_caching_with_user_access_changed(self) -> None:
+        """Testing Repository.objects.accessible_ids invalidates cache when
+        user access lists change
+        """
+        user = User.objects.get(username='doc')
+        repository = self.create_repository(public=False)
+
+        self.assertEqual(Repository.objects.accessible_ids(user), [])
+
+        repository.users.add(user)
+        self.assertEqual(Repository.objects.accessible_ids(user),
+                         [repository.pk])
+
+        repository.users.remove(user)
+        self.assertEqual(Repository.objects.accessible_ids(user), [])
+
+    def test_caching_with_access_changed_in_transaction(self) -> None:
+        """Testing Repository.objects.accessible_ids invalidates cache again
+        when the transaction changing access commits
+        """
+        user = User.objects.get(username='doc')
+        repository = self.create_repository(public=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            repository.users.add(user)
+
+            # Another request may cache results under the new state before
+            # the change is committed.
+            acl_state = Repository.objects.get_acl_state()
+
+        self.assertNotEqual(Repository.objects.get_acl_state(), acl_state)
+
+    def test_caching_with_group_membership_changed(self) -> None:
+        """Testing Repository.objects.accessible_ids invalidates cache when
+        review group membership changes
+        """
+        user = User.objects.get(username='doc')
+        repository = self.create_repository(public=False)
+        group = self.create_review_group()
+        repository.review_groups.add(group)
+
+        self.assertEqual(Repository.objects.accessible_ids(user), [])
+
+        group.users.add(user)
+        self.assertEqual(Repository.objects.accessible_ids(user),
+                         [repository.pk])
+
+        group.delete()
+        self.assertEqual(Repository.objects.accessible_ids(user), [])
+
+    def test_caching_with_visibility_changed(self) -> None:
+        """Testing Repository.objects.accessible_ids invalidates cache when
+        repository visibility changes
+        """
+        user = User.objects.get(username='doc')
+        repository = self.create_repository(public=True)
+
+        self.assertEqual(Repository.objects.accessible_ids(user),
+                         [repository.pk])
+
+        repository.public = False
+        repository.save(update_fields=('public',))
+        self.assertEqual(Repository.objects.accessible_ids(user), [])
+
+        repository.visible = False
+        repository.public = True
+        repository.save()
+        self.assertEqual(Repository.objects.accessible_ids(user), [])
+
     def _test_accessible_ids(
         self,
         *,
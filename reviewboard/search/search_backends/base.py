@@ -56,6 +56,15 @@ class SearchBackend(object):
     #: A mapping of search engine settings to form fields.
     form_field_map = {}
 
+    #: Whether multiple processes can write to the search index at once.
+    #:
+    #: This is used by the :command:`index` management command to determine
+    #: whether the index can be rebuilt using multiple workers.
+    #:
+    #: Version Added:
+    #:     9.0
+    supports_parallel_indexing = True
+
     @property
     def configuration(self):
         """The configuration for the search engine.
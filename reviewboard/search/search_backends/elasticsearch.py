@@ -115,6 +115,10 @@ class ElasticsearchBackend(SearchBackend):
     default_settings = {
         'URL': 'http://127.0.0.1:9200/',
         'INDEX_NAME': 'reviewboard',
+
+        # The number of objects sent in each bulk request when rebuilding or
+        # updating the index.
+        'BATCH_SIZE': 1000,
     }
     config_form_class = ElasticsearchConfigForm
     form_field_map = {
@@ -55,6 +55,9 @@ class WhooshBackend(SearchBackend):
         'search_index_file': 'PATH',
     }
 
+    # Whoosh only allows a single writer to hold the index lock at a time.
+    supports_parallel_indexing = False
+
     @property
     def default_settings(self):
         """The default settings for the backend.
@@ -62,8 +65,16 @@ class WhooshBackend(SearchBackend):
         This is dynamic, in order to account for a change to
         ``SITE_DATA_DIR``. In production, this value shouldn't change, but
         it does in unit tests.
+
+        ``BATCH_SIZE`` is the number of objects written to the index at a
+        time when rebuilding or updating the index.
+
+        Version Changed:
+            9.0:
+            Added ``BATCH_SIZE``.
         """
         return {
+            'BATCH_SIZE': 1000,
             'PATH': os.path.join(settings.SITE_DATA_DIR, 'search-index'),
             'STORAGE': 'file',
         }
@@ -3,20 +3,30 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from functools import partial
+from typing import Iterable, TYPE_CHECKING
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections, transaction
 from django.db.models.signals import post_delete, post_save, m2m_changed
 from djblets.siteconfig.models import SiteConfiguration
+from haystack.exceptions import NotHandled
 from haystack.signals import BaseSignalProcessor
+from haystack.utils import get_model_ct
 
 from reviewboard.accounts.models import Profile
 from reviewboard.reviews.models import Group, ReviewRequest
 from reviewboard.reviews.signals import review_request_published
 from reviewboard.search import search_backend_registry
 
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    _IndexChanges = dict[type[Model], set[int]]
+
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +42,17 @@ class SignalProcessor(BaseSignalProcessor):
 
     1) Search is enabled.
     2) The current search engine backend supports on-the-fly indexing.
+
+    If the ``search_index_batching_enabled`` site configuration setting is
+    enabled, changed objects are instead collected for the current
+    transaction and updated in bulk once it commits. Each object is only
+    updated once per batch, no matter how many times it changed. If the
+    ``search_index_flush_interval`` setting is greater than 0, batches are
+    collected for that many seconds and updated on a background thread.
+
+    Version Changed:
+        9.0:
+        Added support for batched indexing.
     """
 
     save_signals = [
@@ -59,6 +80,11 @@ class SignalProcessor(BaseSignalProcessor):
         self._can_process_signals = False
         self._handlers = {}
         self._pending_user_changes = threading.local()
+        self._pending_index_changes = threading.local()
+        self._queued_index_changes: _IndexChanges = {}
+        self._queue_lock = threading.Lock()
+        self._flush_timer: (threading.Timer | None) = None
+        self._flush_timer_pid: (int | None) = None
 
         super(SignalProcessor, self).__init__(*args, **kwargs)
 
@@ -74,6 +100,20 @@ class SignalProcessor(BaseSignalProcessor):
 
         return self._can_process_signals
 
+    @property
+    def batching_enabled(self) -> bool:
+        """Whether index updates are batched.
+
+        Version Added:
+            9.0
+
+        Type:
+            bool
+        """
+        siteconfig = SiteConfiguration.objects.get_current()
+
+        return bool(siteconfig.get('search_index_batching_enabled'))
+
     def setup(self):
         """Register the signal handlers for this processor."""
 
@@ -131,7 +171,10 @@ class SignalProcessor(BaseSignalProcessor):
                 kwargs['sender'] = User
                 instance = instance.user
 
-            self.handle_save(instance=instance, **kwargs)
+            if self.batching_enabled:
+                self._queue_index_changes(kwargs['sender'], [instance.pk])
+            else:
+                self.handle_save(instance=instance, **kwargs)
 
     def check_handle_delete(self, **kwargs):
         """Conditionally update the search index when an object is deleted.
@@ -147,7 +190,13 @@ class SignalProcessor(BaseSignalProcessor):
         backend = search_backend_registry.current_backend
 
         if backend and search_backend_registry.on_the_fly_indexing_enabled:
-            self.handle_delete(**kwargs)
+            if self.batching_enabled:
+                # Deleted objects won't be found when the batch is
+                # processed, and will be removed from the index.
+                self._queue_index_changes(kwargs['sender'],
+                                          [kwargs['instance'].pk])
+            else:
+                self.handle_delete(**kwargs)
 
     def handle_save(self, **kwargs):
         """Update the search index when an object is updated.
@@ -189,6 +238,165 @@ class SignalProcessor(BaseSignalProcessor):
                          'index. Error: %s',
                          e)
 
+    def flush_index_updates(self) -> None:
+        """Update the search index for all queued changes.
+
+        This processes any batches waiting for the flush interval to
+        elapse. It's a no-op if there are no queued changes.
+
+        Version Added:
+            9.0
+        """
+        with self._queue_lock:
+            changes = self._queued_index_changes
+            self._queued_index_changes = {}
+            self._flush_timer = None
+
+        if changes:
+            self._update_index(changes)
+
+    def _queue_index_changes(
+        self,
+        model: type[Model],
+        pks: Iterable[int],
+    ) -> None:
+        """Queue objects to be updated in the search index.
+
+        The objects will be updated once the current transaction commits.
+
+        Version Added:
+            9.0
+
+        Args:
+            model (type):
+                The model class for the objects.
+
+            pks (iterable of int):
+                The primary keys of the objects to update.
+        """
+        try:
+            changes = self._pending_index_changes.changes
+        except AttributeError:
+            changes = {}
+            self._pending_index_changes.changes = changes
+
+        changes.setdefault(model, set()).update(pks)
+
+        # Every change registers a callback, so that the batch is still
+        # processed if the savepoint of an earlier change was rolled back.
+        # The first callback to run processes everything pending for the
+        # thread, and the rest will be no-ops.
+        transaction.on_commit(self._commit_index_changes)
+
+    def _commit_index_changes(self) -> None:
+        """Process the changes collected for the committed transaction.
+
+        The changes will either be sent to the search backend immediately, or
+        queued until the flush interval elapses.
+
+        Version Added:
+            9.0
+        """
+        changes = getattr(self._pending_index_changes, 'changes', None)
+
+        if not changes:
+            return
+
+        self._pending_index_changes.changes = {}
+
+        siteconfig = SiteConfiguration.objects.get_current()
+        flush_interval = siteconfig.get('search_index_flush_interval')
+
+        if flush_interval <= 0:
+            self._update_index(changes)
+            return
+
+        pid = os.getpid()
+
+        with self._queue_lock:
+            queued_changes = self._queued_index_changes
+
+            for model, pks in changes.items():
+                queued_changes.setdefault(model, set()).update(pks)
+
+            if self._flush_timer is None or self._flush_timer_pid != pid:
+                self._flush_timer = threading.Timer(flush_interval,
+                                                    self._run_flush_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer_pid = pid
+                self._flush_timer.start()
+
+    def _run_flush_timer(self) -> None:
+        """Update the search index for all queued changes.
+
+        This runs on a background thread once the flush interval elapses.
+
+        Version Added:
+            9.0
+        """
+        try:
+            self.flush_index_updates()
+        finally:
+            connections.close_all()
+
+    def _update_index(
+        self,
+        changes: _IndexChanges,
+    ) -> None:
+        """Update the search index for a batch of changed objects.
+
+        Objects are fetched using each search index's queryset and sent to
+        the backend in one bulk update per index. Any objects that no longer
+        exist (or are no longer part of the index's queryset) are removed
+        from the index.
+
+        If there's any error writing to the search backend, the error will
+        be caught and logged.
+
+        Version Added:
+            9.0
+
+        Args:
+            changes (dict):
+                A mapping of model classes to sets of primary keys to update.
+        """
+        try:
+            for using in self.connection_router.for_write():
+                unified_index = self.connections[using].get_unified_index()
+
+                for model, pks in changes.items():
+                    try:
+                        index = unified_index.get_index(model)
+                    except NotHandled:
+                        continue
+
+                    backend = index.get_backend(using)
+
+                    if backend is None:
+                        continue
+
+                    objs = list(index.index_queryset(using=using)
+                                .filter(pk__in=pks))
+                    objs_to_update = [
+                        obj
+                        for obj in objs
+                        if index.should_update(obj)
+                    ]
+
+                    if objs_to_update:
+                        backend.update(index, objs_to_update)
+
+                    model_ct = get_model_ct(model)
+
+                    for pk in pks.difference(obj.pk for obj in objs):
+                        backend.remove('%s.%s' % (model_ct, pk))
+        except Exception as e:
+            logger.error('Error updating the search index. Check to '
+                         'make sure the search backend is running and '
+                         'configured correctly, and then rebuild the search '
+                         'index. Error: %s',
+                         e)
+
     def _handle_group_m2m_changed(self, instance, action, pk_set, reverse,
                                   **kwargs):
         """Handle a Group.users relation changing.
@@ -246,6 +454,14 @@ class SignalProcessor(BaseSignalProcessor):
             self._pending_user_changes.data = {}
 
         if action in ('post_add', 'post_remove'):
+            if self.batching_enabled:
+                if reverse:
+                    self._queue_index_changes(User, [instance.pk])
+                else:
+                    self._queue_index_changes(User, pk_set)
+
+                return
+
             if reverse:
                 # When using the reverse relation, the instance is the User and
                 # the pk_set is the PKs of the groups being added or removed.
@@ -271,6 +487,16 @@ class SignalProcessor(BaseSignalProcessor):
                 self._pending_user_changes.data[instance.pk] = list(
                     instance.users.values_list('pk', flat=True))
         elif action == 'post_clear':
+            if self.batching_enabled:
+                if reverse:
+                    self._queue_index_changes(User, [instance.pk])
+                else:
+                    self._queue_index_changes(
+                        User,
+                        self._pending_user_changes.data.pop(instance.pk))
+
+                return
+
             if reverse:
                 # When ``reverse`` is ``True``, we just have to reindex a
                 # single user.
@@ -455,6 +455,67 @@ class SearchTests(SpyAgency, TestCase):
         self.assertEqual(result.username, 'not_doc')
         self.assertEqual(result.full_name, 'Not Doc Dwarf')
 
+    def test_on_the_fly_indexing_users_batched(self):
+        """Testing on-the-fly indexing for users with batched indexing"""
+        reindex_search()
+
+        signal_processor = self.signal_processor
+
+        u = User.objects.get(username='doc')
+
+        group = self.create_review_group()
+
+        with self.siteconfig_settings({'search_on_the_fly_indexing': True,
+                                       'search_index_batching_enabled': True},
+                                      reload_settings=False):
+            self.spy_on(signal_processor.handle_save)
+            self.spy_on(signal_processor._update_index)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                u.username = 'not_doc'
+                u.first_name = 'Not Doc'
+                u.last_name = 'Dwarf'
+                u.save()
+
+                u.review_groups.add(group)
+                u.get_profile().save()
+
+                self.assertSpyNotCalled(signal_processor._update_index)
+
+            rsp = self.search('not_doc')
+
+        # The changes were collapsed into a single update of the user.
+        self.assertSpyNotCalled(signal_processor.handle_save)
+        self.assertSpyCalledOnceWith(signal_processor._update_index,
+                                     {User: {u.pk}})
+
+        self.assertEqual(rsp.context['hits_returned'], 1)
+        result = rsp.context['result']
+
+        self.assertEqual(result.groups, 'test-group')
+        self.assertEqual(result.username, 'not_doc')
+        self.assertEqual(result.full_name, 'Not Doc Dwarf')
+
+    def test_on_the_fly_indexing_batched_delete(self):
+        """Testing on-the-fly indexing for deleted review requests with
+        batched indexing
+        """
+        review_request = self.create_review_request(summary='foo',
+                                                    publish=True)
+        reindex_search()
+
+        self.assertEqual(self.search('foo').context['hits_returned'], 1)
+
+        with self.siteconfig_settings({'search_on_the_fly_indexing': True,
+                                       'search_index_batching_enabled': True},
+                                      reload_settings=False):
+            with self.captureOnCommitCallbacks(execute=True):
+                review_request.delete()
+
+            rsp = self.search('foo')
+
+        self.assertEqual(rsp.context['hits_returned'], 0)
+
     def test_on_the_fly_indexing_profile(self):
         """Testing on-the-fly indexing for user profiles"""
         reindex_search()
@@ -387,6 +387,17 @@ SVNTOOL_BACKENDS = [
     'reviewboard.scmtools.svn.pysvn',
 ]
 
+# The broker used to push real-time notifications (such as review request
+# updates) to connected clients. The default broker only works within a
+# single process, and isn't used for pushing updates unless its
+# 'single_process' option is set. Installations with multiple web server
+# processes should use a shared broker, such as
+# reviewboard.notifications.pubsub.RedisPubSubBroker.
+PUBSUB_BROKER = {
+    'BACKEND': 'reviewboard.notifications.pubsub.LocalPubSubBroker',
+    'OPTIONS': {},
+}
+
 # Gravatar configuration.
 GRAVATAR_DEFAULT = 'mm'
 
@@ -619,23 +619,80 @@ export class ReviewRequest extends BaseResource<
      *
      * The 'updated' event will be triggered when there's a new update.
      *
+     * If a stream URL is provided and the browser supports it, updates will
+     * be pushed from the server as they happen. Otherwise, or if the stream
+     * can't be used, the server will be polled periodically.
+     *
+     * Version Changed:
+     *     9.0:
+     *     Added the ``options`` argument.
+     *
      * Args:
      *     updateType (string):
      *         The type of updates to check for.
      *
      *     lastUpdateTimestamp (string):
      *         The timestamp of the last known update.
+     *
+     *     options (object, optional):
+     *         Options for checking for updates.
+     *
+     * Option Args:
+     *     streamURL (string, optional):
+     *         The URL of the server-sent event stream for updates.
      */
     async beginCheckForUpdates(
         updateType: string,
         lastUpdateTimestamp: string,
+        options: {
+            streamURL?: string;
+        } = {},
     ) {
         this._checkUpdatesType = updateType;
         this._lastUpdateTimestamp = lastUpdateTimestamp;
 
         await this.ready();
-        setTimeout(this._checkForUpdates.bind(this),
-                   ReviewRequest.CHECK_UPDATES_MSECS);
+
+        if (options.streamURL && window.EventSource) {
+            this._listenForUpdates(options.streamURL);
+        } else {
+            setTimeout(this._checkForUpdates.bind(this),
+                       ReviewRequest.CHECK_UPDATES_MSECS);
+        }
+    }
+
+    /**
+     * Listen for updates pushed from the server.
+     *
+     * If the stream fails and the browser gives up reconnecting, this will
+     * fall back to polling for updates.
+     *
+     * Version Added:
+     *     9.0
+     *
+     * Args:
+     *     streamURL (string):
+     *         The URL of the server-sent event stream for updates.
+     */
+    _listenForUpdates(streamURL: string) {
+        const eventSource = new EventSource(streamURL);
+
+        eventSource.addEventListener(
+            'update',
+            (evt: MessageEvent) => this._handleLastUpdate(
+                JSON.parse(evt.data)));
+
+        eventSource.addEventListener('error', () => {
+            if (eventSource.readyState === EventSource.CLOSED) {
+                /*
+                 * The browser won't try again (for instance, if the server
+                 * has disabled pushing updates). Poll instead.
+                 */
+                eventSource.close();
+                setTimeout(this._checkForUpdates.bind(this),
+                           ReviewRequest.CHECK_UPDATES_MSECS);
+            }
+        });
     }
 
     /**
@@ -650,15 +707,7 @@ export class ReviewRequest extends BaseResource<
             noActivityIndicator: true,
             prefix: this.get('sitePrefix'),
             success: rsp => {
-                const lastUpdate = rsp.last_update;
-
-                if ((!this._checkUpdatesType ||
-                     this._checkUpdatesType === lastUpdate.type) &&
-                    this._lastUpdateTimestamp !== lastUpdate.timestamp) {
-                    this.trigger('updated', lastUpdate);
-                }
-
-                this._lastUpdateTimestamp = lastUpdate.timestamp;
+                this._handleLastUpdate(rsp.last_update);
 
                 setTimeout(this._checkForUpdates.bind(this),
                            ReviewRequest.CHECK_UPDATES_MSECS);
@@ -668,6 +717,30 @@ export class ReviewRequest extends BaseResource<
         });
     }
 
+    /**
+     * Handle information on the last update from the server.
+     *
+     * If this is a new update of the type being checked for, the 'updated'
+     * event will be triggered.
+     *
+     * Version Added:
+     *     9.0
+     *
+     * Args:
+     *     lastUpdate (object):
+     *         The last update information, in the format of the
+     *         ``last_update`` API resource.
+     */
+    _handleLastUpdate(lastUpdate) {
+        if ((!this._checkUpdatesType ||
+             this._checkUpdatesType === lastUpdate.type) &&
+            this._lastUpdateTimestamp !== lastUpdate.timestamp) {
+            this.trigger('updated', lastUpdate);
+        }
+
+        this._lastUpdateTimestamp = lastUpdate.timestamp;
+    }
+
     /**
      * Serialize for sending to the server.
      *
@@ -26,6 +26,15 @@
  *     reviewRequestEditor (RB.ReviewRequestEditor):
  *         The review request editor managing state on the page.
  *
+ *     stub (boolean):
+ *         Whether this entry is a stub, rendered without its content.
+ *
+ *         The content will be loaded from the server when the entry is
+ *         expanded.
+ *
+ *         Version Added:
+ *             9.0
+ *
  *     typeID (string):
  *         The type of this entry, corresponding to a entry type ID that's
  *         been registered server-side.
@@ -43,6 +52,7 @@ RB.ReviewRequestPage.Entry = Backbone.Model.extend({
         etag: null,
         page: null,
         reviewRequestEditor: null,
+        stub: false,
         typeID: null,
         updatedTimestamp: null,
     },
@@ -66,6 +76,7 @@ RB.ReviewRequestPage.Entry = Backbone.Model.extend({
                             ? attrs.addedTimestamp
                             : moment.utc(attrs.addedTimestamp).toDate(),
             etag: attrs.etag || null,
+            stub: !!attrs.stub,
             updatedTimestamp: _.isDate(attrs.updatedTimestamp)
                               ? attrs.updatedTimestamp
                               : moment.utc(attrs.updatedTimestamp).toDate(),
@@ -81,6 +92,9 @@ RB.ReviewRequestPage.Entry = Backbone.Model.extend({
      * should always be sufficient, subclasses can override the logic if
      * needed.
      *
+     * Stub entries are always considered updated, so that their content
+     * will be loaded.
+     *
      * Args:
      *     metadata (object):
      *         Deserialized metadata from the update payload.
@@ -90,6 +104,10 @@ RB.ReviewRequestPage.Entry = Backbone.Model.extend({
      *     ``true`` if the entry has been updated. ``false`` if it has not.
      */
     isUpdated(metadata) {
+        if (this.get('stub')) {
+            return true;
+        }
+
         const newTimestamp = moment.utc(metadata.updatedTimestamp).toDate();
 
         /* Normalize these to null, if undefined or empty. */
@@ -131,6 +149,18 @@ RB.ReviewRequestPage.Entry = Backbone.Model.extend({
     afterApplyUpdate(entryData) {
     },
 
+    /**
+     * Load the content for this entry, if it's a stub.
+     *
+     * Version Added:
+     *     9.0
+     */
+    loadContent() {
+        if (this.get('stub')) {
+            this.get('page').loadStubEntry(this);
+        }
+    },
+
     /**
      * Watch for updates to this entry.
      *
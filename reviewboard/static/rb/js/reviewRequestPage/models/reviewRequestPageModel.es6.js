@@ -27,6 +27,14 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
      */
     WATCH_UPDATED_POLL_CAP_MS: 10 * 1000,
 
+    /**
+     * The maximum number of stub entries to load in a single request.
+     *
+     * Version Added:
+     *     9.0
+     */
+    LOAD_STUB_ENTRIES_BATCH_SIZE: 50,
+
     defaults: _.defaults({
         updatesURL: null,
     }, RB.ReviewablePage.prototype.defaults),
@@ -42,6 +50,7 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
         this._watchedUpdatesTimeout = null;
         this._watchedUpdatesLastScheduleTime = null;
         this._watchedUpdatesLastTimestamp = null;
+        this._pendingStubEntries = null;
 
         this.entries = new Backbone.Collection([], {
             model: RB.ReviewRequestPage.Entry,
@@ -83,6 +92,47 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
         this.entries.add(entry);
     },
 
+    /**
+     * Load the content for a stub entry.
+     *
+     * Stub entries are rendered without their content, which is loaded
+     * from the server once needed. Requests for multiple entries made at
+     * the same time (such as when expanding all entries) are batched
+     * together.
+     *
+     * Version Added:
+     *     9.0
+     *
+     * Args:
+     *     entry (RB.ReviewRequestPage.Entry):
+     *         The stub entry to load.
+     */
+    loadStubEntry(entry) {
+        if (this._pendingStubEntries === null) {
+            this._pendingStubEntries = {};
+
+            _.defer(() => {
+                const entries = Object.values(this._pendingStubEntries);
+                const batchSize = this.LOAD_STUB_ENTRIES_BATCH_SIZE;
+
+                this._pendingStubEntries = null;
+
+                for (let i = 0; i < entries.length; i += batchSize) {
+                    /*
+                     * Stub entries may be older than the last update, so
+                     * don't filter based on time.
+                     */
+                    this._loadUpdates({
+                        entries: entries.slice(i, i + batchSize),
+                        since: null,
+                    });
+                }
+            });
+        }
+
+        this._pendingStubEntries[entry.cid] = entry;
+    },
+
     /**
      * Watch for updates to an entry.
      *
@@ -235,6 +285,11 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
      *
      *     onDone (function, optional):
      *         Optional function to call after everything is loaded.
+     *
+     *     since (Date, optional):
+     *         Only load entries updated after this time. This defaults to
+     *         the time of the last update seen. If ``null``, entries will
+     *         not be filtered by time.
      */
     _loadUpdates(options={}) {
         const updatesURL = this.get('updatesURL');
@@ -273,7 +328,9 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
             urlQuery.push(`entries=${urlEntryTypeIDs.join(';')}`);
         }
 
-        const timestamp = this._watchedUpdatesLastTimestamp;
+        const timestamp = (options.since !== undefined
+                           ? options.since
+                           : this._watchedUpdatesLastTimestamp);
 
         if (timestamp !== null) {
             urlQuery.push(`since=${timestamp.toISOString()}`);
@@ -317,7 +374,9 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
      */
     _processUpdatesFromPayload(arrayBuffer, onDone) {
         if (arrayBuffer.byteLength === 0) {
-            onDone(0);
+            if (_.isFunction(onDone)) {
+                onDone(0);
+            }
 
             return;
         }
@@ -511,6 +570,7 @@ RB.ReviewRequestPage.ReviewRequestPage = RB.ReviewablePage.extend({
                 metadata.modelData,
                 {
                     etag: metadata.etag,
+                    stub: false,
                     updatedTimestamp: metadata.updatedTimestamp,
                 })));
 
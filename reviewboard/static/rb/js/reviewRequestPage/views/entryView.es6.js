@@ -39,6 +39,8 @@ RB.ReviewRequestPage.EntryView = Backbone.View.extend({
 
     /**
      * Expand the box.
+     *
+     * If the entry is a stub, its content will be loaded from the server.
      */
     expand() {
         this._$box.removeClass('collapsed');
@@ -47,6 +49,7 @@ RB.ReviewRequestPage.EntryView = Backbone.View.extend({
             .addClass('rb-icon-collapse-review');
 
         this.model.set('collapsed', false);
+        this.model.loadContent();
     },
 
     /**
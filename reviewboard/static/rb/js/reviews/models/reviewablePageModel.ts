@@ -54,6 +54,14 @@ export interface ReviewablePageAttrs extends ModelAttributes {
      * The review request that this page is for.
      */
     reviewRequest?: ReviewRequest;
+
+    /**
+     * The URL of the stream used to push updates to the page, if enabled.
+     *
+     * Version Added:
+     *     9.0
+     */
+    updatesStreamURL?: string;
 }
 
 
@@ -69,6 +77,7 @@ export interface ReviewablePageParseData {
     checkForUpdates: boolean;
     checkUpdatesType: string;
     lastActivityTimestamp: string;
+    updatesStreamURL?: string;
 }
 
 
@@ -93,6 +102,7 @@ export class ReviewablePage<
         lastActivityTimestamp: null,
         pendingReview: null,
         reviewRequest: null,
+        updatesStreamURL: null,
     };
 
     /**********************
@@ -240,13 +250,15 @@ export class ReviewablePage<
             lastActivityTimestamp: rsp.lastActivityTimestamp,
             pendingReview: reviewRequest.createReview(),
             reviewRequest: reviewRequest,
+            updatesStreamURL: rsp.updatesStreamURL,
         };
     }
 
     /**
      * Register for update notification to the review request from the server.
      *
-     * The server will be periodically checked for new updates. When a new
+     * The server will push new updates to the page if supported, or will
+     * otherwise be periodically checked for new updates. When a new
      * update arrives, an update bubble will be displayed in the bottom-right
      * of the page, and if the user has allowed desktop notifications in their
      * account settings, a desktop notification will be shown with the update
@@ -255,6 +267,9 @@ export class ReviewablePage<
     _registerForUpdates() {
         this.get('reviewRequest').beginCheckForUpdates(
             this.get('checkUpdatesType'),
-            this.get('lastActivityTimestamp'));
+            this.get('lastActivityTimestamp'),
+            {
+                streamURL: this.get('updatesStreamURL'),
+            });
     }
 }
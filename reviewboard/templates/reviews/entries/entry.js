@@ -7,6 +7,7 @@ page.addEntryView(new {{entry.js_view_class}}({
     model: new {{entry.js_model_class}}({
         id: '{{entry.entry_id|escapejs}}',
         collapsed: {{entry.collapsed|yesno:'true,false'}},
+        stub: {{entry.stub|yesno:'true,false'}},
         addedTimestamp: {{entry.added_timestamp|json_dumps}},
         updatedTimestamp: {{entry.updated_timestamp|json_dumps}},
         typeID: '{{entry.entry_type_id|escapejs}}',
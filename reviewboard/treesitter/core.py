@@ -6,17 +6,156 @@ Version Added:
 
 from __future__ import annotations
 
+import logging
+import threading
+from collections import Counter
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from tree_sitter import Language, Parser
+from tree_sitter import Language, Parser, Query, QueryCursor
 from tree_sitter_language_pack import get_language as lp_get_language
 
+from reviewboard.treesitter.predicates import create_predicate_handler
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from tree_sitter import QueryPredicate
+
     from reviewboard.treesitter.language import SupportedLanguage
 
 
+logger = logging.getLogger(__name__)
+
+
+#: Hit and miss counters for each live thread using the registry.
+#:
+#: Each thread only updates its own counters, so that counting doesn't need
+#: a lock. The counters are summed when reading stats. Counters for threads
+#: that have exited are folded into :py:data:`_retired_stats`.
+#:
+#: Version Added:
+#:     9.0
+_thread_stats: dict[threading.Thread, Counter[str]] = {}
+_thread_stats_lock = threading.Lock()
+
+#: Hit and miss counters from threads that have exited.
+#:
+#: Version Added:
+#:     9.0
+_retired_stats: Counter[str] = Counter()
+
+#: Compiled queries, keyed by language name and query filename.
+#:
+#: A value of ``None`` means there's no query file for the language.
+#:
+#: Version Added:
+#:     9.0
+_compiled_queries: dict[tuple[str, str], CompiledQuery | None] = {}
+_compiled_queries_lock = threading.Lock()
+
+#: Per-thread state for parsers.
+#:
+#: Version Added:
+#:     9.0
+_thread_state = threading.local()
+
+
+class CompiledQuery:
+    """A compiled tree-sitter query.
+
+    This holds a compiled :py:class:`tree_sitter.Query` along with its
+    predicate handler, and hands out a reusable
+    :py:class:`tree_sitter.QueryCursor` per thread. Instances are shared
+    process-wide, and retrieved through :py:func:`get_compiled_query`.
+
+    Version Added:
+        9.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The predicate handler for the query.
+    predicate_handler: QueryPredicate
+
+    #: The compiled query.
+    query: Query
+
+    def __init__(
+        self,
+        query: Query,
+    ) -> None:
+        """Initialize the compiled query.
+
+        Args:
+            query (tree_sitter.Query):
+                The compiled query.
+        """
+        self.query = query
+        self.predicate_handler = create_predicate_handler(query=query)
+        self._local = threading.local()
+
+    @property
+    def cursor(self) -> QueryCursor:
+        """A query cursor for the current thread.
+
+        Type:
+            tree_sitter.QueryCursor
+        """
+        try:
+            return self._local.cursor
+        except AttributeError:
+            cursor = QueryCursor(self.query)
+            self._local.cursor = cursor
+
+            return cursor
+
+
+def _count(
+    name: str,
+) -> None:
+    """Increment a registry counter.
+
+    Version Added:
+        9.0
+
+    Args:
+        name (str):
+            The name of the counter.
+    """
+    try:
+        stats = _thread_state.stats
+    except AttributeError:
+        stats = Counter()
+        _thread_state.stats = stats
+
+        with _thread_stats_lock:
+            _retire_thread_stats()
+            _thread_stats[threading.current_thread()] = stats
+
+    stats[name] += 1
+
+
+def _retire_thread_stats() -> None:
+    """Fold the counters of exited threads into the retired counters.
+
+    This keeps :py:data:`_thread_stats` from growing as threads are
+    recycled. It must be called with :py:data:`_thread_stats_lock` held.
+
+    Version Added:
+        9.0
+    """
+    for thread, stats in list(_thread_stats.items()):
+        if not thread.is_alive():
+            # The thread can no longer update its counters, so they're safe
+            # to read without racing it.
+            _retired_stats.update(stats)
+            del _thread_stats[thread]
+
+
 @lru_cache
 def get_language(
     language_name: SupportedLanguage,
@@ -41,12 +180,16 @@ def get_language(
     return lp_get_language(language_name)
 
 
-@lru_cache
 def get_parser(
     language_name: SupportedLanguage,
 ) -> Parser:
     """Get a tree sitter parser.
 
+    Parsers are created once per thread and language, and reused
+    afterward. Callers that change parser state (such as
+    :py:attr:`tree_sitter.Parser.included_ranges`) must restore it when
+    done.
+
     Version Added:
         9.0
 
@@ -62,7 +205,22 @@ def get_parser(
         LookupError:
             A matching grammar for the language name could not be loaded.
     """
-    return Parser(get_language(language_name))
+    try:
+        parsers = _thread_state.parsers
+    except AttributeError:
+        parsers = {}
+        _thread_state.parsers = parsers
+
+    try:
+        parser = parsers[language_name]
+    except KeyError:
+        _count('parser_misses')
+        parser = Parser(get_language(language_name))
+        parsers[language_name] = parser
+    else:
+        _count('parser_hits')
+
+    return parser
 
 
 @lru_cache
@@ -94,3 +252,127 @@ def get_queries(
             return f.read()
     except OSError:
         return None
+
+
+def get_compiled_query(
+    language_name: SupportedLanguage,
+    filename: str,
+) -> CompiledQuery | None:
+    """Return a compiled query for a given language.
+
+    Queries are compiled once per process and shared afterward.
+
+    Version Added:
+        9.0
+
+    Args:
+        language_name (reviewboard.treesitter.language.SupportedLanguage):
+            The language name.
+
+        filename (str):
+            The query filename (e.g., 'highlights.scm').
+
+    Returns:
+        CompiledQuery:
+        The compiled query, or ``None`` if no query exists.
+
+    Raises:
+        LookupError:
+            A matching grammar for the language name could not be loaded.
+
+        tree_sitter.QueryError:
+            The query could not be compiled.
+    """
+    key = (language_name, filename)
+
+    try:
+        compiled_query = _compiled_queries[key]
+    except KeyError:
+        pass
+    else:
+        _count('query_hits')
+
+        return compiled_query
+
+    _count('query_misses')
+
+    queries = get_queries(language_name, filename)
+
+    if queries:
+        compiled_query = CompiledQuery(Query(get_language(language_name),
+                                             queries))
+    else:
+        compiled_query = None
+
+    with _compiled_queries_lock:
+        # Another thread may have compiled this while we did. Keep the
+        # first result so that everyone shares the same instance.
+        return _compiled_queries.setdefault(key, compiled_query)
+
+
+def get_registry_stats() -> dict[str, int]:
+    """Return the hit and miss counters for parsers and compiled queries.
+
+    Version Added:
+        9.0
+
+    Returns:
+        dict:
+        A dictionary containing ``parser_hits``, ``parser_misses``,
+        ``query_hits`` and ``query_misses``.
+    """
+    with _thread_stats_lock:
+        _retire_thread_stats()
+        totals = _retired_stats.copy()
+
+        for stats in _thread_stats.values():
+            totals.update(stats)
+
+    return {
+        key: totals[key]
+        for key in ('parser_hits', 'parser_misses',
+                    'query_hits', 'query_misses')
+    }
+
+
+def reset_registry_stats() -> None:
+    """Reset the hit and miss counters.
+
+    Version Added:
+        9.0
+    """
+    with _thread_stats_lock:
+        _retired_stats.clear()
+
+        for stats in _thread_stats.values():
+            stats.clear()
+
+
+def warm_registry(
+    language_names: Iterable[SupportedLanguage],
+) -> None:
+    """Load grammars and compile queries for a list of languages.
+
+    This is used at startup so that the first highlighting of a file in
+    one of these languages doesn't pay for loading the grammar or compiling
+    queries. Both are shared by all threads. Parsers are per-thread and
+    cheap to create from a loaded grammar, so they aren't created here.
+
+    Languages that fail to load are logged and skipped.
+
+    Version Added:
+        9.0
+
+    Args:
+        language_names (iterable of str):
+            The names of the languages to load.
+    """
+    for language_name in language_names:
+        try:
+            get_language(language_name)
+
+            for filename in ('highlights.scm', 'injections.scm'):
+                get_compiled_query(language_name, filename)
+        except Exception as e:
+            logger.error('Unable to load tree-sitter language "%s": %s',
+                         language_name, e)
@@ -14,18 +14,17 @@ from typing import TYPE_CHECKING
 import tree_sitter
 
 from reviewboard.treesitter.core import (
-    get_language,
+    get_compiled_query,
     get_parser,
-    get_queries,
 )
 from reviewboard.treesitter.debug import DEBUG_TREESITTER
 from reviewboard.treesitter.language import SUPPORTED_LANGUAGES
-from reviewboard.treesitter.predicates import create_predicate_handler
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
     from typing import TypeAlias
 
+    from reviewboard.treesitter.core import CompiledQuery
     from reviewboard.treesitter.language import SupportedLanguage
 
 
@@ -80,6 +79,16 @@ HIGHLIGHT_IGNORE = {
 }
 
 
+#: Type alias for a range of lines to highlight.
+#:
+#: This is a tuple of the 0-based start line and the 0-based line after the
+#: end of the range.
+#:
+#: Version Added:
+#:     9.0
+LineRange: TypeAlias = tuple[int, int]
+
+
 #: Type aliases for a highlighted node.
 #:
 #: Version Added:
@@ -407,10 +416,64 @@ def _apply_events(
     return result
 
 
+def _get_captures_in_line_ranges(
+    compiled_query: CompiledQuery,
+    root_node: tree_sitter.Node,
+    line_ranges: Sequence[LineRange],
+) -> dict[str, list[tree_sitter.Node]]:
+    """Return the captures for a query within ranges of lines.
+
+    Each range is run through the query separately, restricting matching to
+    nodes that intersect the range. Nodes that span more than one range are
+    only returned once.
+
+    A new query cursor is used, so that the range restrictions don't affect
+    the shared cursor for the query.
+
+    Version Added:
+        9.0
+
+    Args:
+        compiled_query (reviewboard.treesitter.core.CompiledQuery):
+            The compiled query to run.
+
+        root_node (tree_sitter.Node):
+            The node to run the query on.
+
+        line_ranges (list of LineRange):
+            The ranges of lines to capture.
+
+    Returns:
+        dict:
+        A mapping of capture names to lists of captured nodes.
+    """
+    cursor = tree_sitter.QueryCursor(compiled_query.query)
+    captures: defaultdict[str, list[tree_sitter.Node]] = defaultdict(list)
+    seen: set[tuple[str, int, int]] = set()
+
+    for start_row, end_row in line_ranges:
+        cursor.set_point_range((start_row, 0), (end_row, 0))
+
+        range_captures = cursor.captures(root_node,
+                                         compiled_query.predicate_handler)
+
+        for name, nodes in range_captures.items():
+            for node in nodes:
+                key = (name, node.start_byte, node.end_byte)
+
+                if key not in seen:
+                    seen.add(key)
+                    captures[name].append(node)
+
+    return captures
+
+
 def _highlight_tree(
     tree: tree_sitter.Tree,
     root_node: tree_sitter.Node,
     language_name: SupportedLanguage,
+    *,
+    line_ranges: (Sequence[LineRange] | None) = None,
 ) -> Sequence[HighlightCapture]:
     """Highlight a subtree with a given language.
 
@@ -427,20 +490,25 @@ def _highlight_tree(
         language_name (reviewboard.treesitter.language.SupportedLanguage):
             The name of the language to use for highlighting.
 
+        line_ranges (list of LineRange, optional):
+            The ranges of lines to highlight. If not provided, the whole
+            subtree will be highlighted.
+
     Returns:
         list of HighlightCapture:
         Information about each captured range.
     """
-    queries = get_queries(language_name, 'highlights.scm')
+    compiled_query = get_compiled_query(language_name, 'highlights.scm')
 
-    if not queries:
+    if compiled_query is None:
         return []
 
-    ts_language = get_language(language_name)
-    query = tree_sitter.Query(ts_language, queries)
-    predicate_handler = create_predicate_handler(query=query)
-    cursor = tree_sitter.QueryCursor(query)
-    captures = cursor.captures(root_node, predicate_handler)
+    if line_ranges is None:
+        captures = compiled_query.cursor.captures(
+            root_node, compiled_query.predicate_handler)
+    else:
+        captures = _get_captures_in_line_ranges(compiled_query, root_node,
+                                                line_ranges)
 
     if not captures:
         return []
@@ -492,6 +560,7 @@ def _highlight_injections(
     content: bytes,
     language_name: SupportedLanguage,
     ranges: Sequence[tree_sitter.Range],
+    line_ranges: (Sequence[LineRange] | None) = None,
 ) -> Sequence[HighlightCapture]:
     """Highlight an injected language.
 
@@ -510,6 +579,10 @@ def _highlight_injections(
         ranges (list of tree_sitter.Range):
             The ranges that should be highlighted using this language.
 
+        line_ranges (list of LineRange, optional):
+            The ranges of lines to highlight. If not provided, all injected
+            ranges will be highlighted.
+
     Yields:
         HighlightCapture:
         The captured highlighted regions.
@@ -523,7 +596,8 @@ def _highlight_injections(
         parser.included_ranges = ranges
         tree = parser.parse(content)
 
-        return _highlight_tree(tree, tree.root_node, language_name)
+        return _highlight_tree(tree, tree.root_node, language_name,
+                               line_ranges=line_ranges)
     finally:
         del parser.included_ranges
 
@@ -637,9 +711,16 @@ def highlight(
     lines: Sequence[str],
     tree: tree_sitter.Tree,
     language_name: SupportedLanguage,
+    *,
+    line_ranges: (Sequence[LineRange] | None) = None,
 ) -> Sequence[str] | None:
     """Apply highlighting to a file.
 
+    If ``line_ranges`` is provided, only lines within those ranges will be
+    highlighted, using range-restricted query execution. All other lines
+    will be returned HTML-escaped but otherwise unstyled. This is much
+    faster for very large files where only a small portion will be shown.
+
     Version Added:
         9.0
 
@@ -656,6 +737,10 @@ def highlight(
         language_name (reviewboard.treesitter.language.SupportedLanguage):
             The language for the file.
 
+        line_ranges (list of LineRange, optional):
+            The ranges of lines to highlight. Each is a tuple of the
+            0-based start line and the 0-based line after the end.
+
     Returns:
         list of str:
         A list of lines, with syntax highlighting applied.
@@ -669,21 +754,20 @@ def highlight(
     logger.debug('Highlighting file for language %s',
                  language_name)
 
-    captures = _highlight_tree(tree, tree.root_node, language_name)
+    captures = _highlight_tree(tree, tree.root_node, language_name,
+                               line_ranges=line_ranges)
 
-    if not captures:
+    if not captures and line_ranges is None:
         return None
 
     chained_captures = [captures]
 
-    injections_queries = get_queries(language_name, 'injections.scm')
+    compiled_query = get_compiled_query(language_name, 'injections.scm')
 
-    if injections_queries:
-        ts_language = get_language(language_name)
-        injections_query = tree_sitter.Query(ts_language, injections_queries)
-        predicate_handler = create_predicate_handler(query=injections_query)
-        cursor = tree_sitter.QueryCursor(injections_query)
-        matches = cursor.matches(tree.root_node, predicate_handler)
+    if compiled_query is not None:
+        injections_query = compiled_query.query
+        matches = compiled_query.cursor.matches(
+            tree.root_node, compiled_query.predicate_handler)
 
         injection_ranges: defaultdict[
             SupportedLanguage,
@@ -738,6 +822,15 @@ def highlight(
 
                     node_range = adjusted_range
 
+                if line_ranges is not None and not any(
+                    (node_range.start_point.row < end_row and
+                     node_range.end_point.row >= start_row)
+                    for start_row, end_row in line_ranges
+                ):
+                    # This injection is outside of the lines being
+                    # highlighted.
+                    continue
+
                 injection_ranges[injection_lang].add(node_range)
 
         for language, ranges in injection_ranges.items():
@@ -745,6 +838,7 @@ def highlight(
                 content=content,
                 language_name=language,
                 ranges=sorted(ranges, key=lambda range: range.start_byte),
+                line_ranges=line_ranges,
             ))
 
     nodes_by_line = _get_nodes_by_line(itertools.chain(*chained_captures),
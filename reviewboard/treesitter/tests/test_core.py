@@ -0,0 +1,152 @@
+"""Tests for reviewboard.treesitter.core module.
+
+Version Added:
+    9.0
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from reviewboard.treesitter.core import (
+    get_compiled_query,
+    get_parser,
+    get_registry_stats,
+    reset_registry_stats,
+    warm_registry,
+)
+
+
+@pytest.fixture(autouse=True, scope='session')
+def django_db_setup() -> None:
+    """Perform django database setup.
+
+    These tests don't use the django database at all. This overrides db
+    setup to be a no-op.
+    """
+    pass
+
+
+@pytest.fixture
+def _django_db_helper() -> None:  # pyright:ignore[reportUnusedFunction]
+    """Perform internal django database work.
+
+    These tests don't use the django database at all. This overrides db
+    setup to be a no-op.
+    """
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats() -> None:  # pyright:ignore[reportUnusedFunction]
+    """Reset the registry counters before each test."""
+    reset_registry_stats()
+
+
+def test_get_compiled_query_reuses_query() -> None:
+    """Test get_compiled_query returns a shared compiled query."""
+    compiled_query = get_compiled_query('python', 'highlights.scm')
+    assert compiled_query is not None
+
+    assert get_compiled_query('python', 'highlights.scm') is compiled_query
+    assert compiled_query.cursor is compiled_query.cursor
+
+    stats = get_registry_stats()
+    assert stats['query_hits'] >= 1
+
+
+def test_get_compiled_query_with_missing_query() -> None:
+    """Test get_compiled_query with a language without the query file."""
+    assert get_compiled_query('python', 'does-not-exist.scm') is None
+    assert get_compiled_query('python', 'does-not-exist.scm') is None
+
+    stats = get_registry_stats()
+    assert stats['query_misses'] == 1
+    assert stats['query_hits'] == 1
+
+
+def test_get_compiled_query_cursor_per_thread() -> None:
+    """Test CompiledQuery.cursor returns a separate cursor per thread."""
+    compiled_query = get_compiled_query('python', 'highlights.scm')
+    assert compiled_query is not None
+
+    cursors = []
+    thread = threading.Thread(
+        target=lambda: cursors.append(compiled_query.cursor))
+    thread.start()
+    thread.join()
+
+    assert cursors[0] is not compiled_query.cursor
+
+
+def test_get_parser_reuses_parser() -> None:
+    """Test get_parser returns a reused parser per thread."""
+    parser = get_parser('python')
+
+    assert get_parser('python') is parser
+    assert get_parser('c') is not parser
+
+    parsers = []
+    thread = threading.Thread(
+        target=lambda: parsers.append(get_parser('python')))
+    thread.start()
+    thread.join()
+
+    assert parsers[0] is not parser
+    assert get_registry_stats()['parser_hits'] >= 1
+
+
+def test_get_registry_stats_across_threads() -> None:
+    """Test get_registry_stats sums counters from all threads."""
+    get_compiled_query('python', 'highlights.scm')
+
+    thread = threading.Thread(
+        target=lambda: get_compiled_query('python', 'highlights.scm'))
+    thread.start()
+    thread.join()
+
+    stats = get_registry_stats()
+    assert stats['query_hits'] + stats['query_misses'] == 2
+
+def test_get_registry_stats_drops_exited_threads() -> None:
+    """Test get_registry_stats drops counters for exited threads while
+    keeping their counts
+    """
+    from reviewboard.treesitter import core
+
+    reset_registry_stats()
+
+    thread = threading.Thread(
+        target=lambda: get_compiled_query('python', 'highlights.scm'))
+    thread.start()
+    thread.join()
+
+    stats = get_registry_stats()
+    assert stats['query_hits'] + stats['query_misses'] == 1
+    assert thread not in core._thread_stats
+
+
+def test_warm_registry() -> None:
+    """Test warm_registry compiles queries shared by other threads."""
+    warm_registry(['python', 'not-a-language'])  # type:ignore
+
+    reset_registry_stats()
+
+    # Warming happens on one thread, and must benefit any other thread.
+    compiled_queries = []
+    thread = threading.Thread(
+        target=lambda: compiled_queries.extend([
+            get_compiled_query('python', 'highlights.scm'),
+            get_compiled_query('python', 'injections.scm'),
+        ]))
+    thread.start()
+    thread.join()
+
+    assert None not in compiled_queries
+
+    stats = get_registry_stats()
+    assert stats['query_hits'] == 2
+    assert stats['query_misses'] == 0
+    assert stats['parser_misses'] == 0
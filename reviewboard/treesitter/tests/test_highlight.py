@@ -631,3 +631,59 @@ def test_highlight_injection_with_offset() -> None:
     # The YAML injection highlighted the metadata contents.
     assert '<span class="ts-string">title</span>' in result[1]
     assert '<span class="ts-number">2026</span>' in result[2]
+
+
+def test_highlight_with_line_ranges() -> None:
+    """Test highlight with line_ranges only highlights those lines."""
+    content = (
+        'def hello():\n'
+        '    return "hello"\n'
+        '\n'
+        'def goodbye():\n'
+        '    return "goodbye"\n'
+    )
+    content_bytes = content.encode()
+    lines = content.splitlines()
+
+    parser = get_parser('python')
+    tree = parser.parse(content_bytes)
+
+    full_result = highlight(content_bytes, lines, tree, 'python')
+    result = highlight(content_bytes, lines, tree, 'python',
+                       line_ranges=[(3, 5)])
+
+    assert full_result is not None
+    assert result is not None
+
+    # Lines outside of the ranges are only escaped.
+    assert result[:3] == [
+        'def hello():',
+        '    return &quot;hello&quot;',
+        '',
+    ]
+    assert result[3:] == full_result[3:]
+
+
+def test_highlight_with_line_ranges_no_captures() -> None:
+    """Test highlight with line_ranges containing nothing to highlight."""
+    content = (
+        'def hello():\n'
+        '    pass\n'
+        '\n'
+        '\n'
+    )
+    content_bytes = content.encode()
+    lines = content.splitlines()
+
+    parser = get_parser('python')
+    tree = parser.parse(content_bytes)
+
+    result = highlight(content_bytes, lines, tree, 'python',
+                       line_ranges=[(2, 4)])
+
+    assert result == [
+        'def hello():',
+        '    pass',
+        '',
+        '',
+    ]
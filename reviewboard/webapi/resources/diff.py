@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 
 from django.core.exceptions import PermissionDenied, ObjectDoesNotExist
-from django.http import HttpResponse
 from djblets.util.http import get_http_requested_mimetype, set_last_modified
 from djblets.webapi.decorators import (webapi_login_required,
                                        webapi_response_errors,
@@ -23,6 +22,7 @@ from djblets.webapi.fields import (DateTimeFieldType,
 from reviewboard.diffviewer.errors import DiffTooBigError, EmptyDiffError
 from reviewboard.diffviewer.features import dvcs_feature
 from reviewboard.diffviewer.models import DiffSet
+from reviewboard.diffviewer.responses import RawDiffResponse
 from reviewboard.reviews.forms import UploadDiffForm
 from reviewboard.reviews.models import ReviewRequest, ReviewRequestDraft
 from reviewboard.reviews.signals import review_request_diffset_uploaded
@@ -194,9 +194,8 @@ class DiffResource(WebAPIResource):
             return self.get_no_access_error(request)
 
         tool = review_request.repository.get_scmtool()
-        data = tool.get_parser(b'').raw_diff(diffset)
-
-        resp = HttpResponse(data, content_type='text/x-patch')
+        resp = RawDiffResponse(parser=tool.get_parser(b''),
+                               diffset_or_commit=diffset)
 
         if diffset.name == 'diff':
             filename = 'bug%s.patch' % \
@@ -5,7 +5,6 @@ from __future__ import annotations
 from urllib.parse import urlencode
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import HttpResponse
 from djblets.util.decorators import augment_method_from
 from djblets.util.http import get_http_requested_mimetype, set_last_modified
 from djblets.webapi.decorators import (webapi_login_required,
@@ -18,6 +17,7 @@ from djblets.webapi.fields import (DateTimeFieldType, DictFieldType,
 
 from reviewboard.diffviewer.features import dvcs_feature
 from reviewboard.diffviewer.models import DiffCommit, DiffSet
+from reviewboard.diffviewer.responses import RawDiffResponse
 from reviewboard.diffviewer.validators import COMMIT_ID_LENGTH
 from reviewboard.webapi.base import ImportExtraDataError, WebAPIResource
 from reviewboard.webapi.decorators import (webapi_check_local_site,
@@ -249,9 +249,9 @@ class DiffCommitResource(WebAPIResource):
             return self.get_no_access_error(request)
 
         tool = review_request.repository.get_scmtool()
-        data = tool.get_parser(b'').raw_diff(commit)
-
-        rsp = HttpResponse(data, content_type=mimetype)
+        rsp = RawDiffResponse(parser=tool.get_parser(b''),
+                              diffset_or_commit=commit,
+                              content_type=mimetype)
         rsp['Content-Disposition'] = ('inline; filename=%s.patch'
                                       % commit.commit_id)
 
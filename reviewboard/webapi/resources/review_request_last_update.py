@@ -2,15 +2,13 @@ from __future__ import annotations
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import HttpResponseNotModified
-from django.utils.translation import gettext as _
 from djblets.util.http import encode_etag, etag_if_none_match
 from djblets.webapi.errors import DOES_NOT_EXIST
 from djblets.webapi.fields import (ChoiceFieldType,
                                    DateTimeFieldType,
                                    StringFieldType)
 
-from reviewboard.diffviewer.models import DiffSet
-from reviewboard.reviews.models import Review, ReviewRequest
+from reviewboard.reviews.updates import get_last_update_info
 from reviewboard.webapi.base import WebAPIResource
 from reviewboard.webapi.decorators import (webapi_check_local_site,
                                            webapi_check_login_required)
@@ -85,57 +83,20 @@ class ReviewRequestLastUpdateResource(WebAPIResource):
         info = review_request.get_last_activity_info()
         timestamp = info['timestamp']
         updated_object = info['updated_object']
-        changedesc = info['changedesc']
 
         etag = encode_etag('%s:%s' % (timestamp, updated_object.pk))
 
         if etag_if_none_match(request, etag):
             return HttpResponseNotModified()
 
-        summary = None
-        update_type = None
-        user = None
-
-        if isinstance(updated_object, ReviewRequest):
-            if updated_object.status == ReviewRequest.SUBMITTED:
-                summary = _('Review request completed')
-            elif updated_object.status == ReviewRequest.DISCARDED:
-                summary = _('Review request discarded')
-            else:
-                summary = _('Review request updated')
-
-            update_type = 'review-request'
-        elif isinstance(updated_object, DiffSet):
-            summary = _('Diff updated')
-            update_type = 'diff'
-        elif isinstance(updated_object, Review):
-            if updated_object.is_reply():
-                summary = _('New reply')
-                update_type = 'reply'
-            else:
-                summary = _('New review')
-                update_type = 'review'
-
-            user = updated_object.user
-        else:
-            # Should never be able to happen. The object will always at least
-            # be a ReviewRequest.
-            assert False
-
-        if changedesc:
-            user = changedesc.get_user(review_request)
-        elif user is None:
-            # There is no changedesc which means this review request hasn't
-            # been changed since it was first published, so this change must
-            # be due to the original submitter.
-            user = review_request.submitter
+        last_update = get_last_update_info(review_request, info)
 
         return 200, {
             self.item_result_key: {
-                'timestamp': timestamp,
-                'user': user,
-                'summary': summary,
-                'type': update_type,
+                'timestamp': last_update['timestamp'],
+                'user': last_update['user'],
+                'summary': last_update['summary'],
+                'type': last_update['type'],
             }
         }, {
             'ETag': etag,
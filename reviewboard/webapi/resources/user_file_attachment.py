@@ -310,7 +310,9 @@ class UserFileAttachmentResource(BaseFileAttachmentResource):
                                            *args, **kwargs):
             return self.get_no_access_error(request)
 
-        if file_attachment.file:
+        # Shared files may be referenced by other attachments, and are
+        # released once this attachment is deleted.
+        if file_attachment.file and not file_attachment.uses_shared_file:
             file_attachment.file.delete()
 
         file_attachment.delete()